@@ -7,7 +7,18 @@ This package provides tools for integrating OmniScope API with LangChain.
 import os
 from typing import Optional
 
-from .omniscope_client import OmniScopeClient
+from .omniscope_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    OmniScopeAPIError,
+    OmniScopeClient,
+    ResponseCache,
+    RetryPolicy,
+)
+from .omniscope_async_client import AsyncOmniScopeClient
+from .omniscope_formats import OUTPUT_FORMATS, format_output
+from .omniscope_mcp_server import OmniScopeMCPServer, create_sse_app
 from .omniscope_tools import (
     OmniScopeToolkit,
     get_btc_usd_tool,
@@ -24,6 +35,7 @@ from .omniscope_tools import (
     get_solana_updates_tool,
     get_bitcoin_activity_tool,
     get_ethereum_activity_tool,
+    get_batch_tool,
 )
 
 def create_toolkit_from_env(base_url: Optional[str] = None) -> OmniScopeToolkit:
@@ -57,6 +69,17 @@ def create_toolkit_from_env(base_url: Optional[str] = None) -> OmniScopeToolkit:
 __all__ = [
     "OmniScopeToolkit",
     "OmniScopeClient",
+    "AsyncOmniScopeClient",
+    "ResponseCache",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "OmniScopeAPIError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "OmniScopeMCPServer",
+    "create_sse_app",
+    "OUTPUT_FORMATS",
+    "format_output",
     "create_toolkit_from_env",
     "get_btc_usd_tool",
     "get_btc_krw_tool",
@@ -72,4 +95,5 @@ __all__ = [
     "get_solana_updates_tool",
     "get_bitcoin_activity_tool",
     "get_ethereum_activity_tool",
+    "get_batch_tool",
 ]
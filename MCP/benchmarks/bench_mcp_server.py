@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+MCP 서버 다중 에이전트 벤치마크
+
+가짜 업스트림(고정 지연, httpx MockTransport)에 대해 N개 에이전트가 동시에 같은 도구들을
+호출할 때, 에이전트마다 클라이언트를 두는 경우와 하나의 MCP 서버(공유 연결 풀, 캐시,
+진행 중 요청 병합)를 거치는 경우의 업스트림 요청 수와 소요 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_mcp_server.py [에이전트 수] [업스트림 지연(ms)]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_async_client import AsyncOmniScopeClient
+from omniscope_mcp_server import OmniScopeMCPServer
+
+CATALOG = {"apis": [
+    {"path": "/crypto/btc/usd", "method": "GET", "summary": "BTC/USD", "category": "crypto"},
+    {"path": "/crypto/kimchi-premium", "method": "GET", "summary": "Kimchi premium", "category": "crypto"},
+    {"path": "/opensource/{repo}", "method": "GET", "summary": "Repository activity", "category": "opensource"},
+]}
+CALLS = [
+    ("get_crypto_btc_usd", {}),
+    ("get_crypto_kimchi_premium", {}),
+    ("get_opensource_repo", {"repo": "bitcoin", "fields": "stats"}),
+]
+
+def make_transport(latency, counter):
+    async def handler(request):
+        counter[0] += 1
+        await asyncio.sleep(latency)
+        if request.url.path.endswith("/api-catalog/list"):
+            return httpx.Response(200, json=CATALOG)
+        return httpx.Response(200, json={"path": request.url.path, "price": 1.0, "stats": {"stars": 1}},
+                              headers={"Cache-Control": "private, max-age=5", "ETag": 'W/"bench"'})
+    return httpx.MockTransport(handler)
+
+async def run_agent(server, agent):
+    await server.handle_message({"jsonrpc": "2.0", "id": 0, "method": "initialize", "params": {}})
+    await server.handle_message({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+    for request_id, (name, arguments) in enumerate(CALLS, 2):
+        response = await server.handle_message({"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+                                                "params": {"name": name, "arguments": arguments}})
+        assert not response["result"]["isError"], response
+
+async def embedded(agents, latency):
+    # 에이전트마다 별도 클라이언트(캐시 없음)
+    counter = [0]
+    servers = [OmniScopeMCPServer(AsyncOmniScopeClient("hsk", "sk", "http://bench.invalid/api",
+                                                       transport=make_transport(latency, counter)))
+               for _ in range(agents)]
+    await asyncio.gather(*(run_agent(server, i) for i, server in enumerate(servers)))
+    for server in servers:
+        await server.client.aclose()
+    return counter[0]
+
+async def shared(agents, latency):
+    counter = [0]
+    client = AsyncOmniScopeClient("hsk", "sk", "http://bench.invalid/api", cache=True,
+                                  transport=make_transport(latency, counter))
+    server = OmniScopeMCPServer(client)
+    await asyncio.gather(*(run_agent(server, i) for i in range(agents)))
+    await client.aclose()
+    return counter[0]
+
+def main():
+    agents = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 100) / 1000
+    print(f"Agents: {agents}, upstream latency: {latency * 1000:.0f}ms")
+    for label, scenario in (("embedded", embedded), ("shared", shared)):
+        started = time.perf_counter()
+        requests = asyncio.run(scenario(agents, latency))
+        print(f"{label:10s} {(time.perf_counter() - started) * 1000:9.2f}ms  upstream requests={requests}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+도구 출력 형식별 크기 벤치마크
+
+합성 저장소 활동 응답(기본 PR 30개)을 각 출력 형식으로 인코딩해 글자 수,
+대략적인 토큰 수(글자 수 / 4)와 인코딩 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_output_formats.py [PR 수]
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_formats import format_output
+
+def make_activity(count):
+    return {
+        "name": "bitcoin",
+        "full_name": "bitcoin/bitcoin",
+        "stats": {"stars": 80123, "forks": 36012, "open_issues": 612, "contributors": 1043,
+                  "release_version": "v27.0", "release_date": "2024-04-16T00:00:00Z"},
+        "pull_requests": [
+            {
+                "number": 30000 + i,
+                "title": f"net: refactor connection handling part {i}",
+                "author": f"contributor{i % 7}",
+                "state": "open" if i % 3 else "closed",
+                "created_at": "2024-05-01T12:00:00Z",
+                "updated_at": "2024-05-02T08:30:00Z",
+                "additions": 120 + i,
+                "deletions": 40 + i,
+                "labels": ["P2P", "Refactoring"],
+                "body": "This change splits the connection manager into smaller pieces. " * 4,
+            }
+            for i in range(count)
+        ],
+        "updated_at": "2024-05-02T09:00:00Z",
+    }
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    result = make_activity(count)
+    print(f"Pull requests: {count}")
+    cases = [
+        ("pretty", None), ("json", None), ("table", None), ("summary", None),
+        ("summary", "stats.stars,pull_requests.number,pull_requests.title,pull_requests.state"),
+    ]
+    for output_format, fields in cases:
+        started = time.perf_counter()
+        text = format_output(result, output_format, fields)
+        elapsed = (time.perf_counter() - started) * 1000
+        label = output_format + ("+fields" if fields else "")
+        print(f"{label:15s} {len(text):7d} chars  ~{len(text) // 4:6d} tokens  {elapsed:6.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+OmniScopeToolkit 시작 시간 벤치마크
+
+합성 API 카탈로그 N개 항목(기본 500개)으로 다음 시나리오의 get_tools() 시간을 측정합니다.
+- cold: 디스크 캐시 없음, 카탈로그를 네트워크에서 한 번 조회 (지연 시간 시뮬레이션)
+- warm: 디스크 캐시 사용, ETag 재검증은 백그라운드에서 수행
+- memoized: 같은 툴킷에서 get_tools() 재호출
+
+사용법:
+    python benchmarks/bench_toolkit_startup.py [카탈로그 항목 수] [네트워크 지연(ms)]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_tools import OmniScopeToolkit
+
+CATEGORIES = ["crypto", "social", "derivatives", "projects", "opensource", "search"]
+
+def make_catalog(count):
+    apis = [
+        {
+            "path": f"/{CATEGORIES[i % len(CATEGORIES)]}/endpoint-{i}",
+            "method": "GET",
+            "summary": f"Synthetic endpoint {i}",
+            "description": "Returns synthetic data for benchmarking tool construction.",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "tags": [],
+        }
+        for i in range(count)
+    ]
+    return {"total_count": count, "apis": apis}
+
+def make_toolkit(cache_path, catalog, latency):
+    toolkit = OmniScopeToolkit("hsk_bench", "sk_bench", base_url="http://bench.invalid", catalog_cache_path=cache_path)
+
+    # 네트워크 지연을 흉내내는 카탈로그 조회 (ETag가 같으면 304)
+    def get_api_catalog_if_changed(etag=None):
+        time.sleep(latency)
+        return (None, etag) if etag == '"bench"' else (catalog, '"bench"')
+
+    toolkit.client.get_api_catalog_if_changed = get_api_catalog_if_changed
+    return toolkit
+
+def timed(label, func):
+    started = time.perf_counter()
+    result = func()
+    print(f"{label:10s} {(time.perf_counter() - started) * 1000:9.2f}ms  tools={len(result)}")
+    return result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 200) / 1000
+    catalog = make_catalog(count)
+    cache_path = os.path.join(tempfile.mkdtemp(), "catalog.json")
+    print(f"Catalog entries: {count}, simulated latency: {latency * 1000:.0f}ms")
+
+    toolkit = make_toolkit(cache_path, catalog, latency)
+    timed("cold", toolkit.get_tools)
+    timed("memoized", toolkit.get_tools)
+
+    toolkit = make_toolkit(cache_path, catalog, latency)
+    timed("warm", toolkit.get_tools)
+    timed("memoized", toolkit.get_tools)
+
+if __name__ == "__main__":
+    main()
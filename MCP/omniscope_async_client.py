@@ -0,0 +1,358 @@
+"""
+OmniScope Async API Client
+
+This module provides an asyncio client for the OmniScope API with a pooled,
+keep-alive HTTP connection and concurrent fan-out over several endpoints.
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from omniscope_client import OmniScopeAPIError, OmniScopeClient, ResponseCache
+
+# fetch_many 요청 항목: 메서드 이름, (메서드 이름, 인자 dict) 또는 awaitable
+FetchSpec = Union[str, Tuple[str, Dict[str, Any]], Awaitable[Any]]
+
+class AsyncOmniScopeClient:
+    """
+    Async client for interacting with the OmniScope API.
+
+    Use it as an async context manager (or call `aclose()`) so the connection pool is released.
+    """
+
+    def __init__(self, api_key_id: str, api_key_secret: str, base_url: str = "https://omniscope.sungwoonsong.com/api",
+                 timeout: float = 30.0, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 transport: Optional[httpx.AsyncBaseTransport] = None, cache: Union[bool, ResponseCache] = False):
+        """
+        Initialize the async OmniScope API client.
+
+        Args:
+            api_key_id: The API key ID
+            api_key_secret: The API key secret
+            base_url: The base URL for the OmniScope API (default: https://omniscope.sungwoonsong.com/api)
+            timeout: Default per-request timeout in seconds
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            transport: Optional custom httpx transport (e.g. for testing)
+            cache: Enable the GET response cache (True for defaults, or a configured ResponseCache)
+        """
+        self.api_key_id = api_key_id
+        self.api_key_secret = api_key_secret
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = ResponseCache() if cache is True else (cache or None)
+        self._inflight: Dict[Tuple, "asyncio.Future[Any]"] = {}
+        self.client = httpx.AsyncClient(
+            headers={
+                'api-key-id': api_key_id,
+                'api-key-secret': api_key_secret,
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_keepalive_connections),
+            transport=transport
+        )
+
+    async def __aenter__(self) -> "AsyncOmniScopeClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self.client.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                            data: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Make a request to the OmniScope API.
+
+        Concurrent identical GET requests with the same timeout share one upstream call
+        (a caller never waits on another caller's timeout), and GET responses are
+        served from / revalidated against the response cache when it is enabled.
+
+        Args:
+            method: The HTTP method to use
+            endpoint: The API endpoint
+            params: Query parameters
+            data: Request body data
+            timeout: Per-call timeout in seconds (defaults to the client timeout)
+
+        Returns:
+            The API response as a dictionary
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+
+        method = method.lower()
+        timeout = self.timeout if timeout is None else timeout
+        if method not in ('get', 'post', 'put', 'delete'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        if method != 'get':
+            return await self._send(method, url, params, data, timeout)
+
+        key, etag = ResponseCache.make_key(url, params), None
+        if self.cache is not None:
+            cached, etag = self.cache.lookup(key)
+            if cached is not None:
+                return cached
+
+        # 동일한 GET 요청(같은 timeout, 같은 재검증 ETag)이 진행 중이면 새로 보내지 않고 그 결과를 공유
+        inflight_key = (key, timeout, etag)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(key, url, params, timeout, etag))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda done: self._forget(inflight_key, done))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _forget(self, key: Tuple, task: "asyncio.Future[Any]") -> None:
+        self._inflight.pop(key, None)
+        # 모든 호출자가 취소된 경우에도 예외가 조회되지 않았다는 경고가 남지 않도록 처리
+        if not task.cancelled():
+            task.exception()
+
+    async def _get(self, key: Tuple, url: str, params: Optional[Dict[str, Any]], timeout: float,
+                   etag: Optional[str]) -> Any:
+        if self.cache is None:
+            return await self._send('get', url, params, None, timeout)
+
+        response = await self._send('get', url, params, None, timeout,
+                                    headers={'If-None-Match': etag} if etag else None, raw=True)
+        if response.status_code == 304:
+            cached = self.cache.revalidated(key, response.headers)
+            if cached is not None:
+                return cached
+            response = await self._send('get', url, params, None, timeout, raw=True)
+        body = response.json()
+        self.cache.store(key, body, response.headers)
+        return body
+
+    async def _send(self, method: str, url: str, params: Optional[Dict[str, Any]], data: Optional[Dict[str, Any]],
+                    timeout: float, headers: Optional[Dict[str, str]] = None, raw: bool = False) -> Any:
+        try:
+            response = await self.client.request(
+                method.upper(), url, params=params, json=data, headers=headers, timeout=timeout
+            )
+        except httpx.HTTPError as e:
+            raise OmniScopeAPIError(f"OmniScope API error: {e!r}")
+        if response.status_code != 304 and not response.is_success:
+            raise OmniScopeClient._error_from_response(response)
+        if raw:
+            return response
+        try:
+            return response.json()
+        except ValueError as e:
+            raise OmniScopeAPIError(f"OmniScope API error: invalid JSON response ({e})", response.status_code)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Hits, misses, revalidations, size and hit rate (all zero when caching is disabled)
+        """
+        if self.cache is None:
+            return {'hits': 0, 'misses': 0, 'revalidations': 0, 'size': 0, 'hit_rate': 0.0}
+        return self.cache.stats()
+
+    async def fetch_many(self, requests: Sequence[FetchSpec], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run several API calls concurrently over the shared connection pool.
+
+        Args:
+            requests: Method names (e.g. 'get_btc_usd'), (method name, kwargs) tuples or awaitables
+            return_exceptions: Return failures in place of results instead of raising the first one
+
+        Returns:
+            Results in the same order as `requests`
+        """
+        calls = []
+        for spec in requests:
+            if isinstance(spec, str):
+                calls.append(getattr(self, spec)())
+            elif isinstance(spec, tuple):
+                name, kwargs = spec
+                calls.append(getattr(self, name)(**kwargs))
+            else:
+                calls.append(spec)
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    # Crypto Price API
+    async def get_btc_usd(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current BTC price in USD from Binance.
+
+        Returns:
+            The current BTC/USD price data
+        """
+        return await self._make_request('get', '/crypto/btc/usd', timeout=timeout)
+
+    async def get_btc_krw(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current BTC price in KRW from Upbit.
+
+        Returns:
+            The current BTC/KRW price data
+        """
+        return await self._make_request('get', '/crypto/btc/krw', timeout=timeout)
+
+    async def get_usdt_krw(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current USDT price in KRW from Upbit.
+
+        Returns:
+            The current USDT/KRW price data
+        """
+        return await self._make_request('get', '/crypto/usdt/krw', timeout=timeout)
+
+    async def get_kimchi_premium(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current Kimchi Premium (difference between BTC price in KRW and USD).
+
+        Returns:
+            The current Kimchi Premium data
+        """
+        return await self._make_request('get', '/crypto/kimchi-premium', timeout=timeout)
+
+    # Social Media API
+    async def get_trump_posts(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest posts from Donald Trump.
+
+        Returns:
+            The latest posts from Donald Trump
+        """
+        return await self._make_request('get', '/social/trump', timeout=timeout)
+
+    async def get_elon_posts(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest posts from Elon Musk.
+
+        Returns:
+            The latest posts from Elon Musk
+        """
+        return await self._make_request('get', '/social/elon', timeout=timeout)
+
+    async def get_x_trends(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current trending topics on X (Twitter).
+
+        Returns:
+            The current trending topics on X
+        """
+        return await self._make_request('get', '/social/x/trends', timeout=timeout)
+
+    # Derivatives Market API
+    async def get_funding_rates(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current funding rates for cryptocurrency futures.
+
+        Returns:
+            The current funding rates data
+        """
+        return await self._make_request('get', '/derivatives/funding-rates', timeout=timeout)
+
+    async def get_open_interest(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the current open interest for cryptocurrency derivatives.
+
+        Returns:
+            The current open interest data
+        """
+        return await self._make_request('get', '/derivatives/open-interest', timeout=timeout)
+
+    # Blockchain Projects API
+    async def get_hsk_updates(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest updates from HashKey Chain.
+
+        Returns:
+            The latest updates from HashKey Chain
+        """
+        return await self._make_request('get', '/projects/hsk', timeout=timeout)
+
+    async def get_ethereum_standards(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get information about Ethereum standards and proposals.
+
+        Returns:
+            Information about Ethereum standards and proposals
+        """
+        return await self._make_request('get', '/projects/ethereum/standards', timeout=timeout)
+
+    async def get_solana_updates(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest updates from Solana blockchain.
+
+        Returns:
+            The latest updates from Solana blockchain
+        """
+        return await self._make_request('get', '/projects/solana', timeout=timeout)
+
+    # Open Source API
+    async def get_bitcoin_activity(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest activities from Bitcoin Core.
+
+        Returns:
+            Latest activities from Bitcoin Core
+        """
+        return await self._make_request('get', '/opensource/bitcoin', timeout=timeout)
+
+    async def get_ethereum_activity(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the latest activities from Ethereum Core.
+
+        Returns:
+            Latest activities from Ethereum Core
+        """
+        return await self._make_request('get', '/opensource/ethereum', timeout=timeout)
+
+    # Batch API
+    async def batch(self, requests: List[Union[str, Dict[str, Any]]], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Call several data APIs in a single round-trip.
+
+        Args:
+            requests: API paths (e.g. '/crypto/btc/usd') or {'path': ..., 'params': {...}} dicts
+            timeout: Optional per-call timeout in seconds
+
+        Returns:
+            The batch response with per-item 'status', 'body' and 'error'
+        """
+        items = [{'path': item} if isinstance(item, str) else item for item in requests]
+        return await self._make_request('post', '/batch', data={'requests': items}, timeout=timeout)
+
+    # API Catalog
+    async def get_api_catalog(self, category: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the API catalog from OmniScope.
+
+        Args:
+            category: Optional category to filter APIs
+            timeout: Optional per-call timeout in seconds
+
+        Returns:
+            The API catalog data
+        """
+        params = {}
+        if category:
+            params['category'] = category
+        return await self._make_request('get', '/api-catalog/list', params=params, timeout=timeout)
+
+    async def get_categories(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the available API categories from OmniScope.
+
+        Returns:
+            The API categories data
+        """
+        return await self._make_request('get', '/api-catalog/categories', timeout=timeout)
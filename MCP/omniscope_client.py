@@ -4,16 +4,246 @@ OmniScope API Client
 This module provides a client for interacting with the OmniScope API.
 """
 
+import copy
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 import requests
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 import json
 
+class OmniScopeAPIError(Exception):
+    """
+    Error returned by (or while calling) the OmniScope API.
+    """
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+class CircuitOpenError(OmniScopeAPIError):
+    """
+    Raised without a request while an endpoint's circuit breaker is open.
+    """
+
+class DeadlineExceededError(OmniScopeAPIError):
+    """
+    Raised when the active deadline leaves no time for another attempt.
+    """
+
+class RetryPolicy:
+    """
+    Retry policy with full-jitter exponential backoff.
+    """
+    
+    def __init__(self, max_attempts: int = 3, backoff_base: float = 0.5, backoff_max: float = 8.0,
+                 max_retry_after: float = 10.0, retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)):
+        """
+        Initialize the retry policy.
+        
+        Args:
+            max_attempts: Total attempts per request (1 disables retries)
+            backoff_base: Backoff for the first retry in seconds (doubled per attempt)
+            backoff_max: Upper bound for a single backoff
+            max_retry_after: Give up instead of waiting when the server asks for a longer Retry-After
+            retry_statuses: HTTP status codes that are retried
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = retry_statuses
+    
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Compute the wait before retry number `attempt` (1-based).
+        
+        Returns:
+            Seconds to wait, or None if the server's Retry-After exceeds max_retry_after
+        """
+        backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+        if retry_after is None:
+            return backoff
+        if retry_after > self.max_retry_after:
+            return None
+        return max(retry_after, backoff)
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker (closed -> open -> half-open).
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock=time.monotonic):
+        """
+        Initialize the circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before letting one trial request through
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if self.clock() - self.opened_at >= self.reset_timeout else 'open'
+    
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_in_flight = False
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of GET responses honoring Cache-Control and ETag.
+
+    Fresh entries are served without a request; stale entries with an ETag are
+    revalidated with If-None-Match so an unchanged response costs only a 304.
+    """
+    
+    def __init__(self, max_entries: int = 256, default_ttl: float = 0.0, clock=time.monotonic):
+        """
+        Initialize the response cache.
+        
+        Args:
+            max_entries: Maximum number of cached responses (least recently used are evicted)
+            default_ttl: Freshness in seconds when the server sends no Cache-Control
+            clock: Monotonic time source
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Tuple, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> Tuple:
+        return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+    
+    def _ttl(self, headers) -> Optional[float]:
+        # no-store면 None(저장 안 함), no-cache면 0(항상 재검증)
+        cache_control = headers.get('Cache-Control', '').lower()
+        if not cache_control:
+            return self.default_ttl
+        if 'no-store' in cache_control:
+            return None
+        if 'no-cache' in cache_control:
+            return 0.0
+        match = re.search(r'max-age=(\d+)', cache_control)
+        return float(match.group(1)) if match else self.default_ttl
+    
+    def lookup(self, key: Tuple) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a cached response.
+        
+        Returns:
+            (fresh body or None, ETag to revalidate with or None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            self._entries.move_to_end(key)
+            body, etag, expires_at = entry
+            if self.clock() < expires_at:
+                self.hits += 1
+                return copy.deepcopy(body), None
+            self.misses += 1
+            return None, etag
+    
+    def store(self, key: Tuple, body: Any, headers) -> None:
+        """
+        Store a 200 response according to its Cache-Control/ETag headers.
+        """
+        ttl, etag = self._ttl(headers), headers.get('ETag')
+        with self._lock:
+            if ttl is None or (ttl <= 0 and not etag):
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = [copy.deepcopy(body), etag, self.clock() + ttl]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def revalidated(self, key: Tuple, headers) -> Optional[Any]:
+        """
+        Refresh an entry after a 304 Not Modified response.
+        
+        Returns:
+            The cached body, or None if it was evicted meanwhile
+        """
+        ttl = self._ttl(headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.revalidations += 1
+            entry[2] = self.clock() + (ttl or 0.0)
+            return copy.deepcopy(entry[0])
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Hits, misses, revalidations, size and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'size': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 class OmniScopeClient:
     """
     Client for interacting with the OmniScope API.
     """
     
-    def __init__(self, api_key_id: str, api_key_secret: str, base_url: str = "https://omniscope.sungwoonsong.com/api"):
+    def __init__(self, api_key_id: str, api_key_secret: str, base_url: str = "https://omniscope.sungwoonsong.com/api",
+                 timeout: float = 30.0, cache: Union[bool, ResponseCache] = False,
+                 retry_policy: Optional[RetryPolicy] = None, failure_threshold: int = 5, reset_timeout: float = 30.0):
         """
         Initialize the OmniScope API client.
         
@@ -21,10 +251,23 @@ class OmniScopeClient:
             api_key_id: The API key ID
             api_key_secret: The API key secret
             base_url: The base URL for the OmniScope API (default: https://omniscope.sungwoonsong.com/api)
+            timeout: Default per-request timeout in seconds
+            cache: Enable the GET response cache (True for defaults, or a configured ResponseCache)
+            retry_policy: Retry/backoff policy (default: 3 attempts with jittered exponential backoff)
+            failure_threshold: Consecutive failures that open an endpoint's circuit breaker
+            reset_timeout: Seconds an open circuit waits before a trial request
         """
         self.api_key_id = api_key_id
         self.api_key_secret = api_key_secret
         self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cache = ResponseCache() if cache is True else (cache or None)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._local = threading.local()
         self.session = requests.Session()
         self.session.headers.update({
             'api-key-id': api_key_id,
@@ -33,47 +276,168 @@ class OmniScopeClient:
             'Accept': 'application/json'
         })
     
+    @contextmanager
+    def deadline(self, seconds: float):
+        """
+        Bound every request made inside the block (including retries) by a shared deadline.
+        
+        Nested blocks keep the earlier deadline, so a tool that calls several endpoints
+        cannot exceed the budget of the agent step that invoked it.
+        
+        Args:
+            seconds: Time budget from now
+        """
+        previous = getattr(self._local, 'deadline', None)
+        deadline = time.monotonic() + seconds
+        self._local.deadline = deadline if previous is None else min(previous, deadline)
+        try:
+            yield
+        finally:
+            self._local.deadline = previous
+    
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        key = endpoint.split('?')[0].rstrip('/') or '/'
+        with self._breakers_lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[key]
+    
+    def _send(self, method: str, url: str, params: Optional[Dict[str, Any]], data: Optional[Dict[str, Any]],
+              headers: Optional[Dict[str, str]], timeout: float) -> requests.Response:
+        if method == 'get':
+            return self.session.get(url, params=params, headers=headers, timeout=timeout)
+        elif method == 'post':
+            return self.session.post(url, params=params, json=data, timeout=timeout)
+        elif method == 'put':
+            return self.session.put(url, params=params, json=data, timeout=timeout)
+        elif method == 'delete':
+            return self.session.delete(url, params=params, json=data, timeout=timeout)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    @staticmethod
+    def _error_from_response(response: requests.Response) -> OmniScopeAPIError:
+        # requests.Response / httpx.Response 모두 처리 (비동기 클라이언트와 공유)
+        reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
+        try:
+            error_message = response.json().get('detail', reason)
+        except ValueError:
+            error_message = response.text or reason
+        retry_after = response.headers.get('Retry-After')
+        try:
+            retry_after = float(retry_after) if retry_after is not None else None
+        except ValueError:
+            retry_after = None
+        return OmniScopeAPIError(f"OmniScope API error: {error_message}", response.status_code, retry_after)
+    
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None, 
-                     data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                     data: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Make a request to the OmniScope API.
         
+        Retryable failures (connection errors, timeouts, 429 and 5xx) are retried with jittered
+        exponential backoff, honoring Retry-After, within the active deadline. Each endpoint has its
+        own circuit breaker that fails fast after repeated failures.
+        
         Args:
             method: The HTTP method to use
             endpoint: The API endpoint
             params: Query parameters
             data: Request body data
+            timeout: Per-call timeout in seconds (defaults to the client timeout)
             
         Returns:
             The API response as a dictionary
+            
+        Raises:
+            OmniScopeAPIError: If the request fails (CircuitOpenError / DeadlineExceededError when failing fast)
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        method = method.lower()
+        timeout = self.timeout if timeout is None else timeout
+        if method not in ('get', 'post', 'put', 'delete'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        try:
-            if method.lower() == 'get':
-                response = self.session.get(url, params=params)
-            elif method.lower() == 'post':
-                response = self.session.post(url, params=params, json=data)
-            elif method.lower() == 'put':
-                response = self.session.put(url, params=params, json=data)
-            elif method.lower() == 'delete':
-                response = self.session.delete(url, params=params, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        # 캐시가 켜져 있으면 GET 응답을 캐시에서 제공하거나 ETag로 재검증
+        cache_key, headers = None, None
+        if self.cache is not None and method == 'get':
+            cache_key = self.cache.make_key(url, params)
+            cached, etag = self.cache.lookup(cache_key)
+            if cached is not None:
+                return cached
+            if etag:
+                headers = {'If-None-Match': etag}
+        
+        breaker = self._breaker(endpoint)
+        deadline = getattr(self._local, 'deadline', None)
+        attempt = 0
+        while True:
+            # 기한을 먼저 확인해 half-open 시험 요청 자격을 쓰지 않고 실패하는 경우가 없도록 함
+            attempt_timeout = timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceededError(f"OmniScope API error: deadline exceeded for {endpoint}")
+                attempt_timeout = min(timeout, remaining)
+            if not breaker.allow():
+                raise CircuitOpenError(f"OmniScope API error: circuit open for {endpoint} after repeated failures")
             
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            if hasattr(e, 'response') and e.response is not None:
+            # allow() 이후에는 어떤 경로로 나가든 성공/실패를 기록 (half-open 시험 요청 해제)
+            succeeded = False
+            try:
                 try:
-                    error_data = e.response.json()
-                    error_message = error_data.get('detail', str(e))
-                except ValueError:
-                    error_message = e.response.text or str(e)
-            else:
-                error_message = str(e)
+                    response = self._send(method, url, params, data, headers, attempt_timeout)
+                    if cache_key is not None and response.status_code == 304:
+                        cached = self.cache.revalidated(cache_key, response.headers)
+                        if cached is not None:
+                            succeeded = True
+                            return cached
+                        response = self._send(method, url, params, data, None, attempt_timeout)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    # POST는 서버 처리 여부를 알 수 없으므로 네트워크 오류 시 재시도하지 않음
+                    error, retryable = OmniScopeAPIError(f"OmniScope API error: {e}"), method != 'post'
+                except requests.exceptions.RequestException as e:
+                    raise OmniScopeAPIError(f"OmniScope API error: {e}")
+                else:
+                    if response.ok:
+                        try:
+                            body = response.json()
+                        except ValueError as e:
+                            raise OmniScopeAPIError(f"OmniScope API error: invalid JSON response ({e})",
+                                                    response.status_code)
+                        succeeded = True
+                        if cache_key is not None:
+                            self.cache.store(cache_key, body, response.headers)
+                        return body
+                    error = self._error_from_response(response)
+                    if response.status_code not in self.retry_policy.retry_statuses:
+                        # 4xx 등 클라이언트 오류는 엔드포인트 장애가 아님
+                        succeeded = True
+                        raise error
+                    retryable = method != 'post' or response.status_code in (429, 503)
+            finally:
+                if succeeded:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
             
-            raise Exception(f"OmniScope API error: {error_message}")
+            attempt += 1
+            if not retryable or attempt >= self.retry_policy.max_attempts:
+                raise error
+            delay = self.retry_policy.delay(attempt, error.retry_after)
+            if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                raise error
+            time.sleep(delay)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+        
+        Returns:
+            Hits, misses, revalidations, size and hit rate (all zero when caching is disabled)
+        """
+        if self.cache is None:
+            return {'hits': 0, 'misses': 0, 'revalidations': 0, 'size': 0, 'hit_rate': 0.0}
+        return self.cache.stats()
     
     # Crypto Price API
     def get_btc_usd(self) -> Dict[str, Any]:
@@ -138,7 +502,7 @@ class OmniScopeClient:
         Returns:
             The current trending topics on X
         """
-        return self._make_request('get', '/social/x-trends')
+        return self._make_request('get', '/social/x/trends')
     
     # Derivatives Market API
     def get_funding_rates(self) -> Dict[str, Any]:
@@ -176,7 +540,7 @@ class OmniScopeClient:
         Returns:
             Information about Ethereum standards and proposals
         """
-        return self._make_request('get', '/projects/ethereum-standards')
+        return self._make_request('get', '/projects/ethereum/standards')
     
     def get_solana_updates(self) -> Dict[str, Any]:
         """
@@ -206,6 +570,20 @@ class OmniScopeClient:
         """
         return self._make_request('get', '/opensource/ethereum')
     
+    # Batch API
+    def batch(self, requests: List[Union[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Call several data APIs in a single round-trip.
+        
+        Args:
+            requests: API paths (e.g. '/crypto/btc/usd') or {'path': ..., 'params': {...}} dicts
+            
+        Returns:
+            The batch response with per-item 'status', 'body' and 'error'
+        """
+        items = [{'path': item} if isinstance(item, str) else item for item in requests]
+        return self._make_request('post', '/batch', data={'requests': items})
+    
     # API Catalog
     def get_api_catalog(self, category: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -220,7 +598,28 @@ class OmniScopeClient:
         params = {}
         if category:
             params['category'] = category
-        return self._make_request('get', '/api-catalog', params=params)
+        return self._make_request('get', '/api-catalog/list', params=params)
+    
+    def get_api_catalog_if_changed(self, etag: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Get the full API catalog unless it still matches a previously seen ETag.
+        
+        Args:
+            etag: ETag of the locally cached catalog
+            
+        Returns:
+            (catalog, etag), or (None, etag) if the server answered 304 Not Modified
+        """
+        headers = {'If-None-Match': etag} if etag else None
+        try:
+            response = self.session.get(f"{self.base_url}/api-catalog/list", headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise OmniScopeAPIError(f"OmniScope API error: {e}")
+        if response.status_code == 304:
+            return None, etag
+        if not response.ok:
+            raise self._error_from_response(response)
+        return response.json(), response.headers.get('ETag')
     
     def get_categories(self) -> Dict[str, Any]:
         """
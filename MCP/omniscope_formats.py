@@ -0,0 +1,147 @@
+"""
+OmniScope Output Formats
+
+This module encodes API results as compact text for LLM tools: compact JSON,
+CSV-like tables, or a field-projected summary.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# 지원하는 출력 형식 (text는 도구별 서술형 출력)
+OUTPUT_FORMATS = ("text", "pretty", "json", "table", "summary")
+
+# summary 형식 기본 제한
+SUMMARY_MAX_ROWS = 5
+SUMMARY_MAX_WIDTH = 120
+
+def compact_json(value: Any) -> str:
+    """
+    Encode a value as JSON without whitespace or ASCII escaping.
+    """
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+
+# parse_fields/project는 서버 app/utils/projection.py와 같은 구현 (MCP 패키지는 백엔드와 별도 배포되므로
+# 가져오지 않고 유지, backend/tests/test_projection.py에서 두 구현의 결과가 같은지 확인)
+def parse_fields(fields: str) -> Dict[str, Any]:
+    """
+    Parse 'a,b.c' into a projection tree {'a': None, 'b': {'c': None}} (same syntax as the server `fields=` parameter).
+    """
+    tree: Dict[str, Any] = {}
+    for field in filter(None, (part.strip() for part in fields.split(','))):
+        node = tree
+        parts = field.split('.')
+        for part in parts[:-1]:
+            if node.get(part, {}) is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree
+
+def project(data: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """
+    Keep only the fields in a projection tree (lists are projected item by item).
+    """
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: project(data[key], sub) for key, sub in tree.items() if key in data}
+    return data
+
+def _is_records(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, dict) for item in value)
+
+def _flatten(record: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    # 중첩 dict는 점 표기 컬럼으로, 리스트는 compact JSON 셀로 변환
+    flat = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            flat[name] = compact_json(value)
+        else:
+            flat[name] = value
+    return flat
+
+def _collect(data: Any, prefix: str, scalars: Dict[str, Any], tables: List[Tuple[str, List[Dict[str, Any]]]]) -> None:
+    if _is_records(data):
+        tables.append((prefix or "rows", data))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            _collect(value, f"{prefix}.{key}" if prefix else str(key), scalars, tables)
+    elif isinstance(data, list):
+        scalars[prefix or "value"] = compact_json(data)
+    else:
+        scalars[prefix or "value"] = data
+
+def _cell(value: Any, max_width: Optional[int]) -> str:
+    text = "" if value is None else str(value)
+    if max_width and len(text) > max_width:
+        text = text[:max_width - 1] + "…"
+    return text.replace("\n", " ")
+
+def to_table(data: Any, max_rows: Optional[int] = None, max_width: Optional[int] = None) -> str:
+    """
+    Encode a result as CSV-like tables.
+
+    Top-level scalar fields become one header/value row; every list of objects
+    becomes a '# name (N rows)' section with a single header line.
+
+    Args:
+        data: The API result
+        max_rows: Maximum rows per table (None for all)
+        max_width: Maximum characters per cell (None for no limit)
+
+    Returns:
+        The encoded text
+    """
+    scalars: Dict[str, Any] = {}
+    tables: List[Tuple[str, List[Dict[str, Any]]]] = []
+    _collect(data, "", scalars, tables)
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    if scalars:
+        writer.writerow(list(scalars))
+        writer.writerow([_cell(value, max_width) for value in scalars.values()])
+    for name, records in tables:
+        rows = [_flatten(record) for record in records[:max_rows]]
+        columns = list(dict.fromkeys(column for row in rows for column in row))
+        shown = f"{len(rows)} of {len(records)}" if len(rows) < len(records) else str(len(records))
+        out.write(f"# {name} ({shown} rows)\n")
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_cell(row.get(column), max_width) for column in columns])
+    return out.getvalue().rstrip("\n")
+
+def format_output(result: Any, output_format: str = "json", fields: Optional[str] = None) -> str:
+    """
+    Encode an API result for a tool response.
+
+    Args:
+        result: The API result
+        output_format: 'pretty' (indented JSON), 'json' (compact JSON), 'table' (CSV-like) or
+            'summary' (projected to `fields`, first rows only, long values truncated)
+        fields: Optional comma-separated fields to keep (e.g. 'stats.stars,pull_requests.title')
+
+    Returns:
+        The encoded text
+    """
+    if fields:
+        result = project(result, parse_fields(fields))
+
+    if output_format == "pretty":
+        return json.dumps(result, indent=2, ensure_ascii=False, default=str)
+    if output_format in ("json", "text"):
+        return compact_json(result)
+    if output_format == "table":
+        return to_table(result)
+    if output_format == "summary":
+        return to_table(result, max_rows=SUMMARY_MAX_ROWS, max_width=SUMMARY_MAX_WIDTH)
+    raise ValueError(f"Unsupported output format: {output_format} (expected one of {', '.join(OUTPUT_FORMATS)})")
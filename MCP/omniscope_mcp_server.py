@@ -0,0 +1,413 @@
+"""
+OmniScope MCP Server
+
+This module serves the OmniScope API as Model Context Protocol tools over stdio
+or SSE. One server process holds a single pooled upstream connection and a
+response cache shared by every connected agent, and handles requests concurrently.
+
+Usage:
+    python omniscope_mcp_server.py --transport stdio
+    python omniscope_mcp_server.py --transport sse --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+from omniscope_async_client import AsyncOmniScopeClient
+from omniscope_formats import OUTPUT_FORMATS, format_output
+
+# 지원하는 MCP 프로토콜 버전 (첫 번째가 기본값)
+PROTOCOL_VERSIONS = ("2024-11-05", "2025-03-26")
+SERVER_INFO = {"name": "omniscope", "version": "0.1.0"}
+
+# JSON-RPC 오류 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# SSE 연결 유지용 주석 전송 간격 (초)
+SSE_KEEPALIVE_SECONDS = 15
+
+BATCH_TOOL_NAME = "omniscope_batch"
+
+class MCPError(Exception):
+    """
+    JSON-RPC error returned to the MCP client.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+def tool_name_for_path(path: str) -> str:
+    """
+    Generate an MCP tool name from an API path (e.g. '/opensource/{repo}' -> 'get_opensource_repo').
+    """
+    return f"get_{re.sub(r'[^A-Za-z0-9]+', '_', path).strip('_')}"[:64]
+
+def path_parameters(path: str) -> List[str]:
+    """
+    Get the path template parameters of an API path.
+    """
+    return re.findall(r"\{(\w+)\}", path)
+
+class OmniScopeMCPServer:
+    """
+    MCP server exposing the OmniScope API catalog as tools.
+
+    Transport-independent: `handle_message` takes one decoded JSON-RPC message (or batch)
+    and returns the response, so stdio and SSE sessions share the same tools, client and cache.
+    """
+
+    def __init__(self, client: AsyncOmniScopeClient, output_format: str = "json", max_concurrency: int = 32):
+        """
+        Initialize the MCP server.
+
+        Args:
+            client: Async OmniScope client shared by all sessions (enable its cache to share responses)
+            output_format: Tool result encoding ('json', 'table', 'summary' or 'pretty')
+            max_concurrency: Maximum number of tool calls running upstream at once
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.client = client
+        self.output_format = "json" if output_format == "text" else output_format
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tools: Optional[Dict[str, Dict[str, Any]]] = None
+        self._tools_task: Optional["asyncio.Future[Dict[str, Dict[str, Any]]]"] = None
+        self._handlers: Dict[str, Callable] = {
+            "initialize": self._initialize,
+            "ping": self._ping,
+            "tools/list": self._list_tools,
+            "tools/call": self._call_tool,
+        }
+
+    # 도구 정의
+    async def get_tools(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the tool definitions, loading the API catalog once (concurrent sessions share the load).
+
+        Returns:
+            Tool definitions by name, each with its MCP schema and upstream path
+        """
+        if self._tools is not None:
+            return self._tools
+        if self._tools_task is None:
+            self._tools_task = asyncio.ensure_future(self._load_tools())
+        try:
+            self._tools = await asyncio.shield(self._tools_task)
+        except Exception:
+            # 실패하면 다음 요청에서 다시 조회
+            self._tools_task = None
+            raise
+        return self._tools
+
+    async def _load_tools(self) -> Dict[str, Dict[str, Any]]:
+        catalog = await self.client.get_api_catalog()
+        tools = {}
+        for api in catalog.get("apis", []):
+            if api.get("method", "GET").upper() != "GET":
+                continue
+            name = tool_name_for_path(api["path"])
+            tools[name] = {"path": api["path"], "schema": self._tool_schema(name, api)}
+        tools[BATCH_TOOL_NAME] = {"path": "/batch", "schema": {
+            "name": BATCH_TOOL_NAME,
+            "description": (
+                "Fetch several OmniScope data APIs in one call. Prefer this over calling several tools "
+                "one after another."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {"paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "API paths (query strings allowed), e.g. ['/crypto/btc/usd', '/derivatives/funding-rates']",
+                }},
+                "required": ["paths"],
+            },
+        }}
+        return tools
+
+    @staticmethod
+    def _tool_schema(name: str, api: Dict[str, Any]) -> Dict[str, Any]:
+        summary = api.get("summary") or f"Get data from {api['path']}"
+        description = api.get("description") or ""
+        required = path_parameters(api["path"])
+        properties: Dict[str, Any] = {parameter: {"type": "string"} for parameter in required}
+        properties["fields"] = {
+            "type": "string",
+            "description": "Comma-separated fields to return (dot notation for nested fields, e.g. 'stats.stars')",
+        }
+        properties["query"] = {
+            "type": "object",
+            "description": "Additional query parameters",
+            "additionalProperties": {"type": ["string", "number", "boolean"]},
+        }
+        return {
+            "name": name,
+            "description": f"{summary}. {description}".strip(),
+            "inputSchema": {"type": "object", "properties": properties, "required": required},
+        }
+
+    # 도구 실행
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a tool.
+
+        Upstream failures are returned as an error result (isError) so the agent can see them.
+
+        Args:
+            name: The tool name
+            arguments: The tool arguments
+
+        Returns:
+            The MCP tool result
+        """
+        tools = await self.get_tools()
+        tool = tools.get(name)
+        if tool is None:
+            raise MCPError(INVALID_PARAMS, f"Unknown tool: {name}")
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        try:
+            async with self._semaphore:
+                if name == BATCH_TOOL_NAME:
+                    paths = arguments.get("paths") or []
+                    if isinstance(paths, str):
+                        paths = [path.strip() for path in paths.split(",") if path.strip()]
+                    result = await self.client.batch(paths)
+                else:
+                    result = await self.client._make_request("get", *self._resolve(tool["path"], arguments))
+        except MCPError:
+            raise
+        except Exception as e:
+            return {"content": [{"type": "text", "text": f"Error calling {tool['path']}: {e}"}], "isError": True}
+        return {"content": [{"type": "text", "text": format_output(result, self.output_format)}], "isError": False}
+
+    @staticmethod
+    def _resolve(path: str, arguments: Dict[str, Any]):
+        for parameter in path_parameters(path):
+            if arguments.get(parameter) in (None, ""):
+                raise MCPError(INVALID_PARAMS, f"Missing required argument: {parameter}")
+            path = path.replace(f"{{{parameter}}}", quote(str(arguments[parameter]), safe=""))
+
+        params = dict(arguments.get("query") or {})
+        if arguments.get("fields"):
+            params["fields"] = arguments["fields"]
+        return path, params or None
+
+    # JSON-RPC 처리
+    async def handle_message(self, message: Any) -> Optional[Any]:
+        """
+        Handle one JSON-RPC message or batch.
+
+        Args:
+            message: The decoded JSON-RPC message
+
+        Returns:
+            The response (None for notifications and client responses)
+        """
+        if isinstance(message, list):
+            responses = await asyncio.gather(*(self.handle_message(item) for item in message))
+            return [response for response in responses if response is not None] or None
+        if not isinstance(message, dict) or "method" not in message:
+            if isinstance(message, dict) and ("result" in message or "error" in message):
+                return None
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+        if "id" not in message:
+            # notifications/initialized, notifications/cancelled 등 알림은 응답하지 않음
+            return None
+
+        handler = self._handlers.get(message["method"])
+        if handler is None:
+            return self._error(message["id"], METHOD_NOT_FOUND, f"Method not found: {message['method']}")
+        try:
+            result = await handler(message.get("params") or {})
+        except MCPError as e:
+            return self._error(message["id"], e.code, e.message)
+        except Exception as e:
+            return self._error(message["id"], INTERNAL_ERROR, str(e))
+        return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    async def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        requested = params.get("protocolVersion")
+        return {
+            "protocolVersion": requested if requested in PROTOCOL_VERSIONS else PROTOCOL_VERSIONS[0],
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": SERVER_INFO,
+        }
+
+    async def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+    async def _list_tools(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        tools = await self.get_tools()
+        return {"tools": [tool["schema"] for tool in tools.values()]}
+
+    async def _call_tool(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(params.get("name"), str):
+            raise MCPError(INVALID_PARAMS, "Tool name is required")
+        return await self.call_tool(params["name"], params.get("arguments") or {})
+
+    # stdio 전송
+    async def serve_stdio(self, reader: Optional[asyncio.StreamReader] = None,
+                          write: Optional[Callable[[bytes], None]] = None) -> None:
+        """
+        Serve newline-delimited JSON-RPC over stdin/stdout until stdin closes.
+
+        Each request is handled in its own task, so a slow tool call does not block the others.
+
+        Args:
+            reader: Input stream (default: stdin)
+            write: Output function (default: write and flush stdout)
+        """
+        if reader is None:
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader()
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        if write is None:
+            def write(data: bytes) -> None:
+                sys.stdout.buffer.write(data)
+                sys.stdout.buffer.flush()
+
+        def send(response: Any) -> None:
+            if response is not None:
+                write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+
+        async def respond(message: Any) -> None:
+            send(await self.handle_message(message))
+
+        pending = set()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                send(self._error(None, PARSE_ERROR, "Parse error"))
+                continue
+            task = asyncio.ensure_future(respond(message))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+def create_sse_app(server: OmniScopeMCPServer):
+    """
+    Create a Starlette app serving the MCP SSE transport.
+
+    GET /sse opens a session stream whose first 'endpoint' event gives the URL to POST
+    JSON-RPC messages to; responses are pushed back on the stream as 'message' events.
+
+    Args:
+        server: The MCP server shared by all sessions
+
+    Returns:
+        The Starlette application (requires the 'server' extra: starlette, uvicorn)
+    """
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response, StreamingResponse
+    from starlette.routing import Route
+
+    sessions: Dict[str, asyncio.Queue] = {}
+    pending = set()
+
+    async def sse(request: Request):
+        session_id = uuid.uuid4().hex
+        queue: asyncio.Queue = asyncio.Queue()
+        sessions[session_id] = queue
+
+        async def events():
+            try:
+                yield f"event: endpoint\ndata: {request.scope.get('root_path', '')}/messages?session_id={session_id}\n\n"
+                while True:
+                    try:
+                        message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        yield ": keepalive\n\n"
+                        continue
+                    yield f"event: message\ndata: {json.dumps(message, ensure_ascii=False)}\n\n"
+            finally:
+                sessions.pop(session_id, None)
+
+        return StreamingResponse(events(), media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    async def messages(request: Request):
+        queue = sessions.get(request.query_params.get("session_id", ""))
+        if queue is None:
+            return Response("Unknown session", status_code=404)
+        try:
+            message = json.loads(await request.body())
+        except ValueError:
+            return Response("Parse error", status_code=400)
+
+        async def respond():
+            response = await server.handle_message(message)
+            if response is not None:
+                await queue.put(response)
+
+        # 응답은 SSE 스트림으로 전달하고 POST는 바로 반환
+        task = asyncio.ensure_future(respond())
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        return Response("Accepted", status_code=202)
+
+    return Starlette(
+        routes=[Route("/sse", sse), Route("/messages", messages, methods=["POST"])],
+        on_shutdown=[server.client.aclose],
+    )
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Run the OmniScope MCP server (API key from OMNISCOPE_API_KEY_ID / OMNISCOPE_API_KEY_SECRET).
+    """
+    parser = argparse.ArgumentParser(description="OmniScope MCP server")
+    parser.add_argument("--transport", choices=("stdio", "sse"), default="stdio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--base-url", default=os.environ.get("OMNISCOPE_BASE_URL", "https://omniscope.sungwoonsong.com/api"))
+    parser.add_argument("--output-format", choices=("json", "table", "summary", "pretty"), default="json")
+    parser.add_argument("--max-concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    api_key_id = os.environ.get("OMNISCOPE_API_KEY_ID")
+    api_key_secret = os.environ.get("OMNISCOPE_API_KEY_SECRET")
+    if not api_key_id or not api_key_secret:
+        parser.error("OMNISCOPE_API_KEY_ID and OMNISCOPE_API_KEY_SECRET environment variables must be set")
+
+    client = AsyncOmniScopeClient(api_key_id, api_key_secret, args.base_url, cache=True)
+    server = OmniScopeMCPServer(client, args.output_format, args.max_concurrency)
+    if args.transport == "stdio":
+        async def run() -> None:
+            try:
+                await server.serve_stdio()
+            finally:
+                await client.aclose()
+        asyncio.run(run())
+    else:
+        import uvicorn
+        uvicorn.run(create_sse_app(server), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
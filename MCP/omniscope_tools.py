@@ -4,18 +4,84 @@ OmniScope LangChain Tools
 This module provides LangChain tools for interacting with the OmniScope API.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from langchain.tools import BaseTool, StructuredTool, Tool
 from pydantic import BaseModel, Field
 from omniscope_client import OmniScopeClient
+from omniscope_formats import OUTPUT_FORMATS, format_output
+import hashlib
 import json
+import os
+import threading
+
+# API 카탈로그 디스크 캐시 기본 디렉토리
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "omniscope")
+
+class CatalogCache:
+    """
+    On-disk copy of the API catalog together with its ETag.
+    """
+    
+    def __init__(self, path: Optional[str]):
+        """
+        Initialize the catalog cache.
+        
+        Args:
+            path: JSON file path (None disables the disk cache)
+        """
+        self.path = path
+    
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Load the cached catalog.
+        
+        Returns:
+            (catalog, etag), or (None, None) if nothing usable is cached
+        """
+        if not self.path or not os.path.exists(self.path):
+            return None, None
+        try:
+            with open(self.path, 'r') as f:
+                cached = json.load(f)
+            return cached['catalog'], cached.get('etag')
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading API catalog cache: {str(e)}")
+            return None, None
+    
+    def save(self, catalog: Dict[str, Any], etag: Optional[str]) -> None:
+        """
+        Atomically write the catalog and its ETag.
+        """
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'etag': etag, 'catalog': catalog}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error writing API catalog cache: {str(e)}")
+
+def default_catalog_cache_path(base_url: str) -> str:
+    """
+    Get the default catalog cache file for an API base URL.
+    """
+    digest = hashlib.sha1(base_url.encode()).hexdigest()[:12]
+    return os.path.join(os.environ.get("OMNISCOPE_CACHE_DIR", DEFAULT_CACHE_DIR), f"catalog-{digest}.json")
 
 class OmniScopeToolkit:
     """
     Toolkit for OmniScope API tools.
+    
+    Nothing is fetched at construction time. The API catalog is read from a disk cache
+    (revalidated with its ETag in the background) or fetched once on first use, and tool
+    objects are built on first use and reused afterwards.
     """
     
-    def __init__(self, api_key_id: str, api_key_secret: str, base_url: str = "https://omniscope.sungwoonsong.com"):
+    def __init__(self, api_key_id: str, api_key_secret: str, base_url: str = "https://omniscope.sungwoonsong.com",
+                 cache: bool = False, catalog_cache_path: Optional[str] = None, background_refresh: bool = True,
+                 output_format: str = "text"):
         """
         Initialize the OmniScope toolkit.
         
@@ -23,10 +89,83 @@ class OmniScopeToolkit:
             api_key_id: The API key ID
             api_key_secret: The API key secret
             base_url: The base URL for the OmniScope API (default: https://omniscope.sungwoonsong.com)
+            cache: Cache tool responses client-side (repeated calls within the server TTL are free)
+            catalog_cache_path: API catalog cache file (default: ~/.cache/omniscope/catalog-<hash>.json, '' disables it)
+            background_refresh: Revalidate a disk-cached catalog in a background thread instead of blocking
+            output_format: Tool output encoding: 'text' (readable prose, indented JSON for catalog tools),
+                'json' (compact JSON), 'table' (CSV-like) or 'summary' (first rows, truncated values)
         """
-        self.client = OmniScopeClient(api_key_id, api_key_secret, base_url)
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        self.client = OmniScopeClient(api_key_id, api_key_secret, base_url, cache=cache)
+        self.catalog_cache = CatalogCache(
+            default_catalog_cache_path(base_url) if catalog_cache_path is None else catalog_cache_path
+        )
+        self.background_refresh = background_refresh
         self._api_catalog = None
-        self._categories = None
+        self._catalog_etag = None
+        self._tools: Dict[str, BaseTool] = {}
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+    
+    def _load_catalog(self) -> Dict[str, Any]:
+        # 디스크 캐시가 있으면 즉시 사용하고 백그라운드에서 재검증, 없으면 한 번 동기 조회
+        if self._api_catalog is None:
+            catalog, etag = self.catalog_cache.load()
+            if catalog is not None:
+                self._api_catalog, self._catalog_etag = catalog, etag
+                if self.background_refresh:
+                    self._refresh_thread = threading.Thread(target=self.refresh_catalog, daemon=True)
+                    self._refresh_thread.start()
+                else:
+                    self.refresh_catalog()
+            else:
+                self.refresh_catalog()
+        return self._api_catalog or {'apis': []}
+    
+    def refresh_catalog(self) -> bool:
+        """
+        Revalidate the API catalog with the server (If-None-Match) and update the disk cache.
+        
+        Returns:
+            True if a new catalog was loaded, False if unchanged or unavailable
+        """
+        try:
+            catalog, etag = self.client.get_api_catalog_if_changed(self._catalog_etag)
+        except Exception as e:
+            print(f"Error fetching API catalog: {str(e)}")
+            return False
+        if catalog is None:
+            return False
+        
+        with self._lock:
+            self._api_catalog, self._catalog_etag = catalog, etag
+            # 카탈로그 기반 도구는 변경된 설명으로 다시 생성되도록 제거
+            self._tools = {key: tool for key, tool in self._tools.items() if not key.startswith('/')}
+        self.catalog_cache.save(catalog, etag)
+        return True
+    
+    def _get_or_create_tool(self, key: str, factory) -> BaseTool:
+        with self._lock:
+            tool = self._tools.get(key)
+        if tool is None:
+            tool = factory()
+            with self._lock:
+                tool = self._tools.setdefault(key, tool)
+        return tool
+    
+    def get_predefined_tools(self) -> List[BaseTool]:
+        """
+        Get the predefined OmniScope tools (no network access).
+        
+        Returns:
+            A list of LangChain tools
+        """
+        return [
+            self._get_or_create_tool(factory.__name__, lambda factory=factory: factory(self.client, self.output_format))
+            for factory in PREDEFINED_TOOL_FACTORIES
+        ]
         
     def get_tools(self) -> List[BaseTool]:
         """
@@ -36,22 +175,7 @@ class OmniScopeToolkit:
             A list of LangChain tools
         """
         # 기본 도구 목록
-        tools = [
-            get_btc_usd_tool(self.client),
-            get_btc_krw_tool(self.client),
-            get_usdt_krw_tool(self.client),
-            get_kimchi_premium_tool(self.client),
-            get_trump_posts_tool(self.client),
-            get_elon_posts_tool(self.client),
-            get_x_trends_tool(self.client),
-            get_funding_rates_tool(self.client),
-            get_open_interest_tool(self.client),
-            get_hsk_updates_tool(self.client),
-            get_ethereum_standards_tool(self.client),
-            get_solana_updates_tool(self.client),
-            get_bitcoin_activity_tool(self.client),
-            get_ethereum_activity_tool(self.client),
-        ]
+        tools = self.get_predefined_tools()
         
         # 동적으로 API 카탈로그에서 추가 도구 생성
         dynamic_tools = self.get_dynamic_tools()
@@ -67,30 +191,28 @@ class OmniScopeToolkit:
             A list of dynamically generated LangChain tools
         """
         try:
-            # API 카탈로그 가져오기
-            if self._api_catalog is None:
-                self._api_catalog = self.client.get_api_catalog()
-            
             tools = []
             
             # API 카탈로그에서 각 API에 대한 도구 생성
-            for api in self._api_catalog.get('apis', []):
+            for api in self._load_catalog().get('apis', []):
                 # 이미 기본 도구로 구현된 API는 건너뛰기
                 if self._is_predefined_api(api['path']):
                     continue
                 
-                # API 경로에서 도구 이름 생성
-                tool_name = self._generate_tool_name(api['path'])
-                
-                # 도구 생성
-                tool = self._create_dynamic_tool(api, tool_name)
-                tools.append(tool)
+                tools.append(self._get_catalog_tool(api))
             
             return tools
         except Exception as e:
             print(f"Error generating dynamic tools: {str(e)}")
             return []
     
+    def _get_catalog_tool(self, api: Dict[str, Any]) -> BaseTool:
+        # API 경로에서 도구 이름 생성 후 최초 사용 시에만 도구 생성
+        return self._get_or_create_tool(
+            api['path'],
+            lambda: self._create_dynamic_tool(api, self._generate_tool_name(api['path']))
+        )
+    
     def _is_predefined_api(self, path: str) -> bool:
         """
         Check if the API is already implemented as a predefined tool.
@@ -108,11 +230,11 @@ class OmniScopeToolkit:
             '/crypto/kimchi-premium',
             '/social/trump',
             '/social/elon',
-            '/social/x-trends',
+            '/social/x/trends',
             '/derivatives/funding-rates',
             '/derivatives/open-interest',
             '/projects/hsk',
-            '/projects/ethereum-standards',
+            '/projects/ethereum/standards',
             '/projects/solana',
             '/opensource/bitcoin',
             '/opensource/ethereum'
@@ -149,17 +271,26 @@ class OmniScopeToolkit:
         summary = api.get('summary', f"Get data from {path}")
         description = api.get('description', summary)
         
-        def _run() -> str:
+        output_format = "pretty" if self.output_format == "text" else self.output_format
+        
+        def _run(fields: str = "") -> str:
             try:
-                result = self.client._make_request(method, path)
-                return json.dumps(result, indent=2)
+                # 필드 선택은 서버에서 적용 (fields=), 전송량과 응답 토큰 모두 감소
+                fields = fields.strip()
+                params = {'fields': fields} if fields and method == 'get' else None
+                result = self.client._make_request(method, path, params=params)
+                return format_output(result, output_format)
             except Exception as e:
                 return f"Error calling {path}: {str(e)}"
         
         return Tool.from_function(
             func=_run,
             name=tool_name,
-            description=f"{summary}. {description}",
+            description=(
+                f"{summary}. {description} "
+                "Optional input: comma-separated fields to return (dot notation for nested fields, "
+                "e.g. 'price,timestamp' or 'pull_requests.title')."
+            ),
         )
     
     def get_categories(self) -> List[str]:
@@ -170,10 +301,7 @@ class OmniScopeToolkit:
             A list of API categories
         """
         try:
-            if self._categories is None:
-                result = self.client.get_categories()
-                self._categories = result.get('categories', [])
-            return self._categories
+            return sorted({api['category'] for api in self._load_catalog().get('apis', [])})
         except Exception as e:
             print(f"Error fetching API categories: {str(e)}")
             return []
@@ -189,33 +317,27 @@ class OmniScopeToolkit:
             A list of LangChain tools for the category
         """
         try:
-            # 카테고리별 API 목록 가져오기
-            api_catalog = self.client.get_api_catalog(category=category)
-            
-            tools = []
-            
-            # 카테고리의 각 API에 대한 도구 생성
-            for api in api_catalog.get('apis', []):
-                # API 경로에서 도구 이름 생성
-                tool_name = self._generate_tool_name(api['path'])
-                
-                # 도구 생성
-                tool = self._create_dynamic_tool(api, tool_name)
-                tools.append(tool)
-            
-            return tools
+            # 로드된 카탈로그에서 카테고리별 API 선택 (추가 네트워크 호출 없음)
+            category = category.lower()
+            return [
+                self._get_catalog_tool(api)
+                for api in self._load_catalog().get('apis', [])
+                if api.get('category', '').lower() == category
+            ]
         except Exception as e:
             print(f"Error generating tools for category {category}: {str(e)}")
             return []
 
 
 # Tool Definitions for Cryptocurrency Data
-def get_btc_usd_tool(client: OmniScopeClient) -> BaseTool:
+def get_btc_usd_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting BTC/USD price."""
     
     def _run() -> str:
         try:
             result = client.get_btc_usd()
+            if output_format != "text":
+                return format_output(result, output_format)
             return f"Current price of BTC is {result['price']} USD. Last updated: {result['timestamp']}"
         except Exception as e:
             return f"Error fetching BTC/USD price: {str(e)}"
@@ -226,12 +348,14 @@ def get_btc_usd_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the current BTC price in USD from Binance.",
     )
 
-def get_btc_krw_tool(client: OmniScopeClient) -> BaseTool:
+def get_btc_krw_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting BTC/KRW price."""
     
     def _run() -> str:
         try:
             result = client.get_btc_krw()
+            if output_format != "text":
+                return format_output(result, output_format)
             return f"Current price of BTC is {result['price']} KRW. Last updated: {result['timestamp']}"
         except Exception as e:
             return f"Error fetching BTC/KRW price: {str(e)}"
@@ -242,12 +366,14 @@ def get_btc_krw_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the current BTC price in KRW from Upbit.",
     )
 
-def get_usdt_krw_tool(client: OmniScopeClient) -> BaseTool:
+def get_usdt_krw_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting USDT/KRW price."""
     
     def _run() -> str:
         try:
             result = client.get_usdt_krw()
+            if output_format != "text":
+                return format_output(result, output_format)
             return f"Current price of USDT is {result['price']} KRW. Last updated: {result['timestamp']}"
         except Exception as e:
             return f"Error fetching USDT/KRW price: {str(e)}"
@@ -258,12 +384,14 @@ def get_usdt_krw_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the current USDT price in KRW from Upbit.",
     )
 
-def get_kimchi_premium_tool(client: OmniScopeClient) -> BaseTool:
+def get_kimchi_premium_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Kimchi Premium."""
     
     def _run() -> str:
         try:
             result = client.get_kimchi_premium()
+            if output_format != "text":
+                return format_output(result, output_format)
             return f"Current Kimchi Premium is {result['premium']}%. BTC/USD: ${result['btc_usd']}, BTC/KRW: ₩{result['btc_krw']}, USDT/KRW: ₩{result['usdt_krw']}. Last updated: {result['timestamp']}"
         except Exception as e:
             return f"Error fetching Kimchi Premium: {str(e)}"
@@ -275,12 +403,14 @@ def get_kimchi_premium_tool(client: OmniScopeClient) -> BaseTool:
     )
 
 # Tool Definitions for Social Media
-def get_trump_posts_tool(client: OmniScopeClient) -> BaseTool:
+def get_trump_posts_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Trump's latest posts."""
     
     def _run() -> str:
         try:
             result = client.get_trump_posts()
+            if output_format != "text":
+                return format_output(result, output_format)
             posts = result.get('posts', [])
             if not posts:
                 return "No recent posts from Donald Trump."
@@ -299,12 +429,14 @@ def get_trump_posts_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the latest posts from Donald Trump on social media.",
     )
 
-def get_elon_posts_tool(client: OmniScopeClient) -> BaseTool:
+def get_elon_posts_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Elon Musk's latest posts."""
     
     def _run() -> str:
         try:
             result = client.get_elon_posts()
+            if output_format != "text":
+                return format_output(result, output_format)
             posts = result.get('posts', [])
             if not posts:
                 return "No recent posts from Elon Musk."
@@ -323,12 +455,14 @@ def get_elon_posts_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the latest posts from Elon Musk on social media.",
     )
 
-def get_x_trends_tool(client: OmniScopeClient) -> BaseTool:
+def get_x_trends_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting X (Twitter) trends."""
     
     def _run() -> str:
         try:
             result = client.get_x_trends()
+            if output_format != "text":
+                return format_output(result, output_format)
             trends = result.get('trends', [])
             if not trends:
                 return "No trending topics available."
@@ -348,12 +482,14 @@ def get_x_trends_tool(client: OmniScopeClient) -> BaseTool:
     )
 
 # Tool Definitions for Derivatives Market
-def get_funding_rates_tool(client: OmniScopeClient) -> BaseTool:
+def get_funding_rates_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting funding rates."""
     
     def _run() -> str:
         try:
             result = client.get_funding_rates()
+            if output_format != "text":
+                return format_output(result, output_format)
             rates = result.get('funding_rates', [])
             if not rates:
                 return "No funding rate data available."
@@ -372,12 +508,14 @@ def get_funding_rates_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the current funding rates for cryptocurrency futures.",
     )
 
-def get_open_interest_tool(client: OmniScopeClient) -> BaseTool:
+def get_open_interest_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting open interest data."""
     
     def _run() -> str:
         try:
             result = client.get_open_interest()
+            if output_format != "text":
+                return format_output(result, output_format)
             data = result.get('open_interest', [])
             if not data:
                 return "No open interest data available."
@@ -398,12 +536,14 @@ def get_open_interest_tool(client: OmniScopeClient) -> BaseTool:
     )
 
 # Tool Definitions for Blockchain Projects
-def get_hsk_updates_tool(client: OmniScopeClient) -> BaseTool:
+def get_hsk_updates_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting HashKey Chain updates."""
     
     def _run() -> str:
         try:
             result = client.get_hsk_updates()
+            if output_format != "text":
+                return format_output(result, output_format)
             updates = result.get('updates', [])
             if not updates:
                 return "No recent updates from HashKey Chain."
@@ -423,12 +563,14 @@ def get_hsk_updates_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the latest updates from HashKey Chain.",
     )
 
-def get_ethereum_standards_tool(client: OmniScopeClient) -> BaseTool:
+def get_ethereum_standards_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Ethereum standards information."""
     
     def _run() -> str:
         try:
             result = client.get_ethereum_standards()
+            if output_format != "text":
+                return format_output(result, output_format)
             standards = result.get('standards', [])
             if not standards:
                 return "No Ethereum standards information available."
@@ -449,12 +591,14 @@ def get_ethereum_standards_tool(client: OmniScopeClient) -> BaseTool:
         description="Get information about Ethereum standards and proposals.",
     )
 
-def get_solana_updates_tool(client: OmniScopeClient) -> BaseTool:
+def get_solana_updates_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Solana updates."""
     
     def _run() -> str:
         try:
             result = client.get_solana_updates()
+            if output_format != "text":
+                return format_output(result, output_format)
             updates = result.get('updates', [])
             if not updates:
                 return "No recent updates from Solana blockchain."
@@ -475,12 +619,14 @@ def get_solana_updates_tool(client: OmniScopeClient) -> BaseTool:
     )
 
 # Tool Definitions for Open Source
-def get_bitcoin_activity_tool(client: OmniScopeClient) -> BaseTool:
+def get_bitcoin_activity_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Bitcoin Core repository activity."""
     
     def _run() -> str:
         try:
             result = client.get_bitcoin_activity()
+            if output_format != "text":
+                return format_output(result, output_format)
             commits = result.get('commits', [])
             prs = result.get('pull_requests', [])
             issues = result.get('issues', [])
@@ -517,12 +663,14 @@ def get_bitcoin_activity_tool(client: OmniScopeClient) -> BaseTool:
         description="Get the latest activities from Bitcoin Core repository.",
     )
 
-def get_ethereum_activity_tool(client: OmniScopeClient) -> BaseTool:
+def get_ethereum_activity_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
     """Create a tool for getting Ethereum Core repositories activity."""
     
     def _run() -> str:
         try:
             result = client.get_ethereum_activity()
+            if output_format != "text":
+                return format_output(result, output_format)
             repos = result.get('repositories', [])
             
             if not repos:
@@ -556,3 +704,47 @@ def get_ethereum_activity_tool(client: OmniScopeClient) -> BaseTool:
         name="get_ethereum_activity",
         description="Get the latest activities from Ethereum Core repositories.",
     )
+
+# Tool Definitions for Batch Calls
+def get_batch_tool(client: OmniScopeClient, output_format: str = "text") -> BaseTool:
+    """Create a tool for calling several OmniScope APIs at once."""
+    
+    def _run(paths: str) -> str:
+        try:
+            requests = [path.strip() for path in paths.replace('\n', ',').split(',') if path.strip()]
+            if not requests:
+                return "No API paths given. Pass a comma-separated list such as /crypto/btc/usd, /derivatives/funding-rates"
+            
+            result = client.batch(requests)
+            return format_output(result, "pretty" if output_format == "text" else output_format)
+        except Exception as e:
+            return f"Error calling OmniScope batch API: {str(e)}"
+    
+    return Tool.from_function(
+        func=_run,
+        name="omniscope_batch",
+        description=(
+            "Fetch several OmniScope data APIs in one call. Input is a comma-separated list of API paths "
+            "(query strings allowed), e.g. '/crypto/btc/usd, /crypto/kimchi-premium, /derivatives/funding-rates'. "
+            "Prefer this over calling several tools one after another."
+        ),
+    )
+
+# 기본 도구 생성 함수 (OmniScopeToolkit.get_predefined_tools에서 최초 사용 시 생성)
+PREDEFINED_TOOL_FACTORIES = [
+    get_btc_usd_tool,
+    get_btc_krw_tool,
+    get_usdt_krw_tool,
+    get_kimchi_premium_tool,
+    get_trump_posts_tool,
+    get_elon_posts_tool,
+    get_x_trends_tool,
+    get_funding_rates_tool,
+    get_open_interest_tool,
+    get_hsk_updates_tool,
+    get_ethereum_standards_tool,
+    get_solana_updates_tool,
+    get_bitcoin_activity_tool,
+    get_ethereum_activity_tool,
+    get_batch_tool,
+]
@@ -13,10 +13,14 @@ setup(
         "langchain-core>=0.0.10",
         "langchain-community>=0.0.1",
         "requests>=2.28.0",
+        "httpx>=0.23.0",
         "python-dotenv>=0.21.0",
         "openai>=0.27.0",
         "pydantic>=1.10.0",
     ],
+    extras_require={
+        "server": ["starlette>=0.27.0", "uvicorn>=0.23.0"],
+    },
     author="OmniScope Team",
     author_email="contact@omniscope.ai",
     description="OmniScope Model Context Protocol - LangChain Tool Integration",
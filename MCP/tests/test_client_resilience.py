@@ -0,0 +1,98 @@
+import json
+import os
+import sys
+
+import pytest
+import requests
+
+# MCP 패키지 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_client import (CircuitBreaker, CircuitOpenError, DeadlineExceededError, OmniScopeAPIError,
+                              OmniScopeClient, RetryPolicy)
+
+ENDPOINT = "/crypto/btc/usd"
+
+def make_response(status_code, content):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content if isinstance(content, bytes) else json.dumps(content).encode()
+    return response
+
+class ScriptedSession:
+    """준비된 응답을 반환하거나 예외를 발생시키는 세션"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.headers = {}
+
+    def _next(self, *args, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    get = post = _next
+
+def make_client(outcomes, clock, max_attempts=1):
+    client = OmniScopeClient("id", "secret", retry_policy=RetryPolicy(max_attempts=max_attempts, backoff_base=0))
+    client.session = ScriptedSession(outcomes)
+    client._breakers[ENDPOINT] = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=lambda: clock[0])
+    return client
+
+def test_half_open_trial_is_released_on_every_exit():
+    """half-open 시험 요청이 비연결 오류, 잘못된 JSON, 기한 초과 후에도 해제되어 회로가 복구되는지 테스트"""
+    clock = [0.0]
+    client = make_client([
+        requests.exceptions.ChunkedEncodingError("connection broken"),
+        make_response(200, b"<html>maintenance</html>"),
+        make_response(200, {"price": 65000.0}),
+    ], clock)
+    breaker = client._breakers[ENDPOINT]
+
+    # 연결 오류가 아닌 RequestException도 실패로 기록되어 회로가 열림
+    with pytest.raises(OmniScopeAPIError):
+        client.get_btc_usd()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        client.get_btc_usd()
+
+    # 기한이 이미 지났으면 시험 요청 자격을 쓰지 않고 실패
+    clock[0] = 30.0
+    with client.deadline(0):
+        with pytest.raises(DeadlineExceededError):
+            client.get_btc_usd()
+    assert breaker.state == "half-open" and not breaker._trial_in_flight
+
+    # JSON이 아닌 200 응답은 시험 실패로 기록되고 다시 열림
+    with pytest.raises(OmniScopeAPIError, match="invalid JSON"):
+        client.get_btc_usd()
+    assert breaker.state == "open" and not breaker._trial_in_flight
+
+    clock[0] = 60.0
+    assert client.get_btc_usd() == {"price": 65000.0}
+    assert breaker.state == "closed" and client.session.calls == 3
+
+def test_retries_transient_failures_but_not_client_errors_or_posts():
+    """연결 오류/5xx 재시도, 4xx 즉시 실패 및 POST 네트워크 오류 미재시도 테스트"""
+    clock = [0.0]
+    client = make_client([
+        requests.exceptions.ConnectionError("reset"),
+        make_response(503, {"detail": "upstream down"}),
+        make_response(200, {"price": 65000.0}),
+        make_response(404, {"detail": "not found"}),
+        requests.exceptions.ConnectionError("reset"),
+    ], clock, max_attempts=3)
+    client._breakers[ENDPOINT].failure_threshold = 5
+
+    assert client.get_btc_usd() == {"price": 65000.0}
+    with pytest.raises(OmniScopeAPIError) as error:
+        client.get_btc_usd()
+    assert error.value.status_code == 404
+    assert client._breakers[ENDPOINT].failures == 0
+
+    with pytest.raises(OmniScopeAPIError):
+        client._make_request("post", "/batch", data={"requests": []})
+    assert client.session.calls == 5
@@ -0,0 +1,45 @@
+import json
+import os
+import sys
+
+import pytest
+
+# MCP 패키지 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_formats import format_output
+
+ACTIVITY = {
+    "repository": "bitcoin/bitcoin",
+    "stats": {"stars": 10, "forks": 2},
+    "pull_requests": [
+        {"number": n, "title": f"PR {n}\nsecond line", "labels": ["p2p"], "user": {"login": "dev"}}
+        for n in range(1, 8)
+    ],
+}
+
+def test_json_and_projection():
+    """compact/pretty JSON 출력과 fields 프로젝션 테스트"""
+    assert format_output(ACTIVITY, "json", fields="stats.stars") == '{"stats":{"stars":10}}'
+    assert format_output({"name": "비트코인"}, "text") == '{"name":"비트코인"}'
+    assert json.loads(format_output(ACTIVITY, "pretty")) == ACTIVITY
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        format_output(ACTIVITY, "xml")
+
+def test_table_and_summary():
+    """table 형식의 스칼라 행/레코드 섹션과 summary 형식의 행/폭 제한 테스트"""
+    lines = format_output(ACTIVITY, "table", fields="repository,stats,pull_requests.number,pull_requests.user").splitlines()
+    assert lines[:4] == [
+        "repository,stats.stars,stats.forks",
+        "bitcoin/bitcoin,10,2",
+        "# pull_requests (7 rows)",
+        "number,user.login",
+    ]
+    assert lines[4] == "1,dev" and len(lines) == 11
+
+    summary = format_output({"items": [{"text": "x" * 500, "tags": ["a", "b"]}] * 9}, "summary").splitlines()
+    assert summary[0] == "# items (5 of 9 rows)"
+    assert summary[1] == "text,tags"
+    assert len(summary) == 7
+    assert summary[2].startswith("x" * 119 + "…,")
+    assert summary[2].endswith('"[""a"",""b""]"')
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+
+# MCP 패키지 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_async_client import AsyncOmniScopeClient
+from omniscope_client import OmniScopeAPIError
+from omniscope_mcp_server import (BATCH_TOOL_NAME, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR,
+                                  OmniScopeMCPServer)
+
+CATALOG = {"apis": [
+    {"path": "/crypto/btc/usd", "method": "GET", "summary": "BTC/USD", "category": "crypto"},
+    {"path": "/opensource/{repo}", "method": "GET", "summary": "Repository activity", "category": "opensource"},
+    {"path": "/batch", "method": "POST", "summary": "Batch", "category": "batch"},
+]}
+
+def make_server(requests, delay=0):
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(delay)
+        if request.url.path.endswith("/api-catalog/list"):
+            return httpx.Response(200, json=CATALOG)
+        if request.url.path.endswith("/opensource/missing"):
+            return httpx.Response(404, json={"detail": "Repository not tracked"})
+        return httpx.Response(200, json={"price": 65000.0, "stats": {"stars": 10, "forks": 2}})
+
+    client = AsyncOmniScopeClient("hsk", "sk", "http://test.invalid/api", transport=httpx.MockTransport(handler))
+    return OmniScopeMCPServer(client)
+
+def call(name, arguments=None, request_id=1):
+    return {"jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": name, "arguments": arguments or {}}}
+
+def test_initialize_list_and_call_tools():
+    """initialize 버전 협상, tools/list 카탈로그 변환, tools/call 결과 및 업스트림 오류 결과 테스트"""
+    requests = []
+
+    async def run():
+        server = make_server(requests)
+        initialized = await server.handle_message({"jsonrpc": "2.0", "id": 0, "method": "initialize",
+                                                   "params": {"protocolVersion": "2025-03-26"}})
+        fallback = await server.handle_message({"jsonrpc": "2.0", "id": 1, "method": "initialize",
+                                               "params": {"protocolVersion": "1999-01-01"}})
+        listed = await server.handle_message({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+        price = await server.handle_message(call("get_crypto_btc_usd"))
+        projected = await server.handle_message(call("get_opensource_repo", {"repo": "bitcoin", "fields": "stats.stars"}))
+        missing = await server.handle_message(call("get_opensource_repo", {"repo": "missing"}))
+        await server.client.aclose()
+        return initialized, fallback, listed, price, projected, missing
+
+    initialized, fallback, listed, price, projected, missing = asyncio.run(run())
+    assert initialized["result"]["protocolVersion"] == "2025-03-26"
+    assert initialized["result"]["serverInfo"]["name"] == "omniscope"
+    assert fallback["result"]["protocolVersion"] == "2024-11-05"
+
+    tools = {tool["name"]: tool for tool in listed["result"]["tools"]}
+    assert set(tools) == {"get_crypto_btc_usd", "get_opensource_repo", BATCH_TOOL_NAME}
+    assert tools["get_opensource_repo"]["inputSchema"]["required"] == ["repo"]
+
+    assert price["result"] == {"content": [{"type": "text", "text": '{"price":65000.0,"stats":{"stars":10,"forks":2}}'}],
+                               "isError": False}
+    assert json.loads(projected["result"]["content"][0]["text"]) == {"price": 65000.0, "stats": {"stars": 10, "forks": 2}}
+    assert requests[2].url.params["fields"] == "stats.stars"
+    assert missing["result"]["isError"] is True
+    assert "Repository not tracked" in missing["result"]["content"][0]["text"]
+    # 카탈로그는 한 번만 조회
+    assert sum(request.url.path.endswith("/api-catalog/list") for request in requests) == 1
+
+def test_json_rpc_error_codes():
+    """잘못된 요청, 없는 메서드/도구, 누락된 인자, 알림, 배치 메시지 및 파싱 오류 응답 테스트"""
+    requests = []
+
+    async def run():
+        server = make_server(requests)
+        responses = [
+            await server.handle_message({"jsonrpc": "2.0", "id": 1}),
+            await server.handle_message("not an object"),
+            await server.handle_message({"jsonrpc": "2.0", "id": 2, "method": "resources/list"}),
+            await server.handle_message(call("get_unknown", request_id=3)),
+            await server.handle_message(call("get_opensource_repo", request_id=4)),
+            await server.handle_message({"jsonrpc": "2.0", "id": 5, "method": "tools/call", "params": {}}),
+        ]
+        notification = await server.handle_message({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        batch = await server.handle_message([
+            {"jsonrpc": "2.0", "id": 6, "method": "ping"},
+            {"jsonrpc": "2.0", "method": "notifications/cancelled"},
+        ])
+
+        # stdio 전송: 파싱 오류도 응답하고 다음 줄을 계속 처리
+        reader = asyncio.StreamReader()
+        reader.feed_data(b'{broken\n\n{"jsonrpc": "2.0", "id": 7, "method": "ping"}\n')
+        reader.feed_eof()
+        written = []
+        await server.serve_stdio(reader, written.append)
+        await server.client.aclose()
+        return responses, notification, batch, [json.loads(line) for line in written]
+
+    responses, notification, batch, stdio = asyncio.run(run())
+    codes = [(response["id"], response["error"]["code"]) for response in responses]
+    assert codes == [(None, INVALID_REQUEST), (None, INVALID_REQUEST), (2, METHOD_NOT_FOUND), (3, INVALID_PARAMS),
+                     (4, INVALID_PARAMS), (5, INVALID_PARAMS)]
+    assert "Missing required argument: repo" in responses[4]["error"]["message"]
+    assert notification is None
+    assert batch == [{"jsonrpc": "2.0", "id": 6, "result": {}}]
+    assert stdio == [{"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "Parse error"}},
+                     {"jsonrpc": "2.0", "id": 7, "result": {}}]
+
+def test_inflight_requests_merge_only_with_same_timeout():
+    """동시에 들어온 같은 GET 요청은 같은 timeout일 때만 한 번의 업스트림 호출을 공유하는지 테스트"""
+    requests = []
+
+    async def run():
+        server = make_server(requests, delay=0.05)
+        client = server.client
+        results = await asyncio.gather(
+            client.get_btc_usd(), client.get_btc_usd(), client.get_btc_usd(timeout=1.0),
+        )
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert all(result["price"] == 65000.0 for result in results)
+    assert [request.extensions["timeout"]["read"] for request in requests] == [30.0, 1.0]
+
+def test_async_client_raises_api_error():
+    """비동기 클라이언트가 동기 클라이언트와 같은 OmniScopeAPIError(상태 코드, Retry-After)를 던지는지 테스트"""
+    def handler(request):
+        if request.url.path.endswith("/crypto/btc/usd"):
+            return httpx.Response(429, json={"detail": "Rate limit exceeded"}, headers={"Retry-After": "12"})
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def run():
+        client = AsyncOmniScopeClient("hsk", "sk", "http://test.invalid/api", transport=httpx.MockTransport(handler))
+        errors = await client.fetch_many(["get_btc_usd", "get_btc_krw"], return_exceptions=True)
+        await client.aclose()
+        return errors
+
+    limited, unreachable = asyncio.run(run())
+    assert isinstance(limited, OmniScopeAPIError) and isinstance(unreachable, OmniScopeAPIError)
+    assert str(limited) == "OmniScope API error: Rate limit exceeded"
+    assert (limited.status_code, limited.retry_after) == (429, 12.0)
+    assert unreachable.status_code is None
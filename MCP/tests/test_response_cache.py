@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+
+import requests
+
+# MCP 패키지 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from omniscope_client import OmniScopeClient, ResponseCache
+
+def make_response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if body is None else json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+class FakeSession:
+    """요청 헤더를 기록하고 준비된 응답을 순서대로 반환하는 세션"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+        self.headers = {}
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent_headers.append(headers or {})
+        return self.responses.pop(0)
+
+def test_cache_freshness_eviction_and_no_store():
+    """Cache-Control max-age 만료, no-store, LRU 제거 테스트"""
+    clock = [0.0]
+    cache = ResponseCache(max_entries=2, clock=lambda: clock[0])
+    first, second, third = (ResponseCache.make_key(f"https://api/{n}") for n in ("a", "b", "c"))
+
+    cache.store(first, {"v": 1}, {"Cache-Control": "private, max-age=5", "ETag": 'W/"a"'})
+    body, _ = cache.lookup(first)
+    body["v"] = 99  # 반환값을 바꿔도 캐시에는 영향 없음
+    assert cache.lookup(first) == ({"v": 1}, None)
+    clock[0] = 5.0
+    assert cache.lookup(first) == (None, 'W/"a"')
+    assert cache.revalidated(first, {"Cache-Control": "max-age=5"}) == {"v": 1}
+    assert cache.lookup(first) == ({"v": 1}, None)
+
+    cache.store(second, {"v": 2}, {"Cache-Control": "no-store", "ETag": 'W/"b"'})
+    assert cache.lookup(second) == (None, None)
+    cache.store(second, {"v": 2}, {"Cache-Control": "max-age=60"})
+    cache.store(third, {"v": 3}, {"Cache-Control": "max-age=60"})
+    assert cache.lookup(first) == (None, None)
+    assert cache.stats()["size"] == 2
+
+def test_client_revalidates_stale_entries_with_etag():
+    """클라이언트가 신선한 응답은 요청 없이, 만료된 응답은 If-None-Match로 재검증하는지 테스트"""
+    clock = [0.0]
+    client = OmniScopeClient("id", "secret", cache=ResponseCache(clock=lambda: clock[0]))
+    client.session = FakeSession([
+        make_response(200, {"price": 65000.0}, {"Cache-Control": "private, max-age=5", "ETag": 'W/"p1"'}),
+        make_response(304, headers={"Cache-Control": "private, max-age=5", "ETag": 'W/"p1"'}),
+        make_response(200, {"price": 66000.0}, {"Cache-Control": "private, max-age=5", "ETag": 'W/"p2"'}),
+    ])
+
+    assert client.get_btc_usd() == {"price": 65000.0}
+    assert client.get_btc_usd() == {"price": 65000.0}
+    clock[0] = 6.0
+    assert client.get_btc_usd() == {"price": 65000.0}
+    clock[0] = 12.0
+    assert client.get_btc_usd() == {"price": 66000.0}
+
+    assert client.session.sent_headers == [{}, {"If-None-Match": 'W/"p1"'}, {"If-None-Match": 'W/"p1"'}]
+    assert client.cache_stats()["hits"] == 1 and client.cache_stats()["revalidations"] == 1
@@ -0,0 +1,17 @@
+# 서버 측 알림 패키지
+# 수집된 시계열 값으로 알림 규칙을 평가하고 웹훅으로 전달함
+
+import os
+
+from app.alerts.engine import ALERT_CONDITIONS, ALERT_METRICS, ALERT_RULE_TOPIC, Alert, AlertEngine, ThresholdIndex, alert_stream
+from app.alerts.webhooks import WebhookDispatcher, check_webhook_url, sign_payload
+
+# ALERT_WEBHOOK_ALLOW_PRIVATE=true는 로컬 개발용 (사설/루프백 주소로의 웹훅 허용)
+alert_engine = AlertEngine(WebhookDispatcher(
+    max_attempts=int(os.getenv("ALERT_WEBHOOK_MAX_ATTEMPTS", "5")),
+    timeout=float(os.getenv("ALERT_WEBHOOK_TIMEOUT", "5")),
+    allow_private=os.getenv("ALERT_WEBHOOK_ALLOW_PRIVATE", "false").lower() in ("1", "true", "yes"),
+))
+
+__all__ = ["ALERT_CONDITIONS", "ALERT_METRICS", "ALERT_RULE_TOPIC", "Alert", "AlertEngine", "ThresholdIndex", "WebhookDispatcher",
+           "alert_engine", "alert_stream", "check_webhook_url", "sign_payload"]
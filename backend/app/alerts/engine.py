@@ -0,0 +1,288 @@
+"""
+서버 측 가격 알림 엔진
+
+수집된 시계열 값(가격, 김치 프리미엄, 펀딩비)이 들어올 때마다 직전 값과 비교해
+그 사이를 지난 임계값의 규칙만 찾아 웹훅으로 알립니다.
+규칙은 스트림별로 임계값 기준 정렬 배열에 색인되어 있어, 값 하나를 평가하는 비용은
+전체 규칙 수가 아니라 이진 탐색과 실제로 발동한 규칙 수에 비례합니다.
+"""
+
+import bisect
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.alerts.webhooks import WebhookDispatcher
+
+ALERT_METRICS = ("price", "premium", "funding_rate")
+ALERT_CONDITIONS = ("above", "below", "crosses", "flips_sign")
+
+# 가격 알림 거래소 -> 김치 프리미엄 이력의 가격 시계열
+PRICE_SERIES = {"binance": "binance_price_usd", "upbit": "upbit_price_krw"}
+
+# 규칙 등록/삭제 이벤트 토픽 (다른 워커 프로세스의 엔진에 전파)
+ALERT_RULE_TOPIC = "alerts.rules"
+
+
+def alert_stream(metric: str, symbol: str, exchange: Optional[str] = None) -> str:
+    """
+    Stream a rule listens to (e.g., 'price:upbit:BTC', 'premium:ETH', 'funding_rate:binance:BTC')
+
+    Args:
+        metric: One of ALERT_METRICS
+        symbol: Base asset (e.g., 'BTC'; 'BTC/USDT' is accepted for funding rates)
+        exchange: 'binance' or 'upbit' for prices (defaults to binance), the derivatives exchange for funding rates
+
+    Raises:
+        ValueError: On an unsupported metric or exchange
+    """
+    symbol = symbol.strip().upper().split("/")[0]
+    if not symbol:
+        raise ValueError("Symbol is required")
+    if metric == "premium":
+        return f"premium:{symbol}"
+    if metric == "price":
+        exchange = (exchange or "binance").lower()
+        if exchange not in PRICE_SERIES:
+            raise ValueError(f"Unsupported price exchange: {exchange} (use {' or '.join(PRICE_SERIES)})")
+        return f"price:{exchange}:{symbol}"
+    if metric == "funding_rate":
+        if not exchange:
+            raise ValueError("Funding rate alerts need an exchange (e.g. binance, bybit, okx, deribit)")
+        return f"funding_rate:{exchange.lower()}:{symbol}"
+    raise ValueError(f"Unsupported metric: {metric} (use {', '.join(ALERT_METRICS)})")
+
+
+def series_stream(key: Tuple[str, ...]) -> Optional[str]:
+    """
+    Map a recorded time series key to its alert stream, None for series without alerts
+
+    Premium history keys are (metric, symbol); derivatives keys are (metric, exchange, 'BTC/USDT').
+    """
+    if len(key) == 2 and key[0] == "premium_percentage":
+        return f"premium:{key[1].upper()}"
+    if len(key) == 2 and key[0] in PRICE_SERIES.values():
+        exchange = next(name for name, series in PRICE_SERIES.items() if series == key[0])
+        return f"price:{exchange}:{key[1].upper()}"
+    if len(key) == 3 and key[0] == "funding_rate":
+        return f"funding_rate:{key[1].lower()}:{key[2].upper().split('/')[0]}"
+    return None
+
+
+class ThresholdIndex:
+    """
+    Rule ids per stream, sorted by threshold, separately for rising and falling crossings
+
+    `crossed(stream, previous, value)` returns the rules whose threshold lies in
+    (previous, value] when the value rises, or in [value, previous) when it falls.
+    """
+
+    def __init__(self):
+        # stream -> (정렬된 임계값, 같은 순서의 규칙 ID)
+        self._rising: Dict[str, Tuple[List[float], List[int]]] = {}
+        self._falling: Dict[str, Tuple[List[float], List[int]]] = {}
+
+    @staticmethod
+    def _insert(side: Dict[str, Tuple[List[float], List[int]]], stream: str, threshold: float, rule_id: int):
+        thresholds, ids = side.setdefault(stream, ([], []))
+        position = bisect.bisect_right(thresholds, threshold)
+        thresholds.insert(position, threshold)
+        ids.insert(position, rule_id)
+
+    @staticmethod
+    def _delete(side: Dict[str, Tuple[List[float], List[int]]], stream: str, threshold: float, rule_id: int):
+        thresholds, ids = side.get(stream, ([], []))
+        for position in range(bisect.bisect_left(thresholds, threshold), bisect.bisect_right(thresholds, threshold)):
+            if ids[position] == rule_id:
+                del thresholds[position], ids[position]
+                break
+        if stream in side and not thresholds:
+            del side[stream]
+
+    def add(self, stream: str, threshold: float, rule_id: int, rising: bool, falling: bool):
+        if rising:
+            self._insert(self._rising, stream, threshold, rule_id)
+        if falling:
+            self._insert(self._falling, stream, threshold, rule_id)
+
+    def remove(self, stream: str, threshold: float, rule_id: int):
+        self._delete(self._rising, stream, threshold, rule_id)
+        self._delete(self._falling, stream, threshold, rule_id)
+
+    def crossed(self, stream: str, previous: float, value: float) -> List[int]:
+        if value > previous and stream in self._rising:
+            thresholds, ids = self._rising[stream]
+            return ids[bisect.bisect_right(thresholds, previous):bisect.bisect_right(thresholds, value)]
+        if value < previous and stream in self._falling:
+            thresholds, ids = self._falling[stream]
+            return ids[bisect.bisect_left(thresholds, value):bisect.bisect_left(thresholds, previous)]
+        return []
+
+
+class Alert:
+    """
+    One active alert rule and its trigger statistics
+    """
+
+    def __init__(self, rule_id: int, api_key_id: int, metric: str, symbol: str, exchange: Optional[str],
+                 condition: str, threshold: float, webhook_url: str, secret: Optional[str] = None):
+        if condition not in ALERT_CONDITIONS:
+            raise ValueError(f"Unsupported condition: {condition} (use {', '.join(ALERT_CONDITIONS)})")
+        self.id = rule_id
+        self.api_key_id = api_key_id
+        self.metric = metric
+        self.symbol = symbol
+        self.exchange = exchange
+        self.stream = alert_stream(metric, symbol, exchange)
+        self.condition = condition
+        # 부호 전환은 0을 지나는 것과 같음
+        self.threshold = 0.0 if condition == "flips_sign" else float(threshold)
+        self.webhook_url = webhook_url
+        self.secret = secret
+        self.trigger_count = 0
+        self.last_triggered_at: Optional[float] = None
+        self.last_delivery: Optional[str] = None
+
+    @classmethod
+    def from_rule(cls, rule) -> "Alert":
+        """Build from an AlertRule row"""
+        return cls(rule.id, rule.api_key_id, rule.metric, rule.symbol, rule.exchange, rule.condition,
+                   rule.threshold, rule.webhook_url, rule.secret)
+
+    def rule(self) -> Dict[str, Any]:
+        """Rule fields accepted by from_rule (the payload of rule events)"""
+        return {"id": self.id, "api_key_id": self.api_key_id, "metric": self.metric, "symbol": self.symbol,
+                "exchange": self.exchange, "condition": self.condition, "threshold": self.threshold,
+                "webhook_url": self.webhook_url, "secret": self.secret}
+
+    def payload(self, previous: float, value: float, timestamp: float) -> Dict[str, Any]:
+        return {
+            "alert_id": self.id,
+            "metric": self.metric,
+            "symbol": self.symbol,
+            "exchange": self.exchange,
+            "condition": self.condition,
+            "threshold": self.threshold,
+            "previous_value": previous,
+            "value": value,
+            "direction": "up" if value > previous else "down",
+            "timestamp": datetime.utcfromtimestamp(timestamp).isoformat() + "Z",
+        }
+
+
+class AlertEngine:
+    """
+    Evaluates alert rules incrementally on every observed value and delivers matches as webhooks
+
+    `observe(key, timestamp, value)` matches the TimeSeriesStore subscriber signature and
+    `observe_event(event)` takes the same point published on the event bus. Rules
+    fire on crossings between two consecutive values of their stream: 'above' when the
+    value rises to or past the threshold, 'below' when it falls to or past it, 'crosses'
+    in either direction and 'flips_sign' when it crosses zero.
+    """
+
+    def __init__(self, dispatcher: Optional[WebhookDispatcher] = None):
+        self.dispatcher = dispatcher if dispatcher is not None else WebhookDispatcher()
+        self.observed_count = 0
+        self._alerts: Dict[int, Alert] = {}
+        self._index = ThresholdIndex()
+        self._last: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, alert: Alert):
+        """Index a rule (replacing a rule with the same id)"""
+        with self._lock:
+            if alert.id in self._alerts:
+                self._remove(alert.id)
+            self._alerts[alert.id] = alert
+            self._index.add(alert.stream, alert.threshold, alert.id,
+                            rising=alert.condition != "below", falling=alert.condition != "above")
+
+    def load(self, rules: List[Any]) -> int:
+        """
+        Index AlertRule rows (e.g., every active rule at startup)
+
+        Returns:
+            int: Number of rules loaded
+        """
+        for rule in rules:
+            self.add(Alert.from_rule(rule))
+        return len(rules)
+
+    def _remove(self, rule_id: int) -> Optional[Alert]:
+        alert = self._alerts.pop(rule_id, None)
+        if alert is not None:
+            self._index.remove(alert.stream, alert.threshold, rule_id)
+        return alert
+
+    def remove(self, rule_id: int) -> bool:
+        with self._lock:
+            return self._remove(rule_id) is not None
+
+    def get(self, rule_id: int) -> Optional[Alert]:
+        with self._lock:
+            return self._alerts.get(rule_id)
+
+    def last_value(self, stream: str) -> Optional[float]:
+        with self._lock:
+            return self._last.get(stream)
+
+    def observe(self, key: Tuple[str, ...], timestamp: float, value: float) -> List[Alert]:
+        """
+        Evaluate one new value of a recorded series
+
+        Args:
+            key: Time series key (see series_stream)
+            timestamp: Value time in epoch seconds
+            value: New value
+
+        Returns:
+            List[Alert]: Rules that fired (their webhooks are queued)
+        """
+        stream = series_stream(key)
+        if stream is None:
+            return []
+        with self._lock:
+            self.observed_count += 1
+            previous = self._last.get(stream)
+            self._last[stream] = value
+            if previous is None:
+                return []
+            fired = [self._alerts[rule_id] for rule_id in self._index.crossed(stream, previous, value)]
+            for alert in fired:
+                alert.trigger_count += 1
+                alert.last_triggered_at = timestamp
+
+        for alert in fired:
+            def record(result, alert=alert):
+                alert.last_delivery = result
+            if not self.dispatcher.enqueue(alert.webhook_url, alert.payload(previous, value, timestamp),
+                                           alert.secret, record):
+                alert.last_delivery = "dropped"
+        return fired
+
+    def observe_event(self, event) -> List[Alert]:
+        """Evaluate a time series event ({'key', 'timestamp', 'value'} payload) from the event bus"""
+        payload = event.payload
+        return self.observe(tuple(payload["key"]), payload["timestamp"], payload["value"])
+
+    def apply_rule_event(self, event):
+        """Add or remove a rule from an 'alerts.rules.created' / 'alerts.rules.deleted' event"""
+        if event.topic == f"{ALERT_RULE_TOPIC}.deleted":
+            self.remove(event.payload["id"])
+        elif event.topic == f"{ALERT_RULE_TOPIC}.created":
+            self.add(Alert.from_rule(SimpleNamespace(**event.payload)))
+
+    def start(self):
+        """Start webhook delivery"""
+        self.dispatcher.start()
+
+    def stop(self):
+        self.dispatcher.stop()
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            rules, streams = len(self._alerts), len({alert.stream for alert in self._alerts.values()})
+        return {"rules": rules, "streams": streams, "observed": self.observed_count,
+                "webhooks": self.dispatcher.status()}
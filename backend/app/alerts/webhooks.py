@@ -0,0 +1,236 @@
+"""
+웹훅 전송 및 재시도 큐
+
+알림 이벤트를 JSON으로 POST하며, 실패(연결 오류, 타임아웃, 2xx가 아닌 응답)한 전송은
+지수 백오프로 다시 예약합니다. 최대 시도 횟수를 넘기면 실패로 기록하고 버립니다.
+본문은 규칙별 비밀 값으로 HMAC-SHA256 서명해 수신 측이 출처를 검증할 수 있게 합니다.
+사용자가 지정한 URL로 서버가 요청을 보내므로(SSRF), 규칙 등록 시와 전송 직전에 호스트를 조회해
+사설/루프백/링크 로컬/예약 주소로 향하는 URL은 거부하고 리다이렉트는 따라가지 않습니다.
+"""
+
+import hashlib
+import heapq
+import hmac
+import ipaddress
+import itertools
+import json
+import logging
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('alerts')
+
+SIGNATURE_HEADER = "X-OmniScope-Signature"
+ATTEMPT_HEADER = "X-OmniScope-Attempt"
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """HMAC-SHA256 signature of a webhook body ('sha256=<hex>')"""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def resolve_host(host: str, port: int) -> List[str]:
+    """Resolve a host name to all of its IP addresses"""
+    return [info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)]
+
+
+def is_public_address(address: str) -> bool:
+    """Return True if an IP address is globally routable (not private, loopback, link-local, reserved, ...)"""
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    # IPv4 매핑 IPv6 주소(::ffff:127.0.0.1)는 IPv4 주소로 판단
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+def check_webhook_url(url: str, allow_private: bool = False):
+    """
+    Check that a webhook URL is http(s) and every address its host resolves to is public
+
+    Args:
+        url: Webhook URL
+        allow_private: Skip the address check (local development only)
+
+    Raises:
+        ValueError: If the URL is malformed, cannot be resolved or points at a non-public address
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("Webhook URL must be an http(s) URL with a host")
+    if allow_private:
+        return
+    try:
+        addresses = resolve_host(parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Webhook host cannot be resolved: {parts.hostname} ({e})")
+    blocked = [address for address in addresses if not is_public_address(address)]
+    if blocked or not addresses:
+        raise ValueError(f"Webhook host resolves to a non-public address: {parts.hostname} ({', '.join(blocked)})")
+
+
+class WebhookDelivery:
+    # 전송 한 건 (재시도 시 같은 객체를 다시 예약)
+    def __init__(self, url: str, body: bytes, secret: Optional[str], callback: Optional[Callable[[str], None]]):
+        self.url = url
+        self.body = body
+        self.secret = secret
+        self.callback = callback
+        self.attempts = 0
+
+
+class WebhookDispatcher:
+    """
+    Delivers JSON webhooks from background workers with exponential-backoff retries
+
+    Deliveries wait in a time-ordered queue. A failed attempt is rescheduled after
+    `backoff * 2 ** (attempts - 1)` seconds (capped at `max_backoff`) until
+    `max_attempts` is reached. `enqueue()` never blocks; when `max_queue` deliveries
+    are pending new ones are dropped. The optional callback receives 'delivered',
+    'retrying' or 'failed' after each attempt.
+
+    Before every attempt the URL is checked with `check_webhook_url` (unless
+    `allow_private`), so a host re-pointed at an internal address fails without
+    retries; redirects are never followed.
+    """
+
+    def __init__(self, max_attempts: int = 5, backoff: float = 2.0, max_backoff: float = 300.0,
+                 timeout: float = 5.0, workers: int = 4, max_queue: int = 10000, allow_private: bool = False):
+        self.max_attempts = max_attempts
+        self.allow_private = allow_private
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.workers = workers
+        self.max_queue = max_queue
+        self.session = get_session_with_retries(retries=0)
+        self.delivered_count = 0
+        self.retry_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0
+        self._queue: List = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def enqueue(self, url: str, payload: Dict[str, Any], secret: Optional[str] = None,
+                callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Queue a webhook for immediate delivery
+
+        Returns:
+            bool: False if the queue is full and the delivery was dropped
+        """
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        with self._condition:
+            if len(self._queue) >= self.max_queue:
+                self.dropped_count += 1
+                return False
+            self._schedule(WebhookDelivery(url, body, secret, callback), time.monotonic())
+        return True
+
+    def _schedule(self, delivery: WebhookDelivery, due: float):
+        # 호출자가 _condition을 잡고 있어야 함
+        heapq.heappush(self._queue, (due, next(self._sequence), delivery))
+        self._condition.notify()
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    def _next(self) -> Optional[WebhookDelivery]:
+        with self._condition:
+            while not self._stop_event.is_set():
+                if self._queue:
+                    wait = self._queue[0][0] - time.monotonic()
+                    if wait <= 0:
+                        return heapq.heappop(self._queue)[2]
+                    self._condition.wait(wait)
+                else:
+                    self._condition.wait(1.0)
+            return None
+
+    def deliver(self, delivery: WebhookDelivery) -> bool:
+        """Make one delivery attempt and reschedule it on failure"""
+        delivery.attempts += 1
+        headers = {"Content-Type": "application/json", ATTEMPT_HEADER: str(delivery.attempts)}
+        if delivery.secret:
+            headers[SIGNATURE_HEADER] = sign_payload(delivery.body, delivery.secret)
+        try:
+            check_webhook_url(delivery.url, self.allow_private)
+        except ValueError as e:
+            # 내부 주소로 바뀐 호스트는 재시도하지 않음
+            ok, error = False, str(e)
+            delivery.attempts = self.max_attempts
+        else:
+            try:
+                response = self.session.post(delivery.url, data=delivery.body, headers=headers, timeout=self.timeout,
+                                             allow_redirects=False)
+                ok = 200 <= response.status_code < 300
+                error = None if ok else f"HTTP {response.status_code}"
+            except Exception as e:
+                ok, error = False, str(e)
+
+        if ok:
+            result = "delivered"
+            with self._condition:
+                self.delivered_count += 1
+        elif delivery.attempts < self.max_attempts:
+            result = "retrying"
+            delay = min(self.backoff * 2 ** (delivery.attempts - 1), self.max_backoff)
+            with self._condition:
+                self.retry_count += 1
+                self._schedule(delivery, time.monotonic() + delay)
+        else:
+            result = "failed"
+            logger.warning(f"웹훅 전송 실패 ({delivery.url}, {delivery.attempts}회 시도): {error}")
+            with self._condition:
+                self.failed_count += 1
+        if delivery.callback is not None:
+            try:
+                delivery.callback(result)
+            except Exception as e:
+                logger.error(f"웹훅 콜백 오류: {e}")
+        return ok
+
+    def _run(self):
+        while True:
+            delivery = self._next()
+            if delivery is None:
+                return
+            self.deliver(delivery)
+
+    def start(self):
+        """Start the delivery workers (no-op if already running)"""
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        self._stop_event.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f"webhook-{i}", daemon=True) for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the delivery workers (pending deliveries stay queued)"""
+        self._stop_event.set()
+        with self._condition:
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def status(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "pending": len(self._queue),
+                "delivered": self.delivered_count,
+                "retries": self.retry_count,
+                "failed": self.failed_count,
+                "dropped": self.dropped_count,
+            }
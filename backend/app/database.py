@@ -47,7 +47,7 @@ def init_db():
     Initialize database tables
     """
     # Import models here to ensure they are registered with Base
-    from app.models import User, Transaction, APIKey
+    from app.models import User, Transaction, APIKey, AlertRule
     
     # Create tables
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,15 @@
+# 이벤트 버스 패키지
+# 수집 엔진이 발행한 시세/프리미엄/펀딩비/소셜 이벤트를 웹소켓 클라이언트, 캐시, 알림이 구독함
+
+import os
+
+from app.events.bus import QUEUE_POLICIES, Event, EventBus, Subscription, series_topic, topic_matches
+from app.events.transport import Transport, UnixSocketTransport
+
+# 설정 시 같은 노드의 워커 프로세스가 이 소켓으로 버스를 공유함 (수집은 리더 프로세스에서만 실행)
+EVENT_BUS_SOCKET = os.getenv("EVENT_BUS_SOCKET")
+
+event_bus = EventBus(UnixSocketTransport(EVENT_BUS_SOCKET) if EVENT_BUS_SOCKET else None)
+
+__all__ = ["QUEUE_POLICIES", "Event", "EventBus", "Subscription", "Transport", "UnixSocketTransport",
+           "event_bus", "series_topic", "topic_matches"]
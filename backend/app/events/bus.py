@@ -0,0 +1,288 @@
+"""
+프로세스 내 pub/sub 이벤트 버스
+
+수집 스레드가 발행한 이벤트를 토픽 패턴('*'는 한 단계, '#'는 나머지 전체)으로 구독자에게 전달합니다.
+asyncio 구독자(웹소켓 클라이언트 등)는 구독자별 크기 제한 큐를 가지며, 느린 구독자 때문에
+발행자가 막히지 않도록 큐가 차면 정책(drop_oldest, drop_newest, coalesce)에 따라 이벤트를 버립니다.
+콜백 구독자(알림 엔진 등)는 발행한 스레드에서 바로 호출됩니다.
+트랜스포트를 지정하면 이벤트가 다른 프로세스의 버스로도 전달됩니다.
+"""
+
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger('events')
+
+QUEUE_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+
+class Event(NamedTuple):
+    topic: str
+    payload: Any
+    timestamp: float
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """
+    Match a dot-separated topic against a pattern ('*' matches one segment, a trailing '#' the rest)
+
+    Examples:
+        'kimchi.*.BTC' matches 'kimchi.premium_percentage.BTC'; 'derivatives.#' matches every derivatives topic
+    """
+    pattern_parts = pattern.split(".")
+    topic_parts = topic.split(".")
+    for index, part in enumerate(pattern_parts):
+        if part == "#":
+            return True
+        if index >= len(topic_parts) or (part != "*" and part != topic_parts[index]):
+            return False
+    return len(pattern_parts) == len(topic_parts)
+
+
+def series_topic(prefix: str, key: Tuple[str, ...]) -> str:
+    """
+    Topic of a time series point (e.g., ('funding_rate', 'Binance', 'BTC/USDT') -> 'derivatives.funding_rate.Binance.BTC/USDT')
+    """
+    return ".".join((prefix,) + tuple(str(part).replace(".", "_") for part in key))
+
+
+class Subscription:
+    """
+    Bounded event queue of one asyncio subscriber to one or more topic patterns
+
+    Events are offered from any thread and consumed with `await get()` or `async for`
+    on the event loop the subscription was created on. When `maxsize` events are
+    waiting, 'drop_oldest' discards the oldest one, 'drop_newest' discards the new one
+    and 'coalesce' keeps only the latest event per topic, in the position of the first
+    waiting one (dropping the oldest topic when `maxsize` topics are waiting).
+    """
+
+    def __init__(self, bus: "EventBus", patterns: Union[str, Iterable[str]], maxsize: int = 100,
+                 policy: str = "drop_oldest"):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unsupported queue policy: {policy} (use {', '.join(QUEUE_POLICIES)})")
+        self.bus = bus
+        self.patterns = (patterns,) if isinstance(patterns, str) else tuple(patterns)
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped_count = 0
+        self.closed = False
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        # drop_oldest는 deque의 maxlen으로 가장 오래된 이벤트를 밀어냄
+        self._queue: collections.deque = collections.deque(maxlen=maxsize if policy == "drop_oldest" else None)
+        self._latest: "collections.OrderedDict[str, Event]" = collections.OrderedDict()
+
+    def matches(self, topic: str) -> bool:
+        return any(topic_matches(pattern, topic) for pattern in self.patterns)
+
+    def _offer(self, event: Event):
+        # 구독자의 이벤트 루프에서만 호출됨
+        if self.closed:
+            return
+        if self.policy == "coalesce":
+            if event.topic in self._latest:
+                # 대기 중인 이벤트를 제자리에서 교체 (토픽의 대기 순서는 유지)
+                self.dropped_count += 1
+            elif len(self._latest) >= self.maxsize:
+                self._latest.popitem(last=False)
+                self.dropped_count += 1
+            self._latest[event.topic] = event
+        else:
+            if len(self._queue) >= self.maxsize:
+                self.dropped_count += 1
+                if self.policy == "drop_newest":
+                    return
+            self._queue.append(event)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def qsize(self) -> int:
+        return len(self._latest) if self.policy == "coalesce" else len(self._queue)
+
+    def get_nowait(self) -> Optional[Event]:
+        """Next waiting event, None if the queue is empty"""
+        if self.policy == "coalesce":
+            event = self._latest.popitem(last=False)[1] if self._latest else None
+        else:
+            event = self._queue.popleft() if self._queue else None
+        if not self.qsize():
+            self._ready.clear()
+        return event
+
+    async def get(self) -> Optional[Event]:
+        """Wait for the next event, None once the subscription is closed and drained"""
+        while True:
+            event = self.get_nowait()
+            if event is not None or self.closed:
+                return event
+            await self._ready.wait()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        event = await self.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self):
+        """Unsubscribe and wake up a pending get()"""
+        self.bus.unsubscribe(self)
+        self.closed = True
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass
+
+
+class EventBus:
+    """
+    Topic-based pub/sub between ingestion threads and their consumers
+
+    `publish()` is thread-safe and never blocks on consumers: callback subscribers run
+    in the publishing thread and asyncio subscribers get the event on their own loop.
+    Events published from other threads are handed to each loop in batches, with one
+    wakeup per batch rather than one per subscriber.
+    Every locally published event is also handed to the transport; events received
+    from the transport are delivered locally only.
+    """
+
+    def __init__(self, transport=None):
+        self.transport = transport
+        self.published_count = 0
+        self._subscriptions: List[Subscription] = []
+        self._callbacks: List[Tuple[str, Callable[[Event], None]]] = []
+        # 토픽별 매칭 구독자 캐시 (이벤트 루프별로 묶음, 구독이 바뀌면 비움)
+        self._routes: Dict[str, Tuple[Dict[asyncio.AbstractEventLoop, List[Subscription]],
+                                      List[Callable[[Event], None]]]] = {}
+        # 다른 스레드에서 발행되어 이벤트 루프별로 전달을 기다리는 이벤트
+        self._pending: Dict[asyncio.AbstractEventLoop, List[Tuple[List[Subscription], Event]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_leader(self) -> bool:
+        """True if this process runs the ingestion engines (always without a transport)"""
+        return self.transport is None or self.transport.is_leader
+
+    async def start(self):
+        """Connect the transport (call once on the serving event loop)"""
+        if self.transport is not None:
+            await self.transport.start(self._deliver)
+
+    async def stop(self):
+        if self.transport is not None:
+            await self.transport.stop()
+
+    def on_leader(self, callback: Callable[[], None]):
+        """Register a callback invoked when this process is promoted to leader after startup"""
+        if self.transport is not None:
+            self.transport.on_leader(callback)
+
+    def subscribe(self, patterns: Union[str, Iterable[str]], maxsize: int = 100,
+                  policy: str = "drop_oldest") -> Subscription:
+        """
+        Subscribe the running event loop to one or more topic patterns
+
+        Returns:
+            Subscription: Queue to consume with `await get()` or `async for`; call close() when done
+        """
+        subscription = Subscription(self, patterns, maxsize, policy)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            self._routes = {}
+        return subscription
+
+    def subscribe_callback(self, pattern: str, callback: Callable[[Event], None]):
+        """Register a callback invoked with each matching Event in the publishing thread"""
+        with self._lock:
+            self._callbacks.append((pattern, callback))
+            self._routes = {}
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+                self._routes = {}
+
+    def _route(self, topic: str) -> Tuple[Dict[asyncio.AbstractEventLoop, List[Subscription]],
+                                          List[Callable[[Event], None]]]:
+        with self._lock:
+            route = self._routes.get(topic)
+            if route is None:
+                loops: Dict[asyncio.AbstractEventLoop, List[Subscription]] = {}
+                for subscription in self._subscriptions:
+                    if subscription.matches(topic):
+                        loops.setdefault(subscription._loop, []).append(subscription)
+                route = self._routes[topic] = (
+                    loops,
+                    [callback for pattern, callback in self._callbacks if topic_matches(pattern, topic)],
+                )
+            return route
+
+    def publish(self, topic: str, payload: Any, timestamp: Optional[float] = None):
+        """
+        Publish an event to local subscribers and the transport
+
+        Args:
+            topic: Dot-separated topic (e.g., 'kimchi.premium_percentage.BTC')
+            payload: JSON-serializable payload
+            timestamp: Event time (defaults to time.time())
+        """
+        event = Event(topic, payload, time.time() if timestamp is None else timestamp)
+        self.published_count += 1
+        self._deliver(event)
+        if self.transport is not None:
+            self.transport.send(event)
+
+    def _deliver(self, event: Event):
+        loops, callbacks = self._route(event.topic)
+        for loop, subscriptions in loops.items():
+            if asyncio._get_running_loop() is loop:
+                for subscription in subscriptions:
+                    subscription._offer(event)
+            else:
+                self._schedule(loop, subscriptions, event)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"이벤트 구독자 오류 ({event.topic}): {e}")
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, subscriptions: List[Subscription], event: Event):
+        with self._lock:
+            batch = self._pending.setdefault(loop, [])
+            batch.append((subscriptions, event))
+            if len(batch) > 1:
+                # 이미 예약된 전달에 함께 처리됨
+                return
+        try:
+            loop.call_soon_threadsafe(self._drain, loop)
+        except RuntimeError:
+            # 구독자의 이벤트 루프가 이미 종료됨
+            with self._lock:
+                self._pending.pop(loop, None)
+                self._subscriptions = [s for s in self._subscriptions if s._loop is not loop]
+                self._routes = {}
+
+    def _drain(self, loop: asyncio.AbstractEventLoop):
+        with self._lock:
+            batch = self._pending.pop(loop, [])
+        for subscriptions, event in batch:
+            for subscription in subscriptions:
+                subscription._offer(event)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        return {
+            "leader": self.is_leader,
+            "published": self.published_count,
+            "subscribers": len(subscriptions),
+            "dropped": sum(s.dropped_count for s in subscriptions),
+        }
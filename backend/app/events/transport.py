@@ -0,0 +1,214 @@
+"""
+프로세스 간 이벤트 트랜스포트
+
+같은 노드의 워커 프로세스들이 유닉스 소켓 하나로 이벤트 버스를 공유합니다.
+잠금 파일을 먼저 잡은 프로세스가 리더가 되어 소켓을 열고 수집 엔진을 실행하며,
+나머지 프로세스(팔로워)는 리더에 접속해 이벤트를 받습니다.
+리더가 종료되면 팔로워 중 하나가 잠금을 잡아 리더로 승격됩니다.
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import logging
+import os
+from typing import Callable, List, Optional, Set
+
+from app.events.bus import Event
+
+logger = logging.getLogger('events')
+
+
+class Transport:
+    """
+    Base class for cross-process event transports
+
+    `start(deliver)` connects and calls `deliver(event)` on the event loop for every
+    event received from another process; `send(event)` forwards a locally published
+    event and must be thread-safe and non-blocking.
+    """
+
+    is_leader = True
+
+    async def start(self, deliver: Callable[[Event], None]):
+        raise NotImplementedError
+
+    async def stop(self):
+        pass
+
+    def send(self, event: Event):
+        raise NotImplementedError
+
+    def on_leader(self, callback: Callable[[], None]):
+        """Register a callback invoked on the event loop when this process is promoted to leader"""
+
+
+def encode_event(event: Event) -> bytes:
+    return json.dumps([event.topic, event.payload, event.timestamp], separators=(",", ":"), default=str).encode() + b"\n"
+
+
+def decode_event(line: bytes) -> Event:
+    topic, payload, timestamp = json.loads(line)
+    return Event(topic, payload, timestamp)
+
+
+class UnixSocketTransport(Transport):
+    """
+    Newline-delimited JSON events over a unix socket shared by the processes of one node
+
+    The process holding an exclusive lock on `<path>.lock` is the leader: it listens on
+    `path`, fans events out to every follower and relays events published by one
+    follower to the others. A follower whose connection drops retries the lock and
+    the connection every `reconnect_delay` seconds. Peers that stop reading are not
+    waited for: events are dropped for a peer once `max_buffer` bytes are pending.
+    """
+
+    def __init__(self, path: str, reconnect_delay: float = 1.0, max_buffer: int = 4 * 1024 * 1024):
+        self.path = path
+        self.reconnect_delay = reconnect_delay
+        self.max_buffer = max_buffer
+        self.is_leader = False
+        self.dropped_count = 0
+        self._deliver: Optional[Callable[[Event], None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock_file = None
+        self._server = None
+        self._peers: Set[asyncio.StreamWriter] = set()
+        self._handlers: Set[asyncio.Task] = set()
+        self._leader: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._leader_callbacks: List[Callable[[], None]] = []
+
+    def on_leader(self, callback: Callable[[], None]):
+        self._leader_callbacks.append(callback)
+
+    def _try_lock(self) -> bool:
+        lock_file = open(f"{self.path}.lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        # 프로세스가 종료되면 운영체제가 잠금을 해제함
+        self._lock_file = lock_file
+        return True
+
+    async def _lead(self):
+        # 이전 리더가 남긴 소켓 파일 제거
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        self.is_leader = True
+        logger.info(f"이벤트 버스 리더로 동작 ({self.path})")
+
+    async def start(self, deliver: Callable[[Event], None]):
+        self._deliver = deliver
+        self._loop = asyncio.get_running_loop()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if self._try_lock():
+            await self._lead()
+        else:
+            self._task = self._loop.create_task(self._follow())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for writer in list(self._peers) + ([self._leader] if self._leader else []):
+            writer.close()
+        # 연결을 닫으면 처리 태스크가 EOF를 받고 종료됨 (취소하면 asyncio가 오류로 기록함)
+        if self._handlers:
+            await asyncio.wait(list(self._handlers), timeout=1.0)
+        self._peers.clear()
+        self._leader = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self.is_leader = False
+
+    async def _follow(self):
+        while True:
+            if self._try_lock():
+                await self._lead()
+                for callback in self._leader_callbacks:
+                    try:
+                        callback()
+                    except Exception as e:
+                        logger.error(f"리더 승격 콜백 오류: {e}")
+                return
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            except OSError:
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+            self._leader = writer
+            logger.info(f"이벤트 버스 리더에 연결됨 ({self.path})")
+            try:
+                await self._read(reader, writer)
+            finally:
+                self._leader = None
+                writer.close()
+            logger.warning("이벤트 버스 리더 연결 끊김")
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        handler = asyncio.current_task()
+        self._peers.add(writer)
+        self._handlers.add(handler)
+        try:
+            await self._read(reader, writer)
+        finally:
+            self._peers.discard(writer)
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _read(self, reader: asyncio.StreamReader, source: asyncio.StreamWriter):
+        while True:
+            try:
+                line = await reader.readline()
+            except (ConnectionError, ValueError):
+                # ValueError: 스트림 제한을 넘는 줄
+                return
+            if not line:
+                return
+            try:
+                event = decode_event(line)
+            except (ValueError, TypeError) as e:
+                logger.error(f"잘못된 이벤트 메시지: {e}")
+                continue
+            self._deliver(event)
+            if self.is_leader:
+                # 팔로워가 발행한 이벤트를 다른 팔로워에 중계
+                self._write(line, exclude=source)
+
+    def _write(self, line: bytes, exclude: Optional[asyncio.StreamWriter] = None):
+        writers = self._peers if self.is_leader else ([self._leader] if self._leader else [])
+        for writer in list(writers):
+            if writer is exclude or writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                self.dropped_count += 1
+                continue
+            writer.write(line)
+
+    def send(self, event: Event):
+        if self._loop is None:
+            return
+        line = encode_event(event)
+        try:
+            if asyncio._get_running_loop() is self._loop:
+                self._write(line)
+            else:
+                self._loop.call_soon_threadsafe(self._write, line)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료됨
+            pass
@@ -0,0 +1,6 @@
+# 외부 데이터 수집 패키지
+# 수집 엔진과 도메인별 수집기를 포함함
+
+from app.ingestion.engine import IngestionEngine, IngestionStatus, SourceStats, ensure_collected
+
+__all__ = ["IngestionEngine", "IngestionStatus", "SourceStats", "ensure_collected"]
@@ -0,0 +1,187 @@
+"""
+체결 수집 및 캔들 집계
+
+거래소 체결 API를 주기적으로 폴링해 마지막으로 본 체결 ID 이후의 체결을 페이지 단위로 가져와
+CandleStore에 반영합니다. 저장소가 체결 ID 커서를 함께 저장하므로 재시작 후에도
+같은 체결을 두 번 집계하지 않고 이어서 수집합니다.
+"""
+
+import logging
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.database import DATABASE_DIR
+from app.ingestion.engine import IngestionEngine
+from app.ingestion.upbit import DEFAULT_MARKETS as DEFAULT_UPBIT_MARKETS
+from app.timeseries import CandleStore, IndicatorCache
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('ingestion')
+
+DEFAULT_BINANCE_SYMBOLS = ["BTCUSDT", "ETHUSDT", "XRPUSDT"]
+
+# 폴링 한 번에 요청하는 최대 페이지 수 (밀린 체결은 다음 폴링에서 이어서 조회)
+MAX_PAGES = 5
+
+Trades = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class TradeFeed:
+    """
+    Polls the trades of one symbol and returns the ones not seen before
+
+    Subclasses implement `_fetch_new()` returning (trade_id, time_seconds, price, quantity) rows
+    that page forward from `last_trade_id`, using at most MAX_PAGES requests per poll. Trades
+    that could not be reached within those pages are counted in `gap_count` and logged.
+    """
+
+    exchange = ""
+
+    def __init__(self, symbol: str, base_url: str, timeout: float = 10):
+        self.symbol = symbol
+        self.name = f"{self.exchange}:{symbol}"
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = get_session_with_retries()
+        self.last_trade_id: Optional[int] = None
+        self.gap_count = 0
+
+    def _fetch_new(self) -> List[Tuple[int, float, float, float]]:
+        raise NotImplementedError
+
+    def _report_gap(self, after_id: int, before_id: int):
+        self.gap_count += 1
+        logger.warning(f"[{self.name}] 체결 누락: {after_id} 이후 {before_id} 이전 체결을 가져오지 못했습니다")
+
+    def collect(self) -> Trades:
+        """
+        Fetch new trades
+
+        Returns:
+            Tuple[np.ndarray, ...]: Times (epoch seconds), prices, quantities and trade ids
+            of new trades, sorted by trade id
+        """
+        rows = sorted({row[0]: row for row in self._fetch_new()
+                       if self.last_trade_id is None or row[0] > self.last_trade_id}.values())
+        if not rows:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty, np.empty(0, dtype=np.int64)
+        self.last_trade_id = rows[-1][0]
+        ids, times, prices, quantities = zip(*rows)
+        return np.array(times), np.array(prices), np.array(quantities), np.array(ids, dtype=np.int64)
+
+
+class BinanceTradeFeed(TradeFeed):
+    """
+    Binance spot trades: the latest 1000 on the first poll, then forward from the last
+    trade id with /api/v3/historicalTrades?fromId= (ids are contiguous, so nothing is skipped;
+    a backlog beyond MAX_PAGES pages is picked up on the next poll)
+    """
+
+    exchange = "binance"
+    PAGE_SIZE = 1000
+
+    def __init__(self, symbol: str, base_url: str = "https://api.binance.com", timeout: float = 10):
+        super().__init__(symbol, base_url, timeout)
+
+    def _get(self, path: str, **params):
+        response = self.session.get(f"{self.base_url}{path}", params={"symbol": self.symbol, "limit": self.PAGE_SIZE,
+                                                                      **params}, timeout=self.timeout)
+        response.raise_for_status()
+        return [(trade["id"], trade["time"] / 1000, float(trade["price"]), float(trade["qty"]))
+                for trade in response.json()]
+
+    def _fetch_new(self):
+        if self.last_trade_id is None:
+            return self._get("/api/v3/trades")
+        rows = []
+        from_id = self.last_trade_id + 1
+        for _ in range(MAX_PAGES):
+            page = self._get("/api/v3/historicalTrades", fromId=from_id)
+            rows.extend(page)
+            if len(page) < self.PAGE_SIZE:
+                break
+            from_id = page[-1][0] + 1
+        return rows
+
+
+class UpbitTradeFeed(TradeFeed):
+    """
+    Upbit trades (/v1/trades/ticks, newest first, 200 per page)
+
+    When a page holds only unseen trades, older pages are requested with `cursor`
+    until the last seen trade is reached.
+    """
+
+    exchange = "upbit"
+    PAGE_SIZE = 200
+
+    def __init__(self, symbol: str, base_url: str = "https://api.upbit.com", timeout: float = 10):
+        super().__init__(symbol, base_url, timeout)
+
+    def _get(self, cursor: Optional[int] = None):
+        params = {"market": self.symbol, "count": self.PAGE_SIZE}
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = self.session.get(f"{self.base_url}/v1/trades/ticks", params=params,
+                                    headers={"Accept": "application/json"}, timeout=self.timeout)
+        response.raise_for_status()
+        return [(trade["sequential_id"], trade["timestamp"] / 1000, float(trade["trade_price"]),
+                 float(trade["trade_volume"]))
+                for trade in response.json()]
+
+    def _fetch_new(self):
+        rows = self._get()
+        if self.last_trade_id is None:
+            return rows
+        for _ in range(MAX_PAGES - 1):
+            # 가장 오래된 체결까지 모두 새 체결이면 그 이전 페이지에 놓친 체결이 있을 수 있음
+            if len(rows) < self.PAGE_SIZE or min(row[0] for row in rows) <= self.last_trade_id:
+                return rows
+            page = self._get(cursor=min(row[0] for row in rows))
+            if not page:
+                return rows
+            rows.extend(page)
+        oldest = min(row[0] for row in rows)
+        if oldest > self.last_trade_id:
+            self._report_gap(self.last_trade_id, oldest)
+        return rows
+
+
+def create_candle_engine(store: CandleStore, feeds: Optional[List[TradeFeed]] = None,
+                         interval: float = 10.0) -> IngestionEngine:
+    """
+    Create an ingestion engine folding every feed's new trades into the candle store
+
+    Args:
+        store: Destination candle store
+        feeds: Trade feeds (defaults to CANDLE_BINANCE_SYMBOLS on Binance and CANDLE_UPBIT_MARKETS on Upbit)
+        interval: Seconds between polls
+
+    Returns:
+        IngestionEngine: Engine (not yet started)
+    """
+    if feeds is None:
+        binance_symbols = os.getenv("CANDLE_BINANCE_SYMBOLS", ",".join(DEFAULT_BINANCE_SYMBOLS)).split(",")
+        upbit_markets = os.getenv("CANDLE_UPBIT_MARKETS", ",".join(DEFAULT_UPBIT_MARKETS)).split(",")
+        feeds = [BinanceTradeFeed(symbol) for symbol in binance_symbols] + \
+                [UpbitTradeFeed(market) for market in upbit_markets]
+
+    # 재시작 후에는 저장된 체결 ID 커서부터 이어서 수집
+    for feed in feeds:
+        if feed.last_trade_id is None:
+            feed.last_trade_id = store.last_trade_id(feed.exchange, feed.symbol)
+
+    def sink(feed, trades):
+        store.fold(feed.exchange, feed.symbol, *trades)
+        store.flush()
+
+    return IngestionEngine("candles", feeds, sink, interval=interval)
+
+
+# 애플리케이션 전역 캔들 저장소, 엔진 및 지표 캐시
+candle_store = CandleStore(os.getenv("CANDLES_DIR", str(DATABASE_DIR / "candles")))
+candle_engine = create_candle_engine(candle_store, interval=float(os.getenv("CANDLE_POLL_INTERVAL", "10")))
+indicator_cache = IndicatorCache(candle_store)
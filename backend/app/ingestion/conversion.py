@@ -0,0 +1,224 @@
+"""
+임의 통화 쌍 환산 (환율 그래프)
+
+거래소 시세(업비트 KRW 마켓, 바이낸스 전체 심볼)와 USD/KRW 환율을 통화 간 간선으로 갖는 그래프를 만들고,
+A→B 환산은 가장 좋은 경로(홉 수가 적고, 시세가 최신이며, 거래대금이 큰 간선 우선)를 따라 환율을 곱해 계산합니다.
+출발 통화별 최적 경로 트리는 한 번 계산해 캐시하고, 시세가 갱신되면 무효화합니다.
+"""
+
+import heapq
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# 바이낸스 심볼에서 호가 통화를 분리할 때 사용하는 후보 (긴 것부터 비교)
+BINANCE_QUOTES = ("FDUSD", "USDT", "USDC", "TUSD", "BTC", "ETH", "BNB", "EUR", "TRY", "BRL", "JPY")
+
+# 1:1로 취급하는 스테이블코인 (김치 프리미엄과 같은 가정)
+DEFAULT_PEGS = {"USDT": "USD"}
+
+# 이보다 오래된 간선은 경로 탐색에서 제외 (초)
+DEFAULT_MAX_AGE = 300.0
+
+
+class Edge(NamedTuple):
+    """One directed conversion: 1 unit of `base` buys `rate` units of `quote`"""
+    base: str
+    quote: str
+    rate: float
+    source: str
+    timestamp: float
+    # 24시간 거래대금 (호가 통화 기준, 모르면 None)
+    liquidity: Optional[float] = None
+
+
+def edge_cost(edge: Edge, now: float, max_age: float) -> float:
+    """
+    Path cost of one hop: 1 per hop, plus up to 1 for staleness and up to 1 for illiquidity
+
+    Liquidity is log-scaled, so a pair with a hundred times the volume is only slightly
+    cheaper and volumes in different quote currencies stay comparable.
+    """
+    staleness = min(max(now - edge.timestamp, 0.0) / max_age, 1.0)
+    illiquidity = 1.0 if not edge.liquidity else 1.0 / (1.0 + math.log10(1.0 + edge.liquidity))
+    return 1.0 + staleness + illiquidity
+
+
+def split_binance_symbol(symbol: str) -> Optional[Tuple[str, str]]:
+    """Split a Binance symbol into (base, quote) ('ETHBTC' -> ('ETH', 'BTC')), None if the quote is unknown"""
+    for quote in BINANCE_QUOTES:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    return None
+
+
+class Conversion(NamedTuple):
+    rate: float
+    path: List[Edge]
+
+
+class RateGraph:
+    """
+    Currency graph built from exchange tickers, resolving any A->B conversion over the best path
+
+    Every ticker adds an edge in both directions (the reverse rate is 1/price). The
+    best path minimizes the summed `edge_cost`; when several sources quote the same pair
+    the cheapest edge is used. Costs are the same in both directions, so one cached
+    shortest-path tree per currency serves conversions from and to it. Trees are kept
+    until the next update; rates are always read from the current edges.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE, pegs: Optional[Dict[str, str]] = None):
+        self.max_age = max_age
+        self.pegs = dict(DEFAULT_PEGS if pegs is None else pegs)
+        self.updated_at = 0.0
+        self.version = 0
+        # (base, quote) -> source -> Edge
+        self._edges: Dict[Tuple[str, str], Dict[str, Edge]] = {}
+        self._adjacency: Dict[str, set] = {}
+        # 출발 통화별 최적 경로 트리 (도착 통화 -> 직전 통화)
+        self._trees: Dict[str, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, edges: Iterable[Edge], timestamp: Optional[float] = None):
+        """
+        Add or replace edges (one per ticker) and invalidate the cached paths
+
+        Args:
+            edges: Edges in the ticker's direction; the reverse edge is added automatically
+            timestamp: Update time (defaults to time.time())
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            for edge in edges:
+                if not edge.rate or edge.rate <= 0 or edge.base == edge.quote:
+                    continue
+                reverse = Edge(edge.quote, edge.base, 1.0 / edge.rate, edge.source, edge.timestamp, edge.liquidity)
+                for item in (edge, reverse):
+                    self._edges.setdefault((item.base, item.quote), {})[item.source] = item
+                    self._adjacency.setdefault(item.base, set()).add(item.quote)
+            for stable, currency in self.pegs.items():
+                for base, quote in ((stable, currency), (currency, stable)):
+                    self._edges.setdefault((base, quote), {})["peg"] = Edge(base, quote, 1.0, "peg", now)
+                    self._adjacency.setdefault(base, set()).add(quote)
+            self._trees = {}
+            self.updated_at = now
+            self.version += 1
+
+    def update_upbit(self, tickers: Dict[str, Dict[str, Any]], timestamp: Optional[float] = None):
+        """Add Upbit tickers by market code ('KRW-BTC' is 1 BTC = trade_price KRW)"""
+        now = time.time() if timestamp is None else timestamp
+        edges = []
+        for market, ticker in tickers.items():
+            quote, _, base = market.partition("-")
+            if base and ticker.get("trade_price"):
+                edges.append(Edge(base, quote, float(ticker["trade_price"]), "upbit",
+                                  ticker["timestamp"] / 1000 if ticker.get("timestamp") else now,
+                                  ticker.get("acc_trade_price_24h")))
+        self.update(edges, now)
+
+    def update_binance(self, tickers: Iterable[Dict[str, Any]], timestamp: Optional[float] = None):
+        """Add Binance /api/v3/ticker/price items ('ETHBTC' is 1 ETH = price BTC)"""
+        now = time.time() if timestamp is None else timestamp
+        edges = []
+        for ticker in tickers:
+            pair = split_binance_symbol(ticker["symbol"])
+            if pair is not None:
+                edges.append(Edge(pair[0], pair[1], float(ticker["price"]), "binance", now,
+                                  float(ticker["quoteVolume"]) if "quoteVolume" in ticker else None))
+        self.update(edges, now)
+
+    def update_fx(self, base: str, quote: str, rate: float, source: str = "fx", timestamp: Optional[float] = None):
+        """Add a fiat exchange rate (e.g., 1 USD = rate KRW)"""
+        now = time.time() if timestamp is None else timestamp
+        self.update([Edge(base, quote, rate, source, now)], now)
+
+    def currencies(self) -> List[str]:
+        with self._lock:
+            return sorted(self._adjacency)
+
+    def _best_edge(self, base: str, quote: str, now: float) -> Optional[Edge]:
+        candidates = [edge for edge in self._edges[(base, quote)].values() if now - edge.timestamp <= self.max_age]
+        return min(candidates, key=lambda edge: edge_cost(edge, now, self.max_age), default=None)
+
+    def _tree(self, origin: str, now: float) -> Dict[str, Optional[str]]:
+        # 다익스트라: 출발 통화에서 모든 통화까지의 최적 경로 (직전 통화만 저장)
+        tree = self._trees.get(origin)
+        if tree is not None:
+            return tree
+        tree = {}
+        best = {origin: 0.0}
+        heap = [(0.0, origin, None)]
+        while heap:
+            cost, node, previous = heapq.heappop(heap)
+            if node in tree:
+                continue
+            tree[node] = previous
+            for neighbor in self._adjacency.get(node, ()):
+                if neighbor in tree:
+                    continue
+                edge = self._best_edge(node, neighbor, now)
+                if edge is None:
+                    continue
+                next_cost = cost + edge_cost(edge, now, self.max_age)
+                if next_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = next_cost
+                    heapq.heappush(heap, (next_cost, neighbor, node))
+        self._trees[origin] = tree
+        return tree
+
+    def _path(self, source: str, target: str, now: float, retry: bool = True) -> Optional[List[Edge]]:
+        # 간선 비용은 방향과 무관하므로 도착 통화의 트리를 뒤집어 써도 같은 경로
+        # (캐시된 쪽을 우선, 둘 다 없으면 KRW/USDT처럼 연결이 많아 재사용될 통화 쪽에서 계산)
+        if source in self._trees or target in self._trees:
+            reverse = source not in self._trees
+        else:
+            reverse = len(self._adjacency.get(target, ())) > len(self._adjacency[source])
+        origin, end = (target, source) if reverse else (source, target)
+        tree = self._tree(origin, now)
+        if end not in tree:
+            return None
+        path = []
+        node = end
+        while tree[node] is not None:
+            edge = self._best_edge(node, tree[node], now) if reverse else self._best_edge(tree[node], node, now)
+            if edge is None:
+                # 캐시된 경로의 간선이 그 사이 만료되었으면 트리를 버리고 한 번 다시 계산
+                self._trees.pop(origin, None)
+                return self._path(source, target, now, retry=False) if retry else None
+            path.append(edge)
+            node = tree[node]
+        return path if reverse else path[::-1]
+
+    def convert(self, source: str, target: str, now: Optional[float] = None) -> Optional[Conversion]:
+        """
+        Resolve the rate from one currency to another over the best path
+
+        Args:
+            source: Currency to convert from (e.g., 'ETH')
+            target: Currency to convert to (e.g., 'KRW')
+            now: Current time in epoch seconds (defaults to time.time())
+
+        Returns:
+            Conversion: Units of `target` per unit of `source` and the edges used, None if no path exists
+        """
+        source, target = source.upper(), target.upper()
+        now = time.time() if now is None else now
+        if source == target:
+            return Conversion(1.0, [])
+        with self._lock:
+            if source not in self._adjacency:
+                return None
+            path = self._path(source, target, now)
+        if path is None:
+            return None
+        rate = 1.0
+        for edge in path:
+            rate *= edge.rate
+        return Conversion(rate, path)
+
+
+# 애플리케이션 전역 환율 그래프 (RATE_GRAPH_MAX_AGE초보다 오래된 시세는 경로에서 제외)
+rate_graph = RateGraph(max_age=float(os.getenv("RATE_GRAPH_MAX_AGE", str(DEFAULT_MAX_AGE))))
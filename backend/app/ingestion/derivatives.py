@@ -0,0 +1,326 @@
+"""
+파생상품(펀딩비, 미결제약정) 데이터 수집 어댑터
+
+거래소별 응답을 공통 형식으로 정규화하여 DerivativesStore에 저장합니다.
+정규화된 레코드는 routers/derivatives.py의 FundingRate / OpenInterest 모델 필드와 동일한 키를 가집니다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.database import DATABASE_DIR
+from app.ingestion.engine import IngestionEngine
+from app.timeseries import TimeSeriesStore
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('ingestion')
+
+# 기본 수집 대상 심볼
+DEFAULT_SYMBOLS = ["BTC", "ETH"]
+
+# 펀딩 주기 (모든 지원 거래소 공통)
+FUNDING_INTERVAL = "8h"
+
+# 미결제약정 24시간 변화율 계산에 사용할 기간
+OPEN_INTEREST_CHANGE_WINDOW = 24 * 60 * 60
+
+
+def _from_millis(value) -> datetime:
+    return datetime.utcfromtimestamp(int(value) / 1000)
+
+
+def _next_funding_boundary(now: Optional[datetime] = None, hours: int = 8) -> datetime:
+    # 00:00 / 08:00 / 16:00 UTC 기준 다음 펀딩 시각
+    now = now or datetime.utcnow()
+    base = now.replace(minute=0, second=0, microsecond=0)
+    return base + timedelta(hours=hours - base.hour % hours)
+
+
+class ExchangeAdapter:
+    """
+    Base class for derivatives exchange adapters
+
+    Subclasses implement `fetch_symbol(symbol)` returning a (funding, open_interest)
+    tuple of normalized dicts for one base asset.
+    """
+
+    name = ""
+    base_url = ""
+
+    def __init__(self, symbols: Optional[List[str]] = None, base_url: Optional[str] = None,
+                 timeout: float = 10):
+        self.symbols = symbols or DEFAULT_SYMBOLS
+        self.base_url = (base_url or self.base_url).rstrip('/')
+        self.timeout = timeout
+        self.session = get_session_with_retries()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None):
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_symbol(self, symbol: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        raise NotImplementedError
+
+    def collect(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch funding rates and open interest for all configured symbols
+
+        Returns:
+            Tuple[List[Dict], List[Dict]]: Normalized funding rate and open interest records
+        """
+        funding_rates, open_interest = [], []
+        for symbol in self.symbols:
+            funding, oi = self.fetch_symbol(symbol)
+            funding_rates.append(funding)
+            open_interest.append(oi)
+        return funding_rates, open_interest
+
+
+class BinanceAdapter(ExchangeAdapter):
+    """Binance USDⓈ-M perpetual futures"""
+
+    name = "Binance"
+    base_url = "https://fapi.binance.com"
+
+    def fetch_symbol(self, symbol):
+        market = f"{symbol}USDT"
+        premium = self._get("/fapi/v1/premiumIndex", {'symbol': market})
+        oi = self._get("/fapi/v1/openInterest", {'symbol': market})
+
+        mark_price = float(premium['markPrice'])
+        open_interest = float(oi['openInterest'])
+        pair = f"{symbol}/USDT"
+        return (
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "rate": float(premium['lastFundingRate']),
+                "next_funding_time": _from_millis(premium['nextFundingTime']),
+                "interval": FUNDING_INTERVAL,
+            },
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "open_interest": open_interest,
+                "open_interest_usd": open_interest * mark_price,
+            },
+        )
+
+
+class BybitAdapter(ExchangeAdapter):
+    """Bybit linear (USDT) perpetual futures"""
+
+    name = "Bybit"
+    base_url = "https://api.bybit.com"
+
+    def fetch_symbol(self, symbol):
+        market = f"{symbol}USDT"
+        data = self._get("/v5/market/tickers", {'category': 'linear', 'symbol': market})
+        ticker = data['result']['list'][0]
+
+        pair = f"{symbol}/USDT"
+        return (
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "rate": float(ticker['fundingRate']),
+                "next_funding_time": _from_millis(ticker['nextFundingTime']),
+                "interval": FUNDING_INTERVAL,
+            },
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "open_interest": float(ticker['openInterest']),
+                "open_interest_usd": float(ticker['openInterestValue']),
+            },
+        )
+
+
+class OKXAdapter(ExchangeAdapter):
+    """OKX USDT-margined perpetual swaps"""
+
+    name = "OKX"
+    base_url = "https://www.okx.com"
+
+    def fetch_symbol(self, symbol):
+        inst_id = f"{symbol}-USDT-SWAP"
+        funding = self._get("/api/v5/public/funding-rate", {'instId': inst_id})['data'][0]
+        oi = self._get("/api/v5/public/open-interest", {'instType': 'SWAP', 'instId': inst_id})['data'][0]
+
+        pair = f"{symbol}/USDT"
+        return (
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "rate": float(funding['fundingRate']),
+                "next_funding_time": _from_millis(funding['fundingTime']),
+                "interval": FUNDING_INTERVAL,
+            },
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "open_interest": float(oi['oiCcy']),
+                "open_interest_usd": float(oi['oiUsd']),
+            },
+        )
+
+
+class DeribitAdapter(ExchangeAdapter):
+    """Deribit inverse perpetuals (open interest is quoted in USD)"""
+
+    name = "Deribit"
+    base_url = "https://www.deribit.com"
+
+    def fetch_symbol(self, symbol):
+        instrument = f"{symbol}-PERPETUAL"
+        summary = self._get("/api/v2/public/get_book_summary_by_instrument",
+                            {'instrument_name': instrument})['result'][0]
+
+        mark_price = float(summary['mark_price'])
+        open_interest_usd = float(summary['open_interest'])
+        pair = f"{symbol}/USD"
+        return (
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "rate": float(summary['funding_8h']),
+                "next_funding_time": _next_funding_boundary(),
+                "interval": FUNDING_INTERVAL,
+            },
+            {
+                "symbol": pair,
+                "exchange": self.name,
+                "open_interest": open_interest_usd / mark_price if mark_price else 0.0,
+                "open_interest_usd": open_interest_usd,
+            },
+        )
+
+
+class DerivativesStore:
+    """
+    Thread-safe in-memory store of normalized derivatives data
+
+    Keeps the latest record per (exchange, symbol) and appends every sample to a
+    TimeSeriesStore keyed by (metric, exchange, symbol), where metric is one of
+    HISTORY_METRICS. The history backs change_24h and the /history endpoints.
+    Callbacks registered with `subscribe()` receive (funding_rates, open_interest,
+    timestamp) after every add.
+    """
+
+    HISTORY_METRICS = ("funding_rate", "open_interest", "open_interest_usd")
+
+    def __init__(self, history: Optional[TimeSeriesStore] = None):
+        self.history = history if history is not None else TimeSeriesStore()
+        self._lock = threading.Lock()
+        self._funding: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._open_interest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._subscribers: List[Callable[[List[Dict[str, Any]], List[Dict[str, Any]], float], None]] = []
+
+    def subscribe(self, callback: Callable[[List[Dict[str, Any]], List[Dict[str, Any]], float], None]):
+        """Register a callback invoked with (funding_rates, open_interest, timestamp) after every add"""
+        self._subscribers.append(callback)
+
+    def _change_24h(self, exchange: str, symbol: str, now: float, value: float) -> float:
+        # 윈도우 내 가장 오래된 샘플 대비 변화율 (%)
+        _, values = self.history.range(("open_interest", exchange, symbol), now - OPEN_INTEREST_CHANGE_WINDOW, now)
+        if len(values) == 0 or not values[0]:
+            return 0.0
+        return float((value - values[0]) / values[0] * 100)
+
+    def add(self, funding_rates: List[Dict[str, Any]], open_interest: List[Dict[str, Any]],
+            timestamp: Optional[float] = None):
+        """
+        Insert normalized records from one collection round
+
+        Args:
+            funding_rates: Normalized funding rate records
+            open_interest: Normalized open interest records (change_24h is computed here)
+            timestamp: Collection time (defaults to time.time())
+        """
+        now = time.time() if timestamp is None else timestamp
+        for record in funding_rates:
+            self.history.append(("funding_rate", record['exchange'], record['symbol']), now, record['rate'])
+        for record in open_interest:
+            self.history.append(("open_interest", record['exchange'], record['symbol']), now, record['open_interest'])
+            self.history.append(("open_interest_usd", record['exchange'], record['symbol']), now, record['open_interest_usd'])
+
+        with self._lock:
+            for record in funding_rates:
+                self._funding[(record['exchange'], record['symbol'])] = dict(record)
+            for record in open_interest:
+                change = self._change_24h(record['exchange'], record['symbol'], now, record['open_interest'])
+                self._open_interest[(record['exchange'], record['symbol'])] = dict(record, change_24h=change)
+
+        for callback in self._subscribers:
+            try:
+                callback(funding_rates, open_interest, now)
+            except Exception as e:
+                logger.error(f"파생상품 구독자 오류: {e}")
+
+    def funding_rates(self) -> List[Dict[str, Any]]:
+        """Get the latest funding rate for every (exchange, symbol)"""
+        with self._lock:
+            return [dict(v) for _, v in sorted(self._funding.items())]
+
+    def open_interest(self) -> List[Dict[str, Any]]:
+        """Get the latest open interest for every (exchange, symbol)"""
+        with self._lock:
+            return [dict(v) for _, v in sorted(self._open_interest.items())]
+
+    def resolve_key(self, metric: str, exchange: str, symbol: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Find the history key matching exchange/symbol case-insensitively
+
+        Symbols match with or without the separator (e.g. 'btcusdt' matches 'BTC/USDT').
+        """
+        def normalize(value):
+            return re.sub(r"[^a-z0-9]", "", value.lower())
+
+        for key in self.history.keys():
+            if key[0] == metric and key[1].lower() == exchange.lower() and normalize(key[2]) == normalize(symbol):
+                return key
+        return None
+
+    def flush(self):
+        """Persist the history to disk if the store is file-backed"""
+        self.history.flush()
+
+
+def create_derivatives_engine(store: DerivativesStore, adapters: Optional[List[ExchangeAdapter]] = None,
+                              interval: float = 60.0) -> IngestionEngine:
+    """
+    Create an ingestion engine collecting all exchange adapters into the store
+
+    Args:
+        store: Destination store
+        adapters: Exchange adapters (defaults to Binance, Bybit, OKX and Deribit)
+        interval: Seconds between collection rounds
+
+    Returns:
+        IngestionEngine: Engine (not yet started)
+    """
+    if adapters is None:
+        adapters = [BinanceAdapter(), BybitAdapter(), OKXAdapter(), DeribitAdapter()]
+
+    def sink(adapter, result):
+        funding_rates, open_interest = result
+        store.add(funding_rates, open_interest)
+        store.flush()
+
+    return IngestionEngine("derivatives", adapters, sink, interval=interval)
+
+
+# 애플리케이션 전역 스토어 및 엔진
+derivatives_store = DerivativesStore(TimeSeriesStore(
+    os.getenv("DERIVATIVES_HISTORY_DIR", str(DATABASE_DIR / "timeseries" / "derivatives"))
+))
+derivatives_engine = create_derivatives_engine(
+    derivatives_store,
+    interval=float(os.getenv("DERIVATIVES_POLL_INTERVAL", "60")),
+)
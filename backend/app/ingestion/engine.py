@@ -0,0 +1,184 @@
+"""
+외부 데이터 소스 수집 엔진
+
+여러 소스를 스레드 풀에서 병렬로 수집하고, 소스별 최신성(freshness)과 지연 시간을 추적합니다.
+"""
+
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+
+logger = logging.getLogger('ingestion')
+
+# 지연 시간 이동 평균 가중치
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class SourceStats:
+    """
+    Per-source collection statistics (freshness, latency, error counts)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.last_attempt: Optional[float] = None
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_latency_ms: Optional[float] = None
+        self.avg_latency_ms: Optional[float] = None
+        self.success_count = 0
+        self.error_count = 0
+
+    def record_success(self, started: float, finished: float):
+        latency_ms = (finished - started) * 1000
+        self.last_attempt = started
+        self.last_success = finished
+        self.last_error = None
+        self.last_latency_ms = latency_ms
+        if self.avg_latency_ms is None:
+            self.avg_latency_ms = latency_ms
+        else:
+            self.avg_latency_ms += LATENCY_EWMA_ALPHA * (latency_ms - self.avg_latency_ms)
+        self.success_count += 1
+
+    def record_failure(self, started: float, error: Exception):
+        self.last_attempt = started
+        self.last_error = str(error)
+        self.error_count += 1
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Return a serializable view of the statistics
+
+        Args:
+            now: Reference time used to compute freshness (defaults to time.time())
+
+        Returns:
+            Dict: Statistics including `freshness_seconds` (None if never succeeded)
+        """
+        now = time.time() if now is None else now
+        return {
+            "source": self.name,
+            "freshness_seconds": None if self.last_success is None else max(0.0, now - self.last_success),
+            "last_latency_ms": self.last_latency_ms,
+            "avg_latency_ms": self.avg_latency_ms,
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "last_error": self.last_error,
+        }
+
+
+class IngestionStatus(BaseModel):
+    """Response schema of SourceStats.snapshot(), shared by the routers' /status endpoints"""
+    source: str
+    freshness_seconds: Optional[float] = None
+    last_latency_ms: Optional[float] = None
+    avg_latency_ms: Optional[float] = None
+    success_count: int
+    error_count: int
+    last_error: Optional[str] = None
+
+
+class IngestionEngine:
+    """
+    Collects from a set of sources concurrently and hands each result to a sink
+
+    Each source must expose a `name` attribute and a `collect()` method.
+    The value returned by `collect()` is passed to `sink(source, result)`.
+    """
+
+    def __init__(self, name: str, sources: List[Any], sink: Callable[[Any, Any], None],
+                 interval: float = 30.0, max_workers: Optional[int] = None):
+        """
+        Args:
+            name: Engine name used for logging and the worker thread
+            sources: Source objects with `name` and `collect()`
+            sink: Callback receiving (source, result) for each successful collection
+            interval: Seconds between collection rounds when running in the background
+            max_workers: Thread pool size (defaults to one worker per source)
+        """
+        self.name = name
+        self.sources = list(sources)
+        self.sink = sink
+        self.interval = interval
+        self.max_workers = max_workers or max(1, len(self.sources))
+        self.stats: Dict[str, SourceStats] = {s.name: SourceStats(s.name) for s in self.sources}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _collect_source(self, source):
+        started = time.time()
+        try:
+            result = source.collect()
+            self.sink(source, result)
+        except Exception as e:
+            logger.error(f"[{self.name}] {source.name} 수집 오류: {e}")
+            with self._lock:
+                self.stats[source.name].record_failure(started, e)
+            return False
+        with self._lock:
+            self.stats[source.name].record_success(started, time.time())
+        return True
+
+    def collect_once(self) -> int:
+        """
+        Run one collection round over all sources in parallel
+
+        Returns:
+            int: Number of sources collected successfully
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._collect_source, self.sources))
+        return sum(1 for ok in results if ok)
+
+    def has_collected(self) -> bool:
+        """Return True once at least one source has been collected successfully"""
+        with self._lock:
+            return any(s.last_success is not None for s in self.stats.values())
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Get per-source freshness and latency
+
+        Returns:
+            List[Dict]: One snapshot per source
+        """
+        now = time.time()
+        with self._lock:
+            return [self.stats[s.name].snapshot(now) for s in self.sources]
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.collect_once()
+            except Exception as e:
+                logger.error(f"[{self.name}] 수집 루프 오류: {e}")
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """Start the background collection loop (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"ingestion-{self.name}", daemon=True)
+        self._thread.start()
+        logger.info(f"[{self.name}] 수집 루프 시작 (주기 {self.interval}초)")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background collection loop"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+async def ensure_collected(engine: IngestionEngine):
+    """Collect once in the threadpool if the engine's background loop has not succeeded yet"""
+    if not engine.has_collected():
+        await run_in_threadpool(engine.collect_once)
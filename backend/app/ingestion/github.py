@@ -0,0 +1,355 @@
+"""
+GitHub 저장소 활동 수집기
+
+저장소 통계와 최근 PR을 로컬 미러로 유지합니다.
+ETag / Last-Modified 조건부 요청으로 변경이 없으면 304 응답만 받고(레이트 리밋 미차감),
+PR은 updated_at 워터마크 기준으로 변경된 것만 페이지 단위로 증분 동기화합니다.
+미러와 조건부 요청 검증자(validator)는 JSON 파일에 저장되어 재시작 후에도 유지됩니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from app.database import DATABASE_DIR
+from app.ingestion.engine import IngestionEngine
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('ingestion')
+
+# 기본 추적 저장소 (키=owner/name)
+DEFAULT_REPOSITORIES = "bitcoin=bitcoin/bitcoin,go-ethereum=ethereum/go-ethereum,consensus-specs=ethereum/consensus-specs"
+
+# 저장소별로 미러링할 최근 PR 수
+DEFAULT_MAX_PULL_REQUESTS = 30
+
+# /repos/{repo} 응답으로 채워지는 필수 통계 (릴리스/기여자 수는 선택)
+REQUIRED_STATS = ('stars', 'forks', 'open_issues', 'watchers', 'last_commit')
+
+
+def parse_repositories(value: str) -> Dict[str, str]:
+    """
+    Parse 'key=owner/name,...' into {key: 'owner/name'}
+
+    Entries without a key use the repository name as key.
+    """
+    repositories = {}
+    for entry in filter(None, (part.strip() for part in value.split(','))):
+        key, _, full_name = entry.rpartition('=')
+        repositories[key or full_name.split('/')[-1]] = full_name
+    return repositories
+
+
+class ConditionalFetcher:
+    """
+    GET helper that sends If-None-Match / If-Modified-Since for previously seen URLs
+
+    `validators` maps URL -> {'etag': ..., 'last_modified': ...} and is persisted by the caller.
+    """
+
+    def __init__(self, base_url: str, token: Optional[str] = None, timeout: float = 10,
+                 validators: Optional[Dict[str, Dict[str, str]]] = None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.validators = validators if validators is not None else {}
+        self.session = get_session_with_retries()
+        self.session.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        })
+        if token:
+            self.session.headers['Authorization'] = f"Bearer {token}"
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    def cache_key(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Key under which the validators for `path` + `params` are stored"""
+        url = f"{self.base_url}{path}"
+        return url + ('?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items())) if params else '')
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None,
+            conditional: bool = True, pending: Optional[Dict[str, Dict[str, str]]] = None
+            ) -> Tuple[int, Any, Any]:
+        """
+        Perform a (conditional) GET
+
+        Args:
+            pending: If given, new validators are stored here instead of in `validators`
+                so the caller can commit them once the data they describe is saved
+
+        Returns:
+            Tuple[int, Any, requests.Response]: (status, JSON body or None for 304/404, response)
+        """
+        url = f"{self.base_url}{path}"
+        cache_key = self.cache_key(path, params)
+        headers = {}
+        cached = self.validators.get(cache_key) if conditional else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        self.request_count += 1
+        if response.status_code == 304:
+            self.not_modified_count += 1
+            return 304, None, response
+        if response.status_code == 404:
+            return 404, None, response
+        response.raise_for_status()
+
+        if conditional:
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if etag or last_modified:
+                (self.validators if pending is None else pending)[cache_key] = {'etag': etag, 'last_modified': last_modified}
+        return response.status_code, response.json(), response
+
+
+class RepositoryMirror:
+    """
+    Local, file-backed mirror of one repository's stats and recent pull requests
+    """
+
+    def __init__(self, key: str, full_name: str, path: Optional[str] = None):
+        self.key = key
+        self.full_name = full_name
+        self.path = path
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {}
+        self.pull_requests: Dict[str, Dict[str, Any]] = {}
+        self.pr_watermark: Optional[str] = None
+        self.validators: Dict[str, Dict[str, str]] = {}
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"GitHub 미러 파일 로드 오류 ({self.path}): {e}")
+            return
+        self.stats = state.get('stats', {})
+        self.pull_requests = state.get('pull_requests', {})
+        self.pr_watermark = state.get('pr_watermark')
+        self.validators = state.get('validators', {})
+
+    def save(self):
+        """Atomically write the mirror state to disk"""
+        if not self.path:
+            return
+        with self._lock:
+            state = {
+                'full_name': self.full_name,
+                'stats': self.stats,
+                'pull_requests': self.pull_requests,
+                'pr_watermark': self.pr_watermark,
+                'validators': self.validators,
+            }
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def snapshot(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get stats and pull requests (most recently updated first)
+
+        Returns:
+            Dict: {'stats': ..., 'pull_requests': [...]} (stats is empty before the first sync)
+        """
+        with self._lock:
+            prs = sorted(self.pull_requests.values(), key=lambda pr: pr['updated_at'], reverse=True)
+            return {'stats': dict(self.stats), 'pull_requests': [dict(pr) for pr in prs[:limit]]}
+
+
+class GitHubRepoCollector:
+    """
+    Ingestion source syncing one repository into its RepositoryMirror
+    """
+
+    def __init__(self, mirror: RepositoryMirror, base_url: str = "https://api.github.com",
+                 token: Optional[str] = None, max_pull_requests: int = DEFAULT_MAX_PULL_REQUESTS,
+                 timeout: float = 10):
+        self.mirror = mirror
+        self.name = mirror.key
+        self.max_pull_requests = max_pull_requests
+        self.fetcher = ConditionalFetcher(base_url, token, timeout, validators=mirror.validators)
+
+    def _repo_path(self, suffix: str = '') -> str:
+        return f"/repos/{self.mirror.full_name}{suffix}"
+
+    @staticmethod
+    def _last_page(response) -> Optional[int]:
+        # Link: <...&page=123>; rel="last"
+        match = re.search(r'[?&]page=(\d+)[^>]*>;\s*rel="last"', response.headers.get('Link', ''))
+        return int(match.group(1)) if match else None
+
+    def sync_stats(self) -> bool:
+        """Refresh repository stats; returns True if anything changed"""
+        stats = dict(self.mirror.stats)
+        changed = False
+        # 검증자는 통계가 미러에 반영된 뒤에만 저장 (중간 실패 시 다음 주기에 304로 누락되지 않도록)
+        pending: Dict[str, Dict[str, str]] = {}
+
+        # 필수 통계가 비어 있으면 304로 건너뛰지 않도록 기존 검증자를 버리고 전체 응답을 받음
+        if not all(field in stats for field in REQUIRED_STATS):
+            self.fetcher.validators.pop(self.fetcher.cache_key(self._repo_path()), None)
+        status, repo, _ = self.fetcher.get(self._repo_path(), pending=pending)
+        if status == 200:
+            stats.update({
+                'stars': repo['stargazers_count'],
+                'forks': repo['forks_count'],
+                'open_issues': repo['open_issues_count'],
+                'watchers': repo.get('subscribers_count', repo.get('watchers_count', 0)),
+                'last_commit': repo['pushed_at'],
+            })
+            changed = True
+
+        # 선택 항목은 실패해도 이전 값을 유지
+        try:
+            status, release, _ = self.fetcher.get(self._repo_path('/releases/latest'), pending=pending)
+            if status == 200:
+                stats.update({'release_version': release['tag_name'], 'release_date': release['published_at']})
+                changed = True
+        except (requests.RequestException, ValueError, KeyError) as e:
+            logger.warning(f"GitHub 릴리스 조회 실패 ({self.mirror.full_name}): {e}")
+
+        try:
+            status, contributors, response = self.fetcher.get(self._repo_path('/contributors'),
+                                                              {'per_page': 1, 'anon': 'true'}, pending=pending)
+            if status == 200:
+                stats['contributors_count'] = self._last_page(response) or len(contributors)
+                changed = True
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"GitHub 기여자 수 조회 실패 ({self.mirror.full_name}): {e}")
+
+        with self.mirror._lock:
+            if changed:
+                self.mirror.stats = stats
+            self.fetcher.validators.update(pending)
+        return changed
+
+    def sync_pull_requests(self) -> int:
+        """
+        Incrementally sync pull requests updated since the last watermark
+
+        Returns:
+            int: Number of pull requests (re)mirrored
+        """
+        watermark = self.mirror.pr_watermark
+        per_page = min(100, self.max_pull_requests)
+        changed: List[Dict[str, Any]] = []
+        page = 1
+        while len(changed) < self.max_pull_requests:
+            params = {'state': 'all', 'sort': 'updated', 'direction': 'desc', 'per_page': per_page, 'page': page}
+            # 첫 페이지만 조건부 요청: 304면 그 이후 변경된 PR이 없음
+            status, pulls, _ = self.fetcher.get(self._repo_path('/pulls'), params, conditional=(page == 1))
+            if status != 200 or not pulls:
+                break
+            reached_watermark = False
+            for pull in pulls:
+                if watermark and pull['updated_at'] <= watermark:
+                    reached_watermark = True
+                    break
+                changed.append(pull)
+            if reached_watermark or len(pulls) < per_page:
+                break
+            page += 1
+
+        changed = changed[:self.max_pull_requests]
+        mirrored = {}
+        for pull in changed:
+            # additions/deletions/comments는 상세 조회에서만 제공됨
+            status, detail, _ = self.fetcher.get(self._repo_path(f"/pulls/{pull['number']}"))
+            if status == 304:
+                with self.mirror._lock:
+                    existing = self.mirror.pull_requests.get(str(pull['number']))
+                if existing is not None:
+                    # 상세 정보는 그대로이므로 기존 항목을 유지하고 목록의 갱신 시각만 반영
+                    mirrored[str(pull['number'])] = dict(existing, updated_at=pull['updated_at'])
+                    continue
+            detail = detail if status == 200 else pull
+            mirrored[str(pull['number'])] = {
+                'id': pull['number'],
+                'title': detail['title'],
+                'author': (detail.get('user') or {}).get('login', ''),
+                'created_at': detail['created_at'],
+                'updated_at': detail['updated_at'],
+                'state': 'merged' if detail.get('merged_at') else detail['state'],
+                'url': detail['html_url'],
+                'comments': detail.get('comments', 0) + detail.get('review_comments', 0),
+                'additions': detail.get('additions', 0),
+                'deletions': detail.get('deletions', 0),
+            }
+
+        with self.mirror._lock:
+            self.mirror.pull_requests.update(mirrored)
+            if changed:
+                self.mirror.pr_watermark = max([changed[0]['updated_at']] + ([watermark] if watermark else []))
+            # 최근 갱신 순으로 max_pull_requests개만 유지
+            keep = sorted(self.mirror.pull_requests.values(), key=lambda pr: pr['updated_at'], reverse=True)
+            self.mirror.pull_requests = {str(pr['id']): pr for pr in keep[:self.max_pull_requests]}
+            # 미러에서 빠진 PR의 상세 조회 검증자는 버림
+            detail_prefix = f"{self.fetcher.base_url}{self._repo_path('/pulls/')}"
+            for cache_key in list(self.mirror.validators):
+                if cache_key.startswith(detail_prefix) and cache_key[len(detail_prefix):] not in self.mirror.pull_requests:
+                    del self.mirror.validators[cache_key]
+        return len(mirrored)
+
+    def collect(self) -> Dict[str, int]:
+        stats_changed = self.sync_stats()
+        pulls_changed = self.sync_pull_requests()
+        return {'stats_changed': int(stats_changed), 'pull_requests_changed': pulls_changed}
+
+
+def create_github_engine(mirrors: Dict[str, RepositoryMirror], base_url: str = "https://api.github.com",
+                         token: Optional[str] = None, interval: float = 300.0,
+                         max_pull_requests: int = DEFAULT_MAX_PULL_REQUESTS) -> IngestionEngine:
+    """
+    Create an ingestion engine syncing every mirror and saving it after each round
+
+    Args:
+        mirrors: Repository mirrors by key
+        base_url: GitHub API base URL
+        token: Optional GitHub token (raises the rate limit)
+        interval: Seconds between sync rounds
+        max_pull_requests: Recent pull requests kept per repository
+
+    Returns:
+        IngestionEngine: Engine (not yet started)
+    """
+    collectors = [GitHubRepoCollector(mirror, base_url, token, max_pull_requests) for mirror in mirrors.values()]
+
+    def sink(collector, result):
+        collector.mirror.save()
+
+    return IngestionEngine("github", collectors, sink, interval=interval)
+
+
+def create_mirrors(repositories: Dict[str, str], directory: Optional[str]) -> Dict[str, RepositoryMirror]:
+    """Create (and load) one mirror per tracked repository"""
+    return {
+        key: RepositoryMirror(key, full_name, os.path.join(directory, f"{key}.json") if directory else None)
+        for key, full_name in repositories.items()
+    }
+
+
+# 애플리케이션 전역 미러 및 엔진
+github_mirrors = create_mirrors(
+    parse_repositories(os.getenv("GITHUB_REPOSITORIES", DEFAULT_REPOSITORIES)),
+    os.getenv("GITHUB_MIRROR_DIR", str(DATABASE_DIR / "github")),
+)
+github_engine = create_github_engine(
+    github_mirrors,
+    base_url=os.getenv("GITHUB_API_URL", "https://api.github.com"),
+    token=os.getenv("GITHUB_TOKEN"),
+    interval=float(os.getenv("GITHUB_POLL_INTERVAL", "300")),
+)
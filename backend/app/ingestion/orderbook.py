@@ -0,0 +1,269 @@
+"""
+로컬 호가창 유지 및 유동성 구간 집계
+
+바이낸스 REST 스냅샷(/api/v3/depth)과 웹소켓 diff 스트림(<symbol>@depth)으로 심볼별 로컬 호가창을 유지합니다.
+업데이트 ID가 끊기면 스냅샷부터 다시 동기화합니다.
+호가가 바뀔 때마다 정렬된 상위 호가와 중간가 기준 ±0.1/0.5/1% 구간 유동성을 미리 계산해 두므로,
+조회는 이미 만들어진 스냅샷을 읽기만 합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('ingestion')
+
+DEFAULT_SYMBOLS = ["BTCUSDT", "ETHUSDT"]
+# 유동성 집계 구간 (중간가 대비 %)
+LIQUIDITY_BANDS = (0.1, 0.5, 1.0)
+# 스냅샷에 보관하는 최대 호가 단계 수
+MAX_DEPTH = 100
+
+
+class OrderBookGap(Exception):
+    """Raised when a diff event does not continue the local book's update sequence"""
+
+    def __init__(self, symbol: str, last_update_id: int, event: Dict[str, Any]):
+        super().__init__(f"{symbol}: expected update {last_update_id + 1}, got {event['U']}-{event['u']}")
+        self.event = event
+
+
+class OrderBook:
+    """
+    Local order book of one symbol built from a REST snapshot plus diff events
+
+    `apply()` follows Binance's rules: events ending at or before the current update id
+    are ignored, and an event must cover `last_update_id + 1` (U <= last + 1 <= u),
+    otherwise OrderBookGap is raised and the book has to be reloaded from a snapshot.
+    After every change a read-only snapshot (top levels, mid, spread, liquidity bands)
+    is published; readers only take the reference.
+    """
+
+    def __init__(self, symbol: str, bands: Sequence[float] = LIQUIDITY_BANDS, max_depth: int = MAX_DEPTH):
+        self.symbol = symbol
+        self.bands = tuple(bands)
+        self.max_depth = max_depth
+        self.last_update_id: Optional[int] = None
+        self.update_count = 0
+        self._bids: Dict[float, float] = {}
+        self._asks: Dict[float, float] = {}
+        self.snapshot: Optional[Dict[str, Any]] = None
+
+    @staticmethod
+    def _update_levels(levels: Dict[float, float], updates: Iterable[Sequence[str]]):
+        for price, quantity in updates:
+            price, quantity = float(price), float(quantity)
+            if quantity == 0:
+                levels.pop(price, None)
+            else:
+                levels[price] = quantity
+
+    def load_snapshot(self, snapshot: Dict[str, Any], timestamp: Optional[float] = None):
+        """
+        Replace the book with a REST depth snapshot ({'lastUpdateId', 'bids', 'asks'})
+        """
+        self._bids, self._asks = {}, {}
+        self._update_levels(self._bids, snapshot["bids"])
+        self._update_levels(self._asks, snapshot["asks"])
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self._publish(timestamp)
+
+    def apply(self, event: Dict[str, Any], timestamp: Optional[float] = None) -> bool:
+        """
+        Apply one depth diff event ({'U', 'u', 'b', 'a', 'E'})
+
+        Returns:
+            bool: False if the event was older than the book and ignored
+
+        Raises:
+            OrderBookGap: If the event does not continue the update sequence
+        """
+        if event["u"] <= self.last_update_id:
+            return False
+        if not event["U"] <= self.last_update_id + 1 <= event["u"]:
+            raise OrderBookGap(self.symbol, self.last_update_id, event)
+        self._update_levels(self._bids, event["b"])
+        self._update_levels(self._asks, event["a"])
+        self.last_update_id = int(event["u"])
+        self.update_count += 1
+        if timestamp is None and "E" in event:
+            timestamp = event["E"] / 1000
+        self._publish(timestamp)
+        return True
+
+    def _publish(self, timestamp: Optional[float]):
+        bid_prices = np.array(sorted(self._bids, reverse=True), dtype=np.float64)
+        ask_prices = np.array(sorted(self._asks), dtype=np.float64)
+        bid_quantities = np.array([self._bids[price] for price in bid_prices.tolist()], dtype=np.float64)
+        ask_quantities = np.array([self._asks[price] for price in ask_prices.tolist()], dtype=np.float64)
+
+        mid = spread = None
+        bands = []
+        if len(bid_prices) and len(ask_prices):
+            mid = float((bid_prices[0] + ask_prices[0]) / 2)
+            spread = float(ask_prices[0] - bid_prices[0])
+            # 누적 수량/금액에서 구간 경계까지의 합을 이진 탐색으로 조회
+            # 경계에 걸친 호가가 부동소수점 오차로 빠지지 않도록 구간 폭을 아주 약간 넓힘
+            reach = mid * np.array(self.bands) / 100 * (1 + 1e-9)
+            bid_index = np.searchsorted(-bid_prices, -(mid - reach), side='right')
+            ask_index = np.searchsorted(ask_prices, mid + reach, side='right')
+            bid_quantity = np.r_[0.0, np.cumsum(bid_quantities)][bid_index]
+            ask_quantity = np.r_[0.0, np.cumsum(ask_quantities)][ask_index]
+            bid_notional = np.r_[0.0, np.cumsum(bid_prices * bid_quantities)][bid_index]
+            ask_notional = np.r_[0.0, np.cumsum(ask_prices * ask_quantities)][ask_index]
+            bands = [
+                {"band_percent": band, "bid_quantity": bq, "ask_quantity": aq, "bid_notional": bn, "ask_notional": an}
+                for band, bq, aq, bn, an in zip(self.bands, bid_quantity.tolist(), ask_quantity.tolist(),
+                                                bid_notional.tolist(), ask_notional.tolist())
+            ]
+
+        depth = self.max_depth
+        self.snapshot = {
+            "symbol": self.symbol,
+            "last_update_id": self.last_update_id,
+            "timestamp": timestamp or time.time(),
+            "mid": mid,
+            "spread": spread,
+            "bids": np.column_stack([bid_prices[:depth], bid_quantities[:depth]]).tolist(),
+            "asks": np.column_stack([ask_prices[:depth], ask_quantities[:depth]]).tolist(),
+            "bands": bands,
+        }
+
+
+class BinanceDepthFeed:
+    """
+    Keeps one OrderBook in sync with Binance in a background thread
+
+    Opens the diff stream first, then loads a REST snapshot that is at least as new as
+    the first buffered event, replays the buffer and keeps applying events. A sequence
+    gap reloads the snapshot; a dropped connection reconnects after `retry_delay`.
+    """
+
+    def __init__(self, symbol: str, rest_url: str = "https://api.binance.com",
+                 stream_url: str = "wss://stream.binance.com:9443/ws", snapshot_limit: int = 1000,
+                 retry_delay: float = 5.0, timeout: float = 10):
+        self.symbol = symbol.upper()
+        self.name = f"binance:{self.symbol}"
+        self.book = OrderBook(self.symbol)
+        self.rest_url = rest_url.rstrip('/')
+        self.stream_url = f"{stream_url.rstrip('/')}/{self.symbol.lower()}@depth@100ms"
+        self.snapshot_limit = snapshot_limit
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.session = get_session_with_retries()
+        self.resync_count = 0
+        self.last_error: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def fetch_snapshot(self) -> Dict[str, Any]:
+        response = self.session.get(f"{self.rest_url}/api/v3/depth",
+                                    params={"symbol": self.symbol, "limit": self.snapshot_limit}, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _receive(self, connection) -> Optional[Dict[str, Any]]:
+        # 종료 요청을 확인할 수 있도록 짧은 타임아웃으로 대기
+        while not self._stop_event.is_set():
+            try:
+                return json.loads(connection.recv(timeout=1.0))
+            except TimeoutError:
+                continue
+        return None
+
+    def _synchronize(self, connection):
+        # 스트림을 먼저 열고 첫 이벤트를 받은 뒤 스냅샷 조회 (그동안의 이벤트는 연결 버퍼에 쌓임)
+        pending = [self._receive(connection)]
+        while pending[0] is not None and not self._stop_event.is_set():
+            snapshot = self.fetch_snapshot()
+            # 스냅샷이 버퍼의 첫 이벤트보다 오래되었으면 잠시 후 다시 조회
+            if snapshot["lastUpdateId"] + 1 < pending[0]["U"]:
+                self._stop_event.wait(0.5)
+                continue
+            self.book.load_snapshot(snapshot)
+            try:
+                for event in pending:
+                    self.book.apply(event)
+                while True:
+                    event = self._receive(connection)
+                    if event is None:
+                        return
+                    self.book.apply(event)
+            except OrderBookGap as e:
+                logger.warning(f"[{self.name}] 호가 업데이트 누락, 스냅샷부터 다시 동기화: {e}")
+                self.resync_count += 1
+                pending = [e.event]
+
+    def run(self):
+        """Synchronize until stop() is called (blocking)"""
+        try:
+            from websockets.sync.client import connect
+        except ImportError:
+            logger.error(f"[{self.name}] websockets 패키지가 없어 호가창을 동기화할 수 없습니다")
+            return
+        while not self._stop_event.is_set():
+            try:
+                with connect(self.stream_url, open_timeout=self.timeout) as connection:
+                    self._synchronize(connection)
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"[{self.name}] 호가 스트림 오류: {e}")
+            self._stop_event.wait(self.retry_delay)
+
+    def start(self):
+        """Start the background synchronization thread (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, name=f"orderbook-{self.symbol}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background synchronization thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+class OrderBookManager:
+    """
+    Order book feeds for all tracked symbols, started and stopped with the ingestion engines
+    """
+
+    def __init__(self, feeds: List[BinanceDepthFeed]):
+        self.feeds = {feed.symbol: feed for feed in feeds}
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest published snapshot of a symbol
+
+        Returns:
+            Dict: Snapshot, or None if the symbol is not tracked or not synchronized yet
+        """
+        feed = self.feeds.get(symbol.upper().replace("/", "").replace("-", ""))
+        return feed.book.snapshot if feed else None
+
+    def symbols(self) -> List[str]:
+        return list(self.feeds)
+
+    def start(self):
+        for feed in self.feeds.values():
+            feed.start()
+
+    def stop(self):
+        for feed in self.feeds.values():
+            feed.stop()
+
+
+# 애플리케이션 전역 호가창 (ORDERBOOK_SYMBOLS)
+orderbook_manager = OrderBookManager([
+    BinanceDepthFeed(symbol) for symbol in os.getenv("ORDERBOOK_SYMBOLS", ",".join(DEFAULT_SYMBOLS)).split(",")
+])
@@ -0,0 +1,248 @@
+"""
+다중 코인 김치 프리미엄 계산 및 기록
+
+업비트 KRW 마켓과 바이낸스 USDT 마켓의 전체 시세를 기준 심볼(BTC, ETH, ...)로 맞추고,
+양쪽에 모두 상장된 모든 쌍의 프리미엄을 NumPy 벡터 연산 한 번으로 계산합니다.
+계산된 프리미엄과 기초 가격/환율은 시계열 저장소에 기록해 이력 조회에 사용합니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.database import DATABASE_DIR
+from app.ingestion.engine import IngestionEngine
+from app.timeseries import TimeSeriesStore
+
+UPBIT_QUOTE_PREFIX = "KRW-"
+BINANCE_QUOTE = "USDT"
+
+logger = logging.getLogger('ingestion')
+
+
+def upbit_krw_prices(tickers: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Map Upbit KRW tickers to base symbol -> KRW price ('KRW-BTC' -> 'BTC')
+
+    Args:
+        tickers: Raw Upbit ticker by market code (UpbitTicker.fetch_all() result)
+
+    Returns:
+        Dict[str, float]: KRW trade price by base symbol
+    """
+    prefix_length = len(UPBIT_QUOTE_PREFIX)
+    return {
+        market[prefix_length:]: float(ticker["trade_price"])
+        for market, ticker in tickers.items()
+        if market.startswith(UPBIT_QUOTE_PREFIX) and ticker.get("trade_price")
+    }
+
+
+def binance_usdt_prices(tickers: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Map Binance price tickers to base symbol -> USDT price ('BTCUSDT' -> 'BTC')
+
+    Args:
+        tickers: Raw /api/v3/ticker/price items ({'symbol': ..., 'price': ...})
+
+    Returns:
+        Dict[str, float]: USDT price by base symbol (pairs quoted at 0, i.e. delisted, are skipped)
+    """
+    prices = {}
+    for ticker in tickers:
+        symbol = ticker["symbol"]
+        if symbol.endswith(BINANCE_QUOTE) and len(symbol) > len(BINANCE_QUOTE):
+            price = float(ticker["price"])
+            if price > 0:
+                prices[symbol[:-len(BINANCE_QUOTE)]] = price
+    return prices
+
+
+class PremiumTable(NamedTuple):
+    """
+    Kimchi premium of every pair listed on both exchanges, as parallel arrays sorted by premium
+    """
+    symbols: List[str]
+    upbit_price_krw: np.ndarray
+    binance_price_usd: np.ndarray
+    premium_percentage: np.ndarray
+    # top 필터 적용 전 양쪽에 상장된 쌍의 수
+    pair_count: int
+
+    def rows(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [
+            {
+                "symbol": symbol,
+                "premium_percentage": premium,
+                "binance_price_usd": binance_price,
+                "upbit_price_krw": upbit_price,
+            }
+            for symbol, premium, binance_price, upbit_price in zip(
+                self.symbols[:limit], self.premium_percentage[:limit].tolist(),
+                self.binance_price_usd[:limit].tolist(), self.upbit_price_krw[:limit].tolist())
+        ]
+
+
+def premium_table(upbit_prices: Dict[str, float], binance_prices: Dict[str, float], exchange_rate: float,
+                  top: Optional[int] = None, ascending: bool = False) -> PremiumTable:
+    """
+    Compute the kimchi premium of every symbol priced on both exchanges in one vectorized pass
+
+    Uses the same formula as calculate_premium for each pair:
+    (upbit_krw - binance_usdt * usd_krw) / (binance_usdt * usd_krw) * 100
+
+    Args:
+        upbit_prices: KRW price by base symbol
+        binance_prices: USDT price by base symbol
+        exchange_rate: USD/KRW exchange rate
+        top: Keep only the first N rows after sorting
+        ascending: Sort from the lowest (most negative) premium instead of the highest
+
+    Returns:
+        PremiumTable: Aligned prices and premiums, sorted by premium
+    """
+    # 심볼 정렬은 딕셔너리 조회로 (수백 개 문자열은 np.intersect1d의 정렬 기반 교집합보다 빠름)
+    symbols = [symbol for symbol in upbit_prices if symbol in binance_prices]
+    count = len(symbols)
+    upbit = np.fromiter(map(upbit_prices.__getitem__, symbols), dtype=np.float64, count=count)
+    binance = np.fromiter(map(binance_prices.__getitem__, symbols), dtype=np.float64, count=count)
+
+    binance_krw = binance * exchange_rate
+    premium = (upbit - binance_krw) / binance_krw * 100
+
+    # 안정 정렬로 같은 프리미엄은 업비트 마켓 순서 유지
+    order = np.argsort(premium if ascending else -premium, kind="stable")
+    if top is not None:
+        order = order[:top]
+    return PremiumTable([symbols[i] for i in order.tolist()], upbit[order], binance[order], premium[order], count)
+
+
+class PremiumHistory:
+    """
+    Records computed premiums and their inputs into a TimeSeriesStore
+
+    Series are keyed by (metric, symbol) for the PAIR_METRICS and by
+    ('exchange_rate', 'USDKRW') for the FX rate. Recording only appends in memory;
+    a background thread started with `start()` flushes the store every
+    `flush_interval` seconds, so no disk write happens on the request path.
+    """
+
+    PAIR_METRICS = ("premium_percentage", "binance_price_usd", "upbit_price_krw")
+    EXCHANGE_RATE_KEY = ("exchange_rate", "USDKRW")
+
+    def __init__(self, history: Optional[TimeSeriesStore] = None, flush_interval: float = 30.0):
+        self.history = history if history is not None else TimeSeriesStore()
+        self.flush_interval = flush_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, symbol: str, premium: float, binance_price: float, upbit_price: float, exchange_rate: float,
+               timestamp: Optional[float] = None):
+        """
+        Record one computed premium and the prices it was computed from
+
+        Args:
+            symbol: Base symbol (e.g., 'BTC')
+            premium: Premium percentage
+            binance_price: Binance USDT price
+            upbit_price: Upbit KRW price
+            exchange_rate: USD/KRW exchange rate
+            timestamp: Computation time (defaults to time.time())
+        """
+        now = time.time() if timestamp is None else timestamp
+        for metric, value in zip(self.PAIR_METRICS, (premium, binance_price, upbit_price)):
+            self.history.append((metric, symbol), now, value)
+        self.history.append(self.EXCHANGE_RATE_KEY, now, exchange_rate)
+
+    def record_table(self, table: PremiumTable, exchange_rate: float, timestamp: Optional[float] = None):
+        """
+        Record every row of a premium table at one timestamp
+        """
+        now = time.time() if timestamp is None else timestamp
+        for metric, values in zip(self.PAIR_METRICS,
+                                  (table.premium_percentage, table.binance_price_usd, table.upbit_price_krw)):
+            for symbol, value in zip(table.symbols, values.tolist()):
+                self.history.append((metric, symbol), now, value)
+        self.history.append(self.EXCHANGE_RATE_KEY, now, exchange_rate)
+
+    def symbols(self) -> List[str]:
+        """Symbols with recorded premiums"""
+        return sorted(key[1] for key in self.history.keys() if key[0] == "premium_percentage")
+
+    def flush(self):
+        """Persist the history to disk if the store is file-backed"""
+        self.history.flush()
+
+    def _run(self):
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"김치 프리미엄 이력 저장 오류: {e}")
+
+    def start(self):
+        """Start the background flush loop (no-op if already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="premium-history-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background flush loop and flush what is left"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+
+class MarketSnapshotSource:
+    """
+    Ingestion source returning (upbit_tickers, binance_tickers, usd_krw_rate) from a fetch function
+
+    Raises when any part is missing, so the engine records the round as failed.
+    """
+
+    name = "market_snapshot"
+
+    def __init__(self, fetch: Callable[[], Tuple[Any, Any, Optional[float]]]):
+        self.fetch = fetch
+
+    def collect(self):
+        snapshot = self.fetch()
+        if any(part is None for part in snapshot):
+            raise RuntimeError("Failed to retrieve necessary price information")
+        return snapshot
+
+
+def create_premium_engine(fetch: Callable[[], Tuple[Any, Any, Optional[float]]], history: PremiumHistory,
+                          interval: float = 30.0) -> IngestionEngine:
+    """
+    Create an ingestion engine recording the full premium table on every round
+
+    Args:
+        fetch: Function returning (Upbit KRW tickers by market, Binance price tickers, USD/KRW rate)
+        history: Destination premium history
+        interval: Seconds between rounds
+
+    Returns:
+        IngestionEngine: Engine (not yet started)
+    """
+    def sink(source, snapshot):
+        upbit_tickers, binance_tickers, exchange_rate = snapshot
+        table = premium_table(upbit_krw_prices(upbit_tickers), binance_usdt_prices(binance_tickers), exchange_rate)
+        history.record_table(table, exchange_rate)
+
+    return IngestionEngine("kimchi_premium", [MarketSnapshotSource(fetch)], sink, interval=interval)
+
+
+# 애플리케이션 전역 김치 프리미엄 이력 (시계열당 최근 KIMCHI_HISTORY_MAX_POINTS개 보관)
+premium_history = PremiumHistory(TimeSeriesStore(
+    os.getenv("KIMCHI_HISTORY_DIR", str(DATABASE_DIR / "timeseries" / "kimchi_premium")),
+    max_points=int(os.getenv("KIMCHI_HISTORY_MAX_POINTS", "100000")),
+), flush_interval=float(os.getenv("KIMCHI_HISTORY_FLUSH_INTERVAL", "30")))
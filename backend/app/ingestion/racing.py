@@ -0,0 +1,224 @@
+"""
+업스트림 소스 경쟁 (hedged requests)
+
+같은 값을 제공하는 여러 소스 중 기본 소스를 먼저 호출하고, 기본 소스의 지연 시간 백분위를
+넘기면 다음 소스를 추가로 호출해 가장 먼저 도착한 유효한 값을 사용합니다.
+소스가 실패하면 헤지 지연을 기다리지 않고 바로 다음 소스를 호출합니다.
+"""
+
+import bisect
+import concurrent.futures
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger('ingestion')
+
+# 경쟁 요청 실행용 공용 스레드 풀 (지연된 패자 요청이 끝날 때까지 워커를 점유하므로 여유 있게 설정)
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix='source-racer')
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with decay
+
+    Buckets grow geometrically from `min_seconds` to `max_seconds`. When the sample count
+    exceeds `max_samples` every bucket is halved, so percentiles follow recent behaviour.
+    """
+
+    def __init__(self, min_seconds: float = 0.001, max_seconds: float = 60.0, buckets_per_decade: int = 20,
+                 max_samples: int = 1000):
+        decades = math.log10(max_seconds / min_seconds)
+        count = int(math.ceil(decades * buckets_per_decade))
+        self.bounds = [min_seconds * 10 ** (i / buckets_per_decade) for i in range(1, count + 1)]
+        self.counts = [0.0] * (count + 1)
+        self.total = 0.0
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+            self.total += 1
+            if self.total > self.max_samples:
+                self.counts = [count / 2 for count in self.counts]
+                self.total /= 2
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Return the upper bound of the bucket holding the q-th quantile (0 < q <= 1), None if empty
+        """
+        with self._lock:
+            if self.total == 0:
+                return None
+            target = q * self.total
+            cumulative = 0.0
+            for index, count in enumerate(self.counts):
+                cumulative += count
+                if cumulative >= target and count:
+                    return self.bounds[min(index, len(self.bounds) - 1)]
+            return self.bounds[-1]
+
+    @property
+    def count(self) -> float:
+        return self.total
+
+
+class RaceSource:
+    """
+    One source in a race: a fetch function plus its latency histogram and counters
+    """
+
+    def __init__(self, name: str, fetch: Callable[[], Any]):
+        self.name = name
+        self.fetch = fetch
+        self.latency = LatencyHistogram()
+        self.success_count = 0
+        self.error_count = 0
+        self.win_count = 0
+        self.last_error: Optional[str] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        def ms(value):
+            return None if value is None else round(value * 1000, 1)
+        return {
+            "source": self.name,
+            "p50_ms": ms(self.latency.percentile(0.5)),
+            "p90_ms": ms(self.latency.percentile(0.9)),
+            "p99_ms": ms(self.latency.percentile(0.99)),
+            "success_count": self.success_count,
+            "error_count": self.error_count,
+            "win_count": self.win_count,
+            "last_error": self.last_error,
+        }
+
+
+class SourceRacer:
+    """
+    Fetches one value from redundant sources with latency-driven hedging
+
+    Sources are tried in order. The next source is started when the running one fails
+    (returns None or raises) or when it is slower than its own `hedge_percentile` latency.
+    The first valid value wins; sources that have not started yet are cancelled and late
+    answers are ignored (but still recorded in their latency histogram).
+    """
+
+    def __init__(self, name: str, sources: Sequence[Tuple[str, Callable[[], Any]]], hedge_percentile: float = 0.9,
+                 default_hedge_delay: float = 1.0, min_hedge_delay: float = 0.05, min_samples: int = 5,
+                 timeout: float = 15.0, validate: Callable[[Any], bool] = lambda value: value is not None,
+                 executor: Optional[concurrent.futures.Executor] = None):
+        """
+        Args:
+            name: Name used in logs and status
+            sources: (name, fetch) pairs in priority order; fetch makes a single attempt
+            hedge_percentile: Latency quantile of the running source after which the next one is started
+            default_hedge_delay: Hedge delay in seconds until a source has `min_samples` successes
+            min_hedge_delay: Lower bound for the hedge delay in seconds
+            min_samples: Successful samples required before the histogram drives the hedge delay
+            timeout: Overall time budget in seconds
+            validate: Predicate for a usable value
+            executor: Executor running the fetches (defaults to a shared thread pool)
+        """
+        self.name = name
+        self.sources = [RaceSource(source_name, fetch) for source_name, fetch in sources]
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+        self.timeout = timeout
+        self.validate = validate
+        self.executor = executor or _executor
+        self.hedge_count = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, source: RaceSource) -> float:
+        """
+        Seconds to wait on a source before hedging to the next one
+        """
+        if source.latency.count < self.min_samples:
+            return self.default_hedge_delay
+        return max(self.min_hedge_delay, source.latency.percentile(self.hedge_percentile))
+
+    def _run(self, source: RaceSource) -> Any:
+        started = time.monotonic()
+        try:
+            value = source.fetch()
+        except Exception as e:
+            with self._lock:
+                source.error_count += 1
+                source.last_error = str(e)
+            raise
+        valid = self.validate(value)
+        with self._lock:
+            if valid:
+                source.success_count += 1
+            else:
+                source.error_count += 1
+                source.last_error = "invalid value"
+        if valid:
+            source.latency.record(time.monotonic() - started)
+        return value
+
+    def fetch(self) -> Any:
+        """
+        Race the sources and return the first valid value
+
+        Returns:
+            The winning value, or None if every source failed or the time budget ran out
+        """
+        deadline = time.monotonic() + self.timeout
+        running: Dict[concurrent.futures.Future, RaceSource] = {}
+        next_index = 0
+        hedge_at = deadline
+
+        def start_next():
+            nonlocal next_index, hedge_at
+            source = self.sources[next_index]
+            next_index += 1
+            running[self.executor.submit(self._run, source)] = source
+            hedge_at = time.monotonic() + self.hedge_delay(source)
+
+        start_next()
+        try:
+            while running:
+                now = time.monotonic()
+                if now >= deadline:
+                    logger.warning(f"{self.name}: 모든 소스가 {self.timeout}초 안에 응답하지 않았습니다")
+                    return None
+                wait_until = min(deadline, hedge_at) if next_index < len(self.sources) else deadline
+                done, _ = concurrent.futures.wait(running, timeout=max(0.0, wait_until - now),
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in done:
+                    source = running.pop(future)
+                    value = None if future.exception() else future.result()
+                    if self.validate(value):
+                        with self._lock:
+                            source.win_count += 1
+                        return value
+                    logger.warning(f"{self.name}: {source.name} 소스 실패, 다음 소스 시도")
+
+                if next_index < len(self.sources) and (not running or time.monotonic() >= hedge_at):
+                    if running:
+                        with self._lock:
+                            self.hedge_count += 1
+                        logger.info(f"{self.name}: 응답 지연으로 {self.sources[next_index].name} 소스에 헤지 요청")
+                    start_next()
+            return None
+        finally:
+            for future in running:
+                future.cancel()
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Return hedge count and per-source latency percentiles and counters
+        """
+        with self._lock:
+            sources = [source.snapshot() for source in self.sources]
+            hedge_count = self.hedge_count
+        for source, snapshot in zip(self.sources, sources):
+            snapshot["hedge_delay_ms"] = round(self.hedge_delay(source) * 1000, 1)
+        return {"name": self.name, "hedge_count": hedge_count, "sources": sources}
+
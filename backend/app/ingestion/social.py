@@ -0,0 +1,340 @@
+"""
+소셜 피드 수집기
+
+계정별 피드를 since_id 커서로 증분 수집하여 계정별 고정 크기 링 버퍼에 저장합니다.
+정규화된 게시물은 routers/social.py의 SocialPost / TrendingTopic 모델 필드와 동일한 키를 가집니다.
+"""
+
+import html
+import logging
+import os
+import re
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from app.ingestion.engine import IngestionEngine
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('ingestion')
+
+# 계정별 링 버퍼 크기
+DEFAULT_BUFFER_SIZE = 500
+
+# 한 번의 요청으로 가져올 최대 게시물 수
+FETCH_LIMIT = 40
+
+
+def post_sequence(post_id: str) -> int:
+    """
+    Extract the numeric, time-ordered part of a post id ('ts_123' -> 123)
+
+    Truth Social (Mastodon) and X ids are snowflake-style integers, so newer
+    posts always have larger sequence numbers.
+    """
+    match = re.search(r"(\d+)$", post_id or "")
+    return int(match.group(1)) if match else -1
+
+
+def _parse_datetime(value: str) -> datetime:
+    # '2024-06-20T12:00:00.000Z' -> naive UTC datetime
+    return datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S")
+
+
+def _strip_html(value: str) -> str:
+    text = re.sub(r"<br\s*/?>|</p>\s*<p>", "\n", value or "")
+    return html.unescape(re.sub(r"<[^>]+>", "", text)).strip()
+
+
+class PostRingBuffer:
+    """
+    Bounded, id-ordered buffer of posts for one account
+
+    Posts are kept oldest-first; when full, the oldest posts are evicted.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_SIZE):
+        self._posts = deque(maxlen=capacity)
+        self._ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._posts)
+
+    def extend(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add posts newer than the newest buffered post
+
+        Returns:
+            List[Dict]: Posts actually added, oldest first
+        """
+        added = []
+        with self._lock:
+            last = post_sequence(self._posts[-1]['id']) if self._posts else -1
+            for post in sorted(posts, key=lambda p: post_sequence(p['id'])):
+                if post['id'] in self._ids or post_sequence(post['id']) <= last:
+                    continue
+                if len(self._posts) == self._posts.maxlen:
+                    self._ids.discard(self._posts[0]['id'])
+                self._posts.append(post)
+                self._ids.add(post['id'])
+                last = post_sequence(post['id'])
+                added.append(post)
+        return added
+
+    def last_id(self) -> Optional[str]:
+        """Id of the newest buffered post"""
+        with self._lock:
+            return self._posts[-1]['id'] if self._posts else None
+
+    def since(self, since_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Get posts newer than since_id, newest first
+
+        Args:
+            since_id: Only posts with a larger id are returned (None for all)
+            limit: Maximum number of posts (the newest ones are kept)
+
+        Returns:
+            List[Dict]: Posts, newest first
+        """
+        threshold = post_sequence(since_id) if since_id else -1
+        result = []
+        with self._lock:
+            for post in reversed(self._posts):
+                if len(result) >= limit or post_sequence(post['id']) <= threshold:
+                    break
+                result.append(dict(post))
+        return result
+
+
+class FeedSource:
+    """
+    Base class for incremental account feeds
+
+    Subclasses implement `fetch(since_id)` returning normalized posts newer than
+    since_id. The engine sink advances `cursor` after each successful round.
+    """
+
+    name = ""
+
+    def __init__(self, account: str, base_url: str, timeout: float = 10):
+        self.account = account
+        self.name = f"{self.name}:{account}"
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cursor: Optional[str] = None
+        self.session = get_session_with_retries()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None):
+        response = self.session.get(f"{self.base_url}{path}", params=params, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch(self, since_id: Optional[str]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def collect(self) -> List[Dict[str, Any]]:
+        return self.fetch(self.cursor)
+
+
+class TruthSocialSource(FeedSource):
+    """Truth Social account statuses (Mastodon-compatible API)"""
+
+    name = "truthsocial"
+
+    def __init__(self, account: str, account_id: str, username: str,
+                 base_url: str = "https://truthsocial.com", timeout: float = 10):
+        super().__init__(account, base_url, timeout)
+        self.account_id = account_id
+        self.username = username
+
+    def fetch(self, since_id):
+        params = {'limit': FETCH_LIMIT, 'exclude_replies': 'true'}
+        if since_id:
+            params['since_id'] = str(post_sequence(since_id))
+        statuses = self._get(f"/api/v1/accounts/{self.account_id}/statuses", params)
+        return [
+            {
+                "id": f"ts_{status['id']}",
+                "username": self.username,
+                "content": _strip_html(status.get('content', '')),
+                "timestamp": _parse_datetime(status['created_at']),
+                "likes": int(status.get('favourites_count', 0)),
+                "reposts": int(status.get('reblogs_count', 0)),
+                "comments": int(status.get('replies_count', 0)),
+            }
+            for status in statuses
+        ]
+
+
+class XTimelineSource(FeedSource):
+    """X (Twitter) user timeline via API v2"""
+
+    name = "x"
+
+    def __init__(self, account: str, user_id: str, username: str, bearer_token: str,
+                 base_url: str = "https://api.twitter.com", timeout: float = 10):
+        super().__init__(account, base_url, timeout)
+        self.user_id = user_id
+        self.username = username
+        self.bearer_token = bearer_token
+
+    def fetch(self, since_id):
+        params = {
+            'max_results': FETCH_LIMIT,
+            'tweet.fields': 'created_at,public_metrics',
+            'exclude': 'replies',
+        }
+        if since_id:
+            params['since_id'] = str(post_sequence(since_id))
+        data = self._get(f"/2/users/{self.user_id}/tweets", params,
+                         headers={'Authorization': f"Bearer {self.bearer_token}"})
+        return [
+            {
+                "id": f"x_{tweet['id']}",
+                "username": self.username,
+                "content": tweet['text'],
+                "timestamp": _parse_datetime(tweet['created_at']),
+                "likes": int(tweet['public_metrics'].get('like_count', 0)),
+                "reposts": int(tweet['public_metrics'].get('retweet_count', 0)),
+                "comments": int(tweet['public_metrics'].get('reply_count', 0)),
+            }
+            for tweet in data.get('data', [])
+        ]
+
+
+class XTrendsSource:
+    """X (Twitter) trending topics snapshot via API v1.1 (not incremental)"""
+
+    name = "x:trends"
+
+    def __init__(self, bearer_token: str, woeid: int = 1,
+                 base_url: str = "https://api.twitter.com", timeout: float = 10):
+        self.bearer_token = bearer_token
+        self.woeid = woeid
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = get_session_with_retries()
+
+    def collect(self) -> List[Dict[str, Any]]:
+        response = self.session.get(f"{self.base_url}/1.1/trends/place.json", params={'id': self.woeid},
+                                    headers={'Authorization': f"Bearer {self.bearer_token}"},
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        place = response.json()[0]
+        location = place.get('locations', [{}])[0].get('name')
+        trends = [t for t in place.get('trends', []) if t.get('tweet_volume')]
+        trends.sort(key=lambda t: t['tweet_volume'], reverse=True)
+        return [
+            {
+                "id": f"trend_{i}",
+                "name": trend['name'],
+                "tweet_count": int(trend['tweet_volume']),
+                "category": "Trending",
+                "location": location,
+            }
+            for i, trend in enumerate(trends, 1)
+        ]
+
+
+class SocialFeedStore:
+    """
+    Per-account post ring buffers plus the latest trends snapshot
+
+    Callbacks registered with `subscribe()` receive (account, new_posts)
+    whenever new posts are added.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._buffers: Dict[str, PostRingBuffer] = {}
+        self._trends: List[Dict[str, Any]] = []
+        self._subscribers: List[Callable[[str, List[Dict[str, Any]]], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[str, List[Dict[str, Any]]], None]):
+        """Register a callback invoked with (account, new_posts) on every insert"""
+        self._subscribers.append(callback)
+
+    def buffer(self, account: str) -> PostRingBuffer:
+        with self._lock:
+            if account not in self._buffers:
+                self._buffers[account] = PostRingBuffer(self.buffer_size)
+            return self._buffers[account]
+
+    def add_posts(self, account: str, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add posts to an account buffer and notify subscribers
+
+        Returns:
+            List[Dict]: Posts actually added
+        """
+        added = self.buffer(account).extend(posts)
+        if added:
+            for callback in self._subscribers:
+                try:
+                    callback(account, added)
+                except Exception as e:
+                    logger.error(f"소셜 게시물 구독자 오류: {e}")
+        return added
+
+    def posts(self, account: str, since_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Posts for an account newer than since_id, newest first"""
+        return self.buffer(account).since(since_id, limit)
+
+    def set_trends(self, trends: List[Dict[str, Any]]):
+        with self._lock:
+            self._trends = list(trends)
+
+    def trends(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(t) for t in self._trends[:limit]]
+
+
+def create_social_engine(store: SocialFeedStore, sources: List[Any], interval: float = 60.0) -> IngestionEngine:
+    """
+    Create an ingestion engine that feeds account sources and trends into the store
+
+    Args:
+        store: Destination store
+        sources: FeedSource instances and/or an XTrendsSource
+        interval: Seconds between collection rounds
+
+    Returns:
+        IngestionEngine: Engine (not yet started)
+    """
+    def sink(source, result):
+        if isinstance(source, FeedSource):
+            store.add_posts(source.account, result)
+            source.cursor = store.buffer(source.account).last_id()
+        else:
+            store.set_trends(result)
+
+    return IngestionEngine("social", sources, sink, interval=interval)
+
+
+def default_social_sources() -> List[Any]:
+    """
+    Build the default sources from environment configuration
+
+    X sources are only enabled when X_BEARER_TOKEN is set.
+    """
+    sources: List[Any] = [
+        TruthSocialSource("trump", os.getenv("TRUTH_SOCIAL_TRUMP_ACCOUNT_ID", "107780257626128497"), "realDonaldTrump"),
+    ]
+    bearer_token = os.getenv("X_BEARER_TOKEN")
+    if bearer_token:
+        sources.append(XTimelineSource("elon", os.getenv("X_ELON_USER_ID", "44196397"), "elonmusk", bearer_token))
+        sources.append(XTrendsSource(bearer_token, woeid=int(os.getenv("X_TRENDS_WOEID", "1"))))
+    return sources
+
+
+# 애플리케이션 전역 스토어 및 엔진
+social_store = SocialFeedStore()
+social_engine = create_social_engine(
+    social_store,
+    default_social_sources(),
+    interval=float(os.getenv("SOCIAL_POLL_INTERVAL", "60")),
+)
@@ -0,0 +1,206 @@
+"""
+업비트 다중 마켓 시세 어댑터
+
+설정된 모든 마켓의 시세를 /v1/ticker 한 번의 요청(markets=KRW-BTC,KRW-USDT,...)으로 조회하고,
+짧은 유효 시간 동안 스냅샷을 공유해 단일 마켓 조회도 같은 스냅샷에서 제공합니다.
+마켓 전체가 필요하면 /v1/ticker/all로 호가 통화의 모든 마켓을 한 번에 조회합니다.
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from app.utils.http import get_session_with_retries
+
+# 기본 조회 마켓
+DEFAULT_MARKETS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-USDT"]
+
+# 스냅샷 유효 시간 (초)
+DEFAULT_MAX_AGE = float(os.getenv("UPBIT_TICKER_MAX_AGE", "1.0"))
+
+MARKET_PATTERN = re.compile(r"^[A-Z]{3,4}-[A-Z0-9]{1,15}$")
+
+
+def normalize_market(market: str) -> str:
+    """
+    Normalize a market code ('krw-btc' -> 'KRW-BTC')
+
+    Raises:
+        ValueError: If the code is not a valid Upbit market code
+    """
+    market = market.strip().upper()
+    if not MARKET_PATTERN.match(market):
+        raise ValueError(f"Invalid Upbit market code: {market}")
+    return market
+
+
+class UpbitTicker:
+    """
+    Bulk ticker for a growing set of Upbit markets
+
+    `fetch()` makes one /v1/ticker request for every tracked market. `snapshot()` reuses the
+    last result for `max_age` seconds and lets concurrent callers share a single refresh.
+    Requesting a market that is not tracked yet adds it to the set for the next refresh;
+    markets Upbit rejects are dropped and not requested again.
+    """
+
+    def __init__(self, markets: Optional[Iterable[str]] = None, base_url: str = "https://api.upbit.com",
+                 max_age: float = DEFAULT_MAX_AGE, timeout: float = 10, retries: int = 3):
+        self.markets: List[str] = [normalize_market(market) for market in (markets or DEFAULT_MARKETS)]
+        # 업비트에 존재하는 것으로 확인된 마켓 (설정된 마켓은 상장 폐지가 확인될 때까지 신뢰)
+        self._known = set(self.markets)
+        # 업비트가 거부한 마켓 (다시 요청하지 않음)
+        self._rejected = set()
+        self.base_url = base_url.rstrip('/')
+        self.max_age = max_age
+        self.timeout = timeout
+        # 헤지 경쟁으로 호출할 때는 retries=0 (숨은 재시도가 지연 시간 분포를 부풀리지 않도록)
+        self.session = get_session_with_retries(retries=retries)
+        self.request_count = 0
+        self._snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def track(self, markets: Iterable[str]) -> List[str]:
+        """
+        Add markets to the tracked set
+
+        Returns:
+            List[str]: The normalized market codes
+        """
+        normalized = [normalize_market(market) for market in markets]
+        with self._lock:
+            for market in normalized:
+                if market not in self.markets and market not in self._rejected:
+                    self.markets.append(market)
+        return normalized
+
+    def fetch(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch all tracked markets in one request
+
+        Returns:
+            Dict[str, Dict]: Raw ticker by market code
+        """
+        with self._lock:
+            markets = list(self.markets)
+        response = self._request(markets)
+        if response.status_code == 404:
+            # 존재하지 않는 마켓이 하나라도 섞이면 요청 전체가 거부되므로 새로 추가된 마켓을 빼고 재시도
+            with self._lock:
+                unknown = [market for market in markets if market not in self._known]
+            if not unknown:
+                # 확인된 마켓만 요청했는데도 거부되면 상장 폐지된 마켓을 전체 마켓 목록으로 찾음
+                listed = self._listed_markets()
+                unknown = [market for market in markets if market not in listed]
+            with self._lock:
+                self._rejected.update(unknown)
+                self._known.difference_update(unknown)
+                self.markets = [market for market in self.markets if market not in unknown]
+                markets = list(self.markets)
+            if unknown and markets:
+                response = self._request(markets)
+        response.raise_for_status()
+        tickers = {ticker["market"]: ticker for ticker in response.json()}
+        with self._lock:
+            self._known.update(tickers)
+        return tickers
+
+    def fetch_all(self, quote_currency: str = "KRW") -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch every market of a quote currency in one /v1/ticker/all request
+
+        The result also replaces the shared snapshot when it covers every tracked market.
+
+        Args:
+            quote_currency: Quote currency (e.g., 'KRW', 'BTC', 'USDT')
+
+        Returns:
+            Dict[str, Dict]: Raw ticker by market code
+        """
+        with self._lock:
+            self.request_count += 1
+        response = self.session.get(f"{self.base_url}/v1/ticker/all", params={"quote_currencies": quote_currency},
+                                    headers={"Accept": "application/json"}, timeout=self.timeout)
+        response.raise_for_status()
+        tickers = {ticker["market"]: ticker for ticker in response.json()}
+        with self._lock:
+            self._known.update(tickers)
+            if all(market in tickers for market in self.markets):
+                self._snapshot, self._fetched_at = tickers, time.monotonic()
+        return tickers
+
+    def _listed_markets(self) -> Set[str]:
+        with self._lock:
+            self.request_count += 1
+        response = self.session.get(f"{self.base_url}/v1/market/all", headers={"Accept": "application/json"},
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        return {market["market"] for market in response.json()}
+
+    def _request(self, markets: List[str]):
+        with self._lock:
+            self.request_count += 1
+        return self.session.get(f"{self.base_url}/v1/ticker", params={"markets": ",".join(markets)},
+                                headers={"Accept": "application/json"}, timeout=self.timeout)
+
+    def snapshot(self, markets: Iterable[str] = (), loader: Optional[Callable[[], Any]] = None
+                 ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Return a snapshot no older than `max_age` containing `markets`
+
+        Args:
+            markets: Markets that must be present (added to the tracked set if missing)
+            loader: Refresh function returning a fetch() result or None (defaults to fetch; e.g. a hedged racer)
+
+        Returns:
+            Dict[str, Dict]: Raw ticker by market code, or None if the refresh failed
+        """
+        required = self.track(markets)
+        loader = loader or self.fetch
+
+        def fresh():
+            snapshot = self._snapshot
+            if snapshot is None or time.monotonic() - self._fetched_at > self.max_age:
+                return None
+            return snapshot if all(market in snapshot or market in self._rejected for market in required) else None
+
+        snapshot = fresh()
+        if snapshot is not None:
+            return snapshot
+        # 동시에 들어온 요청은 하나의 갱신 결과를 공유
+        with self._refresh_lock:
+            snapshot = fresh()
+            if snapshot is not None:
+                return snapshot
+            snapshot = loader()
+            if snapshot is None:
+                return None
+            self._snapshot, self._fetched_at = snapshot, time.monotonic()
+            return snapshot
+
+    def get_price(self, market: str, loader: Optional[Callable[[], Any]] = None) -> Optional[float]:
+        """
+        Get the last trade price of one market from the shared snapshot
+
+        Returns:
+            float: Trade price, or None if unavailable
+        """
+        market = normalize_market(market)
+        snapshot = self.snapshot([market], loader)
+        ticker = (snapshot or {}).get(market)
+        return float(ticker["trade_price"]) if ticker else None
+
+    def get_prices(self, markets: Iterable[str], loader: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+        """
+        Get the last trade prices of several markets from one snapshot
+
+        Returns:
+            Dict[str, float]: Trade price by market code (missing markets omitted)
+        """
+        markets = [normalize_market(market) for market in markets]
+        snapshot = self.snapshot(markets, loader) or {}
+        return {market: float(snapshot[market]["trade_price"]) for market in markets if market in snapshot}
@@ -1,14 +1,28 @@
 import os
 
+from app.alerts import alert_engine
 from app.auth.dependencies import get_current_user
-from app.database import Base, engine, get_db, init_db
-from app.routers import (api_catalog, api_keys, auth, crypto, derivatives,
-                         opensource, projects, social, users)
+from app.database import Base, SessionLocal, engine, get_db, init_db
+from app.events import event_bus, series_topic
+from app.ingestion.candles import candle_engine
+from app.ingestion.derivatives import derivatives_engine, derivatives_store
+from app.ingestion.github import github_engine
+from app.ingestion.orderbook import orderbook_manager
+from app.ingestion.premium import premium_history
+from app.ingestion.social import social_engine, social_store
+from app.models import AlertRule
+from app.routers import (alerts, api_catalog, api_keys, auth, batch, crypto, derivatives, events,
+                         opensource, projects, search, social, users)
+from app.utils.cache_headers import CacheHeadersMiddleware
+from app.utils.projection import FieldsProjectionMiddleware
 from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # 데이터베이스 초기화
 init_db()
@@ -139,6 +153,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 필드 프로젝션 (?fields=a,b.c), 캐시 미들웨어 안쪽에서 적용되어 ETag도 프로젝션 결과 기준
+app.add_middleware(FieldsProjectionMiddleware)
+
+# 데이터 API 응답 캐시 힌트 (Cache-Control, ETag, 304 재검증)
+app.add_middleware(CacheHeadersMiddleware)
+
+# 업스트림 장애(503) 시 클라이언트가 재시도 간격을 알 수 있도록 Retry-After 추가
+RETRY_AFTER_SECONDS = int(os.getenv("RETRY_AFTER_SECONDS", "5"))
+
+@app.exception_handler(StarletteHTTPException)
+async def retry_after_exception_handler(request, exc):
+    if exc.status_code == status.HTTP_503_SERVICE_UNAVAILABLE and "Retry-After" not in (exc.headers or {}):
+        exc.headers = {**(exc.headers or {}), "Retry-After": str(RETRY_AFTER_SECONDS)}
+    return await http_exception_handler(request, exc)
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/users", tags=["Users"])
@@ -148,11 +177,115 @@ app.include_router(social.router, prefix="/social", tags=["Social Media"])
 app.include_router(derivatives.router, prefix="/derivatives", tags=["Derivatives Market"])
 app.include_router(projects.router, prefix="/projects", tags=["Blockchain Projects"])
 app.include_router(opensource.router, prefix="/opensource", tags=["Open Source"])
+app.include_router(search.router, prefix="/search", tags=["Search"])
+app.include_router(batch.router, prefix="/batch", tags=["Batch"])
 app.include_router(api_catalog.router, prefix="/api-catalog", tags=["API Catalog"])
+app.include_router(alerts.router, prefix="/alerts", tags=["Alerts"])
+app.include_router(events.router, prefix="/events", tags=["Events"])
 
 # API 카탈로그에 앱 인스턴스 설정
 api_catalog.set_app_instance(app)
 
+# 백그라운드 데이터 수집 엔진 (INGESTION_ENABLED=false로 비활성화)
+INGESTION_ENABLED = os.getenv("INGESTION_ENABLED", "true").lower() in ("1", "true", "yes")
+ingestion_engines = [social_engine, github_engine, candle_engine, orderbook_manager]
+# 이벤트 버스 리더 프로세스에서만 실행 (결과는 버스로 팔로워 프로세스에 복제, 웹훅은 노드당 한 번만 전송)
+leader_engines = [derivatives_engine, crypto.premium_engine, alert_engine]
+
+# 수집된 소셜 게시물 및 프로젝트 데이터 검색 색인
+social_store.subscribe(search.index_social_posts)
+search.index_project_documents()
+
+# 리더가 수집한 시계열/파생상품/소셜 데이터를 이벤트 버스에 발행
+def publish_series(prefix):
+    def publish(key, timestamp, value):
+        if event_bus.is_leader:
+            event_bus.publish(series_topic(prefix, key), {"key": list(key), "timestamp": timestamp, "value": value},
+                              timestamp)
+    return publish
+
+def publish_derivatives(funding_rates, open_interest, timestamp):
+    if event_bus.is_leader:
+        event_bus.publish("derivatives.snapshot", jsonable_encoder(
+            {"funding_rates": funding_rates, "open_interest": open_interest, "timestamp": timestamp}
+        ), timestamp)
+
+def publish_social_posts(account, posts):
+    if event_bus.is_leader:
+        event_bus.publish(f"social.posts.{account}", jsonable_encoder(posts))
+
+premium_history.history.subscribe(publish_series("kimchi"))
+derivatives_store.history.subscribe(publish_series("derivatives"))
+derivatives_store.subscribe(publish_derivatives)
+social_store.subscribe(publish_social_posts)
+
+# 팔로워 프로세스는 받은 이벤트로 로컬 캐시를 채움
+def mirror_premium_history(event):
+    if not event_bus.is_leader:
+        premium_history.history.append(tuple(event.payload["key"]), event.payload["timestamp"], event.payload["value"])
+
+def mirror_derivatives(event):
+    if not event_bus.is_leader:
+        derivatives_store.add(event.payload["funding_rates"], event.payload["open_interest"], event.payload["timestamp"])
+
+event_bus.subscribe_callback("kimchi.#", mirror_premium_history)
+event_bus.subscribe_callback("derivatives.snapshot", mirror_derivatives)
+
+# 김치 프리미엄/가격 및 펀딩비 이벤트로 알림 규칙 평가 (리더에서만), 규칙 변경은 모든 프로세스에 반영
+def evaluate_alerts(event):
+    if event_bus.is_leader:
+        alert_engine.observe_event(event)
+
+event_bus.subscribe_callback("kimchi.#", evaluate_alerts)
+event_bus.subscribe_callback("derivatives.funding_rate.#", evaluate_alerts)
+event_bus.subscribe_callback("alerts.rules.*", alert_engine.apply_rule_event)
+
+@app.on_event("startup")
+async def start_event_bus():
+    await event_bus.start()
+
+@app.on_event("startup")
+def load_alert_rules():
+    db = SessionLocal()
+    try:
+        alert_engine.load(db.query(AlertRule).filter(AlertRule.is_active == True).all())
+    finally:
+        db.close()
+
+@app.on_event("startup")
+def start_ingestion():
+    if INGESTION_ENABLED:
+        for ingestion_engine in ingestion_engines:
+            ingestion_engine.start()
+        if event_bus.is_leader:
+            start_leader_engines()
+
+def start_leader_engines():
+    if INGESTION_ENABLED:
+        for leader_engine in leader_engines:
+            leader_engine.start()
+
+# 리더 프로세스가 종료되면 승격된 팔로워가 이어서 수집
+event_bus.on_leader(start_leader_engines)
+
+@app.on_event("shutdown")
+def stop_ingestion():
+    for ingestion_engine in ingestion_engines + leader_engines:
+        ingestion_engine.stop()
+
+@app.on_event("shutdown")
+async def stop_event_bus():
+    await event_bus.stop()
+
+# 김치 프리미엄 이력은 요청 처리와 별도 스레드에서 주기적으로 저장 (모든 프로세스, 팔로워 복제분 포함)
+@app.on_event("startup")
+def start_premium_history_flush():
+    premium_history.start()
+
+@app.on_event("shutdown")
+def flush_premium_history():
+    premium_history.stop()
+
 # 커스텀 OpenAPI 스키마 정의
 def custom_openapi():
     if app.openapi_schema:
@@ -4,5 +4,6 @@
 from app.models.user import User
 from app.models.api_key import APIKey, APIUsage
 from app.models.deposit import Transaction
+from app.models.alert import AlertRule
 
-__all__ = ["User", "APIKey", "Transaction", "APIUsage"]
+__all__ = ["User", "APIKey", "Transaction", "APIUsage", "AlertRule"]
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+class AlertRule(Base):
+    __tablename__ = "alert_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    api_key_id = Column(Integer, ForeignKey("api_keys.id"), nullable=False, index=True)
+    metric = Column(String, nullable=False)  # price, premium, funding_rate
+    symbol = Column(String, nullable=False)  # 기초 자산 (예: BTC)
+    exchange = Column(String, nullable=True)  # 가격/펀딩비 알림의 거래소
+    condition = Column(String, nullable=False)  # above, below, crosses, flips_sign
+    threshold = Column(Float, nullable=False, default=0.0)
+    webhook_url = Column(String, nullable=False)
+    secret = Column(String, nullable=False)  # 웹훅 본문 서명용 비밀 값
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationship
+    api_key = relationship("APIKey")
+
+    def __repr__(self):
+        return f"<AlertRule id={self.id} metric={self.metric} symbol={self.symbol} condition={self.condition}>"
@@ -0,0 +1,167 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+import os
+import secrets
+
+from app.database import get_db
+from app.models import APIKey, AlertRule
+from app.auth.api_key import get_api_key_with_tracking
+from app.alerts import ALERT_CONDITIONS, ALERT_METRICS, ALERT_RULE_TOPIC, Alert, alert_engine, check_webhook_url
+from app.events import event_bus
+from pydantic import BaseModel, Field
+
+router = APIRouter()
+
+# API 키당 최대 활성 알림 규칙 수
+MAX_ALERTS_PER_KEY = int(os.getenv("MAX_ALERTS_PER_KEY", "100"))
+
+# 스키마 정의
+class AlertRuleCreate(BaseModel):
+    metric: str = Field(..., description=f"Metric to watch: {', '.join(ALERT_METRICS)}")
+    symbol: str = Field(..., description="Base asset (e.g. BTC)")
+    exchange: Optional[str] = Field(None, description="binance or upbit for prices (default binance); binance, bybit, okx or deribit for funding rates")
+    condition: str = Field(..., description=f"Trigger condition: {', '.join(ALERT_CONDITIONS)}")
+    threshold: float = Field(0.0, description="Threshold (ignored for flips_sign); premiums in percent, prices in USDT (binance) or KRW (upbit)")
+    webhook_url: str = Field(..., pattern=r"^https?://", max_length=2048, description="URL receiving a JSON POST when the rule fires")
+
+class AlertRuleResponse(BaseModel):
+    id: int
+    metric: str
+    symbol: str
+    exchange: Optional[str] = None
+    condition: str
+    threshold: float
+    webhook_url: str
+    created_at: Optional[datetime] = None
+    current_value: Optional[float] = None
+    trigger_count: int = 0
+    last_triggered_at: Optional[datetime] = None
+    last_delivery: Optional[str] = None
+
+class AlertRuleWithSecret(AlertRuleResponse):
+    secret: str
+
+def alert_rule_response(rule: AlertRule) -> dict:
+    """
+    Combine a stored rule with the live trigger statistics of the alert engine
+
+    Args:
+        rule (AlertRule): Stored rule
+
+    Returns:
+        dict: AlertRuleResponse fields
+    """
+    alert = alert_engine.get(rule.id)
+    return {
+        "id": rule.id,
+        "metric": rule.metric,
+        "symbol": rule.symbol,
+        "exchange": rule.exchange,
+        "condition": rule.condition,
+        "threshold": rule.threshold,
+        "webhook_url": rule.webhook_url,
+        "created_at": rule.created_at,
+        "current_value": alert_engine.last_value(alert.stream) if alert else None,
+        "trigger_count": alert.trigger_count if alert else 0,
+        "last_triggered_at": datetime.utcfromtimestamp(alert.last_triggered_at) if alert and alert.last_triggered_at else None,
+        "last_delivery": alert.last_delivery if alert else None,
+    }
+
+@router.post("/", response_model=AlertRuleWithSecret, status_code=status.HTTP_201_CREATED, summary="Register an alert rule")
+async def create_alert_rule(
+    rule_data: AlertRuleCreate,
+    request: Request,
+    api_key: APIKey = Depends(get_api_key_with_tracking),
+    db: Session = Depends(get_db)
+):
+    """
+    Register an alert rule evaluated server-side on every ingested value, instead of polling `/crypto/*`
+
+    - **price** above/below/crosses a threshold (Binance USDT or Upbit KRW price)
+    - **premium** (kimchi premium %) above/below/crosses a threshold
+    - **funding_rate** flips_sign (or crosses a threshold) on a derivatives exchange
+
+    When the rule fires, a JSON payload is POSTed to the webhook URL (retried with backoff on failure,
+    redirects not followed). The URL must resolve to public addresses only.
+    The body is signed with HMAC-SHA256 using the returned secret (`X-OmniScope-Signature: sha256=<hex>`).
+    The secret is only shown once.
+    """
+    active_count = db.query(AlertRule).filter(AlertRule.api_key_id == api_key.id, AlertRule.is_active == True).count()
+    if active_count >= MAX_ALERTS_PER_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Alert rule limit reached ({MAX_ALERTS_PER_KEY} per API key)"
+        )
+
+    metric = rule_data.metric.lower()
+    condition = rule_data.condition.lower()
+    exchange = rule_data.exchange.lower() if rule_data.exchange else None
+    # 규칙을 저장하기 전에 검증 (지원하지 않는 지표/조건/거래소)
+    try:
+        Alert(0, api_key.id, metric, rule_data.symbol, exchange, condition, rule_data.threshold, rule_data.webhook_url)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # 웹훅 호스트가 사설/루프백/링크 로컬/예약 주소로 향하면 거부 (전송 시에도 다시 확인)
+    try:
+        await run_in_threadpool(check_webhook_url, rule_data.webhook_url, alert_engine.dispatcher.allow_private)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    rule = AlertRule(
+        api_key_id=api_key.id,
+        metric=metric,
+        symbol=rule_data.symbol.strip().upper(),
+        exchange=exchange,
+        condition=condition,
+        threshold=0.0 if condition == "flips_sign" else rule_data.threshold,
+        webhook_url=rule_data.webhook_url,
+        secret=f"whsec_{secrets.token_hex(24)}",
+    )
+    db.add(rule)
+    db.commit()
+    db.refresh(rule)
+    # 모든 워커 프로세스의 알림 엔진에 규칙 전파
+    event_bus.publish(f"{ALERT_RULE_TOPIC}.created", Alert.from_rule(rule).rule())
+
+    return {**alert_rule_response(rule), "secret": rule.secret}
+
+@router.get("/", response_model=List[AlertRuleResponse], summary="List alert rules")
+async def list_alert_rules(
+    request: Request,
+    api_key: APIKey = Depends(get_api_key_with_tracking),
+    db: Session = Depends(get_db)
+):
+    """
+    List the active alert rules of the calling API key with their trigger statistics
+    """
+    rules = db.query(AlertRule).filter(AlertRule.api_key_id == api_key.id, AlertRule.is_active == True).all()
+    return [alert_rule_response(rule) for rule in rules]
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete an alert rule")
+async def delete_alert_rule(
+    request: Request,
+    rule_id: int = Path(..., description="Alert rule ID"),
+    api_key: APIKey = Depends(get_api_key_with_tracking),
+    db: Session = Depends(get_db)
+):
+    """
+    Deactivate an alert rule of the calling API key
+    """
+    rule = db.query(AlertRule).filter(
+        AlertRule.id == rule_id,
+        AlertRule.api_key_id == api_key.id,
+        AlertRule.is_active == True
+    ).first()
+
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Alert rule not found"
+        )
+
+    rule.is_active = False
+    db.commit()
+    event_bus.publish(f"{ALERT_RULE_TOPIC}.deleted", {"id": rule.id})
@@ -28,6 +28,7 @@ API_CATEGORIES = {
     "derivatives": "Derivatives Market",
     "projects": "Blockchain Projects",
     "opensource": "Open Source",
+    "search": "Search",
     # 새로운 실용적 정보 카테고리는 여기에 추가
 }
 
@@ -38,6 +39,7 @@ TAG_TO_CATEGORY = {
     "Derivatives Market": "derivatives",
     "Blockchain Projects": "projects",
     "Open Source": "opensource",
+    "Search": "search",
     # 새로운 태그-카테고리 매핑은 여기에 추가
 }
 
@@ -61,7 +63,7 @@ EXCLUDED_CATEGORIES = {
 
 # 포함할 카테고리 - 실용적인 정보 API만 포함
 INCLUDED_CATEGORIES = {
-    "crypto", "social", "derivatives", "projects", "opensource", "api_catalog"
+    "crypto", "social", "derivatives", "projects", "opensource", "search", "api_catalog"
 }
 
 # 경로에서 카테고리 추출하는 함수
@@ -104,7 +106,7 @@ def collect_api_routes(app) -> List[APIInfo]:
             if is_excluded_path(path):
                 continue
                 
-            method = route.methods.pop() if route.methods else "GET"
+            method = sorted(route.methods)[0] if route.methods else "GET"
             summary = route.summary or ""
             description = route.description or ""
             
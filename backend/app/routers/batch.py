@@ -0,0 +1,163 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+import asyncio
+import json
+
+from app.models import APIKey
+from app.auth.api_key import BATCH_SCOPE_KEY, track_api_usage, verify_api_key
+from app.database import get_db
+from app.routers.api_catalog import API_CATEGORIES
+
+router = APIRouter()
+
+# 배치당 최대 요청 수 및 동시 실행 수
+MAX_BATCH_SIZE = 20
+MAX_CONCURRENCY = 10
+
+# 하위 요청에 전달할 헤더
+FORWARDED_HEADERS = ("api-key-id", "api-key-secret", "accept", "user-agent")
+
+class BatchItem(BaseModel):
+    path: str = Field(..., description="Catalog path, optionally with a query string (e.g. /crypto/btc/usd)")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Query parameters")
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+class BatchItemResult(BaseModel):
+    path: str
+    status: int
+    body: Any = None
+    error: Optional[str] = None
+
+class BatchResponse(BaseModel):
+    success_count: int
+    results: List[BatchItemResult]
+
+def split_path(item: BatchItem):
+    # 경로에 포함된 쿼리 문자열과 params 병합
+    parts = urlsplit(item.path)
+    params = dict(parse_qsl(parts.query))
+    params.update({key: str(value) for key, value in item.params.items()})
+    return parts.path, params
+
+def is_batchable(path: str) -> bool:
+    # API 카탈로그 카테고리의 데이터 API만 허용
+    category = path.lstrip("/").split("/", 1)[0]
+    return path.startswith("/") and category in API_CATEGORIES
+
+async def call_in_process(app, path: str, params: Dict[str, str], headers: List, api_key: APIKey):
+    """
+    Run a GET request through the ASGI app without a network hop
+
+    Returns:
+        tuple: (status code, response body bytes)
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": urlencode(params).encode(),
+        "headers": headers,
+        "client": ("batch", 0),
+        "server": ("batch", 80),
+        BATCH_SCOPE_KEY: api_key,
+    }
+    response = {"status": 500, "body": [], "request_sent": False}
+    response_complete = asyncio.Event()
+
+    async def receive():
+        # 빈 본문을 한 번 전달한 뒤에는 응답이 끝날 때까지 대기 후 연결 종료 통지
+        if not response["request_sent"]:
+            response["request_sent"] = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return response["status"], b"".join(response["body"])
+
+# 여러 데이터 API를 한 번에 호출
+@router.post("", response_model=BatchResponse, summary="Call several data APIs in one request")
+async def batch(
+    request: Request,
+    batch_request: BatchRequest,
+    api_key: APIKey = Depends(verify_api_key),
+    db: Session = Depends(get_db)
+):
+    """
+    Execute several catalog GET endpoints concurrently in-process and return their results together
+
+    Each item runs on its own event loop in a worker thread (at most MAX_CONCURRENCY at a time),
+    so handlers that block inside async def still overlap instead of running one after another.
+
+    The API key is verified once for the whole batch and usage is recorded as a single entry
+    billed per executed item. An item whose handler raises is reported as a 500 result
+    without affecting the other items.
+
+    Returns:
+        BatchResponse: Per-item status and body, in request order
+    """
+    headers = [
+        (name.encode(), value.encode())
+        for name, value in request.headers.items()
+        if name in FORWARDED_HEADERS
+    ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def run(item: BatchItem) -> BatchItemResult:
+        path, params = split_path(item)
+        if not is_batchable(path):
+            return BatchItemResult(path=item.path, status=400, error=f"Path not available in batch: {path}")
+        async with semaphore:
+            # 데이터 API 핸들러는 async def 안에서 블로킹 호출을 하므로 항목마다 별도 스레드의 이벤트 루프에서 실행
+            try:
+                status_code, raw_body = await run_in_threadpool(
+                    asyncio.run, call_in_process(request.app, path, params, headers, api_key)
+                )
+            except Exception as e:
+                # 처리되지 않은 예외는 ServerErrorMiddleware가 다시 던지므로 해당 항목만 500으로 기록
+                return BatchItemResult(path=item.path, status=500, error=f"Internal server error: {e}")
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            body = raw_body.decode(errors="replace")
+        if status_code >= 400:
+            detail = body.get("detail") if isinstance(body, dict) else body
+            return BatchItemResult(path=item.path, status=status_code, error=str(detail))
+        return BatchItemResult(path=item.path, status=status_code, body=body)
+
+    # 한 항목의 실패가 배치 전체를 실패시키지 않도록 예외도 결과로 수집
+    outcomes = await asyncio.gather(*(run(item) for item in batch_request.requests), return_exceptions=True)
+    results = [
+        outcome if isinstance(outcome, BatchItemResult)
+        else BatchItemResult(path=item.path, status=500, error=f"Internal server error: {outcome}")
+        for item, outcome in zip(batch_request.requests, outcomes)
+    ]
+
+    # 실제 실행된 항목 수만큼 한 번에 과금
+    executed = sum(1 for item in batch_request.requests if is_batchable(split_path(item)[0]))
+    if executed:
+        await run_in_threadpool(track_api_usage, api_key, request.url.path, request.method, db, executed)
+
+    return BatchResponse(
+        success_count=sum(1 for result in results if result.status < 400),
+        results=results
+    )
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Request, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Dict, Optional, List
 import os
@@ -9,16 +10,25 @@ import requests
 import json
 from datetime import datetime
 import logging
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-import yfinance as yf
-from bs4 import BeautifulSoup
 import concurrent.futures
+import numpy as np
 
 from app.database import get_db
 from app.models import User, APIKey, APIUsage
 from app.auth.dependencies import get_current_user
 from app.auth.api_key import verify_api_key, get_api_key_with_tracking
+from app.utils.http import get_session_with_retries
+from app.utils.naver import extract_usd_krw
+from app.utils.ratelimit import BudgetExhausted, StaleFallback, upstream_budgets
+from app.utils.yahoo import get_quote_price
+from app.ingestion.candles import candle_engine, candle_store, indicator_cache
+from app.ingestion.conversion import rate_graph
+from app.ingestion.orderbook import orderbook_manager
+from app.ingestion.racing import SourceRacer
+from app.ingestion.upbit import DEFAULT_MARKETS as DEFAULT_UPBIT_MARKETS, UpbitTicker
+from app.ingestion.premium import (binance_usdt_prices, create_premium_engine, premium_history, premium_table,
+                                   upbit_krw_prices)
+from app.timeseries import CANDLE_INTERVALS, parse_interval, to_epoch
 from pydantic import BaseModel, Field
 
 # Configure logging
@@ -51,46 +61,133 @@ class KimchiPremium(BaseModel):
     exchange_rate: float
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-# 요청 세션 생성 함수
-def get_session_with_retries(
-    retries=3,
-    backoff_factor=0.3,
-    status_forcelist=(500, 502, 504),
-    allowed_methods=None
-):
-    """
-    Create a request session with retry functionality
-    
-    Args:
-        retries: Number of retry attempts
-        backoff_factor: Time delay factor between retries
-        status_forcelist: HTTP status codes to retry
-        allowed_methods: HTTP methods to retry
-        
-    Returns:
-        requests.Session: Session with retry functionality
-    """
-    if allowed_methods is None:
-        allowed_methods = ["HEAD", "GET", "OPTIONS"]
-    
-    retry = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=status_forcelist,
-        allowed_methods=allowed_methods,
-    )
-    
-    adapter = HTTPAdapter(max_retries=retry)
-    session = requests.Session()
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    
-    return session
+class KimchiPremiumEntry(BaseModel):
+    symbol: str
+    premium_percentage: float
+    binance_price_usd: float
+    upbit_price_krw: float
+
+class KimchiPremiumTable(BaseModel):
+    premiums: List[KimchiPremiumEntry]
+    pair_count: int
+    exchange_rate: float
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+class HistoryPoint(BaseModel):
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    mean: float
+    count: int
+
+class KimchiPremiumHistory(BaseModel):
+    symbol: str
+    interval: Optional[str] = None
+    premium_percentage: List[HistoryPoint]
+    binance_price_usd: List[HistoryPoint]
+    upbit_price_krw: List[HistoryPoint]
+    exchange_rate: List[HistoryPoint]
+
+class Candle(BaseModel):
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+
+class CandleList(BaseModel):
+    symbol: str
+    exchange: str
+    interval: str
+    # 수집 중 가져오지 못한 체결 구간 수 (0보다 크면 해당 구간 봉의 거래량/체결 수가 실제보다 작음)
+    gap_count: int = 0
+    candles: List[Candle]
+
+class IndicatorValues(BaseModel):
+    symbol: str
+    exchange: str
+    interval: str
+    timestamps: List[datetime]
+    values: Dict[str, List[Optional[float]]]
+
+class OrderBookDepth(BaseModel):
+    symbol: str
+    last_update_id: int
+    mid: Optional[float] = None
+    spread: Optional[float] = None
+    bids: List[List[float]]
+    asks: List[List[float]]
+    timestamp: datetime
+
+class LiquidityBand(BaseModel):
+    band_percent: float
+    bid_quantity: float
+    ask_quantity: float
+    bid_notional: float
+    ask_notional: float
+
+class Liquidity(BaseModel):
+    symbol: str
+    last_update_id: int
+    mid: Optional[float] = None
+    spread: Optional[float] = None
+    bands: List[LiquidityBand]
+    timestamp: datetime
+
+class ConversionHop(BaseModel):
+    base: str
+    quote: str
+    rate: float
+    source: str
+    timestamp: datetime
+
+class CurrencyConversion(BaseModel):
+    from_currency: str
+    to_currency: str
+    amount: float
+    rate: float
+    converted_amount: float
+    path: List[ConversionHop]
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+class RaceSourceStatus(BaseModel):
+    source: str
+    p50_ms: Optional[float] = None
+    p90_ms: Optional[float] = None
+    p99_ms: Optional[float] = None
+    hedge_delay_ms: float
+    success_count: int
+    error_count: int
+    win_count: int
+    last_error: Optional[str] = None
+
+class SourceRaceStatus(BaseModel):
+    name: str
+    hedge_count: int
+    sources: List[RaceSourceStatus]
+
+class UpstreamBudgetStatus(BaseModel):
+    upstream: str
+    limit: int
+    capacity: int
+    window_seconds: float
+    used: int
+    utilization: float
+    window_resets_in: float
+    paused_for: float
+    waiting: int
+    request_count: int
+    queued_count: int
+    shed_count: int
+    throttled_count: int
+    stale_count: int
 
 # 바이낸스 API에서 암호화폐 가격 조회
-def get_binance_price(symbol, max_retries=3, retry_delay=2):
+def get_binance_price(symbol, max_retries=3, retry_delay=2, base_url="https://api.binance.com"):
     """
     Get the recent trading price of a specific cryptocurrency symbol from Binance API
     
@@ -98,11 +195,12 @@ def get_binance_price(symbol, max_retries=3, retry_delay=2):
         symbol (str): Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
         max_retries (int): Maximum number of retry attempts
         retry_delay (int): Delay between retries in seconds
+        base_url (str): Binance API host (api.binance.com or one of its api1-api3 mirrors)
         
     Returns:
         float: Latest price of the cryptocurrency
     """
-    endpoint = "https://api.binance.com/api/v3/trades"
+    endpoint = f"{base_url}/api/v3/trades"
     
     # 요청 파라미터
     params = {
@@ -110,8 +208,8 @@ def get_binance_price(symbol, max_retries=3, retry_delay=2):
         'limit': 1  # 가장 최근 거래만 필요
     }
     
-    # 세션 생성
-    session = get_session_with_retries()
+    # 세션 생성 (max_retries=0이면 소스 경쟁용 단일 시도이므로 urllib3 재시도도 끔)
+    session = get_session_with_retries(retries=0 if max_retries == 0 else 3)
     
     for attempt in range(max_retries + 1):
         try:
@@ -132,6 +230,10 @@ def get_binance_price(symbol, max_retries=3, retry_delay=2):
                     continue
                 return None
                 
+        except BudgetExhausted as e:
+            # 재시도하면 차단 위험만 커지므로 바로 포기
+            logger.warning(f"{symbol} 가격 조회 보류: {e}")
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(f"{symbol} 가격 조회 오류: {e}")
             if attempt < max_retries:
@@ -149,115 +251,62 @@ def get_binance_price(symbol, max_retries=3, retry_delay=2):
                 logger.error(f"{symbol}에 대한 최대 재시도 횟수에 도달했습니다. 포기합니다.")
                 return None
 
-# 업비트 API에서 BTC 가격 조회
-def get_upbit_btc_price(max_retries=3, retry_delay=2):
+# 바이낸스 API에서 전체 심볼 가격 조회
+def get_binance_all_prices(base_url="https://api.binance.com", timeout=10):
     """
-    Get BTC price from Upbit API
+    Get the latest price of every Binance symbol with a single /api/v3/ticker/price request
     
     Args:
-        max_retries (int): Maximum number of retry attempts
-        retry_delay (int): Delay between retries in seconds
+        base_url (str): Binance API host (api.binance.com or one of its api1-api3 mirrors)
+        timeout (float): Request timeout in seconds
         
     Returns:
-        float: BTC price in KRW
+        list: Raw price tickers ({'symbol': ..., 'price': ...}), None on failure
+    """
+    try:
+        # 대체 호스트 경쟁이 재시도를 대신하므로 한 번만 시도
+        response = get_session_with_retries(retries=0).get(f"{base_url}/api/v3/ticker/price", timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"바이낸스 전체 가격 조회 오류 ({base_url}): {e}")
+        return None
+
+# 업비트 API에서 마켓 가격 조회 (모든 마켓을 한 번에 조회한 스냅샷 사용)
+def get_upbit_price(market):
     """
-    endpoint = "https://api.upbit.com/v1/ticker"
-    params = {'markets': 'KRW-BTC'}
-    headers = {'Accept': 'application/json'}
+    Get the last trade price of an Upbit market from the shared multi-market ticker snapshot
     
-    # 세션 생성
-    session = get_session_with_retries()
+    Args:
+        market (str): Upbit market code (e.g., 'KRW-BTC', 'KRW-USDT')
+        
+    Returns:
+        float: Latest trade price in the quote currency (None on failure)
+    """
+    price = upbit_ticker.get_price(market, loader=upbit_fallback)
+    if price is None:
+        logger.error(f"업비트 {market} 가격 조회에 실패했습니다")
+    return price
+
+# 업비트 API에서 BTC 가격 조회
+def get_upbit_btc_price():
+    """
+    Get BTC price from Upbit API
     
-    for attempt in range(max_retries + 1):
-        try:
-            logger.info(f"업비트에서 BTC 가격 조회 중 (시도 {attempt + 1}/{max_retries + 1})")
-            response = session.get(endpoint, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data and len(data) > 0:
-                price = float(data[0]['trade_price'])
-                logger.info(f"업비트 BTC 가격 조회 성공: {price} KRW")
-                return price
-            else:
-                logger.warning("업비트에서 데이터를 찾을 수 없습니다")
-                if attempt < max_retries:
-                    logger.info(f"{retry_delay}초 후 재시도...")
-                    time.sleep(retry_delay)
-                    continue
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"업비트 BTC 가격 조회 오류: {e}")
-            if attempt < max_retries:
-                logger.info(f"{retry_delay}초 후 재시도...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"업비트 BTC 가격에 대한 최대 재시도 횟수에 도달했습니다. 포기합니다.")
-                return None
-        except (ValueError, KeyError, TypeError) as e:
-            logger.error(f"업비트 응답 파싱 오류: {e}")
-            if attempt < max_retries:
-                logger.info(f"{retry_delay}초 후 재시도...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"업비트 BTC 가격에 대한 최대 재시도 횟수에 도달했습니다. 포기합니다.")
-                return None
+    Returns:
+        float: BTC price in KRW
+    """
+    return get_upbit_price('KRW-BTC')
 
 # 업비트 API에서 USDT 가격 조회
-def get_upbit_usdt_price(max_retries=3, retry_delay=2):
+def get_upbit_usdt_price():
     """
     Get USDT price from Upbit API
     
-    Args:
-        max_retries (int): Maximum number of retry attempts
-        retry_delay (int): Delay between retries in seconds
-        
     Returns:
         float: USDT price in KRW
     """
-    endpoint = "https://api.upbit.com/v1/ticker"
-    params = {'markets': 'KRW-USDT'}
-    headers = {'Accept': 'application/json'}
-    
-    # 세션 생성
-    session = get_session_with_retries()
-    
-    for attempt in range(max_retries + 1):
-        try:
-            logger.info(f"업비트에서 USDT 가격 조회 중 (시도 {attempt + 1}/{max_retries + 1})")
-            response = session.get(endpoint, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            if data and len(data) > 0:
-                price = float(data[0]['trade_price'])
-                logger.info(f"업비트 USDT 가격 조회 성공: {price} KRW")
-                return price
-            else:
-                logger.warning("업비트에서 USDT 데이터를 찾을 수 없습니다")
-                if attempt < max_retries:
-                    logger.info(f"{retry_delay}초 후 재시도...")
-                    time.sleep(retry_delay)
-                    continue
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"업비트 USDT 가격 조회 오류: {e}")
-            if attempt < max_retries:
-                logger.info(f"{retry_delay}초 후 재시도...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"업비트 USDT 가격에 대한 최대 재시도 횟수에 도달했습니다. 포기합니다.")
-                return None
-        except (ValueError, KeyError, TypeError) as e:
-            logger.error(f"업비트 USDT 응답 파싱 오류: {e}")
-            if attempt < max_retries:
-                logger.info(f"{retry_delay}초 후 재시도...")
-                time.sleep(retry_delay)
-            else:
-                logger.error(f"업비트 USDT 가격에 대한 최대 재시도 횟수에 도달했습니다. 포기합니다.")
-                return None
+    return get_upbit_price('KRW-USDT')
 
 # 네이버 파이낸스에서 USD/KRW 환율 조회
 def get_usd_krw_rate_naver(max_retries=3, retry_delay=2):
@@ -281,24 +330,18 @@ def get_usd_krw_rate_naver(max_retries=3, retry_delay=2):
             # 브라우저 User-Agent 헤더 추가
             headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
             
-            # 세션 생성
-            session = get_session_with_retries()
+            # 세션 생성 (max_retries=0이면 소스 경쟁용 단일 시도이므로 urllib3 재시도도 끔)
+            session = get_session_with_retries(retries=0 if max_retries == 0 else 3)
             
             # 웹 페이지 요청
             response = session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
-            # BeautifulSoup으로 HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # USD 값만 빠르게 추출하고, 실패하면 전체 HTML 파싱으로 대체
+            exchange_rate, parse_path, parse_ms = extract_usd_krw(response.content, response.encoding)
             
-            # 환율 정보가 포함된 요소 찾기
-            exchange_rate_element = soup.select_one('#exchangeList > li.on > a.head.usd > div > span.value')
-            
-            if exchange_rate_element:
-                # 환율 텍스트 추출 및 float로 변환
-                exchange_rate_text = exchange_rate_element.text.strip().replace(',', '')
-                exchange_rate = float(exchange_rate_text)
-                logger.info(f"네이버 파이낸스에서 USD/KRW 환율 조회 성공: {exchange_rate}")
+            if exchange_rate is not None:
+                logger.info(f"네이버 파이낸스에서 USD/KRW 환율 조회 성공: {exchange_rate} ({parse_path}, 파싱 {parse_ms:.2f}ms)")
                 return exchange_rate
             else:
                 logger.warning("네이버 파이낸스 페이지에서 환율 요소를 찾을 수 없습니다")
@@ -332,11 +375,10 @@ def get_usd_krw_rate_yahoo(max_retries=3, retry_delay=2):
     for attempt in range(max_retries + 1):
         try:
             logger.info(f"Yahoo Finance에서 USD/KRW 환율 조회 중 (시도 {attempt + 1}/{max_retries + 1})")
-            ticker = 'USDKRW=X'
-            data = yf.Ticker(ticker)
-            
-            # 현재 환율 조회
-            exchange_rate = data.info['regularMarketPrice']
+            # 차트 API에서 현재 환율만 조회 (실패 시에만 yfinance 사용)
+            exchange_rate = get_quote_price('USDKRW=X')
+            if exchange_rate is None:
+                raise ValueError("Yahoo Finance에서 환율 값을 받지 못했습니다")
             logger.info(f"Yahoo Finance에서 USD/KRW 환율 조회 성공: {exchange_rate}")
             return exchange_rate
             
@@ -349,27 +391,79 @@ def get_usd_krw_rate_yahoo(max_retries=3, retry_delay=2):
                 logger.error("Yahoo Finance에서 USD/KRW 환율에 대한 최대 재시도 횟수에 도달했습니다. 네이버 파이낸스로 시도합니다...")
                 return None
 
-# USD/KRW 환율 조회 (네이버 및 Yahoo 폴백 메커니즘)
-def get_usd_krw_rate(max_retries=3, retry_delay=2):
+# 가격/환율 소스 경쟁 설정
+# 각 소스는 재시도 없이 한 번만 시도하고, 실패하면 즉시, 느리면 지연 시간 p90 이후 다음 소스로 헤지
+usd_krw_racer = SourceRacer("usd_krw", [
+    ("naver", lambda: get_usd_krw_rate_naver(max_retries=0)),
+    ("yahoo", lambda: get_usd_krw_rate_yahoo(max_retries=0)),
+], timeout=10)
+
+# 업비트 시세는 설정된 모든 마켓을 한 번에 조회 (UPBIT_MARKETS, 요청된 마켓은 자동 추가)
+upbit_ticker = UpbitTicker(os.getenv("UPBIT_MARKETS", ",".join(DEFAULT_UPBIT_MARKETS)).split(","), retries=0)
+# 업비트는 대체 호스트가 없으므로 같은 요청을 한 번 더 보내는 방식으로 헤지
+upbit_racer = SourceRacer("upbit_ticker", [
+    ("upbit", upbit_ticker.fetch),
+    ("upbit-hedge", upbit_ticker.fetch),
+], timeout=10)
+
+# 업비트 KRW 마켓 전체 시세 (다중 코인 김치 프리미엄용)
+upbit_all_racer = SourceRacer("upbit_ticker_all", [
+    ("upbit", upbit_ticker.fetch_all),
+    ("upbit-hedge", upbit_ticker.fetch_all),
+], timeout=10)
+
+# 바이낸스 공식 대체 호스트
+BINANCE_HOSTS = ["https://api.binance.com", "https://api1.binance.com", "https://api2.binance.com"]
+binance_racers: Dict[str, SourceRacer] = {}
+
+# 바이낸스 전체 심볼 가격 (대체 호스트 경쟁)
+binance_all_racer = SourceRacer("binance_all", [
+    (host.split("//")[1], lambda host=host: get_binance_all_prices(base_url=host))
+    for host in BINANCE_HOSTS
+], timeout=10)
+
+def get_binance_racer(symbol):
+    """
+    Get (or create) the source racer for a Binance symbol across the Binance API hosts
+    """
+    if symbol not in binance_racers:
+        binance_racers[symbol] = SourceRacer(f"binance_{symbol.lower()}", [
+            (host.split("//")[1], lambda host=host: get_binance_price(symbol, max_retries=0, base_url=host))
+            for host in BINANCE_HOSTS
+        ], timeout=10)
+    return binance_racers[symbol]
+
+# 요청 예산이 소진되면 UPSTREAM_STALE_MAX_AGE초 이내의 마지막 시세로 응답
+UPSTREAM_STALE_MAX_AGE = float(os.getenv("UPSTREAM_STALE_MAX_AGE", "60"))
+binance_budgets = [upstream_budgets.get("binance")]
+upbit_budgets = [upstream_budgets.get("upbit")]
+upbit_fallback = StaleFallback(lambda: upbit_racer.fetch(), upbit_budgets, UPSTREAM_STALE_MAX_AGE)
+upbit_all_fallback = StaleFallback(lambda: upbit_all_racer.fetch(), upbit_budgets, UPSTREAM_STALE_MAX_AGE)
+binance_all_fallback = StaleFallback(lambda: binance_all_racer.fetch(), binance_budgets, UPSTREAM_STALE_MAX_AGE)
+binance_fallbacks: Dict[str, StaleFallback] = {}
+
+def fetch_binance_price(symbol):
     """
-    Get USD/KRW exchange rate (using fallback mechanism)
-    First tries Naver Finance, then falls back to Yahoo Finance if that fails
+    Get the latest Binance price of a symbol, or its last price while the Binance weight budget is exhausted
     
-    Args:
-        max_retries (int): Maximum number of retry attempts
-        retry_delay (int): Delay between retries in seconds
-        
     Returns:
-        float: USD/KRW exchange rate
+        float: Price in the quote currency (None on failure)
     """
-    # 먼저 네이버 파이낸스 시도
-    rate = get_usd_krw_rate_naver(max_retries, retry_delay)
-    
-    # 네이버 파이낸스가 실패하면 Yahoo Finance 시도
-    if rate is None:
-        rate = get_usd_krw_rate_yahoo(max_retries, retry_delay)
+    if symbol not in binance_fallbacks:
+        binance_fallbacks[symbol] = StaleFallback(lambda: get_binance_racer(symbol).fetch(), binance_budgets,
+                                                  UPSTREAM_STALE_MAX_AGE)
+    return binance_fallbacks[symbol]()
+
+# USD/KRW 환율 조회 (네이버와 Yahoo 경쟁)
+def get_usd_krw_rate():
+    """
+    Get USD/KRW exchange rate by racing Naver Finance against Yahoo Finance
+    Naver is asked first; Yahoo is started as soon as Naver fails or is slower than its usual p90 latency
     
-    return rate
+    Returns:
+        float: USD/KRW exchange rate (None if both sources fail within the time budget)
+    """
+    return usd_krw_racer.fetch()
 
 # 김치 프리미엄 계산
 def calculate_premium(binance_price, upbit_price_krw, exchange_rate):
@@ -406,7 +500,7 @@ async def get_btc_usd_price(request: Request, api_key: APIKey = Depends(get_api_
     Returns:
         CryptoPrice: BTC price information in USD
     """
-    price = get_binance_price('BTCUSDT')
+    price = fetch_binance_price('BTCUSDT')
     
     if price is None:
         raise HTTPException(
@@ -478,7 +572,7 @@ async def get_kimchi_premium(request: Request, api_key: APIKey = Depends(get_api
     # ThreadPoolExecutor를 사용하여 모든 가격을 병렬로 조회
     with concurrent.futures.ThreadPoolExecutor() as executor:
         # 모든 작업을 executor에 제출
-        binance_btc_future = executor.submit(get_binance_price, 'BTCUSDT')
+        binance_btc_future = executor.submit(fetch_binance_price, 'BTCUSDT')
         upbit_btc_future = executor.submit(get_upbit_btc_price)
         usd_krw_future = executor.submit(get_usd_krw_rate)
         
@@ -503,6 +597,9 @@ async def get_kimchi_premium(request: Request, api_key: APIKey = Depends(get_api
             detail="Failed to calculate kimchi premium"
         )
     
+    # 이력 조회를 위해 계산 결과와 기초 가격/환율 기록
+    premium_history.record("BTC", premium, binance_btc_price, upbit_btc_price, usd_krw_rate)
+    
     return KimchiPremium(
         premium_percentage=premium,
         binance_price_usd=binance_btc_price,
@@ -511,6 +608,375 @@ async def get_kimchi_premium(request: Request, api_key: APIKey = Depends(get_api
         timestamp=datetime.utcnow()
     )
 
+# API 엔드포인트: 다중 코인 김치 프리미엄
+@router.get("/kimchi-premium/all", response_model=KimchiPremiumTable, summary="Get kimchi premium of every coin listed on both exchanges")
+async def get_kimchi_premium_all(
+    request: Request,
+    top: Optional[int] = Query(None, ge=1, description="Only return the first N coins after sorting"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="Sort by premium: desc (highest first) or asc"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get the kimchi premium of every coin listed on both Upbit KRW and Binance USDT markets
+    Both exchanges' full ticker sets are fetched in bulk (one request each) and the premiums are computed in one vectorized pass
+    
+    Returns:
+        KimchiPremiumTable: Premium table sorted by premium
+    """
+    # 양 거래소 전체 시세와 환율을 병렬로 조회 (환산 그래프도 함께 갱신)
+    upbit_tickers, binance_tickers, usd_krw_rate = fetch_market_snapshot()
+    
+    if None in [upbit_tickers, binance_tickers, usd_krw_rate]:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to retrieve necessary price information"
+        )
+    
+    table = premium_table(upbit_krw_prices(upbit_tickers), binance_usdt_prices(binance_tickers), usd_krw_rate,
+                          ascending=order == "asc")
+    # top 필터와 관계없이 모든 쌍을 기록
+    premium_history.record_table(table, usd_krw_rate)
+    
+    return KimchiPremiumTable(
+        premiums=table.rows(limit=top),
+        pair_count=table.pair_count,
+        exchange_rate=usd_krw_rate,
+        timestamp=datetime.utcnow()
+    )
+
+# 환율 그래프 갱신 주기 (초, 조회 시 이보다 오래되었으면 전체 시세를 다시 조회)
+RATE_GRAPH_REFRESH_INTERVAL = float(os.getenv("RATE_GRAPH_REFRESH_INTERVAL", "10"))
+
+def fetch_market_snapshot(allow_stale=True):
+    """
+    Fetch both exchanges' full ticker sets and the USD/KRW rate in parallel
+    Every freshly fetched part is also fed into the conversion rate graph
+    
+    Args:
+        allow_stale (bool): Return the last ticker sets while an exchange's request budget is exhausted
+    
+    Returns:
+        tuple: (Upbit KRW tickers by market, Binance price tickers, USD/KRW rate), None for each part that failed
+    """
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        upbit_future = executor.submit(upbit_all_fallback.fetch)
+        binance_future = executor.submit(binance_all_fallback.fetch)
+        usd_krw_future = executor.submit(get_usd_krw_rate)
+        
+        upbit_tickers, upbit_stale = upbit_future.result()
+        binance_tickers, binance_stale = binance_future.result()
+        usd_krw_rate = usd_krw_future.result()
+    
+    # 오래된 시세는 환율 그래프에 다시 넣지 않음 (그래프가 갱신 시각을 기록)
+    update_rate_graph(None if upbit_stale else upbit_tickers, None if binance_stale else binance_tickers, usd_krw_rate)
+    if not allow_stale:
+        upbit_tickers = None if upbit_stale else upbit_tickers
+        binance_tickers = None if binance_stale else binance_tickers
+    return upbit_tickers, binance_tickers, usd_krw_rate
+
+def refresh_rate_graph():
+    """
+    Rebuild the conversion rate graph from both exchanges' full ticker sets and the USD/KRW rate
+    
+    Returns:
+        bool: True if at least one source was added to the graph
+    """
+    return any(value is not None for value in fetch_market_snapshot())
+
+def update_rate_graph(upbit_tickers, binance_tickers, usd_krw_rate):
+    """
+    Feed freshly fetched tickers into the conversion rate graph (None values are skipped)
+    """
+    if upbit_tickers is not None:
+        rate_graph.update_upbit(upbit_tickers)
+    if binance_tickers is not None:
+        rate_graph.update_binance(binance_tickers)
+    if usd_krw_rate is not None:
+        rate_graph.update_fx("USD", "KRW", usd_krw_rate)
+
+# 김치 프리미엄 백그라운드 수집 (KIMCHI_POLL_INTERVAL초마다 전체 프리미엄 기록, 알림 평가의 입력)
+# 기록되는 프리미엄 이력에는 새로 조회한 시세만 사용
+premium_engine = create_premium_engine(lambda: fetch_market_snapshot(allow_stale=False), premium_history,
+                                       interval=float(os.getenv("KIMCHI_POLL_INTERVAL", "30")))
+
+def history_points(key, bucket_seconds, start_ts, end_ts):
+    """
+    Read one premium history series as (optionally downsampled) points
+    
+    Args:
+        key (tuple): History series key
+        bucket_seconds (int): Bucket size in seconds; raw points if None
+        start_ts (float): Range start in epoch seconds (inclusive)
+        end_ts (float): Range end in epoch seconds (inclusive)
+        
+    Returns:
+        list: HistoryPoint-shaped dicts (validated once by the response model instead of building models twice)
+    """
+    if bucket_seconds:
+        buckets = premium_history.history.downsample(key, bucket_seconds, start_ts, end_ts)
+        return [
+            {"timestamp": datetime.utcfromtimestamp(ts), "open": o, "high": h, "low": l, "close": c, "mean": m, "count": n}
+            for ts, o, h, l, c, m, n in zip(
+                buckets['timestamp'].tolist(), buckets['open'].tolist(), buckets['high'].tolist(),
+                buckets['low'].tolist(), buckets['close'].tolist(), buckets['mean'].tolist(),
+                buckets['count'].tolist()
+            )
+        ]
+    timestamps, values = premium_history.history.range(key, start_ts, end_ts)
+    return [
+        {"timestamp": datetime.utcfromtimestamp(ts), "open": v, "high": v, "low": v, "close": v, "mean": v, "count": 1}
+        for ts, v in zip(timestamps.tolist(), values.tolist())
+    ]
+
+# API 엔드포인트: 김치 프리미엄 이력
+@router.get("/kimchi-premium/history", response_model=KimchiPremiumHistory, summary="Get recorded kimchi premium history with optional downsampling")
+async def get_kimchi_premium_history(
+    request: Request,
+    symbol: str = Query("BTC", description="Base symbol (e.g. BTC, ETH)"),
+    start: Optional[datetime] = Query(None, alias="from", description="Range start (UTC)"),
+    end: Optional[datetime] = Query(None, alias="to", description="Range end (UTC)"),
+    interval: Optional[str] = Query(None, description="Bucket size (e.g. 5m, 1h, 1d); raw points if omitted"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get the recorded kimchi premium of one coin with the Binance, Upbit and USD/KRW values it was computed from
+    Served from the server-side history of computed premiums, without calling upstream APIs
+    
+    Returns:
+        KimchiPremiumHistory: History points per series, aggregated per bucket (OHLC/mean) when an interval is given
+    """
+    symbol = symbol.upper()
+    if symbol not in premium_history.symbols():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No kimchi premium history for {symbol}"
+        )
+    
+    try:
+        bucket_seconds = parse_interval(interval) if interval else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    # 타임스탬프는 naive UTC datetime 기준
+    start_ts = to_epoch(start) if start else None
+    end_ts = to_epoch(end) if end else None
+    
+    series = {
+        metric: history_points((metric, symbol), bucket_seconds, start_ts, end_ts)
+        for metric in premium_history.PAIR_METRICS
+    }
+    series["exchange_rate"] = history_points(premium_history.EXCHANGE_RATE_KEY, bucket_seconds, start_ts, end_ts)
+    
+    # 응답 모델 검증이 한 번만 일어나도록 dict로 반환
+    return {"symbol": symbol, "interval": interval, **series}
+
+# API 엔드포인트: OHLCV 캔들
+@router.get("/candles", response_model=CandleList, summary="Get OHLCV candles aggregated from ingested trades")
+async def get_candles(
+    request: Request,
+    symbol: str = Query("BTCUSDT", description="Exchange symbol (e.g. BTCUSDT on Binance, KRW-BTC on Upbit)"),
+    exchange: str = Query("binance", description="Exchange: binance or upbit"),
+    interval: str = Query("1m", description="Candle interval: 1m, 5m, 1h or 1d"),
+    limit: int = Query(500, ge=1, le=10000, description="Maximum number of candles (most recent last)"),
+    end: Optional[datetime] = Query(None, alias="to", description="Last candle to include (UTC); latest if omitted"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get OHLCV candles built incrementally from the trades collected in the background
+    Candles are read as stored, without recomputation or upstream calls (bars without trades are omitted)
+    
+    Returns:
+        CandleList: Candles in time order
+    """
+    if interval not in CANDLE_INTERVALS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported interval: {interval} (supported: {', '.join(CANDLE_INTERVALS)})"
+        )
+    
+    # 백그라운드 수집이 아직 한 번도 성공하지 않았다면 즉시 한 번 수집
+    if not candle_engine.has_collected():
+        await run_in_threadpool(candle_engine.collect_once)
+    
+    key = candle_store.resolve(exchange, symbol)
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No candles for {symbol} on {exchange}"
+        )
+    
+    bars = candle_store.candles(key, interval, limit, to_epoch(end) if end else None)
+    # 응답 모델 검증이 한 번만 일어나도록 dict로 반환
+    candles = [
+        {"timestamp": datetime.utcfromtimestamp(ts), "open": o, "high": h, "low": l, "close": c, "volume": v, "trades": n}
+        for ts, o, h, l, c, v, n in zip(
+            bars['timestamp'].tolist(), bars['open'].tolist(), bars['high'].tolist(), bars['low'].tolist(),
+            bars['close'].tolist(), bars['volume'].tolist(), bars['trades'].tolist()
+        )
+    ]
+    gap_count = sum(feed.gap_count for feed in candle_engine.sources if (feed.exchange, feed.symbol) == key)
+    return {"symbol": key[1], "exchange": key[0], "interval": interval, "gap_count": gap_count, "candles": candles}
+
+# API 엔드포인트: 기술 지표
+@router.get("/indicators", response_model=IndicatorValues, summary="Get technical indicators computed over stored candles")
+async def get_indicators(
+    request: Request,
+    symbol: str = Query("BTCUSDT", description="Exchange symbol (e.g. BTCUSDT on Binance, KRW-BTC on Upbit)"),
+    exchange: str = Query("binance", description="Exchange: binance or upbit"),
+    interval: str = Query("1h", description="Candle interval: 1m, 5m, 1h or 1d"),
+    names: str = Query("rsi14", description="Comma-separated indicators: sma<N>, ema<N>, rsi<N>, bb<N> (Bollinger, 2 std), vwap<N>"),
+    limit: int = Query(1, ge=1, le=1000, description="Number of most recent closed candles to return values for"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get technical indicators over the closed candles of one symbol
+    Values are cached per indicator and only extended when a new candle closes (the forming candle is excluded)
+    
+    Returns:
+        IndicatorValues: Candle timestamps and one value list per indicator column (null while warming up)
+    """
+    if interval not in CANDLE_INTERVALS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported interval: {interval} (supported: {', '.join(CANDLE_INTERVALS)})"
+        )
+    
+    if not candle_engine.has_collected():
+        await run_in_threadpool(candle_engine.collect_once)
+    
+    key = candle_store.resolve(exchange, symbol)
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No candles for {symbol} on {exchange}"
+        )
+    
+    try:
+        timestamps, values = indicator_cache.values(key, interval, [name for name in names.split(",") if name.strip()], limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return {
+        "symbol": key[1],
+        "exchange": key[0],
+        "interval": interval,
+        "timestamps": [datetime.utcfromtimestamp(ts) for ts in timestamps.tolist()],
+        # 워밍업 구간의 NaN은 null로 반환
+        "values": {column: [None if np.isnan(value) else value for value in column_values.tolist()]
+                   for column, column_values in values.items()},
+    }
+
+def get_orderbook_snapshot(symbol):
+    """
+    Get the latest published local order book snapshot of a tracked symbol
+    
+    Args:
+        symbol (str): Binance symbol (e.g., 'BTCUSDT')
+        
+    Returns:
+        dict: Order book snapshot (raises 404 for untracked symbols, 503 until synchronized)
+    """
+    snapshot = orderbook_manager.get(symbol)
+    if snapshot is None:
+        if symbol.upper().replace("/", "").replace("-", "") not in orderbook_manager.symbols():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Order book not tracked for {symbol} (tracked: {', '.join(orderbook_manager.symbols())})"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Order book for {symbol} is not synchronized yet"
+        )
+    return snapshot
+
+# API 엔드포인트: 호가창
+@router.get("/orderbook", response_model=OrderBookDepth, summary="Get the local order book of a tracked Binance symbol")
+async def get_orderbook(
+    request: Request,
+    symbol: str = Query("BTCUSDT", description="Binance symbol (e.g. BTCUSDT)"),
+    depth: int = Query(20, ge=1, le=100, description="Number of price levels per side"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get the top price levels of the local order book, kept in sync from the Binance snapshot and diff stream
+    
+    Returns:
+        OrderBookDepth: Bids (highest first) and asks (lowest first) as [price, quantity] pairs
+    """
+    snapshot = get_orderbook_snapshot(symbol)
+    return dict(snapshot, bids=snapshot["bids"][:depth], asks=snapshot["asks"][:depth],
+                timestamp=datetime.utcfromtimestamp(snapshot["timestamp"]))
+
+# API 엔드포인트: 호가 유동성
+@router.get("/liquidity", response_model=Liquidity, summary="Get order book liquidity within ±0.1/0.5/1% of the mid price")
+async def get_liquidity(
+    request: Request,
+    symbol: str = Query("BTCUSDT", description="Binance symbol (e.g. BTCUSDT)"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get the bid and ask quantity and notional resting within each band around the mid price
+    Bands are precomputed whenever the book changes
+    
+    Returns:
+        Liquidity: Liquidity per band
+    """
+    snapshot = get_orderbook_snapshot(symbol)
+    return {
+        "symbol": snapshot["symbol"],
+        "last_update_id": snapshot["last_update_id"],
+        "mid": snapshot["mid"],
+        "spread": snapshot["spread"],
+        "bands": snapshot["bands"],
+        "timestamp": datetime.utcfromtimestamp(snapshot["timestamp"]),
+    }
+
+# API 엔드포인트: 임의 통화 환산
+@router.get("/convert", response_model=CurrencyConversion, summary="Convert an amount between any two currencies")
+async def convert_currency(
+    request: Request,
+    from_currency: str = Query(..., alias="from", description="Currency to convert from (e.g. ETH)"),
+    to_currency: str = Query(..., alias="to", description="Currency to convert to (e.g. KRW)"),
+    amount: float = Query(1.0, gt=0, description="Amount in the source currency"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Convert between any two currencies quoted on Upbit (KRW markets), Binance or the USD/KRW FX rate
+    The rate is resolved over the best path of the rate graph (fewest hops, freshest and most liquid tickers first)
+    
+    Returns:
+        CurrencyConversion: Rate, converted amount and the hops it was computed from
+    """
+    # 그래프가 오래되었으면 전체 시세로 다시 구성
+    if time.time() - rate_graph.updated_at > RATE_GRAPH_REFRESH_INTERVAL:
+        refreshed = await run_in_threadpool(refresh_rate_graph)
+        if not refreshed and not rate_graph.currencies():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to retrieve necessary price information"
+            )
+    
+    conversion = rate_graph.convert(from_currency, to_currency)
+    if conversion is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No conversion path from {from_currency.upper()} to {to_currency.upper()}"
+        )
+    
+    return {
+        "from_currency": from_currency.upper(),
+        "to_currency": to_currency.upper(),
+        "amount": amount,
+        "rate": conversion.rate,
+        "converted_amount": amount * conversion.rate,
+        "path": [
+            {"base": edge.base, "quote": edge.quote, "rate": edge.rate, "source": edge.source,
+             "timestamp": datetime.utcfromtimestamp(edge.timestamp)}
+            for edge in conversion.path
+        ],
+        "timestamp": datetime.utcnow(),
+    }
+
 # API 엔드포인트: 주요 암호화폐 가격 목록
 @router.get("/prices", response_model=CryptoPriceList, summary="Get major cryptocurrency prices")
 async def get_crypto_prices(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
@@ -523,9 +989,9 @@ async def get_crypto_prices(request: Request, api_key: APIKey = Depends(get_api_
     # ThreadPoolExecutor를 사용하여 모든 가격을 병렬로 조회
     with concurrent.futures.ThreadPoolExecutor() as executor:
         # 모든 작업을 executor에 제출
-        btc_future = executor.submit(get_binance_price, 'BTCUSDT')
-        eth_future = executor.submit(get_binance_price, 'ETHUSDT')
-        xrp_future = executor.submit(get_binance_price, 'XRPUSDT')
+        btc_future = executor.submit(fetch_binance_price, 'BTCUSDT')
+        eth_future = executor.submit(fetch_binance_price, 'ETHUSDT')
+        xrp_future = executor.submit(fetch_binance_price, 'XRPUSDT')
         
         # futures에서 결과 가져오기
         btc_price = btc_future.result()
@@ -553,3 +1019,27 @@ async def get_crypto_prices(request: Request, api_key: APIKey = Depends(get_api_
         currency="USD",
         timestamp=datetime.utcnow()
     )
+
+# API 엔드포인트: 가격/환율 소스 경쟁 상태
+@router.get("/sources", response_model=List[SourceRaceStatus], summary="Get price source latency and hedging statistics")
+async def get_price_sources(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get per-source latency percentiles, hedge delays and win counts of the price and FX source races
+    
+    Returns:
+        List[SourceRaceStatus]: Status of each source race
+    """
+    racers = [usd_krw_racer, upbit_racer, upbit_all_racer, binance_all_racer] + list(binance_racers.values())
+    return [SourceRaceStatus(**racer.status()) for racer in racers]
+
+# API 엔드포인트: 거래소 요청 예산 사용량
+@router.get("/upstream-budgets", response_model=List[UpstreamBudgetStatus], summary="Get exchange request budget utilization")
+async def get_upstream_budgets(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get the request weight used in the current window of each exchange (synced from the exchanges' usage headers)
+    and the number of queued, shed, throttled (429/418) and stale-served requests
+    
+    Returns:
+        List[UpstreamBudgetStatus]: Budget of each upstream
+    """
+    return [UpstreamBudgetStatus(**budget) for budget in upstream_budgets.status()]
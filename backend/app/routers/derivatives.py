@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, Request
-from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 from app.models import APIKey
 from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion import IngestionStatus, ensure_collected
+from app.ingestion.derivatives import derivatives_engine, derivatives_store
+from app.timeseries import parse_interval, to_epoch
 
 router = APIRouter()
 
@@ -22,8 +25,24 @@ class OpenInterest(BaseModel):
     open_interest_usd: float
     change_24h: float
 
+class HistoryPoint(BaseModel):
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    mean: float
+    count: int
+
+class DerivativesHistory(BaseModel):
+    symbol: str
+    exchange: str
+    metric: str
+    interval: Optional[str] = None
+    points: List[HistoryPoint]
+
 # Funding rates for cryptocurrency futures
-@router.get("/funding-rates", summary="Get current funding rates for major cryptocurrency futures markets")
+@router.get("/funding-rates", response_model=List[FundingRate], summary="Get current funding rates for major cryptocurrency futures markets")
 async def get_funding_rates(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
     Get current funding rates for major cryptocurrency futures markets
@@ -31,47 +50,19 @@ async def get_funding_rates(request: Request, api_key: APIKey = Depends(get_api_
     Returns:
         List[FundingRate]: List of funding rates for different cryptocurrency pairs
     """
-    # Dummy data
-    return [
-        FundingRate(
-            symbol="BTC/USDT",
-            exchange="Binance",
-            rate=0.0012,
-            next_funding_time=datetime.utcnow(),
-            interval="8h"
-        ),
-        FundingRate(
-            symbol="ETH/USDT",
-            exchange="Binance",
-            rate=0.0008,
-            next_funding_time=datetime.utcnow(),
-            interval="8h"
-        ),
-        FundingRate(
-            symbol="BTC/USDT",
-            exchange="Bybit",
-            rate=0.0010,
-            next_funding_time=datetime.utcnow(),
-            interval="8h"
-        ),
-        FundingRate(
-            symbol="ETH/USDT",
-            exchange="Bybit",
-            rate=0.0007,
-            next_funding_time=datetime.utcnow(),
-            interval="8h"
-        ),
-        FundingRate(
-            symbol="BTC/USD",
-            exchange="BitMEX",
-            rate=0.0011,
-            next_funding_time=datetime.utcnow(),
-            interval="8h"
+    await ensure_collected(derivatives_engine)
+    rates = derivatives_store.funding_rates()
+    
+    if not rates:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to retrieve funding rates from exchanges"
         )
-    ]
+    
+    return [FundingRate(**rate) for rate in rates]
 
 # Open interest for cryptocurrency derivatives
-@router.get("/open-interest", summary="Get open interest ratios for major cryptocurrency derivatives")
+@router.get("/open-interest", response_model=List[OpenInterest], summary="Get open interest ratios for major cryptocurrency derivatives")
 async def get_open_interest(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
     Get open interest ratios for major cryptocurrency derivatives
@@ -79,41 +70,115 @@ async def get_open_interest(request: Request, api_key: APIKey = Depends(get_api_
     Returns:
         List[OpenInterest]: List of open interest data for different cryptocurrency pairs
     """
-    # Dummy data
-    return [
-        OpenInterest(
-            symbol="BTC/USDT",
-            exchange="Binance",
-            open_interest=45000.25,
-            open_interest_usd=2250012500.0,
-            change_24h=3.5
-        ),
-        OpenInterest(
-            symbol="ETH/USDT",
-            exchange="Binance",
-            open_interest=350000.75,
-            open_interest_usd=875001875.0,
-            change_24h=2.1
-        ),
-        OpenInterest(
-            symbol="BTC/USDT",
-            exchange="OKX",
-            open_interest=38000.5,
-            open_interest_usd=1900025000.0,
-            change_24h=1.8
-        ),
-        OpenInterest(
-            symbol="ETH/USDT",
-            exchange="OKX",
-            open_interest=320000.0,
-            open_interest_usd=800000000.0,
-            change_24h=1.2
-        ),
-        OpenInterest(
-            symbol="BTC/USD",
-            exchange="Deribit",
-            open_interest=25000.0,
-            open_interest_usd=1250000000.0,
-            change_24h=4.2
+    await ensure_collected(derivatives_engine)
+    data = derivatives_store.open_interest()
+    
+    if not data:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to retrieve open interest from exchanges"
         )
-    ]
+    
+    return [OpenInterest(**item) for item in data]
+
+# Ingestion status per exchange
+@router.get("/status", response_model=List[IngestionStatus], summary="Get derivatives data freshness and latency per exchange")
+async def get_ingestion_status(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get derivatives data freshness and collection latency per exchange
+    
+    Returns:
+        List[IngestionStatus]: Freshness (seconds since last successful collection) and latency per exchange
+    """
+    return [IngestionStatus(**item) for item in derivatives_engine.status()]
+
+def build_history(metric: str, symbol: str, exchange: str, start: Optional[datetime],
+                  end: Optional[datetime], interval: Optional[str]) -> DerivativesHistory:
+    """
+    Build a (optionally downsampled) history response from the derivatives store
+    
+    Args:
+        metric: History metric ('funding_rate', 'open_interest' or 'open_interest_usd')
+        symbol: Trading pair (e.g. 'BTC/USDT' or 'BTCUSDT')
+        exchange: Exchange name (case-insensitive)
+        start: Range start (inclusive, UTC)
+        end: Range end (inclusive, UTC)
+        interval: Bucket size such as '8h' or '1d'; raw points are returned if omitted
+        
+    Returns:
+        DerivativesHistory: History points
+    """
+    key = derivatives_store.resolve_key(metric, exchange, symbol)
+    if key is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No {metric} history for {symbol} on {exchange}"
+        )
+    
+    try:
+        bucket_seconds = parse_interval(interval) if interval else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    # 시간대가 없는 값은 UTC로 간주
+    start_ts = to_epoch(start) if start else None
+    end_ts = to_epoch(end) if end else None
+    
+    if bucket_seconds:
+        buckets = derivatives_store.history.downsample(key, bucket_seconds, start_ts, end_ts)
+        points = [
+            HistoryPoint(timestamp=datetime.utcfromtimestamp(ts), open=o, high=h, low=l, close=c, mean=m, count=n)
+            for ts, o, h, l, c, m, n in zip(
+                buckets['timestamp'].tolist(), buckets['open'].tolist(), buckets['high'].tolist(),
+                buckets['low'].tolist(), buckets['close'].tolist(), buckets['mean'].tolist(),
+                buckets['count'].tolist()
+            )
+        ]
+    else:
+        timestamps, values = derivatives_store.history.range(key, start_ts, end_ts)
+        points = [
+            HistoryPoint(timestamp=datetime.utcfromtimestamp(ts), open=v, high=v, low=v, close=v, mean=v, count=1)
+            for ts, v in zip(timestamps.tolist(), values.tolist())
+        ]
+    
+    return DerivativesHistory(symbol=key[2], exchange=key[1], metric=metric, interval=interval, points=points)
+
+# Funding rate history
+@router.get("/funding-rates/history", response_model=DerivativesHistory, summary="Get funding rate history with optional downsampling")
+async def get_funding_rate_history(
+    request: Request,
+    symbol: str = Query(..., description="Trading pair (e.g. BTC/USDT)"),
+    exchange: str = Query(..., description="Exchange name (e.g. Binance)"),
+    start: Optional[datetime] = Query(None, alias="from", description="Range start (UTC)"),
+    end: Optional[datetime] = Query(None, alias="to", description="Range end (UTC)"),
+    interval: Optional[str] = Query(None, description="Bucket size (e.g. 8h, 1d); raw points if omitted"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get funding rate history for one symbol on one exchange
+    
+    Returns:
+        DerivativesHistory: Funding rate points, aggregated per bucket (OHLC/mean) when an interval is given
+    """
+    return build_history("funding_rate", symbol, exchange, start, end, interval)
+
+# Open interest history
+@router.get("/open-interest/history", response_model=DerivativesHistory, summary="Get open interest history with optional downsampling")
+async def get_open_interest_history(
+    request: Request,
+    symbol: str = Query(..., description="Trading pair (e.g. BTC/USDT)"),
+    exchange: str = Query(..., description="Exchange name (e.g. Binance)"),
+    start: Optional[datetime] = Query(None, alias="from", description="Range start (UTC)"),
+    end: Optional[datetime] = Query(None, alias="to", description="Range end (UTC)"),
+    interval: Optional[str] = Query(None, description="Bucket size (e.g. 1h, 1d); raw points if omitted"),
+    usd: bool = Query(False, description="Return open interest in USD instead of contracts"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get open interest history for one symbol on one exchange
+    
+    Returns:
+        DerivativesHistory: Open interest points, aggregated per bucket (OHLC/mean) when an interval is given
+    """
+    metric = "open_interest_usd" if usd else "open_interest"
+    return build_history(metric, symbol, exchange, start, end, interval)
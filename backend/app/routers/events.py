@@ -0,0 +1,109 @@
+from fastapi import (APIRouter, Depends, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect,
+                     WebSocketException, status)
+from sqlalchemy.orm import Session
+from typing import Optional
+import asyncio
+import os
+
+from app.database import get_db
+from app.models import APIKey
+from app.auth.api_key import get_api_key_with_tracking, track_api_usage, verify_api_key
+from app.events import QUEUE_POLICIES, event_bus
+
+router = APIRouter()
+
+# 클라이언트가 구독할 수 있는 토픽 네임스페이스 (alerts.* 등 내부 토픽은 제외)
+STREAM_NAMESPACES = ("kimchi", "derivatives", "social")
+
+# 구독자별 최대 대기 이벤트 수
+MAX_STREAM_BUFFER = int(os.getenv("MAX_STREAM_BUFFER", "1000"))
+
+def get_stream_api_key(
+    websocket: WebSocket,
+    api_key_id: Optional[str] = Header(None, alias="api-key-id"),
+    api_key_secret: Optional[str] = Header(None, alias="api-key-secret"),
+    db: Session = Depends(get_db)
+):
+    """
+    API 키 검증 및 사용량 추적 (웹소켓 연결당 1회 과금)
+
+    브라우저 웹소켓은 헤더를 지정할 수 없으므로 api_key_id/api_key_secret 쿼리 파라미터도 허용합니다.
+
+    Returns:
+        APIKey: 검증된 API 키 객체
+    """
+    api_key_id = api_key_id or websocket.query_params.get("api_key_id")
+    api_key_secret = api_key_secret or websocket.query_params.get("api_key_secret")
+    try:
+        api_key = verify_api_key(api_key_id, api_key_secret, None, db)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+    track_api_usage(api_key, websocket.url.path, "WEBSOCKET", db)
+    return api_key
+
+@router.websocket("/stream")
+async def stream_events(
+    websocket: WebSocket,
+    topics: str = Query(..., description="Comma-separated topic patterns ('*' = one segment, '#' = the rest)"),
+    policy: str = Query("coalesce", description=f"Slow consumer policy: {', '.join(QUEUE_POLICIES)}"),
+    buffer: int = Query(100, ge=1, description="Maximum events waiting for this client"),
+    api_key: APIKey = Depends(get_stream_api_key)
+):
+    """
+    Stream ingested market events over a WebSocket instead of polling
+
+    Topics:
+    - `kimchi.<series>.<SYMBOL>`: premium_percentage, binance_price_usd, upbit_price_krw, exchange_rate
+    - `derivatives.<metric>.<Exchange>.<SYMBOL/USDT>`: funding_rate, open_interest
+    - `social.posts.<account>`: new posts
+
+    Each message is `{"topic", "data", "timestamp", "dropped"}` where `dropped` counts the events
+    discarded so far because the client read slower than events arrived. With the default
+    `coalesce` policy only the latest event per topic is kept while the client lags.
+    """
+    patterns = [pattern.strip() for pattern in topics.split(",") if pattern.strip()]
+    if not patterns or any(pattern.split(".")[0] not in STREAM_NAMESPACES for pattern in patterns):
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=f"Topics must start with one of: {', '.join(STREAM_NAMESPACES)}"
+        )
+    if policy not in QUEUE_POLICIES:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason=f"Unsupported policy: {policy} (use {', '.join(QUEUE_POLICIES)})"
+        )
+
+    # 연결 수락 전에 구독해 수락 직후 발행된 이벤트도 받음
+    subscription = event_bus.subscribe(patterns, min(buffer, MAX_STREAM_BUFFER), policy)
+    await websocket.accept()
+
+    async def wait_for_disconnect():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            subscription.close()
+
+    receiver = asyncio.create_task(wait_for_disconnect())
+    try:
+        async for event in subscription:
+            await websocket.send_json({
+                "topic": event.topic,
+                "data": event.payload,
+                "timestamp": event.timestamp,
+                "dropped": subscription.dropped_count,
+            })
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        subscription.close()
+        receiver.cancel()
+
+@router.get("/status", summary="Event bus status")
+async def get_event_bus_status(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Event bus role of this worker process (leader runs ingestion), published events, subscribers and dropped events
+    """
+    return event_bus.status()
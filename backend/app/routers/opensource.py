@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, Request
-from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 from app.models import APIKey
 from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion import IngestionStatus, ensure_collected
+from app.ingestion.github import REQUIRED_STATS, github_engine, github_mirrors
 
 router = APIRouter()
 
@@ -26,85 +28,51 @@ class RepositoryStats(BaseModel):
     open_issues: int
     watchers: int
     last_commit: datetime
-    contributors_count: int
-    release_version: str
-    release_date: datetime
+    contributors_count: Optional[int] = None
+    release_version: Optional[str] = None
+    release_date: Optional[datetime] = None
+
+class RepositoryActivity(BaseModel):
+    stats: RepositoryStats
+    pull_requests: List[PullRequest]
+
+async def get_repository_activity(repo: str, limit: Optional[int] = None) -> RepositoryActivity:
+    mirror = github_mirrors.get(repo)
+    if mirror is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Repository not tracked: {repo} (available: {', '.join(github_mirrors)})"
+        )
+    
+    # 로컬 미러에 필수 통계가 없고 아직 동기화된 적이 없다면 즉시 한 번 동기화
+    if not all(field in mirror.stats for field in REQUIRED_STATS):
+        await ensure_collected(github_engine)
+    
+    snapshot = mirror.snapshot(limit)
+    if not all(field in snapshot["stats"] for field in REQUIRED_STATS):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to retrieve repository activity for {mirror.full_name}"
+        )
+    
+    return RepositoryActivity(
+        stats=RepositoryStats(**snapshot["stats"]),
+        pull_requests=[PullRequest(**pr) for pr in snapshot["pull_requests"]]
+    )
 
 # Bitcoin Core repository activity
-@router.get("/bitcoin", summary="Get latest pull requests, stars, and activities from Bitcoin Core repository")
+@router.get("/bitcoin", response_model=RepositoryActivity, summary="Get latest pull requests, stars, and activities from Bitcoin Core repository")
 async def get_bitcoin_activity(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
     Get latest pull requests, stars, and activities from Bitcoin Core repository
     
     Returns:
-        Dict: Dictionary containing repository stats and recent pull requests
+        RepositoryActivity: Repository stats and recent pull requests
     """
-    # Dummy data
-    return {
-        "stats": RepositoryStats(
-            stars=72500,
-            forks=34200,
-            open_issues=1250,
-            watchers=4800,
-            last_commit=datetime.utcnow(),
-            contributors_count=890,
-            release_version="25.1",
-            release_date=datetime.utcnow()
-        ),
-        "pull_requests": [
-            PullRequest(
-                id=28123,
-                title="p2p: Add support for v2 transport protocol",
-                author="theStack",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                state="open",
-                url="https://github.com/bitcoin/bitcoin/pull/28123",
-                comments=45,
-                additions=2500,
-                deletions=1200
-            ),
-            PullRequest(
-                id=28120,
-                title="wallet: Improve coin selection algorithm efficiency",
-                author="achow101",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                state="open",
-                url="https://github.com/bitcoin/bitcoin/pull/28120",
-                comments=32,
-                additions=850,
-                deletions=320
-            ),
-            PullRequest(
-                id=28115,
-                title="consensus: Optimize block validation process",
-                author="sipa",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                state="merged",
-                url="https://github.com/bitcoin/bitcoin/pull/28115",
-                comments=78,
-                additions=1200,
-                deletions=950
-            ),
-            PullRequest(
-                id=28110,
-                title="doc: Update developer documentation for new RPC methods",
-                author="MarcoFalke",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                state="merged",
-                url="https://github.com/bitcoin/bitcoin/pull/28110",
-                comments=15,
-                additions=450,
-                deletions=120
-            )
-        ]
-    }
+    return await get_repository_activity("bitcoin")
 
 # Ethereum Core repositories activity
-@router.get("/ethereum", summary="Get latest pull requests, stars, and activities from Ethereum Core repositories")
+@router.get("/ethereum", response_model=Dict[str, RepositoryActivity], summary="Get latest pull requests, stars, and activities from Ethereum Core repositories")
 async def get_ethereum_activity(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
     Get latest pull requests, stars, and activities from Ethereum Core repositories
@@ -112,82 +80,36 @@ async def get_ethereum_activity(request: Request, api_key: APIKey = Depends(get_
     Returns:
         Dict: Dictionary containing repository stats and recent pull requests for multiple Ethereum repositories
     """
-    # Dummy data
     return {
-        "go-ethereum": {
-            "stats": RepositoryStats(
-                stars=43800,
-                forks=18500,
-                open_issues=320,
-                watchers=2800,
-                last_commit=datetime.utcnow(),
-                contributors_count=720,
-                release_version="1.13.4",
-                release_date=datetime.utcnow()
-            ),
-            "pull_requests": [
-                PullRequest(
-                    id=28500,
-                    title="eth: Implement EIP-4844 blob transaction support",
-                    author="karalabe",
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    state="merged",
-                    url="https://github.com/ethereum/go-ethereum/pull/28500",
-                    comments=65,
-                    additions=3200,
-                    deletions=1500
-                ),
-                PullRequest(
-                    id=28495,
-                    title="core: Optimize state trie access patterns",
-                    author="holiman",
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    state="open",
-                    url="https://github.com/ethereum/go-ethereum/pull/28495",
-                    comments=42,
-                    additions=1800,
-                    deletions=950
-                )
-            ]
-        },
-        "consensus-specs": {
-            "stats": RepositoryStats(
-                stars=12500,
-                forks=4300,
-                open_issues=180,
-                watchers=950,
-                last_commit=datetime.utcnow(),
-                contributors_count=320,
-                release_version="v1.4.0",
-                release_date=datetime.utcnow()
-            ),
-            "pull_requests": [
-                PullRequest(
-                    id=3250,
-                    title="specs: Add Verkle tree transition specifications",
-                    author="dankrad",
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    state="open",
-                    url="https://github.com/ethereum/consensus-specs/pull/3250",
-                    comments=85,
-                    additions=4500,
-                    deletions=1200
-                ),
-                PullRequest(
-                    id=3245,
-                    title="specs: Improve validator rewards calculation",
-                    author="djrtwo",
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    state="merged",
-                    url="https://github.com/ethereum/consensus-specs/pull/3245",
-                    comments=38,
-                    additions=850,
-                    deletions=420
-                )
-            ]
-        }
+        "go-ethereum": await get_repository_activity("go-ethereum"),
+        "consensus-specs": await get_repository_activity("consensus-specs")
     }
+
+# Sync status per repository
+@router.get("/status", response_model=List[IngestionStatus], summary="Get GitHub mirror freshness and latency per repository")
+async def get_ingestion_status(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get sync freshness, latency and error counts for each tracked repository
+    
+    Returns:
+        List[IngestionStatus]: Status of each repository sync
+    """
+    return [IngestionStatus(**item) for item in github_engine.status()]
+
+# Any tracked repository activity
+@router.get("/{repo}", response_model=RepositoryActivity, summary="Get latest pull requests, stars, and activities from a tracked repository")
+async def get_repo_activity(
+    request: Request,
+    repo: str,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of pull requests"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Get stats and recent pull requests of a tracked repository from the local mirror
+    
+    - **repo**: Repository key (e.g. bitcoin, go-ethereum, consensus-specs)
+    
+    Returns:
+        RepositoryActivity: Repository stats and recent pull requests (most recently updated first)
+    """
+    return await get_repository_activity(repo, limit)
@@ -26,14 +26,9 @@ class EthereumStandard(BaseModel):
     url: str
     description: str
 
-# HashKey Chain updates
-@router.get("/hsk", summary="Get latest updates and developments from HashKey Chain")
-async def get_hsk_updates(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+def list_hsk_updates() -> List[ProjectUpdate]:
     """
-    Get latest updates and developments from HashKey Chain
-    
-    Returns:
-        List[ProjectUpdate]: List of recent updates from HashKey Chain
+    Get the current list of HashKey Chain updates
     """
     # Dummy data
     return [
@@ -67,14 +62,20 @@ async def get_hsk_updates(request: Request, api_key: APIKey = Depends(get_api_ke
         )
     ]
 
-# Ethereum standards
-@router.get("/ethereum/standards", summary="Get information about new Ethereum standards and proposals")
-async def get_ethereum_standards(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+# HashKey Chain updates
+@router.get("/hsk", summary="Get latest updates and developments from HashKey Chain")
+async def get_hsk_updates(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
-    Get information about new Ethereum standards and proposals
+    Get latest updates and developments from HashKey Chain
     
     Returns:
-        List[EthereumStandard]: List of recent Ethereum Improvement Proposals (EIPs)
+        List[ProjectUpdate]: List of recent updates from HashKey Chain
+    """
+    return list_hsk_updates()
+
+def list_ethereum_standards() -> List[EthereumStandard]:
+    """
+    Get the current list of Ethereum standards
     """
     # Dummy data
     return [
@@ -113,14 +114,20 @@ async def get_ethereum_standards(request: Request, api_key: APIKey = Depends(get
         )
     ]
 
-# Solana updates
-@router.get("/solana", summary="Get latest updates and developments from Solana blockchain")
-async def get_solana_updates(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+# Ethereum standards
+@router.get("/ethereum/standards", summary="Get information about new Ethereum standards and proposals")
+async def get_ethereum_standards(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
     """
-    Get latest updates and developments from Solana blockchain
+    Get information about new Ethereum standards and proposals
     
     Returns:
-        List[ProjectUpdate]: List of recent updates from Solana blockchain
+        List[EthereumStandard]: List of recent Ethereum Improvement Proposals (EIPs)
+    """
+    return list_ethereum_standards()
+
+def list_solana_updates() -> List[ProjectUpdate]:
+    """
+    Get the current list of Solana updates
     """
     # Dummy data
     return [
@@ -153,3 +160,14 @@ async def get_solana_updates(request: Request, api_key: APIKey = Depends(get_api
             type="announcement"
         )
     ]
+
+# Solana updates
+@router.get("/solana", summary="Get latest updates and developments from Solana blockchain")
+async def get_solana_updates(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get latest updates and developments from Solana blockchain
+    
+    Returns:
+        List[ProjectUpdate]: List of recent updates from Solana blockchain
+    """
+    return list_solana_updates()
@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from pydantic import BaseModel
+
+from app.models import APIKey
+from app.auth.api_key import get_api_key_with_tracking
+from app.routers.projects import list_ethereum_standards, list_hsk_updates, list_solana_updates
+from app.search import search_index
+from app.timeseries import parse_interval
+
+router = APIRouter()
+
+# 검색 가능한 소스
+SEARCH_SOURCES = ("social", "projects", "eips")
+
+class SearchResult(BaseModel):
+    source: str
+    id: str
+    title: str
+    content: str
+    timestamp: Optional[datetime] = None
+    score: float
+    url: Optional[str] = None
+    author: Optional[str] = None
+
+class SearchResponse(BaseModel):
+    query: str
+    total_count: int
+    results: List[SearchResult]
+
+# 소셜 게시물 색인 (SocialFeedStore 구독 콜백)
+def index_social_posts(account: str, posts: List[Dict[str, Any]]):
+    """
+    Index newly ingested social posts
+
+    Args:
+        account: Feed account key (e.g. 'trump', 'elon')
+        posts: Normalized SocialPost records
+    """
+    search_index.add_many(
+        {
+            "source": "social",
+            "doc_id": post['id'],
+            "title": "",
+            "body": post['content'],
+            "timestamp": post['timestamp'],
+            "author": post['username'],
+            "account": account,
+        }
+        for post in posts
+    )
+
+# 프로젝트 업데이트 및 EIP 색인
+def index_project_documents():
+    """
+    Index project updates (HashKey Chain, Solana) and Ethereum standards
+    """
+    for project, updates in (("hsk", list_hsk_updates()), ("solana", list_solana_updates())):
+        search_index.add_many(
+            {
+                "source": "projects",
+                "doc_id": update.url,
+                "title": update.title,
+                "body": update.description,
+                "timestamp": update.date,
+                "url": update.url,
+                "project": project,
+            }
+            for update in updates
+        )
+    search_index.add_many(
+        {
+            "source": "eips",
+            "doc_id": f"eip-{standard.eip_number}",
+            "title": f"EIP-{standard.eip_number}: {standard.title}",
+            "body": standard.description,
+            "timestamp": standard.created,
+            "url": standard.url,
+            "author": standard.author,
+        }
+        for standard in list_ethereum_standards()
+    )
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    # 상대 기간(예: 1h, 30m) 또는 ISO 8601 시각
+    if not value:
+        return None
+    try:
+        return datetime.utcnow() - timedelta(seconds=parse_interval(value))
+    except ValueError:
+        pass
+    try:
+        since = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid since value: {value} (use a duration such as 1h or an ISO 8601 time)"
+        )
+    # 색인 시각은 naive UTC이므로 오프셋이 있으면 UTC로 변환
+    return since.astimezone(timezone.utc).replace(tzinfo=None) if since.tzinfo else since
+
+# 전문 검색
+@router.get("", response_model=SearchResponse, summary="Search social posts, project updates and Ethereum standards")
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, description="Search query (all terms must match)"),
+    source: Optional[str] = Query(None, description="Restrict to one source: social, projects or eips"),
+    since: Optional[str] = Query(None, description="Only documents newer than a duration (e.g. 1h) or an ISO 8601 time"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
+    """
+    Full-text search over ingested social posts, project updates and EIPs
+
+    - **q**: Search terms; documents must contain every term.
+    - **source**: Optional source filter.
+    - **since**: Optional recency filter, e.g. `since=1h` for the last hour.
+
+    Returns:
+        SearchResponse: Matches ranked by relevance (BM25)
+    """
+    if source is not None and source not in SEARCH_SOURCES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid source: {source} (choose from {', '.join(SEARCH_SOURCES)})"
+        )
+
+    total, results = search_index.search(q, source=source, since=parse_since(since), limit=limit)
+
+    return SearchResponse(
+        query=q,
+        total_count=total,
+        results=[SearchResult(**result) for result in results]
+    )
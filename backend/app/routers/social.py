@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, Request
-from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Dict, List, Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 from app.models import APIKey
 from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion import IngestionStatus, ensure_collected
+from app.ingestion.social import social_engine, social_store
 
 router = APIRouter()
 
@@ -22,127 +24,92 @@ class TrendingTopic(BaseModel):
     name: str
     tweet_count: int
     category: str
-    location: str = None
+    location: Optional[str] = None
+
+async def get_account_posts(account: str, since_id: Optional[str], limit: int) -> List[SocialPost]:
+    buffer = social_store.buffer(account)
+    if len(buffer) == 0:
+        await ensure_collected(social_engine)
+    
+    if len(buffer) == 0:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Failed to retrieve posts for {account}"
+        )
+    
+    return [SocialPost(**post) for post in buffer.since(since_id, limit)]
 
 # Trump's latest posts from Truth Social
-@router.get("/trump", summary="Get Donald Trump's latest posts from Truth Social")
-async def get_trump_posts(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+@router.get("/trump", response_model=List[SocialPost], summary="Get Donald Trump's latest posts from Truth Social")
+async def get_trump_posts(
+    request: Request,
+    since_id: Optional[str] = Query(None, description="Only return posts newer than this post id"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of posts"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
     """
     Get Donald Trump's latest posts from Truth Social
     
+    - **since_id**: Pass the newest id from a previous response to fetch only new posts.
+    - **limit**: Maximum number of posts to return.
+    
     Returns:
-        List[SocialPost]: List of Trump's latest posts
+        List[SocialPost]: List of Trump's latest posts, newest first
     """
-    # Dummy data
-    return [
-        SocialPost(
-            id="ts_123456789",
-            username="realDonaldTrump",
-            content="MAKE AMERICA GREAT AGAIN! The economy is booming like never before. Jobs, jobs, jobs!",
-            timestamp=datetime.utcnow(),
-            likes=45000,
-            reposts=20000,
-            comments=15000
-        ),
-        SocialPost(
-            id="ts_123456788",
-            username="realDonaldTrump",
-            content="The Fake News Media is working overtime to spread disinformation. SAD!",
-            timestamp=datetime.utcnow(),
-            likes=38000,
-            reposts=18000,
-            comments=12000
-        ),
-        SocialPost(
-            id="ts_123456787",
-            username="realDonaldTrump",
-            content="Just had a great meeting with world leaders. America is respected again!",
-            timestamp=datetime.utcnow(),
-            likes=42000,
-            reposts=19000,
-            comments=14000
-        )
-    ]
+    return await get_account_posts("trump", since_id, limit)
 
 # Elon Musk's latest posts from X (Twitter)
-@router.get("/elon", summary="Get Elon Musk's latest posts from X (Twitter)")
-async def get_elon_posts(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+@router.get("/elon", response_model=List[SocialPost], summary="Get Elon Musk's latest posts from X (Twitter)")
+async def get_elon_posts(
+    request: Request,
+    since_id: Optional[str] = Query(None, description="Only return posts newer than this post id"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of posts"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
     """
     Get Elon Musk's latest posts from X (Twitter)
     
+    - **since_id**: Pass the newest id from a previous response to fetch only new posts.
+    - **limit**: Maximum number of posts to return.
+    
     Returns:
-        List[SocialPost]: List of Elon Musk's latest posts
+        List[SocialPost]: List of Elon Musk's latest posts, newest first
     """
-    # Dummy data
-    return [
-        SocialPost(
-            id="x_987654321",
-            username="elonmusk",
-            content="The future of sustainable energy is here. Tesla's new battery technology will revolutionize the industry.",
-            timestamp=datetime.utcnow(),
-            likes=120000,
-            reposts=50000,
-            comments=30000
-        ),
-        SocialPost(
-            id="x_987654320",
-            username="elonmusk",
-            content="SpaceX Starship successfully completed its orbital test flight. Mars, here we come!",
-            timestamp=datetime.utcnow(),
-            likes=200000,
-            reposts=80000,
-            comments=45000
-        ),
-        SocialPost(
-            id="x_987654319",
-            username="elonmusk",
-            content="Cryptocurrency is the future of finance. Dogecoin to the moon! 🚀",
-            timestamp=datetime.utcnow(),
-            likes=150000,
-            reposts=70000,
-            comments=40000
-        )
-    ]
+    return await get_account_posts("elon", since_id, limit)
 
 # X (Twitter) trending topics
-@router.get("/x/trends", summary="Get current trending topics on X (Twitter)")
-async def get_x_trends(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+@router.get("/x/trends", response_model=List[TrendingTopic], summary="Get current trending topics on X (Twitter)")
+async def get_x_trends(
+    request: Request,
+    limit: int = Query(20, ge=1, le=50, description="Maximum number of topics"),
+    api_key: APIKey = Depends(get_api_key_with_tracking)
+):
     """
     Get current trending topics on X (Twitter)
     
     Returns:
-        List[TrendingTopic]: List of trending topics on X (Twitter)
+        List[TrendingTopic]: List of trending topics on X (Twitter), by tweet volume
     """
-    # Dummy data
-    return [
-        TrendingTopic(
-            id="trend_1",
-            name="#Crypto",
-            tweet_count=250000,
-            category="Business & Finance"
-        ),
-        TrendingTopic(
-            id="trend_2",
-            name="#HSK",
-            tweet_count=180000,
-            category="Cryptocurrency"
-        ),
-        TrendingTopic(
-            id="trend_3",
-            name="#NFTs",
-            tweet_count=150000,
-            category="Technology"
-        ),
-        TrendingTopic(
-            id="trend_4",
-            name="#Web3",
-            tweet_count=120000,
-            category="Technology"
-        ),
-        TrendingTopic(
-            id="trend_5",
-            name="#DeFi",
-            tweet_count=100000,
-            category="Business & Finance"
+    trends = social_store.trends(limit)
+    if not trends:
+        await ensure_collected(social_engine)
+        trends = social_store.trends(limit)
+    
+    if not trends:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to retrieve trending topics from X"
         )
-    ]
+    
+    return [TrendingTopic(**trend) for trend in trends]
+
+# Ingestion status per feed
+@router.get("/status", response_model=List[IngestionStatus], summary="Get social feed freshness and latency per source")
+async def get_ingestion_status(request: Request, api_key: APIKey = Depends(get_api_key_with_tracking)):
+    """
+    Get social feed freshness and collection latency per source
+    
+    Returns:
+        List[IngestionStatus]: Freshness (seconds since last successful collection) and latency per source
+    """
+    return [IngestionStatus(**item) for item in social_engine.status()]
@@ -0,0 +1,10 @@
+# 전문 검색 패키지
+# SEARCH_DB_PATH 환경 변수가 설정되면 SQLite FTS5에 색인 문서를 영구 저장함
+
+import os
+
+from app.search.index import SearchIndex, tokenize
+
+search_index = SearchIndex(os.getenv("SEARCH_DB_PATH") or None)
+
+__all__ = ["SearchIndex", "search_index", "tokenize"]
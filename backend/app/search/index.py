@@ -0,0 +1,224 @@
+"""
+인메모리 역색인(inverted index) 기반 전문 검색
+
+토큰별 포스팅 리스트(문서 번호, 단어 빈도)를 배열로 유지하고, 질의 시 NumPy로 교집합/BM25 점수를 계산합니다.
+db_path가 지정되면 문서를 SQLite FTS5 테이블에 저장하고 재시작 시 색인을 복원합니다.
+"""
+
+import json
+import logging
+import math
+import re
+import sqlite3
+import threading
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.timeseries import to_epoch
+
+logger = logging.getLogger('search')
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens ('#DOGE' and '$doge' both become 'doge')"""
+    return TOKEN_PATTERN.findall((text or "").lower())
+
+
+def _to_epoch(value: Optional[datetime]) -> float:
+    return to_epoch(value) if value else 0.0
+
+
+class SearchIndex:
+    """
+    Incrementally updated inverted index with BM25 ranking
+
+    Documents are identified by (source, doc_id); adding an existing document is a no-op.
+    Queries match documents containing every query token (AND semantics).
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._keys: Dict[Tuple[str, str], int] = {}
+        self._docs: List[Dict[str, Any]] = []
+        self._source_codes: Dict[str, int] = {}
+        self._sources = array('b')
+        self._timestamps = array('d')
+        self._lengths = array('i')
+        self._total_length = 0
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._db = self._open_db(db_path) if db_path else None
+        if self._db is not None:
+            self._load_db()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5("
+                "source UNINDEXED, doc_id UNINDEXED, timestamp UNINDEXED, title, body, fields UNINDEXED)"
+            )
+            return db
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5를 사용할 수 없어 메모리 색인만 사용합니다: {e}")
+            return None
+
+    def _load_db(self):
+        rows = self._db.execute(
+            "SELECT source, doc_id, timestamp, title, body, fields FROM documents ORDER BY rowid"
+        ).fetchall()
+        with self._lock:
+            for source, doc_id, timestamp, title, body, fields in rows:
+                self._index(source, doc_id, title, body, datetime.fromisoformat(timestamp) if timestamp else None,
+                            json.loads(fields) if fields else {})
+        logger.info(f"검색 색인 복원 완료: {len(rows)}건")
+
+    def _index(self, source: str, doc_id: str, title: str, body: str,
+               timestamp: Optional[datetime], fields: Dict[str, Any]) -> bool:
+        key = (source, doc_id)
+        if key in self._keys:
+            return False
+
+        number = len(self._docs)
+        self._keys[key] = number
+        self._docs.append(dict(fields, source=source, id=doc_id, title=title, content=body, timestamp=timestamp))
+        if source not in self._source_codes:
+            self._source_codes[source] = len(self._source_codes)
+        self._sources.append(self._source_codes[source])
+        self._timestamps.append(_to_epoch(timestamp))
+
+        counts = Counter(tokenize(title) + tokenize(body))
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+        for token, tf in counts.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = (array('i'), array('i'))
+            postings[0].append(number)
+            postings[1].append(tf)
+        return True
+
+    def add(self, source: str, doc_id: str, title: str, body: str,
+            timestamp: Optional[datetime] = None, **fields) -> bool:
+        """
+        Index one document
+
+        Args:
+            source: Document source (e.g. 'social', 'projects', 'eips')
+            doc_id: Identifier unique within the source
+            title: Title (may be empty)
+            body: Body text
+            timestamp: Document time (naive UTC), used by `since` filtering
+            **fields: Extra JSON-serializable fields returned with search results
+
+        Returns:
+            bool: False if the document was already indexed
+        """
+        with self._lock:
+            added = self._index(source, str(doc_id), title or "", body or "", timestamp, fields)
+            if added and self._db is not None:
+                self._db.execute(
+                    "INSERT INTO documents (source, doc_id, timestamp, title, body, fields) VALUES (?, ?, ?, ?, ?, ?)",
+                    (source, str(doc_id), timestamp.isoformat() if timestamp else None, title or "", body or "",
+                     json.dumps(fields, default=str)),
+                )
+                self._db.commit()
+        return added
+
+    def add_many(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Index many documents (dicts with the keyword arguments of `add`)
+
+        Returns:
+            int: Number of newly indexed documents
+        """
+        return sum(1 for doc in documents if self.add(**doc))
+
+    def search(self, query: str, source: Optional[str] = None, since: Optional[datetime] = None,
+               limit: int = 20) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Search documents containing all query tokens, ranked by BM25
+
+        Args:
+            query: Free-text query
+            source: Restrict to one source
+            since: Only documents with timestamp >= since
+            limit: Maximum number of results
+
+        Returns:
+            Tuple[int, List[Dict]]: Total number of matches and the top results (with `score`)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return 0, []
+
+        with self._lock:
+            postings = [self._postings.get(token) for token in tokens]
+            if any(p is None for p in postings) or (source is not None and source not in self._source_codes):
+                return 0, []
+
+            postings.sort(key=lambda p: len(p[0]))
+            doc_count = len(self._docs)
+            avg_length = self._total_length / doc_count
+            lengths = np.frombuffer(self._lengths, dtype=np.int32)
+
+            # 가장 짧은 포스팅 리스트부터 교집합 (문서 번호는 오름차순으로 저장됨)
+            # tf_columns[i]는 항상 candidates와 같은 순서로 정렬된 i번째 토큰의 단어 빈도
+            candidates = np.frombuffer(postings[0][0], dtype=np.int32)
+            tf_columns = [np.frombuffer(postings[0][1], dtype=np.int32)]
+            for docs, tfs in postings[1:]:
+                candidates, previous_idx, new_idx = np.intersect1d(
+                    candidates, np.frombuffer(docs, dtype=np.int32), assume_unique=True, return_indices=True
+                )
+                if len(candidates) == 0:
+                    return 0, []
+                tf_columns = [column[previous_idx] for column in tf_columns]
+                tf_columns.append(np.frombuffer(tfs, dtype=np.int32)[new_idx])
+
+            mask = None
+            if source is not None:
+                sources = np.frombuffer(self._sources, dtype=np.int8)
+                mask = sources[candidates] == self._source_codes[source]
+            if since is not None:
+                timestamps = np.frombuffer(self._timestamps, dtype=np.float64)
+                recent = timestamps[candidates] >= _to_epoch(since)
+                mask = recent if mask is None else mask & recent
+            if mask is not None:
+                candidates = candidates[mask]
+                tf_columns = [column[mask] for column in tf_columns]
+            if len(candidates) == 0:
+                return 0, []
+
+            norm = BM25_K1 * (1 - BM25_B + BM25_B / avg_length * lengths[candidates])
+            scores = np.zeros(len(candidates), dtype=np.float64)
+            for (docs, _), tf in zip(postings, tf_columns):
+                df = len(docs)
+                idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                scores += idf * (BM25_K1 + 1) * tf / (tf + norm)
+
+            total = len(candidates)
+            if total > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+            else:
+                top = np.arange(total)
+            top = top[np.argsort(-scores[top], kind='stable')]
+            results = [dict(self._docs[candidates[i]], score=float(scores[i])) for i in top]
+        return total, results
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,8 @@
+# 시계열 저장소 패키지
+
+from app.timeseries.candles import CANDLE_INTERVALS, CandleSeries, CandleStore
+from app.timeseries.indicators import Indicator, IndicatorCache, parse_indicator
+from app.timeseries.store import TimeSeries, TimeSeriesStore, parse_interval, to_epoch
+
+__all__ = ["CANDLE_INTERVALS", "CandleSeries", "CandleStore", "Indicator", "IndicatorCache", "TimeSeries",
+           "TimeSeriesStore", "parse_indicator", "parse_interval", "to_epoch"]
@@ -0,0 +1,273 @@
+"""
+OHLCV 캔들 증분 집계
+
+체결을 1m/5m/1h/1d 봉으로 증분 집계합니다. 봉은 주기별로 미리 할당한 고정 크기 배열의
+(봉 번호 % 용량) 위치에 저장되어 용량을 넘긴 오래된 봉은 새 봉이 덮어쓰며(롤오버),
+디렉토리가 지정되면 배열 자체가 메모리 맵 파일이라 별도의 직렬화 없이 영속됩니다.
+조회는 저장된 봉을 그대로 읽으므로 재계산이 없습니다.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('timeseries')
+
+CANDLE_INTERVALS = {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400}
+
+# 주기별 보관 봉 수 (1m: 7일, 5m: 30일, 1h: 1년, 1d: 10년)
+DEFAULT_CAPACITY = {"1m": 10080, "5m": 8640, "1h": 8760, "1d": 3650}
+
+CANDLE_DTYPE = np.dtype([
+    ("timestamp", "f8"),        # 봉 시작 시각 (epoch 초)
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("trades", "i8"),           # 체결 수 (0이면 빈 슬롯)
+    ("last_trade_time", "f8"),  # 봉에 반영된 마지막 체결 시각 (체결 ID 커서가 없을 때 재반영 방지)
+])
+
+
+class CandleSeries:
+    """
+    OHLCV bars of one symbol at one interval in a preallocated, direct-mapped ring
+
+    Bar number `n` (= floor(timestamp / interval)) lives in slot `n % capacity`, so
+    a new bar silently replaces the bar `capacity` intervals older. With `path` the
+    array is a memory-mapped file that is reopened as-is after a restart.
+    """
+
+    def __init__(self, interval_seconds: int, capacity: int, path: Optional[str] = None):
+        self.interval_seconds = interval_seconds
+        if path and os.path.exists(path) and os.path.getsize(path) % CANDLE_DTYPE.itemsize == 0:
+            # 기존 파일은 저장된 용량 그대로 연다
+            capacity = os.path.getsize(path) // CANDLE_DTYPE.itemsize
+            self._bars = np.memmap(path, dtype=CANDLE_DTYPE, mode='r+', shape=(capacity,))
+        elif path:
+            self._bars = np.memmap(path, dtype=CANDLE_DTYPE, mode='w+', shape=(capacity,))
+        else:
+            self._bars = np.zeros(capacity, dtype=CANDLE_DTYPE)
+        self.capacity = capacity
+        self.last_trade_time = float(self._bars["last_trade_time"].max()) if capacity else 0.0
+
+    def fold(self, timestamps: np.ndarray, prices: np.ndarray, volumes: np.ndarray) -> int:
+        """
+        Fold trades (sorted by time) into their bars
+
+        Every trade given is counted; deduplication is up to the caller (CandleStore
+        filters by trade id).
+
+        Returns:
+            int: Number of trades folded
+        """
+        if len(timestamps) == 0:
+            return 0
+
+        # 배치 내 봉 단위 집계 (정렬된 배열이므로 봉 번호가 바뀌는 위치가 그룹 시작점)
+        buckets = np.floor(timestamps / self.interval_seconds).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(timestamps)]
+        highs = np.maximum.reduceat(prices, starts)
+        lows = np.minimum.reduceat(prices, starts)
+        sums = np.add.reduceat(volumes, starts)
+
+        # 배치가 걸친 봉 수만큼만 반복 (폴링 주기 기준 보통 1~2개)
+        for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            bucket = int(buckets[start])
+            bar = self._bars[bucket % self.capacity]
+            bar_start = float(bucket * self.interval_seconds)
+            if bar["trades"] == 0 or bar["timestamp"] != bar_start:
+                bar["timestamp"] = bar_start
+                bar["open"] = prices[start]
+                bar["high"] = highs[i]
+                bar["low"] = lows[i]
+                bar["volume"] = 0.0
+                bar["trades"] = 0
+            else:
+                bar["high"] = max(bar["high"], highs[i])
+                bar["low"] = min(bar["low"], lows[i])
+            bar["close"] = prices[end - 1]
+            bar["volume"] += sums[i]
+            bar["trades"] += end - start
+            bar["last_trade_time"] = timestamps[end - 1]
+        self.last_trade_time = max(self.last_trade_time, float(timestamps[-1]))
+        return len(timestamps)
+
+    def latest(self, limit: int, end: Optional[float] = None) -> np.ndarray:
+        """
+        Read up to `limit` bars ending at the bar containing `end` (defaults to the last trade)
+
+        Returns:
+            np.ndarray: Copy of the bars (CANDLE_DTYPE) in time order; bars without trades are omitted
+        """
+        end = self.last_trade_time if end is None else min(end, self.last_trade_time)
+        if end <= 0:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        current = int(np.floor(end / self.interval_seconds))
+        buckets = np.arange(current - min(limit, self.capacity) + 1, current + 1, dtype=np.int64)
+        bars = self._bars[buckets % self.capacity]
+        return np.asarray(bars[(bars["timestamp"] == buckets * float(self.interval_seconds)) & (bars["trades"] > 0)])
+
+    def flush(self):
+        if isinstance(self._bars, np.memmap):
+            self._bars.flush()
+
+
+class CandleStore:
+    """
+    Thread-safe candle series for every (exchange, symbol) at every CANDLE_INTERVALS interval
+
+    If `directory` is given, each series is a `<directory>/<exchange>__<symbol>__<interval>.candles`
+    memory-mapped file created on the symbol's first fold; existing files are reopened on creation.
+    The last folded trade id of each symbol is kept next to them in `<exchange>__<symbol>.cursor`
+    and written on flush.
+    """
+
+    def __init__(self, directory: Optional[str] = None, capacity: Optional[Dict[str, int]] = None):
+        self.directory = directory
+        self.capacity = dict(DEFAULT_CAPACITY, **(capacity or {}))
+        self._series: Dict[Tuple[str, str], Dict[str, CandleSeries]] = {}
+        # 심볼별 마지막으로 반영한 체결 ID와 아직 저장하지 않은 심볼
+        self._cursors: Dict[Tuple[str, str], int] = {}
+        self._dirty_cursors = set()
+        self._lock = threading.Lock()
+        # 파일은 첫 fold 때 생성 (조회만으로는 디스크에 아무것도 만들지 않음)
+        if directory and os.path.isdir(directory):
+            self._load()
+
+    @staticmethod
+    def _filename(*parts: str, suffix: str = ".candles") -> str:
+        return "__".join(re.sub(r"[^A-Za-z0-9_.-]", "-", part) for part in parts) + suffix
+
+    def _cursor_path(self, key: Tuple[str, str]) -> str:
+        return os.path.join(self.directory, self._filename(*key, suffix=".cursor"))
+
+    def _read_cursor(self, key: Tuple[str, str]):
+        # 저장된 커서가 있으면 메모리로 읽어 둔다
+        if key not in self._cursors and self.directory and os.path.exists(self._cursor_path(key)):
+            with open(self._cursor_path(key)) as f:
+                self._cursors[key] = int(f.read().strip())
+
+    def _load(self):
+        for name in sorted(os.listdir(self.directory)):
+            parts = name[:-len(".candles")].split("__") if name.endswith(".candles") else []
+            if len(parts) != 3 or parts[2] not in CANDLE_INTERVALS:
+                continue
+            try:
+                self._get_or_create((parts[0], parts[1]))
+            except Exception as e:
+                logger.error(f"캔들 파일 로드 오류 ({name}): {e}")
+
+    def _get_or_create(self, key: Tuple[str, str]) -> Dict[str, CandleSeries]:
+        series = self._series.get(key)
+        if series is None:
+            if self.directory:
+                os.makedirs(self.directory, exist_ok=True)
+            series = self._series[key] = {
+                interval: CandleSeries(
+                    seconds, self.capacity[interval],
+                    os.path.join(self.directory, self._filename(*key, interval)) if self.directory else None,
+                )
+                for interval, seconds in CANDLE_INTERVALS.items()
+            }
+            self._read_cursor(key)
+        return series
+
+    def fold(self, exchange: str, symbol: str, timestamps, prices, volumes, trade_ids=None) -> int:
+        """
+        Fold trades of one symbol into every interval
+
+        With `trade_ids`, trades at or below the symbol's last folded trade id are skipped,
+        so replaying a feed after a restart does not count them twice. Symbols without a
+        stored id yet fall back to skipping trades at or before the last folded trade time.
+
+        Args:
+            exchange: Exchange name (e.g., 'binance')
+            symbol: Exchange symbol (e.g., 'BTCUSDT', 'KRW-BTC')
+            timestamps: Trade times in epoch seconds, sorted ascending
+            prices: Trade prices
+            volumes: Trade quantities in the base asset
+            trade_ids: Exchange trade ids, increasing with time (optional)
+
+        Returns:
+            int: Number of trades folded
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        key = (exchange, symbol)
+        with self._lock:
+            series = self._get_or_create(key)
+            if trade_ids is not None and len(timestamps):
+                trade_ids = np.asarray(trade_ids, dtype=np.int64)
+                cursor = self._cursors.get(key)
+                if cursor is not None:
+                    keep = trade_ids > cursor
+                else:
+                    keep = timestamps > max(candles.last_trade_time for candles in series.values())
+                timestamps, prices, volumes, trade_ids = timestamps[keep], prices[keep], volumes[keep], trade_ids[keep]
+                if len(trade_ids):
+                    self._cursors[key] = int(trade_ids.max())
+                    self._dirty_cursors.add(key)
+            return max(candles.fold(timestamps, prices, volumes) for candles in series.values())
+
+    def last_trade_time(self, key: Tuple[str, str]) -> float:
+        """Get the time of the last folded trade of a series (0 if none)"""
+        with self._lock:
+            series = self._series.get(key)
+            return max(candles.last_trade_time for candles in series.values()) if series else 0.0
+
+    def last_trade_id(self, exchange: str, symbol: str) -> Optional[int]:
+        """Get the last folded trade id of a symbol (None if unknown); reads only the cursor file"""
+        with self._lock:
+            self._read_cursor((exchange, symbol))
+            return self._cursors.get((exchange, symbol))
+
+    def resolve(self, exchange: str, symbol: str) -> Optional[Tuple[str, str]]:
+        """
+        Find the (exchange, symbol) key case-insensitively, with or without separators ('btc/usdt' -> 'BTCUSDT')
+        """
+        def normalize(value):
+            return re.sub(r"[^a-z0-9]", "", value.lower())
+
+        with self._lock:
+            for key in self._series:
+                if key[0].lower() == exchange.lower() and normalize(key[1]) == normalize(symbol):
+                    return key
+        return None
+
+    def keys(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            return list(self._series)
+
+    def candles(self, key: Tuple[str, str], interval: str, limit: int, end: Optional[float] = None) -> np.ndarray:
+        """
+        Read the latest bars of one series (see CandleSeries.latest)
+        """
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return np.empty(0, dtype=CANDLE_DTYPE)
+            return series[interval].latest(limit, end)
+
+    def flush(self):
+        """Flush memory-mapped series and trade id cursors to disk (no-op without a directory)"""
+        with self._lock:
+            for series in self._series.values():
+                for candles in series.values():
+                    candles.flush()
+            if not self.directory:
+                return
+            # 봉을 먼저 저장한 뒤 커서를 교체 (중간에 종료되면 재반영 쪽으로 어긋나도록)
+            for key in self._dirty_cursors:
+                path = self._cursor_path(key)
+                with open(path + ".tmp", "w") as f:
+                    f.write(str(self._cursors[key]))
+                os.replace(path + ".tmp", path)
+            self._dirty_cursors.clear()
@@ -0,0 +1,283 @@
+"""
+캔들 기반 기술 지표
+
+SMA/EMA/RSI/볼린저 밴드/VWAP을 NumPy 벡터 연산으로 계산합니다.
+지표별로 마지막 계산 상태(EMA 값, RSI 평균 상승/하락폭, 최근 입력 구간)를 캐시해 두고,
+새 봉이 마감되면 새 봉만큼만 이어서 계산하므로 최신 값 조회 비용이 전체 이력 길이와 무관합니다.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.timeseries.candles import CANDLE_DTYPE, CANDLE_INTERVALS, CandleStore
+
+INDICATOR_PATTERN = re.compile(r"^(sma|ema|rsi|bb|vwap)(\d+)$")
+BOLLINGER_STD = 2.0
+MAX_PERIOD = 1000
+# 지표별로 보관하는 최근 값 수
+DEFAULT_HISTORY = 1000
+# 누적 곱 기반 EMA 계산에서 한 구간의 최대 지수 (float64 범위 안에서 정밀도 유지)
+_EXP_LIMIT = 300.0
+
+
+def parse_indicator(name: str) -> Tuple[str, int]:
+    """
+    Parse an indicator name such as 'rsi14', 'ema50', 'bb20' or 'vwap24'
+
+    Returns:
+        Tuple[str, int]: (kind, period)
+
+    Raises:
+        ValueError: If the name is not a supported indicator
+    """
+    match = INDICATOR_PATTERN.match(name.strip().lower())
+    if not match or not 2 <= int(match.group(2)) <= MAX_PERIOD:
+        raise ValueError(f"Unsupported indicator: {name} (use sma/ema/rsi/bb/vwap followed by a period of 2-{MAX_PERIOD})")
+    return match.group(1), int(match.group(2))
+
+
+def ema_filter(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """
+    Apply y[t] = alpha * x[t] + (1 - alpha) * y[t-1] with y[-1] = initial, vectorized
+
+    Uses y[t] = d^(t+1) * (initial + alpha * sum(x[i] / d^(i+1))) with d = 1 - alpha,
+    in chunks short enough that d^-(i+1) stays within float64 range.
+    """
+    decay = 1.0 - alpha
+    out = np.empty(len(values), dtype=np.float64)
+    chunk = max(1, int(_EXP_LIMIT / -np.log(decay)))
+    previous = initial
+    for start in range(0, len(values), chunk):
+        segment = values[start:start + chunk]
+        powers = decay ** np.arange(1, len(segment) + 1)
+        out[start:start + len(segment)] = powers * (previous + alpha * np.cumsum(segment / powers))
+        previous = out[start + len(segment) - 1]
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average (NaN until `period` values are available)"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        sums = np.cumsum(np.r_[0.0, values])
+        out[period - 1:] = (sums[period:] - sums[:-period]) / period
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first `period` values"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1] = values[:period].mean()
+        out[period:] = ema_filter(values[period:], 2.0 / (period + 1), out[period - 1])
+    return out
+
+
+def rsi(closes: np.ndarray, period: int) -> Tuple[np.ndarray, Optional[Tuple[float, float]]]:
+    """
+    Wilder's RSI
+
+    Returns:
+        Tuple: RSI values (NaN until `period` changes are available) and the final
+        (average gain, average loss) smoothing state, None while warming up
+    """
+    out = np.full(len(closes), np.nan)
+    if len(closes) <= period:
+        return out, None
+    deltas = np.diff(closes)
+    gains, losses = np.maximum(deltas, 0.0), np.maximum(-deltas, 0.0)
+    avg_gain = np.r_[gains[:period].mean(), ema_filter(gains[period:], 1.0 / period, gains[:period].mean())]
+    avg_loss = np.r_[losses[:period].mean(), ema_filter(losses[period:], 1.0 / period, losses[:period].mean())]
+    out[period:] = _rsi_from_averages(avg_gain, avg_loss)
+    return out, (float(avg_gain[-1]), float(avg_loss[-1]))
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    # 하락이 없으면 100, 변화가 전혀 없으면 50
+    return np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), values)
+
+
+def bollinger(values: np.ndarray, period: int, k: float = BOLLINGER_STD) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger bands (upper, middle, lower) with population standard deviation"""
+    middle = sma(values, period)
+    std = np.full(len(values), np.nan)
+    if len(values) >= period:
+        std[period - 1:] = np.lib.stride_tricks.sliding_window_view(values, period).std(axis=1)
+    return middle + k * std, middle, middle - k * std
+
+
+def vwap(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray, period: int) -> np.ndarray:
+    """Rolling volume-weighted average of the typical price over `period` bars"""
+    out = np.full(len(closes), np.nan)
+    if len(closes) >= period:
+        weighted = np.cumsum(np.r_[0.0, (highs + lows + closes) / 3.0 * volumes])
+        volume = np.cumsum(np.r_[0.0, volumes])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[period - 1:] = (weighted[period:] - weighted[:-period]) / (volume[period:] - volume[:-period])
+    return out
+
+
+class Indicator:
+    """
+    Incrementally computed indicator over a growing sequence of closed candles
+
+    `advance(bars)` takes the candles that closed since the previous call and returns
+    the indicator values for exactly those candles. Windowed indicators (SMA, Bollinger,
+    VWAP) recompute only over the last `period` candles plus the new ones; EMA and RSI
+    continue from their cached recurrence state once warmed up.
+    """
+
+    def __init__(self, name: str):
+        self.kind, self.period = parse_indicator(name)
+        self.name = f"{self.kind}{self.period}"
+        self.columns = [f"{self.name}.{part}" for part in ("upper", "middle", "lower")] if self.kind == "bb" else [self.name]
+        self._tail = np.empty(0, dtype=CANDLE_DTYPE)
+        self._state = None
+
+    def advance(self, bars: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Compute the values for newly closed candles
+
+        Args:
+            bars: Candles (CANDLE_DTYPE) that closed after the ones already processed, in time order
+
+        Returns:
+            Dict[str, np.ndarray]: One array per column, aligned with `bars`
+        """
+        count = len(bars)
+        if self._state is not None:
+            closes = bars["close"]
+            if self.kind == "ema":
+                values = ema_filter(closes, 2.0 / (self.period + 1), self._state)
+                self._state = float(values[-1]) if count else self._state
+                result = {self.name: values}
+            else:
+                previous_close, avg_gain, avg_loss = self._state
+                deltas = np.diff(np.r_[previous_close, closes])
+                gains = ema_filter(np.maximum(deltas, 0.0), 1.0 / self.period, avg_gain)
+                losses = ema_filter(np.maximum(-deltas, 0.0), 1.0 / self.period, avg_loss)
+                if count:
+                    self._state = (float(closes[-1]), float(gains[-1]), float(losses[-1]))
+                result = {self.name: _rsi_from_averages(gains, losses)}
+            return result
+
+        # 워밍업 중이거나 구간형 지표: 최근 period개 + 새 봉으로 계산
+        window = np.concatenate([self._tail, bars])
+        closes = window["close"]
+        if self.kind == "sma":
+            columns = [sma(closes, self.period)]
+        elif self.kind == "ema":
+            columns = [ema(closes, self.period)]
+            if not np.isnan(columns[0][-1]):
+                self._state = float(columns[0][-1])
+        elif self.kind == "rsi":
+            values, averages = rsi(closes, self.period)
+            columns = [values]
+            if averages is not None:
+                self._state = (float(closes[-1]),) + averages
+        elif self.kind == "bb":
+            columns = list(bollinger(closes, self.period))
+        else:
+            columns = [vwap(window["high"], window["low"], closes, window["volume"], self.period)]
+        self._tail = window[-self.period:]
+        return {column: values[len(window) - count:] for column, values in zip(self.columns, columns)}
+
+
+class _CachedIndicator:
+    # 지표 하나의 상태와 최근 값 이력
+    def __init__(self, name: str, history: int):
+        self.indicator = Indicator(name)
+        self.history = history
+        self.last_timestamp: Optional[float] = None
+        self.timestamps = np.empty(0, dtype=np.float64)
+        self.values = {column: np.empty(0, dtype=np.float64) for column in self.indicator.columns}
+
+    def advance(self, bars: np.ndarray):
+        if self.last_timestamp is not None:
+            bars = bars[bars["timestamp"] > self.last_timestamp]
+        if not len(bars):
+            return
+        new_values = self.indicator.advance(bars)
+        self.timestamps = np.r_[self.timestamps, bars["timestamp"]][-self.history:]
+        for column, values in new_values.items():
+            self.values[column] = np.r_[self.values[column], values][-self.history:]
+        self.last_timestamp = float(bars["timestamp"][-1])
+
+
+class IndicatorCache:
+    """
+    Indicator values per (exchange, symbol, interval, indicator), updated as candles close
+
+    The first request for an indicator computes it over every stored candle; later
+    requests only fetch and process the candles that closed since. A candle counts as
+    closed once the store has folded a trade at or after its end (its interval having
+    ended is not enough, since trades are folded a poll later); the forming candle is
+    never included.
+    """
+
+    def __init__(self, store: CandleStore, history: int = DEFAULT_HISTORY):
+        self.store = store
+        self.history = history
+        self._entries: Dict[Tuple[Tuple[str, str], str, str], _CachedIndicator] = {}
+        self._lock = threading.Lock()
+
+    def values(self, key: Tuple[str, str], interval: str, names: Sequence[str], limit: int = 1,
+               now: Optional[float] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Get the latest indicator values over closed candles
+
+        Args:
+            key: Candle series key (exchange, symbol)
+            interval: Candle interval (one of CANDLE_INTERVALS)
+            names: Indicator names (e.g., ['rsi14', 'ema50', 'bb20'])
+            limit: Number of most recent candles to return values for (at most `history`)
+            now: Current time in epoch seconds (defaults to time.time())
+
+        Returns:
+            Tuple: Candle start timestamps and one value array per indicator column (NaN while warming up)
+
+        Raises:
+            ValueError: On an unsupported indicator or interval
+        """
+        if interval not in CANDLE_INTERVALS:
+            raise ValueError(f"Unsupported interval: {interval}")
+        indicators = [Indicator(name).name for name in names]
+        interval_seconds = CANDLE_INTERVALS[interval]
+        now = time.time() if now is None else now
+
+        with self._lock:
+            entries = []
+            for name in dict.fromkeys(indicators):
+                entry = self._entries.get((key, interval, name))
+                if entry is None:
+                    entry = self._entries[(key, interval, name)] = _CachedIndicator(name, self.history)
+                entries.append(entry)
+
+            # 마지막으로 처리한 봉 이후의 봉만 조회 (처음 요청된 지표가 있으면 전체)
+            starts = [entry.last_timestamp for entry in entries]
+            if any(start is None for start in starts):
+                fetch = self.store.capacity[interval]
+            else:
+                # 마지막 처리 봉 이후 now까지 들어갈 수 있는 봉 수 (진행 중인 봉 포함)
+                fetch = int((now - min(starts)) // interval_seconds)
+            # 체결은 폴링 주기마다 늦게 반영되므로, 반영된 마지막 체결이 봉 끝을 지나야 마감된 봉으로 처리
+            # (봉 조회 전에 읽어야 그 사이 반영된 체결로 미완성 봉을 마감으로 보지 않음)
+            closed_until = min(now, self.store.last_trade_time(key))
+            bars = self.store.candles(key, interval, fetch)
+            bars = bars[bars["timestamp"] + interval_seconds <= closed_until]
+            for entry in entries:
+                entry.advance(bars)
+
+            limit = min(limit, self.history)
+            values: Dict[str, np.ndarray] = {}
+            for entry in entries:
+                for column, column_values in entry.values.items():
+                    values[column] = column_values[-limit:]
+            return entries[0].timestamps[-limit:], values
+
@@ -0,0 +1,331 @@
+"""
+배열 기반 append-only 시계열 저장소
+
+시계열마다 타임스탬프/값 NumPy 배열을 유지하며, 범위 조회와 버킷 단위 다운샘플링(OHLC/평균)을 지원합니다.
+최대 보관 개수를 지정하면 링 버퍼처럼 가장 오래된 점부터 버립니다.
+디렉토리가 지정되면 시계열별 .npz 스냅샷과 append-only 세그먼트(.seg) 파일로 저장/복원합니다.
+"""
+
+import contextlib
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger('timeseries')
+
+INTERVAL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+# 세그먼트 레코드 (타임스탬프, 값) float64 쌍
+SEGMENT_RECORD = np.dtype([('ts', np.float64), ('value', np.float64)])
+
+
+def to_epoch(value: datetime) -> float:
+    """
+    Seconds since the epoch of a datetime; naive values are taken as UTC, aware ones are converted
+
+    Args:
+        value: Datetime such as a parsed 'from'/'to' query parameter
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def parse_interval(interval: str) -> int:
+    """
+    Parse an interval string such as '15m', '8h' or '1d' into seconds
+
+    Args:
+        interval: Interval string (number followed by s/m/h/d/w)
+
+    Returns:
+        int: Interval length in seconds
+    """
+    match = re.fullmatch(r"(\d+)([smhdw])", interval.strip().lower()) if interval else None
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"Invalid interval: {interval}")
+    return int(match.group(1)) * INTERVAL_UNITS[match.group(2)]
+
+
+class TimeSeries:
+    """
+    Append-only (timestamp, value) series backed by growable NumPy arrays
+
+    Timestamps are float seconds since the epoch and must be non-decreasing;
+    an append with the same timestamp as the last point replaces its value.
+    With `max_points`, at least the most recent `max_points` points are kept: older
+    points are discarded in batches of a quarter of `max_points`, so the arrays stay
+    contiguous for binary search and appends stay amortized O(1).
+    """
+
+    def __init__(self, capacity: int = 1024, max_points: Optional[int] = None):
+        if max_points is not None:
+            capacity = min(capacity, max_points + max(1, max_points // 4))
+        self._ts = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self.max_points = max_points
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self, needed: int):
+        if self.max_points is not None and needed > self.max_points + max(1, self.max_points // 4):
+            # 보관 한도를 넘으면 최근 max_points개만 앞으로 옮겨 재사용 (링 버퍼)
+            adding = needed - self._size
+            keep = max(0, self.max_points - adding)
+            self._ts[:keep] = self._ts[self._size - keep:self._size]
+            self._values[:keep] = self._values[self._size - keep:self._size]
+            self._size = keep
+            needed = keep + adding
+        capacity = len(self._ts)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._ts = np.resize(self._ts, capacity)
+        self._values = np.resize(self._values, capacity)
+
+    def append(self, timestamp: float, value: float) -> bool:
+        """
+        Append one point
+
+        Returns:
+            bool: False if the point was older than the last one and was dropped
+        """
+        if self._size:
+            last = self._ts[self._size - 1]
+            if timestamp < last:
+                return False
+            if timestamp == last:
+                self._values[self._size - 1] = value
+                return True
+        self._grow(self._size + 1)
+        self._ts[self._size] = timestamp
+        self._values[self._size] = value
+        self._size += 1
+        return True
+
+    def extend(self, timestamps: Iterable[float], values: Iterable[float]):
+        """Append many points (already sorted by timestamp)"""
+        ts = np.asarray(timestamps, dtype=np.float64)
+        vals = np.asarray(values, dtype=np.float64)
+        if len(ts) == 0:
+            return
+        if self._size and ts[0] <= self._ts[self._size - 1]:
+            for t, v in zip(ts, vals):
+                self.append(float(t), float(v))
+            return
+        self._grow(self._size + len(ts))
+        self._ts[self._size:self._size + len(ts)] = ts
+        self._values[self._size:self._size + len(ts)] = vals
+        self._size += len(ts)
+
+    def last(self) -> Optional[Tuple[float, float]]:
+        """Return the most recent (timestamp, value) or None"""
+        if not self._size:
+            return None
+        return float(self._ts[self._size - 1]), float(self._values[self._size - 1])
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get points with start <= timestamp <= end (binary search, no copy)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Timestamp and value views
+        """
+        ts = self._ts[:self._size]
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side='left'))
+        hi = self._size if end is None else int(np.searchsorted(ts, end, side='right'))
+        return ts[lo:hi], self._values[lo:hi]
+
+    def downsample(self, interval_seconds: int, start: Optional[float] = None,
+                   end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Aggregate points into fixed, epoch-aligned buckets
+
+        Args:
+            interval_seconds: Bucket length in seconds
+            start: Optional range start (inclusive)
+            end: Optional range end (inclusive)
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays `timestamp` (bucket start), `open`, `high`, `low`,
+            `close`, `mean` and `count`, one entry per non-empty bucket
+        """
+        ts, values = self.range(start, end)
+        if len(ts) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return {k: empty for k in ('timestamp', 'open', 'high', 'low', 'close', 'mean', 'count')}
+
+        buckets = np.floor(ts / interval_seconds).astype(np.int64)
+        # 정렬된 배열이므로 버킷이 바뀌는 위치가 각 그룹의 시작점
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(ts)]
+        counts = ends - starts
+        sums = np.add.reduceat(values, starts)
+        return {
+            'timestamp': buckets[starts].astype(np.float64) * interval_seconds,
+            'open': values[starts],
+            'high': np.maximum.reduceat(values, starts),
+            'low': np.minimum.reduceat(values, starts),
+            'close': values[ends - 1],
+            'mean': sums / counts,
+            'count': counts,
+        }
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._ts[:self._size].copy(), self._values[:self._size].copy()
+
+
+class TimeSeriesStore:
+    """
+    Thread-safe collection of TimeSeries keyed by string tuples
+
+    If `directory` is given, existing series are loaded on creation and `flush()`
+    appends the points added since the previous flush to `<directory>/<key>.seg`.
+    A series' first flush, and any flush after its segment has grown past the series
+    length, compacts it into a `<key>.npz` snapshot and truncates the segment, so
+    flushing costs O(new points) amortized. `max_points` bounds every series (see TimeSeries).
+    Callbacks registered with `subscribe()` receive (key, timestamp, value) for every
+    accepted point.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_points: Optional[int] = None):
+        self.directory = directory
+        self.max_points = max_points
+        self._series: Dict[Tuple[str, ...], TimeSeries] = {}
+        self._dirty = set()
+        # 디스크에 기록된 상태: 키별 (마지막 타임스탬프, 세그먼트 레코드 수)
+        self._persisted: Dict[Tuple[str, ...], Tuple[float, int]] = {}
+        self._flush_lock = threading.Lock()
+        self._subscribers: List[Callable[[Tuple[str, ...], float, float], None]] = []
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load()
+
+    @staticmethod
+    def _filename(key: Tuple[str, ...]) -> str:
+        return "__".join(re.sub(r"[^A-Za-z0-9_.-]", "-", part) for part in key) + ".npz"
+
+    def _segment_path(self, key: Tuple[str, ...]) -> str:
+        return os.path.join(self.directory, self._filename(key)[:-len(".npz")] + ".seg")
+
+    def _load(self):
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".npz"):
+                continue
+            try:
+                with np.load(os.path.join(self.directory, name)) as data:
+                    key = tuple(str(k) for k in data['key'])
+                    ts, values = data['ts'], data['values']
+                records = self._read_segment(key)
+                if len(records):
+                    # 세그먼트는 스냅샷 마지막 점부터 다시 기록될 수 있음 (같은 타임스탬프는 나중 값이 우선)
+                    keep = ts < records['ts'][0]
+                    ts = np.concatenate([ts[keep], records['ts']])
+                    values = np.concatenate([values[keep], records['value']])
+                    ts, index = np.unique(ts[::-1], return_index=True)
+                    values = values[::-1][index]
+                if self.max_points is not None:
+                    ts, values = ts[-self.max_points:], values[-self.max_points:]
+                series = TimeSeries(capacity=max(1024, len(ts)), max_points=self.max_points)
+                series.extend(ts, values)
+                self._series[key] = series
+                self._persisted[key] = (float(ts[-1]) if len(ts) else float("-inf"), len(records))
+            except Exception as e:
+                logger.error(f"시계열 파일 로드 오류 ({name}): {e}")
+
+    def _read_segment(self, key: Tuple[str, ...]) -> np.ndarray:
+        path = self._segment_path(key)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=SEGMENT_RECORD)
+        data = np.fromfile(path, dtype=np.uint8)
+        # 기록 도중 중단된 마지막 레코드는 버림
+        data = data[:len(data) - len(data) % SEGMENT_RECORD.itemsize]
+        return data.view(SEGMENT_RECORD)
+
+    def subscribe(self, callback: Callable[[Tuple[str, ...], float, float], None]):
+        """Register a callback invoked with (key, timestamp, value) after every accepted append"""
+        self._subscribers.append(callback)
+
+    def append(self, key: Tuple[str, ...], timestamp: float, value: float):
+        """Append a point to the series identified by key (created on demand)"""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = TimeSeries(max_points=self.max_points)
+            appended = series.append(timestamp, value)
+            if appended:
+                self._dirty.add(key)
+        if appended:
+            for callback in self._subscribers:
+                try:
+                    callback(key, timestamp, value)
+                except Exception as e:
+                    logger.error(f"시계열 구독자 오류 ({key}): {e}")
+
+    def get(self, key: Tuple[str, ...]) -> Optional[TimeSeries]:
+        with self._lock:
+            return self._series.get(key)
+
+    def keys(self) -> List[Tuple[str, ...]]:
+        with self._lock:
+            return list(self._series)
+
+    def range(self, key: Tuple[str, ...], start: Optional[float] = None,
+              end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy of the points of one series within [start, end]"""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return np.empty(0), np.empty(0)
+            ts, values = series.range(start, end)
+            return ts.copy(), values.copy()
+
+    def downsample(self, key: Tuple[str, ...], interval_seconds: int, start: Optional[float] = None,
+                   end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Bucketed aggregation of one series (see TimeSeries.downsample)"""
+        with self._lock:
+            series = self._series.get(key) or TimeSeries(capacity=1)
+            return series.downsample(interval_seconds, start, end)
+
+    def flush(self):
+        """Append points added since the last flush to disk (no-op without a directory)"""
+        if not self.directory:
+            return
+        with self._flush_lock:
+            with self._lock:
+                writes = []
+                for key in self._dirty:
+                    series = self._series[key]
+                    persisted = self._persisted.get(key)
+                    if persisted is None or persisted[1] > max(1024, len(series)):
+                        writes.append((key, True, series.to_arrays()))
+                    else:
+                        # 마지막으로 기록한 점부터 다시 기록 (그 사이 같은 타임스탬프 값이 바뀌었을 수 있음)
+                        ts, values = series.range(persisted[0])
+                        writes.append((key, False, (ts.copy(), values.copy())))
+                self._dirty.clear()
+            for key, compact, (ts, values) in writes:
+                last_ts = float(ts[-1]) if len(ts) else float("-inf")
+                if compact:
+                    path = os.path.join(self.directory, self._filename(key))
+                    tmp_path = path + ".tmp.npz"
+                    np.savez(tmp_path, key=np.array(key), ts=ts, values=values)
+                    os.replace(tmp_path, path)
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(self._segment_path(key))
+                    self._persisted[key] = (last_ts, 0)
+                else:
+                    records = np.empty(len(ts), dtype=SEGMENT_RECORD)
+                    records['ts'], records['value'] = ts, values
+                    with open(self._segment_path(key), "ab") as f:
+                        f.write(records.tobytes())
+                    self._persisted[key] = (last_ts, self._persisted[key][1] + len(records))
@@ -0,0 +1,129 @@
+"""
+데이터 API 응답 캐시 힌트 미들웨어
+
+GET 200 응답에 경로별 Cache-Control max-age와 본문 기반 ETag를 붙이고,
+If-None-Match가 일치하면 본문 없이 304를 반환합니다.
+최근에 발급한 ETag는 max-age 동안 기억해 두고, 그 안의 재검증은 API 키 인증만 거친 뒤
+핸들러(업스트림 조회, 과금) 실행 없이 바로 304로 응답합니다.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.auth.api_key import authenticate_api_key
+from app.database import get_db
+
+# 경로 접두사별 캐시 유효 시간(초): 데이터 갱신 주기에 맞춤
+DEFAULT_CACHE_TTLS = {
+    "/crypto": 5,
+    "/derivatives": 30,
+    "/social": 30,
+    "/search": 30,
+    "/projects": 300,
+    "/opensource": 300,
+    "/api-catalog": 300,
+}
+
+# 기억해 두는 최근 ETag 수 (경로+쿼리 단위)
+DEFAULT_MAX_VALIDATORS = 4096
+
+
+def ttl_for_path(path: str, ttls: Dict[str, int]) -> Optional[int]:
+    """
+    Find the cache TTL for a request path (longest matching prefix)
+
+    Returns:
+        Optional[int]: TTL in seconds, or None if the path is not cacheable
+    """
+    matches = [prefix for prefix in ttls if path == prefix or path.startswith(prefix + "/")]
+    return ttls[max(matches, key=len)] if matches else None
+
+
+def authenticate_request(request: Request) -> bool:
+    """
+    Check the request's API key without recording usage or billing
+
+    Uses the application's get_db override when one is set (e.g. in tests).
+    """
+    sessions = request.app.dependency_overrides.get(get_db, get_db)()
+    try:
+        authenticate_api_key(request.headers.get("api-key-id"), request.headers.get("api-key-secret"), next(sessions))
+        return True
+    except HTTPException:
+        return False
+    finally:
+        sessions.close()
+
+
+class CacheHeadersMiddleware(BaseHTTPMiddleware):
+    """
+    Add Cache-Control/ETag to cacheable GET responses and answer revalidations with 304
+
+    The ETag of each path+query is remembered until its max-age runs out. A request
+    presenting that ETag within the window is answered with 304 before the handler
+    runs, so it costs one API key lookup instead of the upstream calls and the billed
+    usage of a full request. Later revalidations run the handler and compare ETags.
+    """
+
+    def __init__(self, app, ttls: Optional[Dict[str, int]] = None,
+                 authenticate: Callable[[Request], bool] = authenticate_request,
+                 max_validators: int = DEFAULT_MAX_VALIDATORS, clock: Callable[[], float] = time.monotonic):
+        super().__init__(app)
+        self.ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        self.authenticate = authenticate
+        self.max_validators = max_validators
+        self.clock = clock
+        self.short_circuit_count = 0
+        self._validators: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _fresh_validator(self, key: str) -> Optional[str]:
+        with self._lock:
+            known = self._validators.get(key)
+            if known is None or known[1] <= self.clock():
+                return None
+            return known[0]
+
+    def _remember(self, key: str, etag: str, ttl: int):
+        with self._lock:
+            self._validators[key] = (etag, self.clock() + ttl)
+            self._validators.move_to_end(key)
+            while len(self._validators) > self.max_validators:
+                self._validators.popitem(last=False)
+
+    async def dispatch(self, request: Request, call_next):
+        ttl = ttl_for_path(request.url.path, self.ttls) if request.method == "GET" else None
+        if ttl is None:
+            return await call_next(request)
+
+        key = f"{request.url.path}?{request.url.query}"
+        presented = [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]
+        etag = self._fresh_validator(key)
+        if etag is not None and etag in presented and await run_in_threadpool(self.authenticate, request):
+            self.short_circuit_count += 1
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": f"private, max-age={ttl}"})
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        self._remember(key, etag, ttl)
+        cache_headers = {"ETag": etag, "Cache-Control": f"private, max-age={ttl}"}
+
+        if etag in presented:
+            return Response(status_code=304, headers=cache_headers)
+
+        headers = dict(response.headers)
+        headers.update(cache_headers)
+        return Response(content=body, status_code=200, headers=headers, media_type=response.media_type)
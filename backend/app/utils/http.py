@@ -0,0 +1,51 @@
+"""
+외부 HTTP 호출을 위한 공용 유틸리티 함수
+"""
+
+import requests
+from urllib3.util.retry import Retry
+
+from app.utils.ratelimit import BudgetedAdapter
+
+# 요청 세션 생성 함수
+def get_session_with_retries(
+    retries=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 504),
+    allowed_methods=None,
+    budgets=None
+):
+    """
+    Create a request session with retry functionality
+
+    Args:
+        retries: Number of retry attempts
+        backoff_factor: Time delay factor between retries
+        status_forcelist: HTTP status codes to retry
+        allowed_methods: HTTP methods to retry
+        budgets: Upstream request budgets (defaults to the exchange budgets in app.utils.ratelimit)
+
+    Returns:
+        requests.Session: Session with retry functionality
+    """
+    if allowed_methods is None:
+        allowed_methods = ["HEAD", "GET", "OPTIONS"]
+
+    retry = Retry(
+        total=retries,
+        read=retries,
+        connect=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=allowed_methods,
+        # 429/418은 재전송하지 않고 요청 예산이 Retry-After 동안 해당 거래소 요청을 멈춤
+        respect_retry_after_header=False,
+    )
+
+    # 거래소 호출은 요청 예산 안에서만 전송
+    adapter = BudgetedAdapter(budgets, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
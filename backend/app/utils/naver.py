@@ -0,0 +1,98 @@
+"""
+네이버 파이낸스 시장지표 페이지 환율 추출
+
+페이지 전체를 파싱하지 않고 원본 바이트에서 USD 항목의 값만 찾아 읽습니다.
+마크업이 바뀌어 빠른 경로가 실패하면 BeautifulSoup 전체 파싱으로 대체합니다.
+"""
+
+import logging
+import re
+import time
+from typing import Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger('crypto_api')
+
+# 빠른 경로 마커 (페이지는 EUC-KR이지만 마커와 숫자는 ASCII라 디코딩 없이 바이트로 검색)
+EXCHANGE_LIST_MARKER = b'id="exchangeList"'
+USD_ANCHOR_MARKER = b'class="head usd"'
+VALUE_MARKER = b'class="value">'
+# USD 앵커와 값 사이 최대 거리 (다른 통화 항목의 값을 읽지 않도록 제한)
+MAX_VALUE_DISTANCE = 2000
+
+USD_VALUE_SELECTOR = '#exchangeList > li.on > a.head.usd > div > span.value'
+
+_NUMBER_PATTERN = re.compile(rb'\d{1,3}(?:,?\d{3})*(?:\.\d+)?')
+
+
+def extract_usd_krw_fast(content: bytes) -> Optional[float]:
+    """
+    Read the USD/KRW rate with targeted byte searches
+
+    Args:
+        content: Raw marketindex page bytes
+
+    Returns:
+        float: Exchange rate, or None if the expected markup was not found
+    """
+    start = content.find(EXCHANGE_LIST_MARKER)
+    if start < 0:
+        return None
+    anchor = content.find(USD_ANCHOR_MARKER, start)
+    if anchor < 0:
+        return None
+    value_start = content.find(VALUE_MARKER, anchor, anchor + MAX_VALUE_DISTANCE)
+    if value_start < 0:
+        return None
+    value_start += len(VALUE_MARKER)
+    value_end = content.find(b'<', value_start, value_start + 64)
+    if value_end < 0:
+        return None
+
+    text = content[value_start:value_end].strip()
+    if not _NUMBER_PATTERN.fullmatch(text):
+        return None
+    return float(text.replace(b',', b''))
+
+
+def extract_usd_krw_soup(html: str, features: str = 'html.parser') -> Optional[float]:
+    """
+    Read the USD/KRW rate by parsing the whole page with BeautifulSoup
+
+    Args:
+        html: Decoded marketindex page
+        features: BeautifulSoup parser backend
+
+    Returns:
+        float: Exchange rate, or None if the element was not found
+    """
+    soup = BeautifulSoup(html, features)
+    element = soup.select_one(USD_VALUE_SELECTOR)
+    if element is None:
+        return None
+    try:
+        return float(element.text.strip().replace(',', ''))
+    except ValueError:
+        return None
+
+
+def extract_usd_krw(content: bytes, encoding: Optional[str] = None) -> Tuple[Optional[float], str, float]:
+    """
+    Extract the USD/KRW rate, using the fast path first and the full parser only if it fails
+
+    Args:
+        content: Raw marketindex page bytes
+        encoding: Page encoding for the fallback parser (defaults to EUC-KR)
+
+    Returns:
+        Tuple: (exchange rate or None, path used: 'fast' / 'fallback' / 'failed', parse time in ms)
+    """
+    started = time.perf_counter()
+    rate = extract_usd_krw_fast(content)
+    path = "fast"
+    if rate is None:
+        logger.warning("네이버 환율 빠른 추출 실패, 전체 HTML 파싱으로 대체합니다")
+        rate = extract_usd_krw_soup(content.decode(encoding or 'euc-kr', errors='replace'))
+        path = "fallback" if rate is not None else "failed"
+    return rate, path, (time.perf_counter() - started) * 1000
@@ -0,0 +1,67 @@
+"""
+응답 필드 프로젝션
+
+데이터 API GET 요청에 `fields=` 쿼리 파라미터가 있으면 JSON 응답에서 요청한 필드만 남깁니다.
+점(.)으로 중첩 필드를 지정하며, 리스트는 각 항목에 동일하게 적용됩니다.
+예: /opensource/bitcoin?fields=stats.stars,pull_requests.title
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+# MCP/omniscope_formats.py에 같은 구현이 있음 (클라이언트 측 프로젝션, 별도 배포 패키지)
+def parse_fields(value: str) -> Dict[str, Any]:
+    """
+    Parse 'a,b.c,b.d' into a projection tree {'a': None, 'b': {'c': None, 'd': None}}
+
+    None means "keep the whole value".
+    """
+    tree: Dict[str, Any] = {}
+    for field in filter(None, (part.strip() for part in value.split(','))):
+        node = tree
+        parts = field.split('.')
+        for part in parts[:-1]:
+            if node.get(part, {}) is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def project(data: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    """
+    Keep only the fields in `tree` (lists are projected item by item)
+    """
+    if tree is None:
+        return data
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: project(data[key], sub) for key, sub in tree.items() if key in data}
+    return data
+
+
+class FieldsProjectionMiddleware(BaseHTTPMiddleware):
+    """
+    Apply `fields=` projection to successful JSON GET responses
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        fields = request.query_params.get("fields")
+        if (not fields or request.method != "GET" or response.status_code != 200
+                or not response.headers.get("content-type", "").startswith("application/json")):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        projected = json.dumps(project(json.loads(body), parse_fields(fields)), separators=(',', ':')).encode()
+
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        return Response(content=projected, status_code=200, headers=headers, media_type="application/json")
@@ -0,0 +1,328 @@
+"""
+업스트림 거래소 요청 예산 관리
+
+거래소별로 고정 시간 창(바이낸스 1분 가중치, 업비트 초당 요청 수) 안에서 사용한 요청 비용을 추적합니다.
+요청 전에 예상 비용을 예약하고, 응답 헤더(X-MBX-USED-WEIGHT-1M, Remaining-Req)로 실제 사용량을 맞춥니다.
+예산이 남지 않으면 창이 곧 초기화될 때만 대기열에서 기다리고, 그렇지 않으면 요청을 보내지 않고 거절합니다.
+429/418 응답을 받으면 Retry-After 동안 해당 업스트림 요청을 모두 거절해 차단이 길어지지 않게 합니다.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger('ratelimit')
+
+# Retry-After 헤더가 없을 때 429/418 이후 요청을 멈추는 시간 (초)
+DEFAULT_BACKOFF = {429: 60.0, 418: 120.0}
+
+UPBIT_REMAINING_PATTERN = re.compile(r"\bsec=(\d+)")
+
+
+class BudgetExhausted(requests.exceptions.RequestException):
+    """Raised instead of sending a request when its upstream budget is exhausted"""
+
+    def __init__(self, upstream: str, retry_after: float):
+        super().__init__(f"{upstream} request budget exhausted (retry in {retry_after:.1f}s)")
+        self.upstream = upstream
+        self.retry_after = retry_after
+
+
+def binance_request_weight(path: str, params: Dict[str, List[str]]) -> int:
+    """
+    Request weight of a Binance spot/futures REST call (as documented for /api/v3 and /fapi/v1)
+
+    Args:
+        path: URL path (e.g., '/api/v3/depth')
+        params: Parsed query parameters
+
+    Returns:
+        int: Weight counted against the per-minute limit
+    """
+    if path == "/api/v3/ticker/price":
+        return 2 if "symbol" in params else 4
+    if path in ("/api/v3/trades", "/api/v3/historicalTrades"):
+        return 25
+    if path == "/api/v3/depth":
+        limit = int(params.get("limit", ["100"])[0])
+        return 5 if limit <= 100 else 25 if limit <= 500 else 50 if limit <= 1000 else 250
+    if path in ("/api/v3/exchangeInfo", "/api/v3/ticker/24hr"):
+        return 20 if "symbol" not in params else 2
+    if path == "/fapi/v1/premiumIndex":
+        return 1 if "symbol" in params else 10
+    return 1
+
+
+def binance_used_weight(headers) -> Optional[int]:
+    """Weight used in the current minute according to Binance (X-MBX-USED-WEIGHT-1M)"""
+    value = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get("X-MBX-USED-WEIGHT")
+    return int(value) if value and value.isdigit() else None
+
+
+def upbit_used_requests(limit: int) -> Callable[[Any], Optional[int]]:
+    """
+    Requests used in the current second according to Upbit ('Remaining-Req: group=default; min=1799; sec=9')
+
+    Args:
+        limit: Per-second request limit of the group
+    """
+    def used(headers) -> Optional[int]:
+        match = UPBIT_REMAINING_PATTERN.search(headers.get("Remaining-Req", ""))
+        return max(0, limit - int(match.group(1))) if match else None
+    return used
+
+
+class UpstreamBudget:
+    """
+    Request budget of one upstream within fixed windows (aligned to the clock like the exchanges' own)
+
+    `acquire(weight)` reserves weight in the current window. When the budget is spent it
+    waits for the next window if that starts within `max_wait` seconds, otherwise it
+    raises BudgetExhausted without sending anything. `observe()` reconciles the local
+    count with the usage reported in response headers (which also covers other
+    processes sharing the IP) and pauses the upstream after 429/418 responses.
+    `reserve` keeps a fraction of the exchange limit unused as a safety margin.
+    """
+
+    def __init__(self, name: str, limit: int, window: float, reserve: float = 0.1, max_wait: float = 1.0,
+                 weigh: Optional[Callable[[str, Dict[str, List[str]]], int]] = None,
+                 used_from_headers: Optional[Callable[[Any], Optional[int]]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            name: Upstream name used in errors and metrics
+            limit: Exchange limit per window (weight or requests)
+            window: Window length in seconds
+            reserve: Fraction of the limit left unused
+            max_wait: Longest a caller waits for the next window before the request is shed
+            weigh: Cost of a request from (path, query params), defaults to 1
+            used_from_headers: Usage of the current window reported by a response, None if absent
+            clock: Time source (epoch seconds)
+        """
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.capacity = max(1, int(limit * (1 - reserve)))
+        self.max_wait = max_wait
+        self.weigh = weigh or (lambda path, params: 1)
+        self.used_from_headers = used_from_headers
+        self.clock = clock
+        self.used = 0
+        self.request_count = 0
+        self.queued_count = 0
+        self.shed_count = 0
+        self.throttled_count = 0
+        self.stale_count = 0
+        self.paused_until = 0.0
+        self._window_start = 0.0
+        self._waiting = 0
+        self._condition = threading.Condition()
+
+    def _roll(self, now: float):
+        # 호출자가 _condition을 잡고 있어야 함
+        window_start = now - now % self.window
+        if window_start != self._window_start:
+            self._window_start = window_start
+            self.used = 0
+            self._condition.notify_all()
+
+    def _retry_after(self, now: float, weight: int) -> float:
+        # 요청을 보낼 수 있을 때까지 남은 시간 (0이면 지금 가능)
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.used + weight <= self.capacity:
+            return 0.0
+        return self._window_start + self.window - now
+
+    def exhausted(self, weight: int = 1) -> bool:
+        """True if a request of `weight` would be shed right now"""
+        with self._condition:
+            now = self.clock()
+            self._roll(now)
+            return self._retry_after(now, weight) > self.max_wait
+
+    def acquire(self, weight: int = 1):
+        """
+        Reserve weight for one request, waiting for the next window if it starts within max_wait
+
+        Raises:
+            BudgetExhausted: If the request should not be sent
+        """
+        with self._condition:
+            deadline = self.clock() + self.max_wait
+            waited = False
+            while True:
+                now = self.clock()
+                self._roll(now)
+                retry_after = self._retry_after(now, weight)
+                if retry_after <= 0:
+                    self.used += weight
+                    self.request_count += 1
+                    return
+                if now + retry_after > deadline:
+                    self.shed_count += 1
+                    raise BudgetExhausted(self.name, retry_after)
+                if not waited:
+                    waited = True
+                    self.queued_count += 1
+                self._waiting += 1
+                try:
+                    self._condition.wait(retry_after)
+                finally:
+                    self._waiting -= 1
+
+    def observe(self, status_code: int, headers):
+        """Reconcile usage with a response (headers and 429/418 throttling)"""
+        with self._condition:
+            now = self.clock()
+            self._roll(now)
+            used = self.used_from_headers(headers) if self.used_from_headers else None
+            if used is not None:
+                self.used = max(self.used, used)
+            if status_code in DEFAULT_BACKOFF:
+                retry_after = headers.get("Retry-After")
+                pause = float(retry_after) if retry_after and retry_after.isdigit() else DEFAULT_BACKOFF[status_code]
+                self.paused_until = max(self.paused_until, now + pause)
+                self.throttled_count += 1
+                logger.warning(f"{self.name} 요청 제한 응답 (HTTP {status_code}), {pause:.0f}초 동안 요청 중단")
+
+    def record_stale(self):
+        """Count a response served from stale data instead of this upstream"""
+        with self._condition:
+            self.stale_count += 1
+
+    def status(self) -> Dict[str, Any]:
+        with self._condition:
+            now = self.clock()
+            self._roll(now)
+            return {
+                "upstream": self.name,
+                "limit": self.limit,
+                "capacity": self.capacity,
+                "window_seconds": self.window,
+                "used": self.used,
+                "utilization": round(min(self.used / self.capacity, 1.0), 4),
+                "window_resets_in": round(self._window_start + self.window - now, 3),
+                "paused_for": round(max(0.0, self.paused_until - now), 3),
+                "waiting": self._waiting,
+                "request_count": self.request_count,
+                "queued_count": self.queued_count,
+                "shed_count": self.shed_count,
+                "throttled_count": self.throttled_count,
+                "stale_count": self.stale_count,
+            }
+
+
+class UpstreamBudgets:
+    """
+    Budgets by upstream host; requests to other hosts are not limited
+    """
+
+    def __init__(self):
+        self._by_host: Dict[str, UpstreamBudget] = {}
+        self._budgets: List[UpstreamBudget] = []
+
+    def register(self, budget: UpstreamBudget, hosts: Iterable[str]) -> UpstreamBudget:
+        """Limit requests to `hosts` (which share one exchange limit, e.g. API mirrors) with `budget`"""
+        self._budgets.append(budget)
+        for host in hosts:
+            self._by_host[host.lower()] = budget
+        return budget
+
+    def get(self, name: str) -> Optional[UpstreamBudget]:
+        return next((budget for budget in self._budgets if budget.name == name), None)
+
+    def for_url(self, url: str) -> Optional[UpstreamBudget]:
+        return self._by_host.get((urlsplit(url).hostname or "").lower())
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [budget.status() for budget in self._budgets]
+
+
+class BudgetedAdapter(HTTPAdapter):
+    """
+    HTTP adapter reserving upstream budget before each request and reconciling it from the response
+    """
+
+    def __init__(self, budgets: Optional[UpstreamBudgets] = None, **kwargs):
+        self.budgets = budgets if budgets is not None else upstream_budgets
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        budget = self.budgets.for_url(request.url)
+        if budget is None:
+            return super().send(request, **kwargs)
+        url = urlsplit(request.url)
+        budget.acquire(budget.weigh(url.path, parse_qs(url.query)))
+        response = super().send(request, **kwargs)
+        budget.observe(response.status_code, response.headers)
+        return response
+
+
+class StaleFallback:
+    """
+    Wraps a fetch function and serves its last valid result while the upstream budgets are exhausted
+
+    The fetch is skipped entirely while any budget is exhausted. When it is skipped or
+    fails because of an exhausted budget, the last valid value is returned if it is
+    at most `max_age` seconds old; otherwise the call is shed (None).
+    """
+
+    def __init__(self, fetch: Callable[[], Any], budgets: Sequence[UpstreamBudget], max_age: float = 60.0):
+        self.fetch_value = fetch
+        self.budgets = list(budgets)
+        self.max_age = max_age
+        self._value: Any = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def fetch(self) -> Tuple[Any, bool]:
+        """
+        Returns:
+            Tuple: (value or None, True if the value is a stale one)
+        """
+        if not any(budget.exhausted() for budget in self.budgets):
+            value = self.fetch_value()
+            if value is not None:
+                with self._lock:
+                    self._value, self._fetched_at = value, time.monotonic()
+                return value, False
+            if not any(budget.exhausted() for budget in self.budgets):
+                return None, False
+        with self._lock:
+            value, fetched_at = self._value, self._fetched_at
+        if value is None or time.monotonic() - fetched_at > self.max_age:
+            return None, False
+        for budget in self.budgets:
+            budget.record_stale()
+        return value, True
+
+    def __call__(self) -> Any:
+        return self.fetch()[0]
+
+
+# 애플리케이션 전역 업스트림 예산 (같은 IP를 쓰는 미러 호스트는 하나의 예산을 공유)
+upstream_budgets = UpstreamBudgets()
+UPSTREAM_BUDGET_RESERVE = float(os.getenv("UPSTREAM_BUDGET_RESERVE", "0.1"))
+UPSTREAM_BUDGET_MAX_WAIT = float(os.getenv("UPSTREAM_BUDGET_MAX_WAIT", "1.0"))
+
+upstream_budgets.register(UpstreamBudget(
+    "binance", int(os.getenv("BINANCE_WEIGHT_LIMIT", "6000")), 60.0, UPSTREAM_BUDGET_RESERVE, UPSTREAM_BUDGET_MAX_WAIT,
+    weigh=binance_request_weight, used_from_headers=binance_used_weight,
+), ["api.binance.com", "api1.binance.com", "api2.binance.com", "api3.binance.com", "api4.binance.com"])
+upstream_budgets.register(UpstreamBudget(
+    "binance_futures", int(os.getenv("BINANCE_FUTURES_WEIGHT_LIMIT", "2400")), 60.0, UPSTREAM_BUDGET_RESERVE,
+    UPSTREAM_BUDGET_MAX_WAIT, weigh=binance_request_weight, used_from_headers=binance_used_weight,
+), ["fapi.binance.com"])
+UPBIT_REQUESTS_PER_SECOND = int(os.getenv("UPBIT_REQUESTS_PER_SECOND", "10"))
+upstream_budgets.register(UpstreamBudget(
+    "upbit", UPBIT_REQUESTS_PER_SECOND, 1.0, UPSTREAM_BUDGET_RESERVE, UPSTREAM_BUDGET_MAX_WAIT,
+    used_from_headers=upbit_used_requests(UPBIT_REQUESTS_PER_SECOND),
+), ["api.upbit.com"])
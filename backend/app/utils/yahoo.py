@@ -0,0 +1,113 @@
+"""
+Yahoo Finance 경량 시세 조회
+
+차트 API(v8)의 meta 필드에서 regularMarketPrice만 읽습니다.
+yfinance는 경량 조회가 실패할 때만 지연 import하며, 설치되어 있지 않으면 사용하지 않습니다.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import requests
+
+from app.utils.http import get_session_with_retries
+
+logger = logging.getLogger('crypto_api')
+
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+# 일봉 1개만 요청해 응답 크기를 최소화 (시세는 meta에 포함)
+CHART_PARAMS = {"range": "1d", "interval": "1d", "includePrePost": "false"}
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+    "Accept": "application/json",
+}
+
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    # 연결 재사용을 위해 세션 하나를 공유 (환율 소스 경쟁의 단일 시도로 쓰이므로 재시도 없음)
+    global _session
+    if _session is None:
+        _session = get_session_with_retries(retries=0)
+    return _session
+
+
+def parse_regular_market_price(payload: Dict[str, Any]) -> Optional[float]:
+    """
+    Read meta.regularMarketPrice from a Yahoo chart API response
+
+    Args:
+        payload: Decoded chart API response
+
+    Returns:
+        float: Regular market price, or None if missing
+    """
+    try:
+        price = payload["chart"]["result"][0]["meta"]["regularMarketPrice"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return float(price) if isinstance(price, (int, float)) and price > 0 else None
+
+
+def get_regular_market_price(symbol: str, base_url: str = YAHOO_CHART_URL, timeout: float = 5) -> Optional[float]:
+    """
+    Get the regular market price of a symbol with a single small chart API request
+
+    Args:
+        symbol: Yahoo symbol (e.g., 'USDKRW=X')
+        base_url: Chart API URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        float: Regular market price, or None on failure
+    """
+    try:
+        response = _get_session().get(f"{base_url}/{symbol}", params=CHART_PARAMS, headers=HEADERS, timeout=timeout)
+        response.raise_for_status()
+        return parse_regular_market_price(response.json())
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.warning(f"Yahoo 차트 API {symbol} 시세 조회 오류: {e}")
+        return None
+
+
+def get_yfinance_price(symbol: str) -> Optional[float]:
+    """
+    Get the regular market price through yfinance (imported on first use, optional)
+
+    Args:
+        symbol: Yahoo symbol (e.g., 'USDKRW=X')
+
+    Returns:
+        float: Regular market price, or None if yfinance is unavailable or the lookup fails
+    """
+    try:
+        import yfinance as yf
+    except ImportError:
+        logger.warning("yfinance가 설치되어 있지 않아 대체 조회를 건너뜁니다")
+        return None
+    try:
+        # fast_info는 전체 quoteSummary(info)보다 적은 데이터만 조회
+        price = yf.Ticker(symbol).fast_info.last_price
+        return float(price) if price else None
+    except Exception as e:
+        logger.warning(f"yfinance {symbol} 시세 조회 오류: {e}")
+        return None
+
+
+def get_quote_price(symbol: str, base_url: str = YAHOO_CHART_URL, timeout: float = 5) -> Optional[float]:
+    """
+    Get the regular market price, falling back to yfinance only if the chart API fails
+
+    Args:
+        symbol: Yahoo symbol (e.g., 'USDKRW=X')
+        base_url: Chart API URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        float: Regular market price, or None on failure
+    """
+    price = get_regular_market_price(symbol, base_url, timeout)
+    if price is None:
+        price = get_yfinance_price(symbol)
+    return price
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+알림 규칙 평가 벤치마크 스크립트
+
+한 스트림(BTC 가격)에 임계값이 서로 다른 규칙(기본 100000개)을 등록하고,
+새 값마다 모든 규칙을 검사하는 경우와 임계값 색인으로 지나친 규칙만 찾는 경우를 비교합니다.
+
+사용법:
+    python benchmarks/bench_alerts.py [규칙 수] [값 수]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.alerts import Alert, AlertEngine, WebhookDispatcher
+
+KEY = ("binance_price_usd", "BTC")
+
+def main():
+    rules = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = np.random.default_rng(42)
+    thresholds = rng.uniform(50000, 80000, rules).tolist()
+    conditions = rng.choice(["above", "below", "crosses"], rules).tolist()
+    prices = (65000 + np.cumsum(rng.normal(0, 20, ticks))).tolist()
+
+    engine = AlertEngine(WebhookDispatcher(max_queue=10 ** 9))
+    alerts = [Alert(i, 1, "price", "BTC", "binance", condition, threshold, "http://127.0.0.1/hook")
+              for i, (condition, threshold) in enumerate(zip(conditions, thresholds))]
+    started = time.perf_counter()
+    for alert in alerts:
+        engine.add(alert)
+    print(f"Rules: {rules}, ticks: {ticks} (index build {(time.perf_counter() - started) * 1000:.0f}ms)")
+
+    started = time.perf_counter()
+    fired_scan = 0
+    previous = None
+    for price in prices:
+        if previous is not None:
+            for alert in alerts:
+                t = alert.threshold
+                if (alert.condition != "below" and previous < t <= price) or \
+                        (alert.condition != "above" and price <= t < previous):
+                    fired_scan += 1
+        previous = price
+    print(f"scan every rule per tick       {(time.perf_counter() - started) / ticks * 1000:8.3f}ms ({fired_scan} fired)")
+
+    started = time.perf_counter()
+    fired_index = sum(len(engine.observe(KEY, i, price)) for i, price in enumerate(prices))
+    print(f"threshold index per tick       {(time.perf_counter() - started) / ticks * 1000:8.3f}ms ({fired_index} fired)")
+
+if __name__ == "__main__":
+    main()
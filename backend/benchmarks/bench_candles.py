@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+OHLCV 캔들 집계 벤치마크 스크립트
+
+합성 체결(기본 100만 건, 약 7일)을 폴링 단위(1000건) 배치로 메모리 맵 캔들 저장소에 반영한 뒤,
+저장된 봉을 그대로 읽는 조회와 요청마다 원시 체결을 다시 다운샘플링하는 방식을 비교합니다.
+
+사용법:
+    python benchmarks/bench_candles.py [체결 수] [조회 봉 수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.timeseries import CandleStore, TimeSeries
+
+def main():
+    trades = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    rng = np.random.default_rng(42)
+    timestamps = 1718000000.0 + np.cumsum(rng.exponential(0.6, trades))
+    prices = 65000.0 * np.exp(np.cumsum(rng.normal(0, 2e-4, trades)))
+    volumes = rng.exponential(0.05, trades)
+    print(f"Trades: {trades} over {(timestamps[-1] - timestamps[0]) / 86400:.1f} days, batch 1000, serving {limit} bars")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = CandleStore(directory)
+        started = time.perf_counter()
+        for offset in range(0, trades, 1000):
+            batch = slice(offset, offset + 1000)
+            store.fold("binance", "BTCUSDT", timestamps[batch], prices[batch], volumes[batch])
+        store.flush()
+        fold_ms = (time.perf_counter() - started) * 1000
+        print(f"fold           {fold_ms:9.1f}ms  ({fold_ms / (trades / 1000) * 1000:.0f}us per 1000-trade poll, all 4 intervals)")
+
+        for interval in ("1m", "1h"):
+            started = time.perf_counter()
+            for _ in range(100):
+                bars = store.candles(("binance", "BTCUSDT"), interval, limit)
+            print(f"stored {interval}      {(time.perf_counter() - started) / 100 * 1000:9.3f}ms  ({len(bars)} bars)")
+
+        # 비교: 요청마다 원시 체결 전체를 다시 집계
+        raw = TimeSeries(capacity=trades)
+        raw.extend(timestamps, prices)
+        started = time.perf_counter()
+        for _ in range(10):
+            buckets = raw.downsample(60)
+        print(f"recompute 1m   {(time.perf_counter() - started) / 10 * 1000:9.3f}ms  ({len(buckets['timestamp'])} bars, without volume)")
+
+if __name__ == "__main__":
+    main()
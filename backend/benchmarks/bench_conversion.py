@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+통화 환산 그래프 벤치마크 스크립트
+
+합성 시세(기본 업비트 KRW 마켓 250개, 바이낸스 USDT/BTC 마켓 각 400개)로 환율 그래프를 만들고,
+시세 갱신 직후 첫 환산(최적 경로 트리 계산)과 캐시된 경로로 환산하는 비용을 비교합니다.
+
+사용법:
+    python benchmarks/bench_conversion.py [코인 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.conversion import RateGraph
+
+def main():
+    coins = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = np.random.default_rng(42)
+    now = time.time()
+    symbols = [f"C{i:04d}" for i in range(coins)]
+    prices = rng.lognormal(0, 3, coins)
+
+    graph = RateGraph()
+    upbit = {f"KRW-{s}": {"trade_price": p * 1380, "timestamp": now * 1000, "acc_trade_price_24h": 1e9}
+             for s, p in zip(symbols[:coins * 5 // 8], prices.tolist())}
+    upbit["KRW-USDT"] = {"trade_price": 1389.0, "timestamp": now * 1000, "acc_trade_price_24h": 1e11}
+    binance = [{"symbol": f"{s}USDT", "price": str(p)} for s, p in zip(symbols, prices.tolist())]
+    binance += [{"symbol": f"{s}BTC", "price": str(p / 65000)} for s, p in zip(symbols, prices.tolist())]
+    binance.append({"symbol": "BTCUSDT", "price": "65000"})
+
+    def update():
+        graph.update_upbit(upbit, timestamp=now)
+        graph.update_binance(binance, timestamp=now)
+        graph.update_fx("USD", "KRW", 1380.0, timestamp=now)
+
+    update()
+    print(f"Currencies: {len(graph.currencies())}, iterations: {iterations}")
+
+    started = time.perf_counter()
+    for _ in range(20):
+        update()
+    print(f"tick update (all tickers)      {(time.perf_counter() - started) / 20 * 1000:8.3f}ms")
+
+    pairs = [(symbols[i], "KRW") for i in rng.integers(0, coins, iterations)]
+    started = time.perf_counter()
+    for source, target in pairs[:200]:
+        graph._trees.clear()
+        graph.convert(source, target, now=now)
+    print(f"convert after update (cold)    {(time.perf_counter() - started) / 200 * 1000:8.3f}ms")
+
+    started = time.perf_counter()
+    for source, target in pairs:
+        graph.convert(source, target, now=now)
+    print(f"convert over cached path       {(time.perf_counter() - started) / iterations * 1000:8.3f}ms")
+
+if __name__ == "__main__":
+    main()
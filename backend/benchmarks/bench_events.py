@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+이벤트 버스 벤치마크 스크립트
+
+수집 스레드가 토픽 50개(심볼별 프리미엄)에 일정 간격(기본 초당 1000개)으로 이벤트를 발행하고,
+구독자(기본 1000개)가 와일드카드 패턴으로 구독합니다. 구독자 하나만 바로 읽고 나머지는 전혀 읽지 않는
+느린 소비자일 때, 정책별 발행 비용, 빠른 구독자의 전달 지연과 느린 구독자의 대기 이벤트 수를 측정합니다.
+
+사용법:
+    python benchmarks/bench_events.py [구독자 수] [이벤트 수] [초당 이벤트 수]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.events import QUEUE_POLICIES, EventBus
+
+SYMBOLS = [f"SYM{i}" for i in range(50)]
+
+async def run(policy: str, subscribers: int, events: int, rate: float):
+    bus = EventBus()
+    slow = [bus.subscribe("kimchi.premium_percentage.*" if i % 2 else "kimchi.#", 100, policy)
+            for i in range(subscribers - 1)]
+    fast = bus.subscribe("kimchi.#", events, "drop_newest")
+    latencies = []
+    publish_times = []
+
+    def ingest():
+        publish_time = 0.0
+        start = time.perf_counter()
+        for i in range(events):
+            # 수집 주기에 맞춰 발행
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            before = time.perf_counter()
+            bus.publish(f"kimchi.premium_percentage.{SYMBOLS[i % len(SYMBOLS)]}", {"value": i}, before)
+            publish_time += time.perf_counter() - before
+        publish_times.append(publish_time)
+
+    thread = threading.Thread(target=ingest)
+    thread.start()
+    for _ in range(events):
+        event = await fast.get()
+        latencies.append(time.perf_counter() - event.timestamp)
+    thread.join()
+
+    latencies.sort()
+    print(f"{policy:12s} publish {publish_times[0] / events * 1e6:6.1f}µs/event  "
+          f"delivery p50 {latencies[len(latencies) // 2] * 1000:7.2f}ms p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f}ms  "
+          f"slow consumer backlog {max(s.qsize() for s in slow)} (dropped {slow[0].dropped_count})")
+
+def main():
+    subscribers = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    print(f"Subscribers: {subscribers}, events: {events} at {rate:.0f}/s, topics: {len(SYMBOLS)}")
+    for policy in QUEUE_POLICIES:
+        asyncio.run(run(policy, subscribers, events, rate))
+
+if __name__ == "__main__":
+    main()
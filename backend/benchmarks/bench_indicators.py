@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+기술 지표 계산 벤치마크 스크립트
+
+합성 1분봉(기본 7일, 10080개)에 대해 rsi14/ema50/bb20/vwap24를
+매 요청 전체 재계산하는 경우와 지표 캐시에서 새로 마감된 봉만 이어서 계산하는 경우를 비교합니다.
+
+사용법:
+    python benchmarks/bench_indicators.py [봉 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.timeseries import CandleStore, Indicator, IndicatorCache
+
+NAMES = ["rsi14", "ema50", "bb20", "vwap24"]
+KEY = ("binance", "BTCUSDT")
+
+def main():
+    bars = int(sys.argv[1]) if len(sys.argv) > 1 else 10080
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    rng = np.random.default_rng(42)
+    start = 1718000000.0 - 1718000000.0 % 60
+    store = CandleStore()
+    store.fold(*KEY, start + np.arange(bars) * 60.0 + 1, 65000 + np.cumsum(rng.normal(0, 20, bars)), rng.exponential(1, bars))
+    print(f"Candles: {bars} x 1m, indicators: {', '.join(NAMES)}, iterations: {iterations}")
+
+    candles = store.candles(KEY, "1m", bars)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for name in NAMES:
+            Indicator(name).advance(store.candles(KEY, "1m", bars))
+    print(f"full recompute per request     {(time.perf_counter() - started) / iterations * 1000:8.3f}ms")
+
+    cache = IndicatorCache(store)
+    now = candles["timestamp"][-1] + 60
+    started = time.perf_counter()
+    cache.values(KEY, "1m", NAMES, now=now)
+    print(f"cache warm-up (first request)  {(time.perf_counter() - started) * 1000:8.3f}ms")
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        cache.values(KEY, "1m", NAMES, now=now)
+    print(f"cached latest value            {(time.perf_counter() - started) / iterations * 1000:8.3f}ms")
+
+    # 매 요청마다 새 1분봉 하나가 마감되는 경우
+    started = time.perf_counter()
+    for i in range(iterations):
+        bar_start = now + i * 60
+        store.fold(*KEY, [bar_start + 1], [65000.0 + i], [1.0])
+        cache.values(KEY, "1m", NAMES, now=bar_start + 60)
+    print(f"one new candle per request     {(time.perf_counter() - started) / iterations * 1000:8.3f}ms")
+
+if __name__ == "__main__":
+    main()
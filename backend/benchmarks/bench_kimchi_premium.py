@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+다중 코인 김치 프리미엄 계산 벤치마크 스크립트
+
+업비트 KRW/바이낸스 USDT 상장 코인 수백 개 규모의 합성 시세로
+심볼 정렬과 프리미엄 계산(벡터 연산)을 코인별 calculate_premium 반복과 비교합니다.
+
+사용법:
+    python benchmarks/bench_kimchi_premium.py [공통 코인 수] [반복 횟수]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.premium import premium_table
+from app.routers.crypto import calculate_premium
+
+EXCHANGE_RATE = 1380.0
+
+def synthetic_prices(pairs):
+    random.seed(42)
+    binance = {f"C{i:04d}": random.uniform(0.001, 50000) for i in range(int(pairs * 1.6))}
+    # 업비트에는 일부만 상장되고, 업비트 전용 코인도 일부 존재
+    upbit = {symbol: price * EXCHANGE_RATE * random.uniform(0.97, 1.06) for symbol, price in list(binance.items())[:pairs]}
+    upbit.update({f"K{i:04d}": random.uniform(1, 10000) for i in range(pairs // 4)})
+    return upbit, binance
+
+def scalar(upbit, binance):
+    rows = []
+    for symbol, upbit_price in upbit.items():
+        if symbol in binance:
+            rows.append((symbol, calculate_premium(binance[symbol], upbit_price, EXCHANGE_RATE)))
+    return sorted(rows, key=lambda row: row[1], reverse=True)
+
+def measure(fn, iterations):
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+def main():
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    upbit, binance = synthetic_prices(pairs)
+    print(f"Upbit KRW: {len(upbit)}, Binance USDT: {len(binance)}, common pairs: {pairs}, iterations: {iterations}")
+
+    vectorized = premium_table(upbit, binance, EXCHANGE_RATE)
+    assert vectorized.symbols == [symbol for symbol, _ in scalar(upbit, binance)]
+
+    print(f"scalar loop   {measure(lambda: scalar(upbit, binance), iterations):.3f}ms")
+    print(f"vectorized    {measure(lambda: premium_table(upbit, binance, EXCHANGE_RATE), iterations):.3f}ms")
+    print(f"vectorized+rows {measure(lambda: premium_table(upbit, binance, EXCHANGE_RATE).rows(), iterations):.3f}ms")
+    print(f"top 20        {measure(lambda: premium_table(upbit, binance, EXCHANGE_RATE, top=20).rows(), iterations):.3f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+네이버 환율 추출 벤치마크 스크립트
+
+저장된 시장지표 페이지(tests/fixtures/naver)에서 USD/KRW 환율을 추출하는 호출당 파싱 시간을
+빠른 경로와 BeautifulSoup 전체 파싱(html.parser, lxml 설치 시 lxml)으로 비교합니다.
+
+사용법:
+    python benchmarks/bench_naver_extract.py [반복 횟수] [페이지 파일...]
+"""
+
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.naver import extract_usd_krw, extract_usd_krw_fast, extract_usd_krw_soup
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures", "naver")
+
+def measure(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    return (time.perf_counter() - started) * 1000 / iterations, result
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    pages = sys.argv[2:] or sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html")))
+    for page in pages:
+        with open(page, "rb") as f:
+            content = f.read()
+        print(f"{os.path.basename(page)} ({len(content) / 1024:.0f} KB), {iterations} iterations")
+
+        cases = [
+            ("fast", lambda: extract_usd_krw_fast(content)),
+            ("fast+fallback", lambda: extract_usd_krw(content)[0]),
+            ("html.parser", lambda: extract_usd_krw_soup(content.decode("euc-kr"))),
+        ]
+        try:
+            import lxml  # noqa: F401
+            cases.append(("lxml", lambda: extract_usd_krw_soup(content.decode("euc-kr"), "lxml")))
+        except ImportError:
+            pass
+
+        for label, func in cases:
+            per_call_ms, rate = measure(func, iterations if label.startswith("fast") else max(1, iterations // 10))
+            print(f"  {label:14s} {per_call_ms:9.3f}ms/call  rate={rate}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+로컬 호가창 벤치마크 스크립트
+
+합성 호가창(기본 양쪽 1000단계)에 diff 이벤트를 적용할 때 스냅샷/유동성 구간을 미리 계산하는 비용과,
+조회 시 미리 만들어진 스냅샷을 읽어 유동성을 반환하는 비용을 비교합니다.
+
+사용법:
+    python benchmarks/bench_orderbook.py [단계 수] [반복 횟수]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.orderbook import BinanceDepthFeed, OrderBookManager
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rng = np.random.default_rng(42)
+    feed = BinanceDepthFeed("BTCUSDT")
+    manager = OrderBookManager([feed])
+    book = feed.book
+    ticks = np.arange(1, levels + 1) * 0.5
+    book.load_snapshot({
+        "lastUpdateId": 0,
+        "bids": [[str(65000 - tick), str(q)] for tick, q in zip(ticks, rng.exponential(1, levels))],
+        "asks": [[str(65000 + tick), str(q)] for tick, q in zip(ticks, rng.exponential(1, levels))],
+    })
+    print(f"Levels: {levels} per side, iterations: {iterations}")
+
+    # 이벤트당 10단계 변경 (100ms 스트림 기준 일반적인 크기)
+    events = [
+        {"U": i + 1, "u": i + 1,
+         "b": [[str(65000 - t), str(q)] for t, q in zip(rng.choice(ticks, 5), rng.exponential(1, 5))],
+         "a": [[str(65000 + t), str(q)] for t, q in zip(rng.choice(ticks, 5), rng.exponential(1, 5))]}
+        for i in range(iterations)
+    ]
+    started = time.perf_counter()
+    for event in events:
+        book.apply(event)
+    print(f"apply diff + publish snapshot  {(time.perf_counter() - started) / iterations * 1e6:8.1f}us")
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        snapshot = manager.get("BTCUSDT")
+        snapshot["bands"], snapshot["bids"][:20]
+    print(f"read liquidity/top 20 levels   {(time.perf_counter() - started) / iterations * 1e6:8.1f}us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+김치 프리미엄 이력 조회 벤치마크 스크립트
+
+10초마다 기록된 프리미엄/기초 가격/환율 시계열(기본 7일)을 대상으로
+/crypto/kimchi-premium/history가 응답을 만드는 시간을 주기별로 측정합니다.
+업스트림 호출 없이 저장된 배열만 다운샘플링합니다.
+
+사용법:
+    python benchmarks/bench_premium_history.py [기록 일수] [기록 간격(초)]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.premium import PremiumHistory
+from app.routers import crypto
+from app.timeseries import TimeSeriesStore
+
+def main():
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 7
+    step = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    timestamps = time.time() - days * 86400 + np.arange(int(days * 86400 / step)) * step
+    history = PremiumHistory(TimeSeriesStore())
+
+    started = time.perf_counter()
+    for i, ts in enumerate(timestamps.tolist()):
+        history.record("BTC", 1.0 + np.sin(i / 500), 67000.0 + i % 97, 93500000.0 + i % 89, 1380.0, timestamp=ts)
+    record_ms = (time.perf_counter() - started) * 1000
+    print(f"Recorded {len(timestamps)} samples x 4 series in {record_ms:.0f}ms ({record_ms / len(timestamps) * 1000:.1f}us per record)")
+
+    crypto.premium_history.history = history.history
+    print(f"{'interval':8s} {'points/series':>13s} {'downsample':>11s} {'response':>10s}")
+    for interval in ("1m", "5m", "1h", "1d"):
+        bucket_seconds = crypto.parse_interval(interval)
+        started = time.perf_counter()
+        for metric in history.PAIR_METRICS:
+            history.history.downsample((metric, "BTC"), bucket_seconds)
+        downsample_ms = (time.perf_counter() - started) * 1000
+
+        # 엔드포인트와 같은 경로: dict 생성 후 응답 모델 검증/직렬화 한 번
+        started = time.perf_counter()
+        series = {metric: crypto.history_points((metric, "BTC"), bucket_seconds, None, None)
+                  for metric in history.PAIR_METRICS}
+        series["exchange_rate"] = crypto.history_points(history.EXCHANGE_RATE_KEY, bucket_seconds, None, None)
+        crypto.KimchiPremiumHistory(symbol="BTC", interval=interval, **series).model_dump_json()
+        response_ms = (time.perf_counter() - started) * 1000
+        print(f"{interval:8s} {len(series['premium_percentage']):13d} {downsample_ms:9.2f}ms {response_ms:8.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+검색 색인 벤치마크 스크립트
+
+합성 문서 N건(기본 1,000,000건)을 색인한 뒤 대표 질의의 응답 시간을 측정합니다.
+
+사용법:
+    python benchmarks/bench_search.py [문서 수]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.search import SearchIndex
+
+VOCABULARY = [f"word{i}" for i in range(50000)]
+TICKERS = ["btc", "eth", "sol", "doge", "xrp", "hsk", "pepe", "ada"]
+QUERIES = ["doge", "doge moon", "btc etf", "word123", "hsk mainnet upgrade"]
+
+def build_index(count):
+    rng = random.Random(42)
+    index = SearchIndex()
+    now = datetime(2024, 6, 20)
+    for i in range(count):
+        words = rng.choices(VOCABULARY, k=12) + rng.choices(TICKERS, k=2)
+        if i % 50 == 0:
+            words += ["moon", "etf", "mainnet", "upgrade"]
+        index.add("social", str(i), "", " ".join(words), now - timedelta(seconds=i))
+    return index
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    started = time.perf_counter()
+    index = build_index(count)
+    print(f"Indexed {count} documents in {time.perf_counter() - started:.1f}s")
+
+    since = datetime(2024, 6, 20) - timedelta(hours=1)
+    for query in QUERIES:
+        for kwargs in ({}, {"since": since}):
+            timings = []
+            for _ in range(20):
+                started = time.perf_counter()
+                total, _ = index.search(query, limit=20, **kwargs)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            label = f"{query!r}" + (" since=1h" if kwargs else "")
+            print(f"{label:32s} matches={total:8d} p50={timings[10]:7.2f}ms p95={timings[18]:7.2f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+업비트 시세 조회 벤치마크 스크립트
+
+녹화된 /v1/ticker 응답(tests/fixtures/upbit)을 제공하는 로컬 스텁 서버에 대해
+/crypto 엔드포인트 호출 조합(BTC/KRW, USDT/KRW, 김치 프리미엄, 4개 마켓 조회)을 N회 반복하며
+마켓별 개별 요청과 다중 마켓 스냅샷의 업스트림 요청 수와 소요 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_upbit_ticker.py [반복 횟수] [스냅샷 유효 시간(초)]
+"""
+
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.upbit import UpbitTicker
+from tests.stub_server import StubServer, load_fixture
+
+# 한 라운드에서 엔드포인트들이 조회하는 마켓
+ROUND = [["KRW-BTC"], ["KRW-USDT"], ["KRW-BTC"], ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL"]]
+MARKETS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL", "KRW-USDT"]
+
+def route(handler):
+    tickers = {ticker["market"]: ticker for ticker in load_fixture("upbit", "ticker.json")}
+    markets = parse_qs(urlsplit(handler.path).query)["markets"][0].split(",")
+    return 200, {}, [tickers[market] for market in markets]
+
+def per_market(base_url, rounds):
+    # 기존 방식: 마켓마다 별도 요청 (스냅샷 재사용 없음)
+    tickers = {market: UpbitTicker([market], base_url=base_url, max_age=0) for market in MARKETS}
+    for _ in range(rounds):
+        for markets in ROUND:
+            for market in markets:
+                tickers[market].get_price(market)
+    return sum(ticker.request_count for ticker in tickers.values())
+
+def bulk(base_url, rounds, max_age):
+    ticker = UpbitTicker(MARKETS, base_url=base_url, max_age=max_age)
+    for _ in range(rounds):
+        for markets in ROUND:
+            ticker.get_prices(markets)
+    return ticker.request_count
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    max_age = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    print(f"Rounds: {rounds}, markets per round: {sum(len(markets) for markets in ROUND)}, snapshot max age: {max_age}s")
+    with StubServer({"/v1/ticker": route}) as server:
+        for label, run in (("per-market", lambda: per_market(server.base_url, rounds)),
+                           ("bulk", lambda: bulk(server.base_url, rounds, max_age)),
+                           ("bulk (no reuse)", lambda: bulk(server.base_url, rounds, 0))):
+            started = time.perf_counter()
+            requests = run()
+            print(f"{label:16s} {(time.perf_counter() - started) * 1000:9.1f}ms  upstream requests={requests}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Yahoo Finance 시세 조회 벤치마크 스크립트
+
+- import 시간: 경량 어댑터(app.utils.yahoo)와 yfinance를 각각 새 프로세스에서 import
+- 호출당 지연 시간: 녹화된 차트 응답(tests/fixtures/yahoo)을 제공하는 로컬 스텁 서버 대상
+- --live: 실제 Yahoo Finance에 경량 어댑터와 yf.Ticker(...).info를 각각 호출
+
+사용법:
+    python benchmarks/bench_yahoo_quote.py [반복 횟수] [--live]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from app.utils.yahoo import get_regular_market_price
+from tests.stub_server import StubServer, load_fixture
+
+SYMBOL = "USDKRW=X"
+
+def import_time_ms(module):
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    return float(output.stdout.strip()) if output.returncode == 0 else None
+
+def per_call_ms(func, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        result = func()
+    return (time.perf_counter() - started) * 1000 / iterations, result
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    iterations = int(args[0]) if args else 50
+
+    print("Import time (fresh process)")
+    for module in ("app.utils.yahoo", "yfinance"):
+        elapsed = import_time_ms(module)
+        print(f"  {module:16s} {'not installed' if elapsed is None else f'{elapsed:9.1f}ms'}")
+
+    print(f"Per-call latency against recorded fixture ({iterations} calls)")
+    stub = StubServer({f"/v8/finance/chart/{SYMBOL}": load_fixture("yahoo", "chart_usdkrw.json")})
+    with stub:
+        elapsed, price = per_call_ms(lambda: get_regular_market_price(SYMBOL, f"{stub.base_url}/v8/finance/chart"), iterations)
+    print(f"  chart adapter    {elapsed:9.2f}ms/call  price={price}")
+
+    if "--live" in sys.argv:
+        import yfinance as yf
+        print("Per-call latency against Yahoo Finance (live)")
+        elapsed, price = per_call_ms(lambda: get_regular_market_price(SYMBOL), 5)
+        print(f"  chart adapter    {elapsed:9.2f}ms/call  price={price}")
+        elapsed, info = per_call_ms(lambda: yf.Ticker(SYMBOL).info, 5)
+        print(f"  yfinance .info   {elapsed:9.2f}ms/call  price={info.get('regularMarketPrice')}")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,9 @@ from fastapi.testclient import TestClient
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# 테스트 중에는 백그라운드 데이터 수집 비활성화
+os.environ.setdefault("INGESTION_ENABLED", "false")
+
 from app.database import Base, get_db
 from app.main import app
 from app.models import User, APIKey, Transaction
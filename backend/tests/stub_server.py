@@ -0,0 +1,129 @@
+"""
+녹화된 응답(fixture)을 제공하는 로컬 스텁 HTTP/웹소켓 서버
+
+외부 API 어댑터와 스트림 피드를 네트워크 없이 테스트하기 위해 사용합니다.
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def normalize_route(path_with_query: str) -> str:
+    """경로와 정렬된 쿼리 문자열로 라우트 키 생성"""
+    parts = urlsplit(path_with_query)
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    return f"{parts.path}?{query}" if query else parts.path
+
+
+def load_fixture(*names):
+    """fixtures 디렉토리의 JSON 파일 로드"""
+    with open(os.path.join(FIXTURES_DIR, *names), "r") as f:
+        return json.load(f)
+
+
+class StubServer:
+    """
+    라우트별로 고정된 응답을 반환하는 HTTP 서버
+
+    routes 값은 JSON 직렬화 가능한 본문이거나, handler를 받아
+    (status, headers, body) 튜플을 반환하는 callable 입니다.
+    POST 요청의 본문은 handler.body로 읽을 수 있고 posts에 (경로, 본문)으로 기록됩니다.
+    """
+
+    def __init__(self, routes=None):
+        self.routes = {normalize_route(k): v for k, v in (routes or {}).items()}
+        self.requests = []
+        self.posts = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.posts.append((self.path, self.body))
+                self.do_GET()
+
+            def do_GET(self):
+                stub.requests.append(self.path)
+                key = normalize_route(self.path)
+                route = stub.routes.get(key, stub.routes.get(urlsplit(self.path).path))
+                if route is None:
+                    self._send(404, {}, {"error": f"no fixture for {key}"})
+                elif callable(route):
+                    self._send(*route(self))
+                else:
+                    self._send(200, {}, route)
+
+            def _send(self, status, headers, body):
+                payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+                self.send_response(status)
+                if "Content-Type" not in headers:
+                    self.send_header("Content-Type", "application/json")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class StubStreamServer:
+    """
+    연결마다 정해진 메시지 목록을 순서대로 보내는 웹소켓 서버
+
+    i번째 연결에는 scripts[i]의 메시지(JSON 직렬화)를 보낸 뒤 클라이언트가 닫을 때까지
+    연결을 유지합니다. 스크립트보다 많이 연결되면 메시지 없이 유지만 합니다.
+    """
+
+    def __init__(self, scripts):
+        from websockets.exceptions import ConnectionClosed
+        from websockets.sync.server import serve
+
+        self.scripts = list(scripts)
+        self.paths = []
+        self._stop_event = threading.Event()
+        stub = self
+
+        def handler(connection):
+            index = len(stub.paths)
+            stub.paths.append(connection.request.path)
+            try:
+                for message in stub.scripts[index] if index < len(stub.scripts) else []:
+                    connection.send(json.dumps(message))
+                while not stub._stop_event.is_set():
+                    try:
+                        connection.recv(timeout=0.1)
+                    except TimeoutError:
+                        continue
+            except ConnectionClosed:
+                pass
+
+        self.server = serve(handler, "127.0.0.1", 0)
+        self.base_url = f"ws://127.0.0.1:{self.server.socket.getsockname()[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop_event.set()
+        self.server.shutdown()
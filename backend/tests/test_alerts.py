@@ -0,0 +1,163 @@
+import json
+import os
+
+import pytest
+import sys
+import time
+from types import SimpleNamespace
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.alerts import Alert, AlertEngine, WebhookDispatcher, check_webhook_url, sign_payload
+from app.alerts import webhooks
+from app.auth.api_key import get_api_key_with_tracking
+from app.events import EventBus
+from app.main import app
+from app.routers import alerts
+from app.timeseries import TimeSeriesStore
+from tests.stub_server import StubServer
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+def test_rules_fire_only_on_crossings():
+    """임계값 색인으로 직전 값과 새 값 사이를 지난 규칙만 발동하는 테스트"""
+    engine = AlertEngine(WebhookDispatcher())
+    url = "http://127.0.0.1:9/hook"
+    engine.add(Alert(1, 1, "price", "BTC", "binance", "above", 70000, url))
+    engine.add(Alert(2, 1, "price", "BTC", "binance", "below", 60000, url))
+    engine.add(Alert(3, 1, "premium", "BTC", None, "crosses", 3.0, url))
+    engine.add(Alert(4, 1, "funding_rate", "BTC", "binance", "flips_sign", 0, url))
+    engine.add(Alert(5, 1, "price", "BTC", "binance", "above", 65000, url))
+
+    store = TimeSeriesStore()
+    store.subscribe(engine.observe)
+
+    def fired(key, ts, value):
+        return sorted(alert.id for alert in engine.observe(key, ts, value))
+
+    # 첫 값은 기준값으로만 사용
+    assert fired(("binance_price_usd", "BTC"), 1, 64000.0) == []
+    assert fired(("binance_price_usd", "BTC"), 2, 71000.0) == [1, 5]
+    assert fired(("binance_price_usd", "BTC"), 3, 72000.0) == []
+    assert fired(("binance_price_usd", "BTC"), 4, 60000.0) == [2]
+    # 다른 거래소/지표 시계열은 영향 없음
+    assert fired(("upbit_price_krw", "BTC"), 5, 1e9) == []
+
+    assert fired(("premium_percentage", "BTC"), 1, 2.5) == []
+    assert fired(("premium_percentage", "BTC"), 2, 3.5) == [3]
+    assert fired(("premium_percentage", "BTC"), 3, 2.9) == [3]
+
+    # 파생상품 저장소에 기록되는 펀딩비로 부호 전환 감지
+    store.append(("funding_rate", "Binance", "BTC/USDT"), 1, 0.0001)
+    store.append(("funding_rate", "Binance", "BTC/USDT"), 2, -0.0002)
+    assert engine.get(4).trigger_count == 1
+    assert engine.dispatcher.pending() == 6
+
+    engine.remove(5)
+    assert fired(("binance_price_usd", "BTC"), 6, 71000.0) == [1]
+
+def test_webhook_retried_until_delivered():
+    """웹훅 실패 시 백오프 재시도 및 서명 헤더 테스트"""
+    responses = [500, 503, 200]
+    headers = []
+
+    def hook(handler):
+        headers.append(dict(handler.headers))
+        return responses[min(len(headers), len(responses)) - 1], {}, {}
+
+    with StubServer({"/hook": hook, "/gone": lambda handler: (410, {}, {})}) as server:
+        dispatcher = WebhookDispatcher(max_attempts=3, backoff=0.01, workers=2, allow_private=True)
+        engine = AlertEngine(dispatcher)
+        engine.add(Alert(7, 1, "premium", "ETH", None, "above", 2.0, f"{server.base_url}/hook", "whsec_test"))
+        engine.add(Alert(8, 1, "premium", "ETH", None, "above", 1.0, f"{server.base_url}/gone"))
+        engine.start()
+        try:
+            engine.observe(("premium_percentage", "ETH"), 1718874000, 0.5)
+            engine.observe(("premium_percentage", "ETH"), 1718874030, 2.5)
+            assert wait_until(lambda: engine.get(7).last_delivery == "delivered" and engine.get(8).last_delivery == "failed")
+        finally:
+            engine.stop()
+
+    assert dispatcher.status() == {"pending": 0, "delivered": 1, "retries": 4, "failed": 1, "dropped": 0}
+    assert [h["X-OmniScope-Attempt"] for h in headers] == ["1", "2", "3"]
+    body = [body for path, body in server.posts if path == "/hook"][-1]
+    assert headers[-1]["X-OmniScope-Signature"] == sign_payload(body, "whsec_test")
+    payload = json.loads(body)
+    assert payload["alert_id"] == 7 and payload["value"] == 2.5 and payload["direction"] == "up"
+
+def fake_dns(monkeypatch):
+    # 테스트 환경에는 DNS가 없으므로 호스트별 주소를 고정
+    hosts = {"example.com": ["93.184.216.34", "2606:2800:220:1:248:1893:25c8:1946"],
+             "metadata.example.com": ["169.254.169.254"], "rebind.example.com": ["8.8.8.8", "10.0.0.5"],
+             "localhost": ["127.0.0.1", "::1"]}
+    # IP 리터럴은 그대로 반환
+    monkeypatch.setattr(webhooks, "resolve_host", lambda host, port: hosts.get(host, [host]))
+
+def test_webhook_destination_checks(monkeypatch):
+    """사설/루프백/링크 로컬 주소 웹훅 거부, 전송 시 재확인 및 리다이렉트 미추종 테스트"""
+    fake_dns(monkeypatch)
+    check_webhook_url("https://example.com/hook")
+    check_webhook_url("http://8.8.8.8/hook")
+    for url in ("http://metadata.example.com/latest", "https://rebind.example.com/", "http://[::ffff:127.0.0.1]/",
+                "http://localhost:8000/", "http://192.168.0.1/", "http://[fe80::1]/", "http:///path"):
+        with pytest.raises(ValueError):
+            check_webhook_url(url)
+
+    # 등록 후 내부 주소로 바뀐 호스트는 요청 없이 재시도 없이 실패
+    dispatcher = WebhookDispatcher(max_attempts=3)
+    dispatcher.enqueue("http://metadata.example.com/latest", {"alert_id": 1})
+    assert dispatcher.deliver(dispatcher._next()) is False
+    assert dispatcher.status()["failed"] == 1 and dispatcher.pending() == 0
+
+    with StubServer({"/hook": lambda handler: (302, {"Location": "/internal"}, {}), "/internal": {}}) as server:
+        dispatcher = WebhookDispatcher(max_attempts=1, allow_private=True)
+        dispatcher.enqueue(f"{server.base_url}/hook", {"alert_id": 1})
+        assert dispatcher.deliver(dispatcher._next()) is False
+    assert [path for path, body in server.posts] == ["/hook"]
+    assert server.requests == ["/hook"]
+
+def test_alert_rule_endpoints(client, monkeypatch):
+    """알림 규칙 등록, 조회, 삭제 엔드포인트 테스트"""
+    engine = AlertEngine(WebhookDispatcher())
+    bus = EventBus()
+    bus.subscribe_callback("alerts.rules.*", engine.apply_rule_event)
+    monkeypatch.setattr(alerts, "alert_engine", engine)
+    monkeypatch.setattr(alerts, "event_bus", bus)
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: SimpleNamespace(id=1)
+    fake_dns(monkeypatch)
+
+    response = client.post("/alerts/", json={
+        "metric": "funding_rate", "symbol": "btc", "exchange": "Bybit", "condition": "flips_sign",
+        "webhook_url": "https://example.com/hook",
+    })
+    assert response.status_code == 201
+    rule = response.json()
+    assert rule["secret"].startswith("whsec_") and rule["symbol"] == "BTC"
+    assert engine.get(rule["id"]).stream == "funding_rate:bybit:BTC"
+
+    engine.observe(("funding_rate", "Bybit", "BTC/USDT"), 1718874000, 0.0003)
+    listed = client.get("/alerts/").json()
+    assert [(r["id"], r["current_value"]) for r in listed] == [(rule["id"], 0.0003)]
+    assert "secret" not in listed[0]
+
+    assert client.post("/alerts/", json={
+        "metric": "volume", "symbol": "BTC", "condition": "above", "threshold": 1, "webhook_url": "https://example.com",
+    }).status_code == 400
+    assert client.post("/alerts/", json={
+        "metric": "price", "symbol": "BTC", "condition": "above", "threshold": 1, "webhook_url": "ftp://example.com",
+    }).status_code == 422
+    response = client.post("/alerts/", json={
+        "metric": "price", "symbol": "BTC", "condition": "above", "threshold": 1,
+        "webhook_url": "http://metadata.example.com/latest/meta-data",
+    })
+    assert response.status_code == 400 and "non-public address" in response.json()["detail"]
+
+    assert client.delete(f"/alerts/{rule['id']}").status_code == 204
+    assert engine.get(rule["id"]) is None
+    assert client.get("/alerts/").json() == []
+    assert client.delete(f"/alerts/{rule['id']}").status_code == 404
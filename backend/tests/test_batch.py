@@ -0,0 +1,84 @@
+import hashlib
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import COST_PER_CALL
+from app.models import APIKey, APIUsage, User
+from app.routers import crypto
+
+def create_api_key(db):
+    db.add(User(wallet_address="0xbatch"))
+    db.commit()
+    api_key = APIKey(key_id="hsk_batch", secret_key_hash=hashlib.sha256(b"sk_batch").hexdigest(), user_wallet="0xbatch")
+    db.add(api_key)
+    db.commit()
+    return {"api-key-id": "hsk_batch", "api-key-secret": "sk_batch"}
+
+def test_batch_executes_items_with_single_billing(client, test_db):
+    """배치 요청 항목별 결과 및 1회 과금 테스트"""
+    headers = create_api_key(test_db)
+    response = client.post("/batch", headers=headers, json={"requests": [
+        {"path": "/projects/hsk"},
+        {"path": "/search?q=blob", "params": {"source": "eips"}},
+        {"path": "/opensource/unknown"},
+        {"path": "/users/me"},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success_count"] == 2
+    assert [item["status"] for item in data["results"]] == [200, 200, 404, 400]
+    assert data["results"][1]["body"]["results"][0]["id"] == "eip-4844"
+    assert "Repository not tracked" in data["results"][2]["error"]
+
+    # 검증은 한 번, 사용량 기록은 실행된 3개 항목을 합산한 한 건
+    billed = test_db.query(APIUsage).filter(APIUsage.cost > 0).all()
+    assert [(usage.endpoint, usage.cost) for usage in billed] == [("/batch", 3 * COST_PER_CALL)]
+
+def test_batch_requires_api_key(client, test_db):
+    """배치 요청 인증 실패 테스트"""
+    create_api_key(test_db)
+    response = client.post("/batch", headers={"api-key-id": "hsk_batch", "api-key-secret": "wrong"},
+                           json={"requests": [{"path": "/projects/hsk"}]})
+    assert response.status_code == 401
+
+def test_batch_overlaps_blocking_handlers(client, test_db, monkeypatch):
+    """async def 안에서 블로킹 호출을 하는 핸들러도 배치에서 동시에 실행되는지 테스트"""
+    headers = create_api_key(test_db)
+
+    def slow_price(symbol):
+        time.sleep(0.3)
+        return 65000.0
+
+    monkeypatch.setattr(crypto, "fetch_binance_price", slow_price)
+    started = time.perf_counter()
+    response = client.post("/batch", headers=headers, json={"requests": [{"path": "/crypto/btc/usd"}] * 4})
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert response.json()["success_count"] == 4
+    assert elapsed < 0.9
+
+def test_batch_isolates_failing_item(client, test_db, monkeypatch):
+    """한 항목의 핸들러에서 처리되지 않은 예외가 나도 나머지 결과와 과금이 유지되는지 테스트"""
+    headers = create_api_key(test_db)
+
+    def broken_price(symbol):
+        raise RuntimeError("upstream parser crashed")
+
+    monkeypatch.setattr(crypto, "fetch_binance_price", broken_price)
+    response = client.post("/batch", headers=headers, json={"requests": [
+        {"path": "/crypto/btc/usd"},
+        {"path": "/projects/hsk"},
+    ]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success_count"] == 1
+    assert [item["status"] for item in data["results"]] == [500, 200]
+    assert "upstream parser crashed" in data["results"][0]["error"]
+    billed = test_db.query(APIUsage).filter(APIUsage.cost > 0).all()
+    assert [(usage.endpoint, usage.cost) for usage in billed] == [("/batch", 2 * COST_PER_CALL)]
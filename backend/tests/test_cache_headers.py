@@ -0,0 +1,64 @@
+import os
+import sys
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.main import app
+from app.utils.cache_headers import DEFAULT_CACHE_TTLS, CacheHeadersMiddleware, ttl_for_path
+
+def test_ttl_for_path():
+    """경로별 캐시 TTL 조회 테스트"""
+    assert ttl_for_path("/crypto/btc/usd", DEFAULT_CACHE_TTLS) == 5
+    assert ttl_for_path("/opensource", DEFAULT_CACHE_TTLS) == 300
+    assert ttl_for_path("/cryptography", DEFAULT_CACHE_TTLS) is None
+    assert ttl_for_path("/auth/nonce", DEFAULT_CACHE_TTLS) is None
+
+def test_etag_revalidation():
+    """ETag 및 Cache-Control 헤더와 304 재검증 테스트"""
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/api-catalog/categories")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, max-age=300"
+        etag = response.headers["etag"]
+
+        response = client.get("/api-catalog/categories", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = client.get("/api-catalog/categories", headers={"If-None-Match": 'W/"stale"'})
+        assert response.status_code == 200
+    finally:
+        app.dependency_overrides = {}
+
+def test_fresh_revalidation_skips_handler():
+    """max-age 안의 재검증은 인증만 거치고 핸들러 실행 없이 304로 응답하는지 테스트"""
+    calls, clock = [], [0.0]
+    authorized = {"valid"}
+    demo = FastAPI()
+    demo.add_middleware(CacheHeadersMiddleware, ttls={"/crypto": 5}, clock=lambda: clock[0],
+                        authenticate=lambda request: request.headers.get("api-key-id") in authorized)
+
+    @demo.get("/crypto/price")
+    async def price():
+        calls.append(1)
+        return {"price": 65000.0}
+
+    client = TestClient(demo)
+    etag = client.get("/crypto/price").headers["etag"]
+    response = client.get("/crypto/price", headers={"If-None-Match": etag, "api-key-id": "valid"})
+    assert response.status_code == 304 and response.headers["etag"] == etag
+    assert len(calls) == 1
+
+    # 인증에 실패하거나 쿼리가 다르거나 max-age가 지나면 핸들러를 실행해 비교
+    assert client.get("/crypto/price", headers={"If-None-Match": etag, "api-key-id": "bad"}).status_code == 304
+    assert client.get("/crypto/price?x=1", headers={"If-None-Match": etag, "api-key-id": "valid"}).status_code == 304
+    clock[0] = 5.0
+    assert client.get("/crypto/price", headers={"If-None-Match": etag, "api-key-id": "valid"}).status_code == 304
+    assert len(calls) == 4
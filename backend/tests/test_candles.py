@@ -0,0 +1,146 @@
+import os
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion import candles
+from app.ingestion.candles import BinanceTradeFeed, UpbitTradeFeed
+from app.main import app
+from app.routers import crypto
+from app.timeseries import CANDLE_INTERVALS, CandleSeries, CandleStore
+from tests.stub_server import StubServer, load_fixture
+
+MINUTE_0859 = 1718873940.0  # 2024-06-20 08:59:00 UTC
+
+def test_fold_rollover_and_memmap_reload(tmp_path):
+    """봉 증분 집계, 용량 초과 시 롤오버, 메모리 맵 파일 재오픈 테스트"""
+    path = str(tmp_path / "btc.candles")
+    series = CandleSeries(60, 3, path)
+    assert series.fold(np.array([0.5, 30.0, 59.0]), np.array([10.0, 12.0, 11.0]), np.array([1.0, 2.0, 3.0])) == 3
+    assert series.fold(np.array([59.5, 61.0]), np.array([9.0, 13.0]), np.array([1.0, 1.0])) == 2
+    bars = series.latest(10)
+    assert bars["timestamp"].tolist() == [0.0, 60.0]
+    assert bars[0].tolist()[1:7] == (10.0, 12.0, 9.0, 9.0, 7.0, 4)
+
+    # 용량 3을 넘어서면 같은 슬롯의 가장 오래된 봉을 덮어씀
+    series.fold(np.array([185.0]), np.array([14.0]), np.array([1.0]))
+    assert series.latest(10)["timestamp"].tolist() == [60.0, 180.0]
+    series.flush()
+
+    reopened = CandleSeries(60, 3, path)
+    assert reopened.latest(10)["close"].tolist() == [13.0, 14.0]
+    assert reopened.last_trade_time == 185.0
+
+def test_store_deduplicates_by_trade_id(tmp_path):
+    """같은 시각의 체결도 체결 ID로만 중복을 거르고, 재시작 후에도 커서를 이어가는지 테스트"""
+    store = CandleStore(str(tmp_path))
+    assert store.fold("binance", "BTCUSDT", [10.0, 20.0, 20.0], [1.0, 2.0, 3.0], [1.0, 1.0, 1.0], [1, 2, 3]) == 3
+    # 이전 폴링의 마지막 체결과 같은 밀리초의 새 체결은 반영
+    assert store.fold("binance", "BTCUSDT", [20.0, 20.0], [3.0, 4.0], [1.0, 1.0], [3, 4]) == 1
+    store.flush()
+
+    reopened = CandleStore(str(tmp_path))
+    assert reopened.last_trade_id("binance", "BTCUSDT") == 4
+    assert reopened.fold("binance", "BTCUSDT", [20.0, 21.0], [4.0, 5.0], [1.0, 1.0], [4, 5]) == 1
+    assert reopened.candles(("binance", "BTCUSDT"), "1m", 1)["trades"].tolist() == [5]
+
+def test_store_creates_files_on_first_fold(tmp_path):
+    """커서 조회만으로는 파일을 만들지 않고 첫 fold 때 캔들 파일을 생성하는지 테스트"""
+    directory = tmp_path / "candles"
+    store = CandleStore(str(directory))
+    assert store.last_trade_id("binance", "BTCUSDT") is None
+    assert not directory.exists()
+    assert store.keys() == []
+
+    store.fold("binance", "BTCUSDT", [10.0], [1.0], [1.0], [1])
+    assert sorted(os.listdir(directory)) == [f"binance__BTCUSDT__{interval}.candles" for interval in sorted(CANDLE_INTERVALS)]
+
+def historical_trades_route(handler):
+    # 바이낸스처럼 fromId부터 limit개의 체결을 반환
+    query = parse_qs(urlsplit(handler.path).query)
+    trades = [trade for trade in load_fixture("binance", "trades_btcusdt.json") if trade["id"] >= int(query["fromId"][0])]
+    return 200, {}, trades[:int(query["limit"][0])]
+
+def ticks_route(handler):
+    # 업비트처럼 최신 체결부터, cursor가 있으면 그보다 이전 체결을 count개 반환
+    query = parse_qs(urlsplit(handler.path).query)
+    ticks = load_fixture("upbit", "trades_ticks_krw_btc.json")
+    if "cursor" in query:
+        ticks = [tick for tick in ticks if tick["sequential_id"] < int(query["cursor"][0])]
+    return 200, {}, ticks[:int(query["count"][0])]
+
+def test_trade_feeds_fold_only_new_trades():
+    """거래소별 최근 체결 폴링 시 새 체결만 집계하는 테스트"""
+    routes = {
+        "/api/v3/trades": load_fixture("binance", "trades_btcusdt.json"),
+        "/api/v3/historicalTrades": historical_trades_route,
+        "/v1/trades/ticks": ticks_route,
+    }
+    store = CandleStore()
+    with StubServer(routes) as server:
+        binance = BinanceTradeFeed("BTCUSDT", base_url=server.base_url)
+        upbit = UpbitTradeFeed("KRW-BTC", base_url=server.base_url)
+        assert store.fold("binance", "BTCUSDT", *binance.collect()) == 8
+        assert store.fold("upbit", "KRW-BTC", *upbit.collect()) == 4
+        # 같은 응답을 다시 받으면 새 체결 없음
+        assert len(binance.collect()[0]) == 0
+        assert len(upbit.collect()[0]) == 0
+
+    minute = store.candles(("binance", "BTCUSDT"), "1m", 10)
+    assert minute["timestamp"].tolist() == [MINUTE_0859, MINUTE_0859 + 60, MINUTE_0859 + 120]
+    assert minute[0].tolist()[1:5] == (64990.0, 65010.5, 64980.0, 64980.0)
+    assert minute["volume"][0] == pytest.approx(0.515)
+    assert store.candles(("binance", "BTCUSDT"), "1h", 10)["trades"].tolist() == [4, 4]
+    assert store.candles(("upbit", "KRW-BTC"), "1d", 10)["close"].tolist() == [93530000.0]
+
+def test_trade_feeds_page_forward_and_report_gaps():
+    """마지막 체결 ID 이후를 페이지 단위로 이어서 가져오고, 닿지 못한 구간을 누락으로 기록하는 테스트"""
+    routes = {"/api/v3/historicalTrades": historical_trades_route, "/v1/trades/ticks": ticks_route}
+    with StubServer(routes) as server:
+        binance = BinanceTradeFeed("BTCUSDT", base_url=server.base_url)
+        binance.PAGE_SIZE, binance.last_trade_id = 3, 3601001
+        assert binance.collect()[3].tolist() == list(range(3601002, 3601008))
+        assert [parse_qs(urlsplit(path).query)["fromId"] for path in server.requests] == [["3601002"], ["3601005"], ["3601008"]]
+
+        upbit = UpbitTradeFeed("KRW-BTC", base_url=server.base_url)
+        upbit.PAGE_SIZE, upbit.last_trade_id = 2, 17188739700000000
+        assert len(upbit.collect()[0]) == 3
+        assert upbit.gap_count == 0
+
+    with StubServer(routes) as server, pytest.MonkeyPatch.context() as patch:
+        patch.setattr(candles, "MAX_PAGES", 2)
+        upbit = UpbitTradeFeed("KRW-BTC", base_url=server.base_url)
+        upbit.PAGE_SIZE, upbit.last_trade_id = 1, 17188739700000000 - 1
+        assert len(upbit.collect()[0]) == 2
+        assert upbit.gap_count == 1
+
+def test_candles_endpoint(monkeypatch):
+    """캔들 엔드포인트 조회 및 오류 응답 테스트"""
+    store = CandleStore()
+    store.fold("binance", "BTCUSDT", MINUTE_0859 + np.arange(600) * 10.0, 65000.0 + np.arange(600), np.ones(600))
+    monkeypatch.setattr(crypto, "candle_store", store)
+    monkeypatch.setattr(crypto.candle_engine, "has_collected", lambda: True)
+
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/candles", params={"symbol": "btc/usdt", "interval": "5m", "limit": 3})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["symbol"] == "BTCUSDT"
+        assert [candle["trades"] for candle in data["candles"]] == [30, 30, 24]
+        assert data["candles"][-1]["close"] == 65599.0
+
+        response = client.get("/crypto/candles", params={"interval": "1m", "to": "2024-06-20T18:00:30+09:00"})
+        assert response.json()["candles"][-1]["timestamp"] == "2024-06-20T09:00:00"
+        assert client.get("/crypto/candles", params={"interval": "3m"}).status_code == 400
+        assert client.get("/crypto/candles", params={"symbol": "KRW-DOGE", "exchange": "upbit"}).status_code == 404
+    finally:
+        app.dependency_overrides = {}
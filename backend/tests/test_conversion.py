@@ -0,0 +1,83 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.conversion import RateGraph
+from app.main import app
+from app.routers import crypto
+from tests.stub_server import load_fixture
+
+NOW = 1718874001.0  # 업비트 fixture 시세 직후
+
+def upbit_tickers():
+    return {ticker["market"]: ticker for ticker in load_fixture("upbit", "ticker.json")}
+
+def test_best_path_and_invalidation_on_update():
+    """직접 시세 우선 경로 선택, 교차 환산, 시세 갱신 시 경로 재계산 및 만료 간선 제외 테스트"""
+    graph = RateGraph(max_age=60)
+    graph.update_upbit(upbit_tickers(), timestamp=NOW)
+    graph.update_binance(load_fixture("binance", "ticker_price.json"), timestamp=NOW)
+    graph.update_fx("USD", "KRW", 1380.0, timestamp=NOW)
+
+    # 업비트 KRW-ETH 직접 시세 (바이낸스 경유보다 홉 수가 적음)
+    conversion = graph.convert("eth", "krw", now=NOW)
+    assert conversion.rate == 4901000.0
+    assert [edge.source for edge in conversion.path] == ["upbit"]
+    assert graph.convert("ETH", "BTC", now=NOW).rate == pytest.approx(0.05223)
+
+    # 업비트에 없는 BNB는 바이낸스 BNB/USDT와 업비트 KRW-USDT를 거쳐 환산 (역방향은 역수)
+    conversion = graph.convert("BNB", "KRW", now=NOW)
+    assert [(edge.base, edge.quote, edge.source) for edge in conversion.path] == [
+        ("BNB", "USDT", "binance"), ("USDT", "KRW", "upbit")]
+    assert conversion.rate == pytest.approx(585.3 * 1389.0)
+    assert graph.convert("KRW", "BNB", now=NOW).rate == pytest.approx(1 / (585.3 * 1389.0))
+    assert graph.convert("ABC", "KRW", now=NOW) is None
+
+    # 업비트 시세가 만료된 뒤 바이낸스/환율만 갱신되면 USDT=USD 페그와 환율 경로로 전환
+    later = NOW + 120
+    graph.update_binance([{"symbol": "BNBUSDT", "price": "600.0"}], timestamp=later)
+    graph.update_fx("USD", "KRW", 1390.0, timestamp=later)
+    conversion = graph.convert("BNB", "KRW", now=later)
+    assert [edge.source for edge in conversion.path] == ["binance", "peg", "fx"]
+    assert conversion.rate == pytest.approx(600.0 * 1390.0)
+    assert graph.convert("ETH", "KRW", now=later) is None
+
+def test_convert_endpoint_refreshes_stale_graph(monkeypatch):
+    """환산 엔드포인트가 오래된 그래프만 전체 시세로 갱신하는 테스트"""
+    calls = []
+
+    def fetch_upbit():
+        calls.append("upbit")
+        return upbit_tickers()
+
+    monkeypatch.setattr(crypto, "rate_graph", RateGraph(max_age=1e10))
+    monkeypatch.setattr(crypto, "upbit_all_racer", SimpleNamespace(fetch=fetch_upbit))
+    monkeypatch.setattr(crypto, "binance_all_racer", SimpleNamespace(
+        fetch=lambda: load_fixture("binance", "ticker_price.json")))
+    monkeypatch.setattr(crypto, "get_usd_krw_rate", lambda: 1380.0)
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/convert", params={"from": "eth", "to": "krw", "amount": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["from_currency"] == "ETH" and data["to_currency"] == "KRW"
+        assert data["converted_amount"] == 9802000.0
+        assert data["path"][0]["source"] == "upbit"
+
+        response = client.get("/crypto/convert", params={"from": "SOL", "to": "BNB"})
+        assert [hop["quote"] for hop in response.json()["path"]] == ["USDT", "BNB"]
+        # 갱신 주기 안의 두 번째 요청은 캐시된 그래프 사용
+        assert calls == ["upbit"]
+
+        assert client.get("/crypto/convert", params={"from": "ABC", "to": "KRW"}).status_code == 404
+        assert client.get("/crypto/convert", params={"from": "ETH", "to": "KRW", "amount": 0}).status_code == 422
+    finally:
+        app.dependency_overrides = {}
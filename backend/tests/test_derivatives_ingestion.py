@@ -0,0 +1,90 @@
+import os
+import sys
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.derivatives import (BinanceAdapter, BybitAdapter, DeribitAdapter,
+                                       DerivativesStore, OKXAdapter,
+                                       create_derivatives_engine)
+from tests.stub_server import StubServer, load_fixture
+
+ADAPTERS = [
+    (BinanceAdapter, "binance.json"),
+    (BybitAdapter, "bybit.json"),
+    (OKXAdapter, "okx.json"),
+    (DeribitAdapter, "deribit.json"),
+]
+
+def make_routes():
+    routes = {}
+    for _, fixture in ADAPTERS:
+        routes.update(load_fixture("derivatives", fixture))
+    return routes
+
+def test_adapters_normalize_fixtures():
+    """거래소별 응답이 공통 형식으로 정규화되는지 테스트"""
+    with StubServer(make_routes()) as server:
+        for adapter_cls, _ in ADAPTERS:
+            adapter = adapter_cls(base_url=server.base_url)
+            funding_rates, open_interest = adapter.collect()
+
+            assert len(funding_rates) == 2
+            assert len(open_interest) == 2
+            for funding in funding_rates:
+                assert funding["exchange"] == adapter.name
+                assert funding["interval"] == "8h"
+                assert isinstance(funding["next_funding_time"], datetime)
+            for oi in open_interest:
+                assert oi["open_interest"] > 0
+                assert oi["open_interest_usd"] > oi["open_interest"]
+
+def test_binance_values():
+    """바이낸스 펀딩비와 미결제약정 USD 환산값 테스트"""
+    with StubServer(load_fixture("derivatives", "binance.json")) as server:
+        funding_rates, open_interest = BinanceAdapter(symbols=["BTC"], base_url=server.base_url).collect()
+
+    assert funding_rates[0]["symbol"] == "BTC/USDT"
+    assert funding_rates[0]["rate"] == 0.0001
+    assert funding_rates[0]["next_funding_time"] == datetime(2024, 6, 20, 16, 0)
+    assert abs(open_interest[0]["open_interest_usd"] - 81234.567 * 67012.4) < 1e-3
+
+def test_engine_collects_concurrently_and_tracks_status():
+    """엔진 병렬 수집 및 거래소별 최신성/지연 시간 추적 테스트"""
+    store = DerivativesStore()
+    with StubServer(make_routes()) as server:
+        adapters = [cls(base_url=server.base_url) for cls, _ in ADAPTERS]
+        engine = create_derivatives_engine(store, adapters=adapters)
+        assert engine.collect_once() == 4
+
+    assert engine.has_collected()
+    assert len(store.funding_rates()) == 8
+    assert {item["exchange"] for item in store.open_interest()} == {"Binance", "Bybit", "OKX", "Deribit"}
+
+    for item in engine.status():
+        assert item["error_count"] == 0
+        assert item["freshness_seconds"] is not None
+        assert item["last_latency_ms"] >= 0
+
+def test_engine_records_failures():
+    """스텁에 없는 경로 요청 시 실패가 기록되는지 테스트"""
+    store = DerivativesStore()
+    with StubServer({}) as server:
+        adapter = BinanceAdapter(base_url=server.base_url)
+        engine = create_derivatives_engine(store, adapters=[adapter])
+        assert engine.collect_once() == 0
+
+    status = engine.status()[0]
+    assert status["error_count"] == 1
+    assert status["freshness_seconds"] is None
+    assert store.funding_rates() == []
+
+def test_open_interest_change_24h():
+    """미결제약정 24시간 변화율 계산 테스트"""
+    store = DerivativesStore()
+    record = {"symbol": "BTC/USDT", "exchange": "Binance", "open_interest": 100.0, "open_interest_usd": 1.0}
+    store.add([], [record], timestamp=1000.0)
+    store.add([], [dict(record, open_interest=110.0)], timestamp=2000.0)
+
+    assert abs(store.open_interest()[0]["change_24h"] - 10.0) < 1e-9
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.events import EventBus, UnixSocketTransport, event_bus, series_topic, topic_matches
+from app.main import app
+from app.routers import events
+
+def test_topic_wildcards_and_slow_consumer_policies():
+    """토픽 와일드카드 매칭 및 느린 구독자 큐 정책(drop_oldest, drop_newest, coalesce) 테스트"""
+    assert topic_matches("kimchi.*.BTC", "kimchi.premium_percentage.BTC")
+    assert not topic_matches("kimchi.*.BTC", "kimchi.premium_percentage.ETH")
+    assert not topic_matches("kimchi.*", "kimchi.premium_percentage.BTC")
+    assert topic_matches("derivatives.#", "derivatives.funding_rate.Binance.BTC/USDT")
+    assert series_topic("derivatives", ("funding_rate", "Binance", "BTC/USDT")) == "derivatives.funding_rate.Binance.BTC/USDT"
+
+    async def run():
+        bus = EventBus()
+        oldest = bus.subscribe("kimchi.#", maxsize=2, policy="drop_oldest")
+        newest = bus.subscribe("kimchi.#", maxsize=2, policy="drop_newest")
+        latest = bus.subscribe(["kimchi.*.BTC", "kimchi.*.ETH"], maxsize=2, policy="coalesce")
+        callbacks = []
+        bus.subscribe_callback("kimchi.premium_percentage.*", callbacks.append)
+
+        for value in (1.0, 2.0, 3.0):
+            bus.publish("kimchi.premium_percentage.BTC", value)
+        bus.publish("kimchi.premium_percentage.ETH", 4.0)
+        bus.publish("derivatives.funding_rate.Binance.BTC/USDT", 0.0001)
+        # 수집 스레드에서 발행한 이벤트도 구독자 루프로 전달
+        thread = threading.Thread(target=bus.publish, args=("kimchi.premium_percentage.ETH", 5.0))
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+
+        assert [oldest.get_nowait().payload for _ in range(2)] == [4.0, 5.0] and oldest.dropped_count == 3
+        assert [newest.get_nowait().payload for _ in range(2)] == [1.0, 2.0] and newest.dropped_count == 3
+        assert [(await latest.get()).payload for _ in range(2)] == [3.0, 5.0] and latest.qsize() == 0
+        assert [event.payload for event in callbacks] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        latest.close()
+        assert [event async for event in latest] == []
+        assert bus.status() == {"leader": True, "published": 6, "subscribers": 2, "dropped": 6}
+
+    asyncio.run(run())
+
+def test_unix_socket_transport_shares_events_across_buses(tmp_path):
+    """유닉스 소켓 트랜스포트로 리더 선출, 팔로워 간 이벤트 중계 및 리더 승격 테스트"""
+    path = str(tmp_path / "bus.sock")
+
+    async def run():
+        leader = EventBus(UnixSocketTransport(path, reconnect_delay=0.05))
+        followers = [EventBus(UnixSocketTransport(path, reconnect_delay=0.05)) for _ in range(2)]
+        await leader.start()
+        for follower in followers:
+            await follower.start()
+        assert leader.is_leader and not any(follower.is_leader for follower in followers)
+        while sum(1 for _ in leader.transport._peers) < 2:
+            await asyncio.sleep(0.01)
+
+        at_leader = leader.subscribe("kimchi.#")
+        at_follower = followers[1].subscribe("kimchi.#")
+        leader.publish("kimchi.premium_percentage.BTC", {"value": 2.5})
+        followers[0].publish("kimchi.premium_percentage.ETH", {"value": 1.5})
+        received = [await asyncio.wait_for(at_follower.get(), 5) for _ in range(2)]
+        assert sorted(event.payload["value"] for event in received) == [1.5, 2.5]
+        received = [await asyncio.wait_for(at_leader.get(), 5) for _ in range(2)]
+        assert [event.topic for event in received] == ["kimchi.premium_percentage.BTC", "kimchi.premium_percentage.ETH"]
+
+        # 리더가 종료되면 팔로워 하나가 승격되어 이어받음
+        promoted = []
+        for follower in followers:
+            follower.on_leader(lambda follower=follower: promoted.append(follower))
+        await leader.stop()
+        while not promoted:
+            await asyncio.sleep(0.01)
+        assert len(promoted) == 1 and promoted[0].is_leader
+        for follower in followers:
+            await follower.stop()
+
+    asyncio.run(run())
+
+def test_stream_endpoint():
+    """웹소켓 스트림 엔드포인트의 토픽 구독 및 내부 토픽 거부 테스트"""
+    app.dependency_overrides[events.get_stream_api_key] = lambda: None
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        with TestClient(app) as client:
+            with client.websocket_connect("/events/stream?topics=kimchi.*.BTC,derivatives.%23&policy=drop_oldest") as ws:
+                point = {"key": ["premium_percentage", "BTC"], "timestamp": 1718874000, "value": 2.5}
+                event_bus.publish("kimchi.premium_percentage.ETH", dict(point, key=["premium_percentage", "ETH"]))
+                event_bus.publish("kimchi.premium_percentage.BTC", point, 1718874000)
+                message = ws.receive_json()
+                assert message == {"topic": "kimchi.premium_percentage.BTC", "data": point,
+                                   "timestamp": 1718874000, "dropped": 0}
+                assert client.get("/events/status").json()["subscribers"] >= 1
+
+            with pytest.raises(WebSocketDisconnect):
+                with client.websocket_connect("/events/stream?topics=alerts.%23") as ws:
+                    ws.receive_json()
+    finally:
+        app.dependency_overrides = {}
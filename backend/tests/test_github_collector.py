@@ -0,0 +1,180 @@
+import os
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.github import (GitHubRepoCollector, RepositoryMirror, create_github_engine,
+                                  github_mirrors, parse_repositories)
+from app.main import app
+from tests.stub_server import StubServer
+
+REPO = "/repos/bitcoin/bitcoin"
+
+def make_pull(number, updated_at, state="open", merged_at=None):
+    return {
+        "number": number, "title": f"PR {number}", "user": {"login": f"dev{number}"},
+        "created_at": "2024-06-01T00:00:00Z", "updated_at": updated_at, "state": state,
+        "merged_at": merged_at, "html_url": f"https://github.com/bitcoin/bitcoin/pull/{number}",
+        "comments": 2, "review_comments": 3, "additions": 10 * number, "deletions": number,
+    }
+
+class FakeGitHub:
+    """ETag 조건부 요청을 지원하는 GitHub API 스텁"""
+
+    def __init__(self):
+        self.version = 1
+        self.pulls = [make_pull(3, "2024-06-20T12:00:00Z"), make_pull(2, "2024-06-19T12:00:00Z"),
+                      make_pull(1, "2024-06-18T12:00:00Z", "closed", "2024-06-18T12:00:00Z")]
+
+    def conditional(self, etag, body, headers=None):
+        def route(handler):
+            if handler.headers.get("If-None-Match") == etag:
+                return 304, {"ETag": etag}, b""
+            return 200, dict(headers or {}, ETag=etag), body
+        return route
+
+    def routes(self):
+        def pulls(handler):
+            page = int(parse_qs(urlsplit(handler.path).query)["page"][0])
+            body = self.pulls[(page - 1) * 2:page * 2]
+            return self.conditional(f'"pulls-{self.version}"', body)(handler)
+
+        def detail(number):
+            return lambda handler: self.conditional(
+                f'"pr-{number}-{self.version}"', next(p for p in self.pulls if p["number"] == number))(handler)
+
+        return {
+            REPO: self.conditional('"repo"', {
+                "stargazers_count": 72500, "forks_count": 34200, "open_issues_count": 1250,
+                "subscribers_count": 4800, "pushed_at": "2024-06-20T12:00:00Z"}),
+            f"{REPO}/releases/latest": self.conditional('"release"', {
+                "tag_name": "v27.1", "published_at": "2024-06-17T00:00:00Z"}),
+            f"{REPO}/contributors": self.conditional('"contributors"', [{"login": "sipa"}], {
+                "Link": f'<https://api.github.com{REPO}/contributors?per_page=1&anon=true&page=890>; rel="last"'}),
+            f"{REPO}/pulls": pulls,
+            **{f"{REPO}/pulls/{n}": detail(n) for n in (1, 2, 3, 4)},
+        }
+
+def test_parse_repositories():
+    """추적 저장소 설정 파싱 테스트"""
+    assert parse_repositories("bitcoin=bitcoin/bitcoin, ethereum/go-ethereum") == {
+        "bitcoin": "bitcoin/bitcoin", "go-ethereum": "ethereum/go-ethereum"}
+
+def test_incremental_sync_with_conditional_requests(tmp_path):
+    """ETag 조건부 요청 및 PR 증분 동기화 테스트"""
+    fake = FakeGitHub()
+    path = str(tmp_path / "bitcoin.json")
+    with StubServer(fake.routes()) as server:
+        mirror = RepositoryMirror("bitcoin", "bitcoin/bitcoin", path)
+        engine = create_github_engine({"bitcoin": mirror}, base_url=server.base_url, max_pull_requests=2)
+        assert engine.collect_once() == 1
+
+        snapshot = mirror.snapshot()
+        assert snapshot["stats"]["contributors_count"] == 890
+        assert snapshot["stats"]["release_version"] == "v27.1"
+        assert [pr["id"] for pr in snapshot["pull_requests"]] == [3, 2]
+        assert snapshot["pull_requests"][0]["comments"] == 5
+
+        # 변경 없음: 모든 요청이 304, PR 상세 재조회 없음
+        server.requests.clear()
+        assert engine.collect_once() == 1
+        assert len(server.requests) == 4
+        assert engine.sources[0].fetcher.not_modified_count == 4
+
+        # PR 1이 갱신되면 워터마크 이후 변경분만 상세 조회
+        fake.version = 2
+        fake.pulls = [make_pull(1, "2024-06-21T12:00:00Z", "closed", "2024-06-21T12:00:00Z")] + fake.pulls[:2]
+        server.requests.clear()
+        engine.collect_once()
+        assert [p for p in server.requests if "/pulls/" in p] == [f"{REPO}/pulls/1"]
+        snapshot = mirror.snapshot()
+        assert [(pr["id"], pr["state"]) for pr in snapshot["pull_requests"]] == [(1, "merged"), (3, "open")]
+
+        # 재시작 후에도 미러와 ETag가 유지됨
+        restored = RepositoryMirror("bitcoin", "bitcoin/bitcoin", path)
+        assert restored.snapshot() == snapshot
+        server.requests.clear()
+        collector = GitHubRepoCollector(restored, base_url=server.base_url, max_pull_requests=2)
+        collector.collect()
+        assert collector.fetcher.not_modified_count == 4
+
+def test_not_modified_pull_request_keeps_mirror_entry():
+    """PR 상세가 304일 때 기존 미러 항목 유지 및 미러에서 빠진 PR의 검증자 정리 테스트"""
+    mirror = RepositoryMirror("bitcoin", "bitcoin/bitcoin")
+    mirror.pull_requests = {"3": dict(make_pull(3, "2024-06-20T12:00:00Z"), id=3, author="dev3", url="u")}
+    mirror.pr_watermark = "2024-06-20T12:00:00Z"
+    with StubServer({
+        f"{REPO}/pulls": [make_pull(3, "2024-06-22T12:00:00Z")],
+        f"{REPO}/pulls/3": lambda handler: (304, {"ETag": '"pr-3"'}, b""),
+    }) as server:
+        mirror.validators.update({f"{server.base_url}{REPO}/pulls/{n}": {"etag": f'"pr-{n}"'} for n in (3, 99)})
+        collector = GitHubRepoCollector(mirror, base_url=server.base_url, max_pull_requests=2)
+        assert collector.sync_pull_requests() == 1
+
+    assert mirror.pull_requests["3"]["updated_at"] == "2024-06-22T12:00:00Z"
+    assert mirror.pull_requests["3"]["additions"] == 30
+    assert [key.rsplit("/", 1)[1] for key in mirror.validators if "/pulls/" in key] == ["3"]
+
+def test_failed_optional_stats_keep_repository_stats(tmp_path):
+    """선택 통계 조회 실패 시 저장소 통계 유지 및 필수 통계 누락 시 조건부 요청 생략 테스트"""
+    fake = FakeGitHub()
+    routes = fake.routes()
+    contributors = routes[f"{REPO}/contributors"]
+    fail = {"contributors": True}
+    routes[f"{REPO}/contributors"] = lambda handler: (
+        (403, {}, {"message": "contributor list is too large"}) if fail["contributors"] else contributors(handler))
+    with StubServer(routes) as server:
+        mirror = RepositoryMirror("bitcoin", "bitcoin/bitcoin", str(tmp_path / "bitcoin.json"))
+        collector = GitHubRepoCollector(mirror, base_url=server.base_url)
+        assert collector.sync_stats()
+        assert mirror.stats["stars"] == 72500
+        assert mirror.stats["release_version"] == "v27.1"
+        assert "contributors_count" not in mirror.stats
+
+        fail["contributors"] = False
+        collector.sync_stats()
+        assert mirror.stats["contributors_count"] == 890
+
+        # 이전 버전에서 검증자만 저장되고 필수 통계가 빠진 미러는 조건부 요청 없이 다시 채움
+        mirror.stats = {"contributors_count": 890}
+        collector.sync_stats()
+        assert mirror.stats["stars"] == 72500
+        assert collector.fetcher.not_modified_count == 4
+
+    github_mirrors["bitcoin-partial"] = mirror
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        mirror.stats = {"stars": 1, "forks": 2, "open_issues": 3, "watchers": 4,
+                        "last_commit": "2024-06-20T12:00:00Z"}
+        assert client.get("/opensource/bitcoin-partial").json()["stats"]["contributors_count"] is None
+    finally:
+        app.dependency_overrides = {}
+        github_mirrors.pop("bitcoin-partial", None)
+
+def test_opensource_endpoint_serves_local_mirror():
+    """/opensource/{repo} 엔드포인트가 로컬 미러를 제공하는지 테스트"""
+    mirror = RepositoryMirror("testrepo", "example/testrepo")
+    mirror.stats = {"stars": 1, "forks": 2, "open_issues": 3, "watchers": 4,
+                    "last_commit": "2024-06-20T12:00:00Z", "contributors_count": 5}
+    mirror.pull_requests = {"7": dict(make_pull(7, "2024-06-20T12:00:00Z"), id=7, author="dev7", url="u")}
+    github_mirrors["testrepo"] = mirror
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/opensource/testrepo")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stats"]["stars"] == 1
+        assert data["stats"]["release_version"] is None
+        assert data["pull_requests"][0]["id"] == 7
+
+        assert client.get("/opensource/unknown").status_code == 404
+    finally:
+        app.dependency_overrides = {}
+        del github_mirrors["testrepo"]
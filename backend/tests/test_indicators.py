@@ -0,0 +1,108 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.main import app
+from app.routers import crypto
+from app.timeseries import CandleStore, Indicator, IndicatorCache, parse_indicator
+from app.timeseries.candles import CANDLE_DTYPE
+from app.timeseries.indicators import ema, rsi
+
+HOUR_START = 1718870400.0  # 2024-06-20 08:00:00 UTC
+
+def reference_ema(values, period):
+    alpha = 2 / (period + 1)
+    out = np.full(len(values), np.nan)
+    out[period - 1] = values[:period].mean()
+    for i in range(period, len(values)):
+        out[i] = alpha * values[i] + (1 - alpha) * out[i - 1]
+    return out
+
+def reference_rsi(closes, period):
+    deltas = np.diff(closes)
+    gains, losses = np.maximum(deltas, 0), np.maximum(-deltas, 0)
+    avg_gain, avg_loss = gains[:period].mean(), losses[:period].mean()
+    out = np.full(len(closes), np.nan)
+    out[period] = 100 - 100 / (1 + avg_gain / avg_loss)
+    for i in range(period + 1, len(closes)):
+        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        out[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+    return out
+
+def make_bars(closes):
+    bars = np.zeros(len(closes), dtype=CANDLE_DTYPE)
+    bars["timestamp"] = HOUR_START + np.arange(len(closes)) * 3600.0
+    bars["open"] = bars["close"] = closes
+    bars["high"], bars["low"] = closes + 1, closes - 1
+    bars["volume"] = 1.0 + np.arange(len(closes)) % 3
+    bars["trades"] = 1
+    return bars
+
+def test_kernels_and_incremental_updates_match_full_computation():
+    """벡터화 지표 계산과 증분 갱신이 전체 재계산 결과와 일치하는지 테스트"""
+    closes = 100 + np.cumsum(np.random.default_rng(7).normal(0, 1, 3000))
+    np.testing.assert_allclose(ema(closes, 50), reference_ema(closes, 50), rtol=1e-12)
+    np.testing.assert_allclose(rsi(closes, 14)[0], reference_rsi(closes, 14), rtol=1e-12)
+
+    bars = make_bars(closes)
+    for name in ("sma20", "ema50", "rsi14", "bb20", "vwap24"):
+        full = Indicator(name).advance(bars)
+        incremental = Indicator(name)
+        parts = [incremental.advance(bars[start:start + 7]) for start in range(0, len(bars), 7)]
+        for column, values in full.items():
+            np.testing.assert_allclose(np.concatenate([part[column] for part in parts]), values, rtol=1e-9)
+
+    assert parse_indicator("EMA50") == ("ema", 50)
+    with pytest.raises(ValueError):
+        parse_indicator("macd")
+
+def test_indicator_cache_processes_only_new_closed_candles(monkeypatch):
+    """새로 마감된 봉만 조회/계산하는 지표 캐시 및 엔드포인트 테스트"""
+    store = CandleStore()
+    closes = 100 + np.sin(np.arange(300) / 5) * 10
+    store.fold("binance", "BTCUSDT", HOUR_START + np.arange(300) * 3600.0 + 1, closes, np.ones(300))
+    now = HOUR_START + 300 * 3600.0
+    store.fold("binance", "BTCUSDT", [now + 5], [115.0], [1.0])
+    cache = IndicatorCache(store)
+    fetched = []
+    original_candles = store.candles
+    monkeypatch.setattr(store, "candles", lambda *args: fetched.append(args[2]) or original_candles(*args))
+
+    timestamps, values = cache.values(("binance", "BTCUSDT"), "1h", ["rsi14", "bb20"], limit=2, now=now + 10)
+    assert timestamps.tolist() == [HOUR_START + 298 * 3600.0, HOUR_START + 299 * 3600.0]
+    assert values["rsi14"][-1] == pytest.approx(reference_rsi(closes, 14)[-1])
+    assert set(values) == {"rsi14", "bb20.upper", "bb20.middle", "bb20.lower"}
+
+    # 봉 끝 시각이 지났어도 그 뒤의 체결이 아직 반영되지 않았으면 마감으로 보지 않음
+    store.fold("binance", "BTCUSDT", [now + 10, now + 3500], [120.0, 121.0], [1.0, 1.0])
+    timestamps, _ = cache.values(("binance", "BTCUSDT"), "1h", ["rsi14"], limit=1, now=now + 3610)
+    assert timestamps.tolist() == [now - 3600]
+
+    # 새 봉 하나가 마감되면 그 구간만 조회
+    store.fold("binance", "BTCUSDT", [now + 3605], [122.0], [1.0])
+    timestamps, values = cache.values(("binance", "BTCUSDT"), "1h", ["rsi14"], limit=1, now=now + 3610)
+    assert fetched == [store.capacity["1h"], 2, 2]
+    assert timestamps.tolist() == [now]
+    assert values["rsi14"][0] == pytest.approx(reference_rsi(np.r_[closes, 121.0], 14)[-1])
+
+    monkeypatch.setattr(crypto, "candle_store", store)
+    monkeypatch.setattr(crypto, "indicator_cache", cache)
+    monkeypatch.setattr(crypto.candle_engine, "has_collected", lambda: True)
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/indicators", params={"names": "sma20,ema50", "interval": "1h", "limit": 3})
+        assert response.status_code == 200
+        assert set(response.json()["values"]) == {"sma20", "ema50"}
+        assert len(response.json()["timestamps"]) == 3
+        assert client.get("/crypto/indicators", params={"names": "macd"}).status_code == 400
+    finally:
+        app.dependency_overrides = {}
@@ -0,0 +1,99 @@
+import os
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.premium import (PremiumHistory, binance_usdt_prices, premium_history, premium_table,
+                                   upbit_krw_prices)
+from app.ingestion.upbit import UpbitTicker
+from app.main import app
+from app.routers.crypto import calculate_premium, get_binance_all_prices
+from app.timeseries import TimeSeriesStore
+from tests.stub_server import StubServer, load_fixture
+
+YEAR_START = 1704067200.0  # 2024-01-01 00:00:00 UTC
+
+def test_bulk_tickers_aligned_into_premium_table():
+    """양 거래소 전체 시세를 한 번씩 조회해 공통 심볼 프리미엄을 계산하는 테스트"""
+    routes = {
+        "/v1/ticker/all": load_fixture("upbit", "ticker.json"),
+        "/api/v3/ticker/price": load_fixture("binance", "ticker_price.json"),
+    }
+    with StubServer(routes) as server:
+        ticker = UpbitTicker(["KRW-BTC"], base_url=server.base_url, max_age=60)
+        upbit_prices = upbit_krw_prices(ticker.fetch_all())
+        binance_prices = binance_usdt_prices(get_binance_all_prices(base_url=server.base_url))
+        # 전체 조회 결과가 단일 마켓 스냅샷으로도 재사용됨
+        assert ticker.get_price("KRW-BTC") == 93512000.0
+    assert len(server.requests) == 2
+    assert "quote_currencies=KRW" in server.requests[0]
+
+    table = premium_table(upbit_prices, binance_prices, 1380.0)
+    # USDT(업비트 전용), BNB(바이낸스 전용), 상장 폐지된 LUNA(가격 0)는 제외
+    assert table.symbols == ["ETH", "BTC", "XRP", "SOL", "DOGE"]
+    assert table.pair_count == 5
+    for row in table.rows():
+        assert row["premium_percentage"] == pytest.approx(
+            calculate_premium(row["binance_price_usd"], row["upbit_price_krw"], 1380.0))
+
+def test_premium_table_top_and_order():
+    """프리미엄 정렬 방향과 상위 N개 필터 테스트"""
+    upbit_prices = {"AAA": 110.0, "BBB": 95.0, "CCC": 100.0}
+    binance_prices = {"AAA": 0.1, "BBB": 0.1, "CCC": 0.1, "DDD": 1.0}
+    table = premium_table(upbit_prices, binance_prices, 1000.0, top=2)
+    assert table.symbols == ["AAA", "CCC"]
+    assert table.premium_percentage.tolist() == pytest.approx([10.0, 0.0])
+    assert table.pair_count == 3
+    assert premium_table(upbit_prices, binance_prices, 1000.0, ascending=True).symbols == ["BBB", "CCC", "AAA"]
+
+def test_premium_history_endpoint():
+    """기록된 김치 프리미엄 이력 다운샘플링 조회 테스트"""
+    history = PremiumHistory(TimeSeriesStore())
+    for i in range(6):
+        history.record("BTC", 1.0 + i, 67000.0 + i, 93500000.0, 1380.0 + i, timestamp=YEAR_START + i * 600)
+
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    original_history = premium_history.history
+    premium_history.history = history.history
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/kimchi-premium/history", params={
+            "symbol": "btc", "interval": "30m", "from": "2024-01-01T09:00:00+09:00", "to": "2024-01-01T00:50:00Z",
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["count"] for p in data["premium_percentage"]] == [3, 3]
+        assert data["premium_percentage"][1]["high"] == 6.0
+        assert data["exchange_rate"][0]["mean"] == 1381.0
+        assert len(client.get("/crypto/kimchi-premium/history").json()["binance_price_usd"]) == 6
+
+        assert client.get("/crypto/kimchi-premium/history", params={"interval": "x"}).status_code == 400
+        assert client.get("/crypto/kimchi-premium/history", params={"symbol": "DOGE"}).status_code == 404
+    finally:
+        premium_history.history = original_history
+        app.dependency_overrides = {}
+
+def test_premium_history_flushes_in_background(tmp_path):
+    """프리미엄 기록은 메모리에만 추가하고 백그라운드 스레드와 종료 시에만 저장하는지 테스트"""
+    history = PremiumHistory(TimeSeriesStore(str(tmp_path)), flush_interval=0.05)
+    history.record("BTC", 1.0, 67000.0, 93500000.0, 1380.0, timestamp=YEAR_START)
+    assert os.listdir(tmp_path) == []
+
+    history.start()
+    try:
+        # 저장 중인 임시 파일은 제외하고 시계열 4개가 모두 저장될 때까지 대기
+        saved = lambda: [name for name in os.listdir(tmp_path) if ".tmp" not in name]
+        deadline = time.monotonic() + 2
+        while len(saved()) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(saved()) == 4
+        history.record("ETH", 2.0, 3500.0, 4900000.0, 1380.0, timestamp=YEAR_START)
+    finally:
+        history.stop()
+    assert TimeSeriesStore(str(tmp_path)).get(("premium_percentage", "ETH")).last() == (YEAR_START, 2.0)
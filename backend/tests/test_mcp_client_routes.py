@@ -0,0 +1,46 @@
+import asyncio
+import inspect
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# MCP 클라이언트 디렉토리
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "MCP"))
+
+from omniscope_async_client import AsyncOmniScopeClient
+from omniscope_client import OmniScopeClient
+
+from app.main import app
+
+def endpoint_methods(client):
+    # 인자 없이(timeout 제외) 호출할 수 있는 고정 경로 조회 메서드
+    for name, method in inspect.getmembers(client, inspect.ismethod):
+        parameters = [p for p in inspect.signature(method).parameters if p != "timeout"]
+        if name.startswith("get_") and not parameters:
+            yield method
+
+def is_routed(path):
+    return any("GET" in getattr(route, "methods", ()) and route.path_regex.match(path) for route in app.routes)
+
+def test_client_endpoints_exist_in_app():
+    """MCP 동기/비동기 클라이언트의 고정 경로가 모두 백엔드 라우트에 존재하는지 테스트"""
+    paths = set()
+
+    client = OmniScopeClient("id", "secret")
+    client._make_request = lambda method, endpoint, *args, **kwargs: paths.add(endpoint)
+    for method in endpoint_methods(client):
+        method()
+
+    async def record(method, endpoint, *args, **kwargs):
+        paths.add(endpoint)
+
+    async def run():
+        async with AsyncOmniScopeClient("id", "secret") as async_client:
+            async_client._make_request = record
+            for method in endpoint_methods(async_client):
+                await method()
+
+    asyncio.run(run())
+    assert {"/social/x/trends", "/projects/ethereum/standards", "/crypto/btc/usd"} <= paths
+    assert [path for path in sorted(paths) if not is_routed(path)] == []
@@ -0,0 +1,31 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.naver import extract_usd_krw, extract_usd_krw_fast, extract_usd_krw_soup
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "naver", "marketindex.html")
+
+def load_page():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+def test_fast_path_matches_full_parser():
+    """저장된 시장지표 페이지 빠른 추출 및 전체 파싱 결과 일치 테스트"""
+    content = load_page()
+    assert extract_usd_krw_fast(content) == 1382.5
+    assert extract_usd_krw_soup(content.decode("euc-kr")) == 1382.5
+    rate, path, parse_ms = extract_usd_krw(content)
+    assert (rate, path) == (1382.5, "fast")
+    assert parse_ms >= 0
+
+def test_fallback_when_markup_changes():
+    """마크업 변경 시 전체 파싱 대체 테스트"""
+    # 클래스 순서가 바뀌면 빠른 경로는 실패하지만 CSS 선택자는 일치
+    content = load_page().replace(b'class="head usd"', b'class="usd head"')
+    assert extract_usd_krw_fast(content) is None
+    assert extract_usd_krw(content)[:2] == (1382.5, "fallback")
+
+    assert extract_usd_krw(b"<html><body>maintenance</body></html>")[:2] == (None, "failed")
@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.orderbook import BinanceDepthFeed, OrderBook, OrderBookGap, OrderBookManager
+from app.main import app
+from app.routers import crypto
+from tests.stub_server import StubServer, StubStreamServer
+
+def diff(first, last, bids=(), asks=()):
+    return {"e": "depthUpdate", "E": 1718873940000 + last, "s": "BTCUSDT", "U": first, "u": last,
+            "b": [[str(p), str(q)] for p, q in bids], "a": [[str(p), str(q)] for p, q in asks]}
+
+def depth_snapshot(last_update_id, bids, asks):
+    return {"lastUpdateId": last_update_id,
+            "bids": [[str(p), str(q)] for p, q in bids], "asks": [[str(p), str(q)] for p, q in asks]}
+
+def test_book_diffs_bands_and_endpoints(monkeypatch):
+    """스냅샷+diff 적용, 업데이트 누락 감지, 유동성 구간 집계 및 호가 엔드포인트 테스트"""
+    book = OrderBook("BTCUSDT")
+    book.load_snapshot(depth_snapshot(100, [(999.5, 1), (999, 2), (995, 4), (989, 8)],
+                                      [(1000.5, 1), (1001, 2), (1005, 4), (1011, 8)]))
+    assert book.snapshot["mid"] == 1000.0 and book.snapshot["spread"] == 1.0
+
+    # 이미 반영된 이벤트는 무시, 이어지는 이벤트는 반영 (수량 0은 호가 삭제)
+    assert book.apply(diff(95, 100, bids=[(999.5, 5)])) is False
+    assert book.apply(diff(99, 101, bids=[(999, 0), (998, 3)], asks=[(1001, 1)])) is True
+    assert book.snapshot["bids"][:2] == [[999.5, 1.0], [998.0, 3.0]]
+    assert book.snapshot["asks"][:2] == [[1000.5, 1.0], [1001.0, 1.0]]
+    with pytest.raises(OrderBookGap):
+        book.apply(diff(103, 104, bids=[(999.5, 9)]))
+    assert book.last_update_id == 101
+
+    # ±0.1%: 999~1001, ±0.5%: 995~1005, ±1%: 990~1010
+    bands = {band["band_percent"]: band for band in book.snapshot["bands"]}
+    assert [bands[b]["bid_quantity"] for b in (0.1, 0.5, 1.0)] == [1.0, 8.0, 8.0]
+    assert [bands[b]["ask_quantity"] for b in (0.1, 0.5, 1.0)] == [2.0, 6.0, 6.0]
+    assert bands[0.1]["ask_notional"] == pytest.approx(1000.5 + 1001)
+
+    manager = OrderBookManager([BinanceDepthFeed("BTCUSDT"), BinanceDepthFeed("ETHUSDT")])
+    manager.feeds["BTCUSDT"].book = book
+    monkeypatch.setattr(crypto, "orderbook_manager", manager)
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/orderbook", params={"symbol": "btc/usdt", "depth": 2})
+        assert response.status_code == 200
+        assert response.json()["bids"] == [[999.5, 1.0], [998.0, 3.0]]
+        assert response.json()["last_update_id"] == 101
+
+        response = client.get("/crypto/liquidity", params={"symbol": "BTCUSDT"})
+        assert response.status_code == 200
+        assert [band["bid_notional"] for band in response.json()["bands"]][0] == pytest.approx(999.5)
+
+        assert client.get("/crypto/liquidity", params={"symbol": "ETHUSDT"}).status_code == 503
+        assert client.get("/crypto/orderbook", params={"symbol": "DOGEUSDT"}).status_code == 404
+    finally:
+        app.dependency_overrides = {}
+
+def test_depth_feed_syncs_against_stub_stream():
+    """diff 스트림 스텁으로 스냅샷 재조회, 오래된 이벤트 무시, 누락 시 재동기화 테스트"""
+    snapshots = [
+        depth_snapshot(90, [(100, 1)], [(101, 1)]),               # 첫 이벤트보다 오래됨 -> 재조회
+        depth_snapshot(102, [(100, 2)], [(101, 2)]),
+        depth_snapshot(111, [(100, 3), (99, 1)], [(101, 3)]),    # 누락 후 재동기화용
+    ]
+    calls = []
+
+    def depth(handler):
+        calls.append(handler.path)
+        return 200, {}, snapshots[min(len(calls), len(snapshots)) - 1]
+
+    events = [
+        diff(95, 100, bids=[(100, 9)]),    # 스냅샷(102)보다 오래되어 무시
+        diff(101, 105, bids=[(99, 5)]),    # 103을 포함하므로 반영
+        diff(110, 112, asks=[(102, 1)]),   # 106~109 누락 -> 재동기화
+        diff(113, 113, bids=[(100, 4)]),
+    ]
+    with StubServer({"/api/v3/depth": depth}) as rest, StubStreamServer([events]) as stream:
+        feed = BinanceDepthFeed("BTCUSDT", rest_url=rest.base_url, stream_url=stream.base_url, retry_delay=0.1)
+        feed.start()
+        try:
+            deadline = time.time() + 10
+            while feed.book.last_update_id != 113 and time.time() < deadline:
+                time.sleep(0.02)
+        finally:
+            feed.stop()
+
+    assert stream.paths == ["/btcusdt@depth@100ms"]
+    assert len(calls) == 3 and "symbol=BTCUSDT" in calls[0]
+    assert feed.resync_count == 1
+    snapshot = feed.book.snapshot
+    assert snapshot["last_update_id"] == 113
+    assert snapshot["bids"] == [[100.0, 4.0], [99.0, 1.0]]
+    assert snapshot["asks"] == [[101.0, 3.0], [102.0, 1.0]]
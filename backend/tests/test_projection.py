@@ -0,0 +1,48 @@
+import os
+import sys
+
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# MCP 클라이언트 디렉토리
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "MCP"))
+
+import omniscope_formats
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.main import app
+from app.utils.projection import parse_fields, project
+
+def test_project_nested_fields():
+    """중첩 필드 및 리스트 프로젝션 테스트"""
+    data = {
+        "stats": {"stars": 10, "forks": 2},
+        "pull_requests": [{"number": 1, "title": "a", "body": "long"}, {"number": 2, "title": "b"}],
+        "updated_at": "2024-01-01",
+    }
+    tree = parse_fields("stats.stars, pull_requests.title,missing")
+    assert project(data, tree) == {"stats": {"stars": 10}, "pull_requests": [{"title": "a"}, {"title": "b"}]}
+    # 상위 필드 전체를 요청하면 하위 필드 지정은 무시
+    assert parse_fields("stats,stats.stars") == {"stats": None}
+
+def test_mcp_projection_matches_server():
+    """MCP 클라이언트의 fields 프로젝션이 서버와 같은 결과를 내는지 테스트"""
+    data = {"a": {"b": 1, "c": [{"d": 2, "e": 3}]}, "f": [1, 2], "g": None}
+    for fields in ("a.b", "a.c.d,f", "a,a.b", "a.c.x,g,missing", " , a.c"):
+        assert omniscope_formats.parse_fields(fields) == parse_fields(fields)
+        assert omniscope_formats.project(data, omniscope_formats.parse_fields(fields)) == project(data, parse_fields(fields))
+
+def test_fields_query_parameter():
+    """fields 쿼리 파라미터 응답 프로젝션 테스트"""
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        full = client.get("/search", params={"q": "blob", "source": "eips"})
+        projected = client.get("/search", params={"q": "blob", "source": "eips", "fields": "results.id"})
+        assert projected.status_code == 200
+        assert projected.json() == {"results": [{"id": item["id"]} for item in full.json()["results"]]}
+        assert len(projected.content) < len(full.content)
+        assert projected.headers["etag"] != full.headers["etag"]
+    finally:
+        app.dependency_overrides = {}
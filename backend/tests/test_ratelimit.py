@@ -0,0 +1,88 @@
+import os
+import sys
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.main import app
+from app.routers import crypto
+from app.utils import ratelimit
+from app.utils.ratelimit import (BudgetExhausted, StaleFallback, UpstreamBudget, UpstreamBudgets,
+                                 binance_request_weight, binance_used_weight, upbit_used_requests)
+from tests.stub_server import StubServer
+
+def test_budget_sheds_queues_and_syncs_with_headers():
+    """요청 예산 초과 시 거절, 창 초기화 직전 대기, 응답 헤더 사용량 반영 및 429 이후 중단 테스트"""
+    assert binance_request_weight("/api/v3/depth", {"limit": ["1000"]}) == 50
+    assert binance_request_weight("/api/v3/ticker/price", {}) == 4
+    assert upbit_used_requests(10)({"Remaining-Req": "group=default; min=1799; sec=3"}) == 7
+
+    clock = [1000.0]  # 60초 창은 960초에 시작해 1020초에 초기화
+    budget = UpstreamBudget("binance", 100, 60, reserve=0.1, max_wait=0.5, weigh=binance_request_weight,
+                            used_from_headers=binance_used_weight, clock=lambda: clock[0])
+    for _ in range(3):
+        budget.acquire(25)
+    with pytest.raises(BudgetExhausted) as error:
+        budget.acquire(20)
+    assert error.value.retry_after == pytest.approx(20) and budget.used == 75
+
+    # 같은 IP를 쓰는 다른 프로세스의 사용량도 헤더로 반영
+    budget.observe(200, {"X-MBX-USED-WEIGHT-1M": "88"})
+    assert not budget.exhausted(2) and budget.exhausted(3)
+
+    # 창이 max_wait 안에 초기화되면 거절하지 않고 기다림
+    clock[0] = 1019.8
+    threading.Timer(0.05, lambda: clock.__setitem__(0, 1020.0)).start()
+    budget.acquire(25)
+    assert budget.used == 25 and budget.queued_count == 1
+
+    budget.observe(429, {"Retry-After": "30"})
+    with pytest.raises(BudgetExhausted):
+        budget.acquire(1)
+    status = budget.status()
+    assert status["utilization"] == round(25 / 90, 4)
+    assert (status["paused_for"], status["shed_count"], status["throttled_count"]) == (30.0, 2, 1)
+
+def test_stale_prices_served_while_budget_exhausted(monkeypatch):
+    """예산 소진 및 429 응답 이후 거래소 요청 없이 마지막 시세를 제공하는지 테스트"""
+    prices = [{"symbol": "BTCUSDT", "price": "65000.0"}]
+    responses = [(200, {"X-MBX-USED-WEIGHT-1M": "10"}, prices), (429, {"Retry-After": "5"}, {"code": -1003})]
+    clock = [1000.0]
+    budgets = UpstreamBudgets()
+    budget = budgets.register(UpstreamBudget("binance", 10, 60, reserve=0, max_wait=0, weigh=binance_request_weight,
+                                             used_from_headers=binance_used_weight, clock=lambda: clock[0]),
+                              ["127.0.0.1"])
+    monkeypatch.setattr(ratelimit, "upstream_budgets", budgets)
+
+    with StubServer({"/api/v3/ticker/price": lambda handler: responses.pop(0)}) as stub:
+        fallback = StaleFallback(lambda: crypto.get_binance_all_prices(base_url=stub.base_url), [budget])
+        assert fallback.fetch() == (prices, False)
+        # 헤더 기준으로 이번 창의 가중치를 모두 사용함
+        assert fallback.fetch() == (prices, True)
+
+        # 다음 창의 첫 요청이 429를 받으면 Retry-After 동안 요청을 보내지 않음
+        clock[0] = 1020.0
+        assert fallback.fetch() == (prices, True)
+        assert fallback.fetch() == (prices, True)
+        assert len(stub.requests) == 2
+
+    status = budget.status()
+    assert (status["stale_count"], status["throttled_count"], status["paused_for"]) == (3, 1, 5.0)
+
+def test_upstream_budgets_endpoint():
+    """거래소별 요청 예산 사용량 엔드포인트 테스트"""
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/crypto/upstream-budgets")
+        assert response.status_code == 200
+        budgets = {budget["upstream"]: budget for budget in response.json()}
+        assert set(budgets) == {"binance", "binance_futures", "upbit"}
+        assert budgets["binance"]["limit"] == 6000 and budgets["upbit"]["window_seconds"] == 1.0
+    finally:
+        app.dependency_overrides = {}
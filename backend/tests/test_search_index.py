@@ -0,0 +1,93 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.social import social_store
+from app.main import app
+from app.search import SearchIndex, tokenize
+
+NOW = datetime(2024, 6, 20, 12, 0)
+
+def make_index(db_path=None):
+    index = SearchIndex(db_path)
+    index.add("social", "x_1", "", "Dogecoin to the moon! $DOGE", NOW - timedelta(minutes=10), author="elonmusk")
+    index.add("social", "x_2", "", "DOGE DOGE DOGE", NOW - timedelta(hours=3), author="elonmusk")
+    index.add("social", "ts_1", "", "Bitcoin will be made in the USA", NOW - timedelta(minutes=30))
+    index.add("eips", "eip-4844", "EIP-4844: Shard Blob Transactions", "Blob-carrying transactions", NOW)
+    return index
+
+def test_tokenize():
+    """토큰화 테스트"""
+    assert tokenize("#DOGE to the $moon!") == ["doge", "to", "the", "moon"]
+
+def test_search_ranking_and_filters():
+    """BM25 랭킹 및 source/since 필터 테스트"""
+    index = make_index()
+
+    total, results = index.search("doge")
+    assert total == 2
+    assert [r["id"] for r in results] == ["x_2", "x_1"]
+    assert results[0]["score"] > results[1]["score"]
+
+    total, results = index.search("doge", since=NOW - timedelta(hours=1))
+    assert [r["id"] for r in results] == ["x_1"]
+
+    assert index.search("doge moon")[0] == 1
+    assert index.search("doge", source="eips") == (0, [])
+    assert index.search("blob", source="eips")[1][0]["title"] == "EIP-4844: Shard Blob Transactions"
+    assert index.search("ethereum") == (0, [])
+
+def test_incremental_add_is_idempotent():
+    """중복 문서 재색인 방지 테스트"""
+    index = make_index()
+    assert not index.add("social", "x_1", "", "Dogecoin to the moon!", NOW)
+    assert index.add("social", "x_3", "", "More doge", NOW)
+    assert len(index) == 5
+    assert index.search("doge")[0] == 3
+
+def test_fts5_persistence(tmp_path):
+    """SQLite FTS5 저장 후 색인 복원 테스트"""
+    db_path = str(tmp_path / "search.db")
+    make_index(db_path).close()
+
+    restored = SearchIndex(db_path)
+    total, results = restored.search("doge", since=NOW - timedelta(hours=1))
+    assert total == 1
+    assert results[0]["author"] == "elonmusk"
+    assert results[0]["timestamp"] == NOW - timedelta(minutes=10)
+
+def test_search_endpoint_indexes_ingested_posts():
+    """수집된 소셜 게시물이 /search 엔드포인트에 반영되는지 테스트"""
+    social_store.add_posts("elon", [{
+        "id": "x_999", "username": "elonmusk", "content": "Zebracoin is the future",
+        "timestamp": datetime.utcnow(), "likes": 1, "reposts": 1, "comments": 1,
+    }])
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/search", params={"q": "ZEBRACOIN", "source": "social", "since": "1h"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 1
+        assert data["results"][0]["id"] == "x_999"
+
+        # 오프셋이 있는 시각은 UTC로 변환해 비교 (+09:00 기준 1시간 전 = UTC 1시간 전)
+        since = (datetime.utcnow() + timedelta(hours=8)).isoformat() + "+09:00"
+        response = client.get("/search", params={"q": "ZEBRACOIN", "source": "social", "since": since})
+        assert response.json()["total_count"] == 1
+        since = (datetime.utcnow() + timedelta(hours=9, minutes=1)).isoformat() + "+09:00"
+        response = client.get("/search", params={"q": "ZEBRACOIN", "source": "social", "since": since})
+        assert response.json()["total_count"] == 0
+
+        response = client.get("/search", params={"q": "blob", "source": "eips"})
+        assert response.json()["results"][0]["url"] == "https://eips.ethereum.org/EIPS/eip-4844"
+
+        assert client.get("/search", params={"q": "doge", "source": "tiktok"}).status_code == 400
+    finally:
+        app.dependency_overrides = {}
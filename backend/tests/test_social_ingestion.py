@@ -0,0 +1,97 @@
+import os
+import sys
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.social import (PostRingBuffer, SocialFeedStore, TruthSocialSource,
+                                  XTimelineSource, XTrendsSource, create_social_engine,
+                                  social_store)
+from app.main import app
+from tests.stub_server import StubServer, load_fixture
+
+TRUMP_ACCOUNT_ID = "107780257626128497"
+
+def statuses_route(handler):
+    """since_id 이후 게시물만 반환하는 Truth Social 스텁"""
+    query = parse_qs(urlsplit(handler.path).query)
+    statuses = load_fixture("social", "truthsocial_statuses.json")
+    if "since_id" in query:
+        since_id = int(query["since_id"][0])
+        statuses = [s for s in statuses if int(s["id"]) > since_id]
+    return 200, {}, statuses
+
+def make_post(seq):
+    return {"id": f"ts_{seq}", "username": "u", "content": str(seq), "timestamp": datetime(2024, 6, 20),
+            "likes": 0, "reposts": 0, "comments": 0}
+
+def test_ring_buffer_bounded_and_since():
+    """링 버퍼 크기 제한 및 since_id 조회 테스트"""
+    buffer = PostRingBuffer(capacity=3)
+    assert len(buffer.extend([make_post(i) for i in (3, 1, 2)])) == 3
+    assert [p["id"] for p in buffer.extend([make_post(2), make_post(4), make_post(5)])] == ["ts_4", "ts_5"]
+
+    assert len(buffer) == 3
+    assert [p["id"] for p in buffer.since()] == ["ts_5", "ts_4", "ts_3"]
+    assert [p["id"] for p in buffer.since("ts_3")] == ["ts_5", "ts_4"]
+    assert [p["id"] for p in buffer.since("4", limit=5)] == ["ts_5"]
+    assert buffer.since("ts_5") == []
+    assert buffer.last_id() == "ts_5"
+
+def test_truth_social_incremental_fetch():
+    """Truth Social 증분 수집 (since_id 커서 전달) 테스트"""
+    path = f"/api/v1/accounts/{TRUMP_ACCOUNT_ID}/statuses"
+    store = SocialFeedStore()
+    with StubServer({path: statuses_route}) as server:
+        source = TruthSocialSource("trump", TRUMP_ACCOUNT_ID, "realDonaldTrump", base_url=server.base_url)
+        engine = create_social_engine(store, [source])
+        assert engine.collect_once() == 1
+        assert engine.collect_once() == 1
+
+    posts = store.posts("trump")
+    assert [p["id"] for p in posts] == ["ts_112648000000000003", "ts_112648000000000002", "ts_112648000000000001"]
+    assert posts[0]["content"] == "Bitcoin & crypto will be made in the USA!"
+    assert posts[2]["content"] == "Great meeting today.\nThank you!"
+    assert posts[0]["likes"] == 45012
+    assert source.cursor == "ts_112648000000000003"
+    assert "since_id=112648000000000003" in server.requests[1]
+
+def test_x_sources():
+    """X 타임라인 및 트렌드 정규화 테스트"""
+    routes = {
+        "/2/users/44196397/tweets": load_fixture("social", "x_user_tweets.json"),
+        "/1.1/trends/place.json": load_fixture("social", "x_trends_place.json"),
+    }
+    store = SocialFeedStore()
+    with StubServer(routes) as server:
+        sources = [
+            XTimelineSource("elon", "44196397", "elonmusk", "token", base_url=server.base_url),
+            XTrendsSource("token", base_url=server.base_url),
+        ]
+        assert create_social_engine(store, sources).collect_once() == 2
+
+    posts = store.posts("elon", limit=1)
+    assert posts[0]["id"] == "x_1803800000000000002"
+    assert posts[0]["reposts"] == 70012
+    assert [t["name"] for t in store.trends()] == ["#Bitcoin", "#HSK", "#Web3"]
+    assert store.trends()[0]["location"] == "Worldwide"
+
+def test_social_endpoint_since_id_and_limit():
+    """/social/trump 엔드포인트 since_id, limit 파라미터 테스트"""
+    social_store.add_posts("trump", [make_post(i) for i in range(1, 6)])
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    try:
+        client = TestClient(app)
+        response = client.get("/social/trump", params={"since_id": "ts_2", "limit": 2})
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == ["ts_5", "ts_4"]
+
+        response = client.get("/social/trump", params={"since_id": "ts_5"})
+        assert response.json() == []
+    finally:
+        app.dependency_overrides = {}
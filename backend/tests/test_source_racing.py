@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.racing import LatencyHistogram, SourceRacer
+from app.routers.crypto import get_binance_all_prices, get_binance_price
+from tests.stub_server import StubServer
+
+def slow(value, delay):
+    def fetch():
+        time.sleep(delay)
+        return value
+    return fetch
+
+def failing():
+    raise RuntimeError("upstream down")
+
+def test_latency_histogram_percentiles():
+    """지연 시간 히스토그램 백분위 테스트"""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(0.9) is None
+    for _ in range(90):
+        histogram.record(0.010)
+    for _ in range(10):
+        histogram.record(1.0)
+    assert 0.010 <= histogram.percentile(0.5) < 0.013
+    assert 1.0 <= histogram.percentile(0.99) < 1.2
+
+def test_hedge_after_slow_primary():
+    """기본 소스 지연 시 헤지 요청 테스트"""
+    racer = SourceRacer("fx", [("naver", slow(1300.0, 1.0)), ("yahoo", slow(1301.0, 0.01))], default_hedge_delay=0.05)
+    started = time.monotonic()
+    assert racer.fetch() == 1301.0
+    assert time.monotonic() - started < 0.5
+    status = racer.status()
+    assert status["hedge_count"] == 1
+    assert [source["win_count"] for source in status["sources"]] == [0, 1]
+
+def test_failure_falls_through_immediately():
+    """기본 소스 실패 시 즉시 다음 소스 시도 테스트"""
+    racer = SourceRacer("fx", [("naver", failing), ("invalid", lambda: None), ("yahoo", lambda: 1302.0)],
+                        default_hedge_delay=5)
+    started = time.monotonic()
+    assert racer.fetch() == 1302.0
+    assert time.monotonic() - started < 0.5
+    assert racer.status()["hedge_count"] == 0
+    assert racer.status()["sources"][0]["last_error"] == "upstream down"
+
+def test_histogram_drives_hedge_delay():
+    """소스별 지연 시간 분포 기반 헤지 지연 테스트"""
+    racer = SourceRacer("fx", [("naver", slow(1300.0, 0.02)), ("yahoo", lambda: 1301.0)], min_samples=3)
+    assert racer.hedge_delay(racer.sources[0]) == racer.default_hedge_delay
+    for _ in range(3):
+        assert racer.fetch() == 1300.0
+    assert 0.05 <= racer.hedge_delay(racer.sources[0]) < 0.1
+
+def test_all_sources_fail_within_timeout():
+    """모든 소스 실패 및 시간 예산 초과 테스트"""
+    assert SourceRacer("fx", [("naver", failing), ("yahoo", lambda: None)]).fetch() is None
+    racer = SourceRacer("fx", [("naver", slow(1.0, 1.0))], timeout=0.1)
+    started = time.monotonic()
+    assert racer.fetch() is None
+    assert time.monotonic() - started < 0.5
+
+def test_raced_sources_make_single_attempt():
+    """경쟁용 소스가 urllib3 재시도 없이 한 번만 요청하는지 테스트"""
+    unavailable = lambda handler: (502, {}, {"msg": "bad gateway"})
+    with StubServer({"/api/v3/trades": unavailable, "/api/v3/ticker/price": unavailable}) as server:
+        assert get_binance_price("BTCUSDT", max_retries=0, base_url=server.base_url) is None
+        assert get_binance_all_prices(base_url=server.base_url) is None
+        assert [path.split("?")[0] for path in server.requests] == ["/api/v3/trades", "/api/v3/ticker/price"]
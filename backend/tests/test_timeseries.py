@@ -0,0 +1,148 @@
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.auth.api_key import get_api_key_with_tracking
+from app.ingestion.derivatives import DerivativesStore, derivatives_store
+from app.main import app
+from app.timeseries import TimeSeries, TimeSeriesStore, parse_interval
+
+EIGHT_HOURS = 8 * 3600
+YEAR_START = 1704067200.0  # 2024-01-01 00:00:00 UTC
+
+def test_parse_interval():
+    """주기 문자열 파싱 테스트"""
+    assert parse_interval("8h") == EIGHT_HOURS
+    assert parse_interval("15m") == 900
+    assert parse_interval("1d") == 86400
+    with pytest.raises(ValueError):
+        parse_interval("0h")
+    with pytest.raises(ValueError):
+        parse_interval("abc")
+
+def test_append_only_and_range():
+    """append-only 동작 및 범위 조회 테스트"""
+    series = TimeSeries(capacity=2)
+    for i in range(10):
+        assert series.append(100.0 + i, float(i))
+    assert not series.append(50.0, 1.0)
+    assert series.append(109.0, 99.0)
+
+    ts, values = series.range(103, 105)
+    assert ts.tolist() == [103.0, 104.0, 105.0]
+    assert values.tolist() == [3.0, 4.0, 5.0]
+    assert series.last() == (109.0, 99.0)
+    assert len(series) == 10
+
+def test_downsample_ohlc_mean():
+    """버킷별 OHLC/평균 다운샘플링 테스트"""
+    series = TimeSeries()
+    series.extend([0, 10, 20, 60, 70], [1.0, 5.0, 3.0, 2.0, 4.0])
+
+    buckets = series.downsample(60)
+    assert buckets["timestamp"].tolist() == [0.0, 60.0]
+    assert buckets["open"].tolist() == [1.0, 2.0]
+    assert buckets["high"].tolist() == [5.0, 4.0]
+    assert buckets["low"].tolist() == [1.0, 2.0]
+    assert buckets["close"].tolist() == [3.0, 4.0]
+    assert buckets["mean"].tolist() == [3.0, 3.0]
+    assert buckets["count"].tolist() == [3, 2]
+
+def test_max_points_keeps_recent_window():
+    """최대 보관 개수 초과 시 오래된 점부터 버리는 링 버퍼 동작 테스트"""
+    series = TimeSeries(max_points=100)
+    for i in range(1000):
+        series.append(float(i), float(i))
+    ts, values = series.range()
+    assert 100 <= len(ts) <= 125
+    assert ts[-1] == 999.0 and values[-1] == 999.0
+    assert np.all(np.diff(ts) == 1.0)
+    assert series.range(900, 901)[0].tolist() == [900.0, 901.0]
+
+def test_year_of_funding_points_across_symbols():
+    """1년치 8시간 펀딩비 x 다수 심볼 범위 조회/다운샘플링 테스트"""
+    store = TimeSeriesStore()
+    timestamps = YEAR_START + np.arange(3 * 365) * EIGHT_HOURS
+    for i in range(40):
+        series_key = ("funding_rate", "Binance", f"SYM{i}/USDT")
+        for ts, value in zip(timestamps, np.sin(timestamps + i) * 1e-4):
+            store.append(series_key, float(ts), float(value))
+
+    started = time.perf_counter()
+    for i in range(40):
+        buckets = store.downsample(("funding_rate", "Binance", f"SYM{i}/USDT"), 7 * 86400,
+                                   timestamps[100], timestamps[900])
+    elapsed = time.perf_counter() - started
+
+    assert buckets["count"].sum() == 801
+    assert elapsed < 1.0
+
+def test_store_flush_and_reload(tmp_path):
+    """디스크 저장 후 재시작 시 복원 및 이후 flush가 새 점만 세그먼트에 추가하는지 테스트"""
+    key = ("funding_rate", "OKX", "BTC/USDT")
+    store = TimeSeriesStore(str(tmp_path))
+    store.append(key, 1.0, 0.0001)
+    store.append(key, 2.0, 0.0002)
+    store.flush()
+    snapshot = tmp_path / "funding_rate__OKX__BTC-USDT.npz"
+    segment = tmp_path / "funding_rate__OKX__BTC-USDT.seg"
+    snapshot_mtime = snapshot.stat().st_mtime_ns
+
+    # 마지막 점의 값 갱신과 새 점은 스냅샷을 다시 쓰지 않고 세그먼트에 추가
+    store.append(key, 2.0, 0.0003)
+    store.append(key, 3.0, 0.0004)
+    store.flush()
+    store.flush()
+    assert snapshot.stat().st_mtime_ns == snapshot_mtime
+    assert segment.stat().st_size == 2 * 16
+
+    reloaded = TimeSeriesStore(str(tmp_path))
+    ts, values = reloaded.range(key)
+    assert ts.tolist() == [1.0, 2.0, 3.0]
+    assert values.tolist() == [0.0001, 0.0003, 0.0004]
+
+    # 세그먼트가 시계열보다 길어지면 스냅샷으로 합침
+    for i in range(1100):
+        reloaded.append(key, 4.0 + i, 0.0005)
+        reloaded.flush()
+    assert segment.stat().st_size < 1100 * 16
+    assert TimeSeriesStore(str(tmp_path)).range(key)[0].tolist() == reloaded.range(key)[0].tolist()
+
+def test_funding_rate_history_endpoint():
+    """펀딩비 히스토리 엔드포인트 다운샘플링 테스트"""
+    derivatives = DerivativesStore()
+    for i in range(6):
+        derivatives.add([{"symbol": "BTC/USDT", "exchange": "Bybit", "rate": 0.0001 * (i + 1),
+                          "next_funding_time": datetime.utcnow(), "interval": "8h"}],
+                        [], timestamp=YEAR_START + i * EIGHT_HOURS)
+
+    app.dependency_overrides[get_api_key_with_tracking] = lambda: None
+    original_history = derivatives_store.history
+    derivatives_store.history = derivatives.history
+    try:
+        client = TestClient(app)
+        response = client.get("/derivatives/funding-rates/history", params={
+            "symbol": "btcusdt", "exchange": "bybit", "interval": "1d",
+            "from": "2024-01-01T09:00:00+09:00", "to": "2024-01-02T23:59:59Z",
+        })
+        assert response.status_code == 200
+        data = response.json()
+        assert data["symbol"] == "BTC/USDT"
+        assert [p["count"] for p in data["points"]] == [3, 3]
+        assert abs(data["points"][1]["high"] - 0.0006) < 1e-12
+
+        response = client.get("/derivatives/funding-rates/history", params={"symbol": "BTC/USDT", "exchange": "Bybit", "interval": "x"})
+        assert response.status_code == 400
+        response = client.get("/derivatives/funding-rates/history", params={"symbol": "DOGE/USDT", "exchange": "Bybit"})
+        assert response.status_code == 404
+    finally:
+        derivatives_store.history = original_history
+        app.dependency_overrides = {}
@@ -0,0 +1,51 @@
+import os
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ingestion.upbit import UpbitTicker
+from tests.stub_server import StubServer, load_fixture
+
+def ticker_route(handler):
+    # 업비트처럼 요청한 마켓만 반환하고, 없는 마켓이 섞이면 요청 전체를 404로 거부
+    tickers = {ticker["market"]: ticker for ticker in load_fixture("upbit", "ticker.json")}
+    markets = parse_qs(urlsplit(handler.path).query)["markets"][0].split(",")
+    if any(market not in tickers for market in markets):
+        return 404, {}, {"error": {"name": "404", "message": "Code not found"}}
+    return 200, {}, [tickers[market] for market in markets]
+
+def test_single_request_serves_all_markets():
+    """여러 마켓 시세를 한 번의 요청으로 조회하는 테스트"""
+    with StubServer({"/v1/ticker": ticker_route}) as server:
+        ticker = UpbitTicker(["KRW-BTC", "KRW-USDT"], base_url=server.base_url, max_age=60)
+        assert ticker.get_price("krw-btc") == 93512000.0
+        assert ticker.get_price("KRW-USDT") == 1389.0
+        assert ticker.get_prices(["KRW-BTC", "KRW-USDT"]) == {"KRW-BTC": 93512000.0, "KRW-USDT": 1389.0}
+        assert ticker.request_count == 1
+
+        # 추적하지 않던 마켓은 다음 갱신 요청에 함께 포함
+        assert ticker.get_price("KRW-ETH") == 4901000.0
+        assert ticker.request_count == 2
+        assert parse_qs(urlsplit(server.requests[-1]).query)["markets"] == ["KRW-BTC,KRW-USDT,KRW-ETH"]
+
+def test_rejected_market_is_dropped():
+    """존재하지 않는 마켓 제외 후 재시도 테스트"""
+    with StubServer({"/v1/ticker": ticker_route}) as server:
+        ticker = UpbitTicker(["KRW-BTC"], base_url=server.base_url, max_age=60)
+        assert ticker.get_price("KRW-NOPE") is None
+        assert ticker.get_price("KRW-BTC") == 93512000.0
+        assert ticker.markets == ["KRW-BTC"]
+        # 거부된 마켓은 다시 요청하지 않음
+        assert ticker.get_price("KRW-NOPE") is None
+        assert ticker.request_count == 2
+
+def test_delisted_configured_market_is_dropped():
+    """설정된 마켓이 상장 폐지되면 전체 마켓 목록으로 확인 후 제외하는 테스트"""
+    listed = [{"market": "KRW-BTC"}, {"market": "KRW-USDT"}]
+    with StubServer({"/v1/ticker": ticker_route, "/v1/market/all": listed}) as server:
+        ticker = UpbitTicker(["KRW-BTC", "KRW-DELISTED"], base_url=server.base_url, max_age=60)
+        assert ticker.get_price("KRW-BTC") == 93512000.0
+        assert ticker.markets == ["KRW-BTC"]
+        assert [urlsplit(path).path for path in server.requests] == ["/v1/ticker", "/v1/market/all", "/v1/ticker"]
@@ -0,0 +1,26 @@
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils import yahoo
+from tests.stub_server import StubServer, load_fixture
+
+def test_chart_adapter_reads_regular_market_price():
+    """차트 API 응답의 regularMarketPrice 조회 테스트"""
+    with StubServer({"/v8/finance/chart/USDKRW=X": load_fixture("yahoo", "chart_usdkrw.json")}) as server:
+        price = yahoo.get_regular_market_price("USDKRW=X", f"{server.base_url}/v8/finance/chart")
+    assert price == 1383.72
+    assert "range=1d" in server.requests[0]
+    assert yahoo.parse_regular_market_price({"chart": {"result": None, "error": {"code": "Not Found"}}}) is None
+
+def test_yfinance_fallback_only_on_failure(monkeypatch):
+    """차트 API 실패 시에만 yfinance 대체 조회 테스트"""
+    calls = []
+    monkeypatch.setattr(yahoo, "get_yfinance_price", lambda symbol: calls.append(symbol) or 1380.0)
+    with StubServer({"/v8/finance/chart/USDKRW=X": load_fixture("yahoo", "chart_usdkrw.json")}) as server:
+        assert yahoo.get_quote_price("USDKRW=X", f"{server.base_url}/v8/finance/chart") == 1383.72
+        assert calls == []
+        assert yahoo.get_quote_price("KRW=X", f"{server.base_url}/v8/finance/chart") == 1380.0
+    assert calls == ["KRW=X"]